@@ -30,6 +30,8 @@ from cbagent.collectors.secondary_latency import SecondaryLatencyStats
 from cbagent.collectors.secondary_stats import SecondaryStats
 from cbagent.collectors.secondary_storage_stats import SecondaryStorageStats
 from cbagent.collectors.secondary_storage_stats_mm import SecondaryStorageStatsMM
+from cbagent.collectors.spring_errors import SpringErrors
+from cbagent.collectors.spring_telemetry import SpringTelemetry
 from cbagent.collectors.system import (
     Disk,
     IO,
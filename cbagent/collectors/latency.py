@@ -1,11 +1,10 @@
 import asyncio
-import csv
-import glob
 from typing import Iterator
 
 from aiohttp import ClientSession
 
 from cbagent.collectors import Collector
+from spring.histogram import read_logs
 
 
 class Latency(Collector):
@@ -34,21 +33,25 @@ class KVLatency(Latency):
 
     PATTERN = '*-worker-*'
 
+    PERCENTILE = 99  # Reported for every interval of the histogram log
+
     def collect(self):
         pass
 
     def read_stats(self) -> Iterator:
-        for filename in glob.glob(self.PATTERN):
-            with open(filename) as fh:
-                reader = csv.reader(fh)
-                for operation, timestamp, latency in reader:
-                    yield operation, timestamp, latency
+        """Yield the percentile of every interval, computed for all at once."""
+        for log in read_logs(self.PATTERN):
+            latencies = log.percentiles(self.PERCENTILE)
+            for code, timestamp, latency in zip(log.codes.tolist(),
+                                                log.timestamps.tolist(),
+                                                latencies.tolist()):
+                yield log.operations[code], timestamp, latency
 
     async def post_results(self, bucket: str):
         async with ClientSession() as self.store.async_session:
             for operation, timestamp, latency in self.read_stats():
                 data = {
-                    'latency_' + operation: float(latency) * 1000,  # Latency in ms
+                    'latency_' + operation: latency / 1000,  # Latency in ms
                 }
                 await self.store.append_async(data=data,
                                               timestamp=int(timestamp),
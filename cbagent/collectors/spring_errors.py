@@ -0,0 +1,58 @@
+import glob
+import json
+from collections import defaultdict
+from typing import Dict, Iterator, Tuple
+
+from cbagent.collectors import Collector
+
+
+def read_error_logs(pattern: str) -> Iterator[Tuple[str, int, Dict[str, float]]]:
+    """Yield the (bucket, timestamp, metrics) samples of all workers."""
+    for filename in glob.glob(pattern):
+        with open(filename) as fh:
+            log = json.load(fh)
+        for sample in log['samples']:
+            timestamp = sample.pop('timestamp')
+            yield log['bucket'], timestamp, sample
+
+
+class SpringErrors(Collector):
+
+    """Post the error statistics of the spring workers as time series.
+
+    The per-second counters of all workers are added up by bucket once the
+    workload is complete.
+    """
+
+    COLLECTOR = "spring_errors"
+
+    PATTERN = 'spring-errors-*.json'
+
+    def update_metadata(self):
+        self.mc.add_cluster()
+        for bucket in self.get_buckets():
+            self.mc.add_bucket(bucket)
+
+    def sample(self):
+        pass
+
+    def collect(self):
+        pass
+
+    def read_stats(self) -> Dict[str, Dict[int, Dict[str, float]]]:
+        stats = defaultdict(lambda: defaultdict(lambda: defaultdict(float)))
+        for bucket, timestamp, sample in read_error_logs(self.PATTERN):
+            for metric, value in sample.items():
+                stats[bucket][timestamp][metric] += value
+        return stats
+
+    def reconstruct(self):
+        for bucket, samples in self.read_stats().items():
+            metrics = {metric for sample in samples.values() for metric in sample}
+            for metric in sorted(metrics):
+                self.mc.add_metric(metric, bucket=bucket, collector=self.COLLECTOR)
+
+            for timestamp, sample in sorted(samples.items()):
+                self.store.append(sample, timestamp=timestamp * 1000,
+                                  cluster=self.cluster, bucket=bucket,
+                                  collector=self.COLLECTOR)
@@ -0,0 +1,45 @@
+import glob
+import os
+import time
+
+from cbagent.collectors import Collector
+from spring.telemetry import read_samples
+
+
+class SpringTelemetry(Collector):
+
+    """Tail the live telemetry files of the local spring workers."""
+
+    COLLECTOR = "spring_telemetry"
+
+    PATTERN = 'spring-telemetry-*.json'
+
+    def __init__(self, settings):
+        super().__init__(settings)
+        self.files = {}
+        self.start_time = time.time()
+
+    def update_metadata(self):
+        self.mc.add_cluster()
+        for bucket in self.get_buckets():
+            self.mc.add_bucket(bucket)
+
+    def read_samples(self):
+        for filename in glob.glob(self.PATTERN):
+            fh = self.files.get(filename)
+            if fh is None:
+                fh = self.files[filename] = open(filename)
+            elif fh.tell() > os.path.getsize(filename):  # Truncated by a new run
+                fh.seek(0)
+            yield from read_samples(fh)
+
+    def sample(self):
+        for sample in self.read_samples():
+            timestamp = sample.pop('timestamp')
+            bucket = sample.pop('bucket')
+            if timestamp < self.start_time:  # Left over from a previous phase
+                continue
+            self.update_metric_metadata(sample.keys(), bucket=bucket)
+            self.store.append(sample, timestamp=timestamp * 1000,
+                              cluster=self.cluster, bucket=bucket,
+                              collector=self.COLLECTOR)
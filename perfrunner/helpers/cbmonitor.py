@@ -40,6 +40,8 @@ from cbagent.collectors import (
     SecondaryStats,
     SecondaryStorageStats,
     SecondaryStorageStatsMM,
+    SpringErrors,
+    SpringTelemetry,
     Sysdig,
     TypePerf,
     XdcrLag,
@@ -51,6 +53,7 @@ from logger import logger
 from perfrunner.helpers.misc import pretty_dict, uhex
 from perfrunner.settings import CBMONITOR_HOST
 from perfrunner.tests import PerfTest
+from spring.placement import CPUTopology, pin
 
 
 @decorator
@@ -206,6 +209,10 @@ class CbAgent:
         if n1ql_stats:
             self.add_collector(N1QLStats)
 
+        if latency or query_latency or n1ql_latency:
+            self.add_collector(SpringTelemetry)
+            self.add_collector(SpringErrors)
+
         if index_latency:
             self.add_collector(ObserveIndexLatency)
 
@@ -316,6 +323,22 @@ class CbAgent:
         self.processes = [Process(target=c.collect) for c in self.collectors]
         for p in self.processes:
             p.start()
+        self.pin_collectors()
+
+    def pin_collectors(self):
+        """Move the collectors to the cores that are reserved for cbagent.
+
+        The cores are reserved on the local workers only.
+        """
+        worker_manager = getattr(self.test, 'worker_manager', None)
+        if worker_manager is None or worker_manager.is_remote:
+            return
+
+        reserved_cores = self.test.test_config.access_settings.reserved_cores
+        if reserved_cores:
+            cpus = CPUTopology.read().reserved(reserved_cores)
+            for p in self.processes:
+                pin(cpus, pid=p.pid)
 
     def stop(self):
         logger.info('Terminating stats collectors')
@@ -1,13 +1,18 @@
 import glob
+import json
 import os
-from typing import Dict, List, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
+from cbagent.collectors import KVLatency, QueryLatency
+from cbagent.collectors.spring_errors import SpringErrors, read_error_logs
 from cbagent.stores import PerfStore
 from logger import logger
 from perfrunner.settings import CBMONITOR_HOST
 from perfrunner.workloads.bigfun.query_gen import Query
+from spring.histogram import merge_logs
+from spring.slosearch import SLOSearch
 
 Number = Union[float, int]
 
@@ -198,6 +203,30 @@ class MetricHelper:
 
         return int(np.percentile(values, 90))
 
+    def max_throughput_under_slo(self) -> Metric:
+        slo = self.test_config.slo_search_settings
+        metric_id = '{}_max_throughput'.format(self.test_config.name)
+        title = 'Max throughput (ops/sec) with {:g}th percentile {} latency ' \
+            '<= {:g} ms, {}'.format(slo.percentile, slo.operation.upper(),
+                                    slo.latency, self._title)
+        metric_info = self._metric_info(metric_id, title, chirality=1)
+
+        throughput = self._max_throughput_under_slo()
+
+        return throughput, self._snapshots, metric_info
+
+    @staticmethod
+    def _max_throughput_under_slo() -> int:
+        """Sum the search results of all buckets."""
+        throughput = 0
+        for filename in glob.glob(SLOSearch.PATTERN):
+            with open(filename) as fh:
+                curve = json.load(fh)
+            if not curve['complete']:
+                logger.warn('Incomplete SLO search: {}'.format(filename))
+            throughput += curve['max_throughput']
+        return round(throughput)
+
     def get_percentile_value_of_node_metric(self, collector, metric, server, percentile):
         values = []
         db = self.store.build_dbname(cluster=self.test.cbmonitor_clusters[0],
@@ -329,14 +358,17 @@ class MetricHelper:
         return latency, self._snapshots, metric_info
 
     def _query_latency(self, percentile: Number) -> float:
-        values = []
-        for bucket in self.test_config.buckets:
-            db = self.store.build_dbname(cluster=self.test.cbmonitor_clusters[0],
-                                         collector='spring_query_latency',
-                                         bucket=bucket)
-            values += self.store.get_values(db, metric='latency_query')
-
-        query_latency = np.percentile(values, percentile)
+        query_latency = self._histogram_latency(QueryLatency.PATTERN, 'query',
+                                                percentile)
+        if query_latency is None:
+            values = []
+            for bucket in self.test_config.buckets:
+                db = self.store.build_dbname(cluster=self.test.cbmonitor_clusters[0],
+                                             collector='spring_query_latency',
+                                             bucket=bucket)
+                values += self.store.get_values(db, metric='latency_query')
+
+            query_latency = np.percentile(values, percentile)
         if query_latency < 100:
             return round(query_latency, 1)
         return int(query_latency)
@@ -388,19 +420,72 @@ class MetricHelper:
                     operation: str,
                     percentile: Number,
                     collector: str) -> float:
-        timings = []
-        metric = 'latency_{}'.format(operation)
-        for bucket in self.test_config.buckets:
-            db = self.store.build_dbname(cluster=self.test.cbmonitor_clusters[0],
-                                         collector=collector,
-                                         bucket=bucket)
-            timings += self.store.get_values(db, metric=metric)
+        latency = None
+        if collector == KVLatency.COLLECTOR:
+            latency = self._histogram_latency(KVLatency.PATTERN, operation,
+                                              percentile)
+        if latency is None:
+            timings = []
+            metric = 'latency_{}'.format(operation)
+            for bucket in self.test_config.buckets:
+                db = self.store.build_dbname(cluster=self.test.cbmonitor_clusters[0],
+                                             collector=collector,
+                                             bucket=bucket)
+                timings += self.store.get_values(db, metric=metric)
+
+            latency = np.percentile(timings, percentile)
 
-        latency = np.percentile(timings, percentile)
         if latency > 100:
             return round(latency)
         return round(latency, 2)
 
+    @staticmethod
+    def _histogram_latency(pattern: str,
+                           operation: str,
+                           percentile: Number) -> Union[float, None]:
+        """Read the percentile from the merged spring histograms (in ms)."""
+        histogram = merge_logs(pattern).get(operation)
+        if histogram is None:
+            return None
+        return histogram.percentile(percentile) / 1000
+
+    def error_rate(self) -> Metric:
+        metric_id = '{}_error_rate'.format(self.test_config.name)
+        title = 'Error rate (%), {}'.format(self._title)
+        metric_info = self._metric_info(metric_id, title, chirality=-1)
+
+        error_rate = self._error_rate()
+
+        return error_rate, self._snapshots, metric_info
+
+    @staticmethod
+    def _error_rate() -> float:
+        """Return the percentage of the spring requests that failed.
+
+        Both the successful and the failed requests of every operation type are
+        counted in the spring error logs. The multi-key operations are counted
+        per key.
+        """
+        errors = ops = 0
+        for _, _, sample in read_error_logs(SpringErrors.PATTERN):
+            for metric, value in sample.items():
+                if metric.startswith('errors_'):
+                    errors += value
+                elif metric.startswith('ops_'):
+                    ops += value
+
+        if not errors:
+            return 0
+        return round(100 * errors / (ops + errors), 3)
+
+    def check_error_rate(self, threshold: float) -> Optional[str]:
+        """Report the error rate if it exceeds the threshold (in %)."""
+        error_rate = self._error_rate()
+        if error_rate > threshold:
+            return 'Error rate is {}% (threshold: {}%)'.format(error_rate, threshold)
+        if error_rate:
+            logger.warn('Error rate is {}%'.format(error_rate))
+
     def observe_latency(self, percentile: Number) -> Metric:
         metric_id = '{}_{}th'.format(self.test_config.name, percentile)
         title = '{}th percentile {}'.format(percentile, self._title)
@@ -258,6 +258,8 @@ class StatsSettings:
                         'memcached']
     TRACED_PROCESSES = []
 
+    MAX_ERROR_RATE = 0  # In %, disabled by default
+
     def __init__(self, options: dict):
         self.enabled = int(options.get('enabled', self.ENABLED))
         self.post_to_sf = int(options.get('post_to_sf', self.POST_TO_SF))
@@ -275,6 +277,8 @@ class StatsSettings:
         self.traced_processes = self.TRACED_PROCESSES + \
             options.get('traced_processes', '').split()
 
+        self.max_error_rate = float(options.get('max_error_rate', self.MAX_ERROR_RATE))
+
 
 class ProfilingSettings:
 
@@ -378,13 +382,90 @@ class RebalanceSettings:
         self.stop_after = int(options.get('stop_after', self.STOP_AFTER))
 
 
+class LoadProfileSettings:
+
+    """Parse the piecewise schedule of the target throughput.
+
+    Every line of the "phases" option defines a phase as a shape name followed
+    by its parameters, e.g.:
+
+        [load_profile]
+        phases =
+            ramp duration=300 start=1000 end=20000
+            step duration=600 rate=20000
+            sine duration=600 mean=15000 amplitude=5000 period=120
+            burst duration=300 rate=10000 peak=40000 length=10 every=60
+    """
+
+    def __init__(self, options: dict):
+        self.phases = []
+        for line in options.get('phases', '').strip().splitlines():
+            shape, *params = line.split()
+            phase = {'shape': shape}
+            for param in params:
+                name, value = param.split('=')
+                phase[name] = float(value)
+            self.phases.append(phase)
+
+
+class SLOSearchSettings:
+
+    """Search for the maximum throughput that meets the latency SLO.
+
+    The search is enabled by a non-zero latency target (in ms), e.g.:
+
+        [slo_search]
+        mode = binary
+        operation = get
+        percentile = 99.9
+        latency = 1
+        min_throughput = 10000
+        max_throughput = 200000
+    """
+
+    MODE = 'step'  # Alt: binary
+    OPERATION = 'get'
+    PERCENTILE = 99
+    LATENCY = 0
+    MIN_THROUGHPUT = 1000
+    MAX_THROUGHPUT = 100000
+    STEP = 5000
+    RESOLUTION = 1000
+    SETTLE_TIME = 30
+    MEASURE_TIME = 60
+
+    def __init__(self, options: dict):
+        self.mode = options.get('mode', self.MODE)
+        self.operation = options.get('operation', self.OPERATION)
+        self.percentile = float(options.get('percentile', self.PERCENTILE))
+        self.latency = float(options.get('latency', self.LATENCY))
+
+        self.min_throughput = int(options.get('min_throughput', self.MIN_THROUGHPUT))
+        self.max_throughput = int(options.get('max_throughput', self.MAX_THROUGHPUT))
+        self.step = int(options.get('step', self.STEP))
+        self.resolution = int(options.get('resolution', self.RESOLUTION))
+
+        self.settle_time = int(options.get('settle_time', self.SETTLE_TIME))
+        self.measure_time = int(options.get('measure_time', self.MEASURE_TIME))
+
+    def __str__(self):
+        return str(self.__dict__)
+
+
 class PhaseSettings:
 
     TIME = 3600 * 24
 
     DOC_GEN = 'basic'
+    DOC_CACHE = 0
+    DATASET_DIR = None
+    KV_ENGINE = 'sdk'
     POWER_ALPHA = 0
     ZIPF_ALPHA = 0
+    KEY_DISTRIBUTION = 'uniform'
+    ZIPF_THETA = 0.99
+    HOTSPOT_KEYS = 20
+    HOTSPOT_OPS = 80
 
     CREATES = 0
     READS = 0
@@ -399,15 +480,28 @@ class PhaseSettings:
 
     HOT_READS = False
     SEQ_UPSERTS = False
+    BULK_LOAD = False
 
     BATCH_SIZE = 1000
     BATCHES = 1
     SPRING_BATCH_SIZE = 100
+    MULTI_BATCH_SIZE = 0
 
     ITERATIONS = 1
 
     ASYNC = False
 
+    OPEN_LOOP = False
+    IN_FLIGHT = 64
+
+    TRACE_RECORD = None
+    TRACE_REPLAY = None
+    TRACE_OFFLINE = False
+    TRACE_SPEED = 1
+
+    CPU_PLACEMENT = 'none'  # Alt: spread, pack
+    RESERVED_CORES = 0
+
     KEY_FMTR = 'decimal'
 
     ITEMS = 0
@@ -426,11 +520,13 @@ class PhaseSettings:
 
     WORKERS = 0
     QUERY_WORKERS = 0
+    QUERY_CONCURRENCY = 1
     N1QL_WORKERS = 0
     WORKLOAD_INSTANCES = 1
 
     N1QL_OP = 'read'
     N1QL_BATCH_SIZE = 100
+    N1QL_CONCURRENCY = 1
     N1QL_TIMEOUT = 0
 
     ARRAY_SIZE = 10
@@ -504,12 +600,22 @@ class PhaseSettings:
 
         # KV settings
         self.doc_gen = options.get('doc_gen', self.DOC_GEN)
+        self.doc_cache = bool(int(options.get('doc_cache', self.DOC_CACHE)))
+        self.dataset_dir = options.get('dataset_dir', self.DATASET_DIR)
+        self.kv_engine = options.get('kv_engine', self.KV_ENGINE)
         self.power_alpha = float(options.get('power_alpha', self.POWER_ALPHA))
         self.zipf_alpha = float(options.get('zipf_alpha', self.ZIPF_ALPHA))
+        self.key_distribution = options.get('key_distribution', self.KEY_DISTRIBUTION)
+        self.zipf_theta = float(options.get('zipf_theta', self.ZIPF_THETA))
+        self.hotspot_keys = float(options.get('hotspot_keys', self.HOTSPOT_KEYS))
+        self.hotspot_ops = float(options.get('hotspot_ops', self.HOTSPOT_OPS))
 
         self.size = int(options.get('size', self.SIZE))
         self.items = int(options.get('items', self.ITEMS))
 
+        self.load_profile = []  # Defined in the [load_profile] section
+        self.slo_search = None  # Defined in the [slo_search] section
+
         self.creates = int(options.get('creates', self.CREATES))
         self.reads = int(options.get('reads', self.READS))
         self.updates = int(options.get('updates', self.UPDATES))
@@ -534,16 +640,26 @@ class PhaseSettings:
                                                        self.WORKING_SET_MOVE_DOCS))
         self.workers = int(options.get('workers', self.WORKERS))
         self.async = bool(int(options.get('async', self.ASYNC)))
+        self.open_loop = bool(int(options.get('open_loop', self.OPEN_LOOP)))
+        self.in_flight = int(options.get('in_flight', self.IN_FLIGHT))
+        self.trace_record = options.get('trace_record', self.TRACE_RECORD)
+        self.trace_replay = options.get('trace_replay', self.TRACE_REPLAY)
+        self.trace_offline = bool(int(options.get('trace_offline', self.TRACE_OFFLINE)))
+        self.trace_speed = float(options.get('trace_speed', self.TRACE_SPEED))
+        self.cpu_placement = options.get('cpu_placement', self.CPU_PLACEMENT)
+        self.reserved_cores = int(options.get('reserved_cores', self.RESERVED_CORES))
         self.key_fmtr = options.get('key_fmtr', self.KEY_FMTR)
 
         self.hot_reads = self.HOT_READS
         self.seq_upserts = self.SEQ_UPSERTS
+        self.bulk_load = bool(int(options.get('bulk_load', self.BULK_LOAD)))
 
         self.iterations = int(options.get('iterations', self.ITERATIONS))
 
         self.batch_size = int(options.get('batch_size', self.BATCH_SIZE))
         self.batches = int(options.get('batches', self.BATCHES))
         self.spring_batch_size = int(options.get('spring_batch_size', self.SPRING_BATCH_SIZE))
+        self.multi_batch_size = int(options.get('multi_batch_size', self.MULTI_BATCH_SIZE))
 
         self.workload_instances = int(options.get('workload_instances',
                                                   self.WORKLOAD_INSTANCES))
@@ -559,6 +675,8 @@ class PhaseSettings:
                                              self.QUERY_WORKERS))
         self.query_throughput = float(options.get('query_throughput',
                                                   self.QUERY_THROUGHPUT))
+        self.query_concurrency = int(options.get('query_concurrency',
+                                                 self.QUERY_CONCURRENCY))
 
         # N1QL settings
         self.n1ql_gen = options.get('n1ql_gen')
@@ -569,6 +687,8 @@ class PhaseSettings:
                                                  self.N1QL_THROUGHPUT))
         self.n1ql_batch_size = int(options.get('n1ql_batch_size',
                                                self.N1QL_BATCH_SIZE))
+        self.n1ql_concurrency = int(options.get('n1ql_concurrency',
+                                                self.N1QL_CONCURRENCY))
         self.array_size = int(options.get('array_size', self.ARRAY_SIZE))
         self.num_categories = int(options.get('num_categories',
                                               self.NUM_CATEGORIES))
@@ -648,6 +768,9 @@ class PhaseSettings:
             self.durability = int(options.get('durability', self.DURABILITY))
         else:
             self.durability = self.DURABILITY
+        if self.kv_engine == 'memcached' and (self.persist_to or self.replicate_to):
+            logger.interrupt('The memcached KV engine does not support persist_to and '
+                             'replicate_to, use durability instead')
 
         # YCSB Retry Strategy settings
         self.retry_strategy = options.get('retry_strategy', self.YCSB_RETRY_STRATEGY)
@@ -1276,8 +1399,24 @@ class TestConfig(Config):
         access.field_count = load_settings.field_count
         access.field_length = load_settings.field_length
 
+        access.load_profile = self.load_profile_settings.phases
+
+        slo_search = self.slo_search_settings
+        if slo_search.latency:
+            access.slo_search = slo_search
+
         return access
 
+    @property
+    def load_profile_settings(self) -> LoadProfileSettings:
+        options = self._get_options_as_dict('load_profile')
+        return LoadProfileSettings(options)
+
+    @property
+    def slo_search_settings(self) -> SLOSearchSettings:
+        options = self._get_options_as_dict('slo_search')
+        return SLOSearchSettings(options)
+
     @property
     def rebalance_settings(self) -> RebalanceSettings:
         options = self._get_options_as_dict('rebalance')
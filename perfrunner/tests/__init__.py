@@ -124,6 +124,7 @@ class PerfTest:
     def debug(self) -> str:
         failure = self.check_core_dumps()
         failure = self.check_rebalance() or failure
+        failure = self.check_error_rate() or failure
         return self.check_failover() or failure
 
     def download_certificate(self):
@@ -147,6 +148,11 @@ class PerfTest:
             if num_failovers:
                 return 'Failover happened {} time(s)'.format(num_failovers)
 
+    def check_error_rate(self) -> Optional[str]:
+        max_error_rate = self.test_config.stats_settings.max_error_rate
+        if max_error_rate:
+            return self.metrics.check_error_rate(max_error_rate)
+
     def check_core_dumps(self) -> str:
         dumps_per_host = self.remote.detect_core_dumps()
         core_dumps = {
@@ -75,6 +75,21 @@ class EnhancedDurabilityLatencyTest(ReadLatencyTest):
         self.report_kpi()
 
 
+class ThroughputSLOTest(KVTest):
+
+    """Search for the maximum throughput that meets the latency SLO.
+
+    See the [slo_search] section of the test config.
+    """
+
+    COLLECTORS = {'latency': True}
+
+    def _report_kpi(self):
+        self.reporter.post(
+            *self.metrics.max_throughput_under_slo()
+        )
+
+
 class DGMTest(KVTest):
 
     COLLECTORS = {'disk': True, 'net': False}
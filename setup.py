@@ -17,6 +17,7 @@ setup(
             'perfrunner = perfrunner.__main__:main',
             'recovery = perfrunner.utils.recovery:main',
             'spring = spring.__main__:main',
+            'spring-bench = spring.benchmark:main',
             'stats = perfrunner.utils.stats:main',
             'templater = perfrunner.utils.templater:main',
             'trigger = perfrunner.utils.trigger:main',
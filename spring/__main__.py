@@ -1,5 +1,7 @@
 from argparse import ArgumentParser
 
+from spring.keydist import KEY_DISTRIBUTIONS
+from spring.placement import Placement
 from spring.settings import TargetSettings, WorkloadSettings
 from spring.wgen import WorkloadGen
 
@@ -75,11 +77,61 @@ class CLIParser(ArgumentParser):
             '-g', dest='generator', type=str, default='basic', metavar='',
             help='document generator (e.g., "basic" or "nested")'
         )
+        self.add_argument(
+            '-m', dest='multi_batch_size', type=int, default=0, metavar='',
+            help='number of keys per multi-key operation (disabled by default)'
+        )
         self.add_argument('--async', action='store_true', default=False,
                           help='enable asynchronous mode')
+        self.add_argument('--open-loop', action='store_true', default=False,
+                          help='issue operations at a fixed rate regardless of responses')
+        self.add_argument('--in-flight', dest='in_flight', type=int, default=64,
+                          metavar='', help='maximum number of outstanding operations '
+                                           'in open-loop mode (64 by default)')
+        self.add_argument('--doc-cache', action='store_true', default=False,
+                          help='enable pre-rendered document templates')
+        self.add_argument('--dataset-dir', dest='dataset_dir', type=str, metavar='DIR',
+                          help='load the documents from a pre-generated dataset, '
+                               'which is compiled in the directory if needed')
+        self.add_argument('--kv-engine', dest='kv_engine', type=str, default='sdk',
+                          choices=('sdk', 'memcached'),
+                          help='client of the KV operations, the SDK or the raw memcached '
+                               'protocol ("sdk" by default)')
+        self.add_argument('--trace-record', dest='trace_record', type=str,
+                          metavar='PREFIX',
+                          help='record the operations of every worker to a trace file')
+        self.add_argument('--offline', action='store_true', default=False,
+                          help='only generate the trace, do not connect to the cluster')
+        self.add_argument('--trace-replay', dest='trace_replay', type=str,
+                          metavar='PREFIX',
+                          help='replay the trace files instead of generating operations')
+        self.add_argument('--trace-speed', dest='trace_speed', type=float,
+                          default=1, metavar='',
+                          help='trace replay speed, 0 for no delays (1 by default)')
+        self.add_argument('--cpu-placement', dest='cpu_placement', type=str,
+                          default='none', choices=Placement.POLICIES,
+                          help='pinning of the workers to CPUs ("none" by default)')
+        self.add_argument('--reserved-cores', dest='reserved_cores', type=int,
+                          default=0, metavar='',
+                          help='number of physical cores to keep free of workers')
+        self.add_argument('--key-distribution', dest='key_distribution', type=str,
+                          default='uniform', choices=('uniform',) + KEY_DISTRIBUTIONS,
+                          help='distribution of the existing keys ("uniform" by default)')
+        self.add_argument('--zipf-theta', dest='zipf_theta', type=float,
+                          default=0.99, metavar='',
+                          help='skew of the zipfian distributions (0.99 by default)')
+        self.add_argument('--hotspot-keys', dest='hotspot_keys', type=float,
+                          default=20, metavar='',
+                          help='percentage of hot keys (20 by default)')
+        self.add_argument('--hotspot-ops', dest='hotspot_ops', type=float,
+                          default=80, metavar='',
+                          help='percentage of operations on hot keys (80 by default)')
 
     def parse_args(self, *args):
-        args = super().parse_args()
+        args = super().parse_args(*args)
+
+        if args.trace_replay:  # The operations are defined by the trace
+            return args
 
         percentages = [args.creates, args.reads, args.updates, args.deletes]
         if list(filter(lambda p: not 0 <= p <= 100, percentages)) or \
@@ -92,6 +144,9 @@ class CLIParser(ArgumentParser):
         if not 0 <= args.working_set_access <= 100:
             self.error('Invalid access percentage [-W].')
 
+        if args.offline and not args.trace_record:
+            self.error('Offline mode [--offline] requires --trace-record')
+
         if (args.reads or args.updates) and not args.items:
             self.error('Trying to read/update indefinite dataset. '
                        'Please specify number of items in dataset (-i)')
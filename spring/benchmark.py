@@ -0,0 +1,474 @@
+import gc
+import json
+import random
+import resource
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from argparse import SUPPRESS, ArgumentParser
+from itertools import cycle
+from multiprocessing import Value
+from types import SimpleNamespace
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from logger import logger
+from spring.docgen import (
+    Key,
+    KeyForRemoval,
+    MovingWorkingSetKey,
+    NewOrderedKey,
+    PowerKey,
+    UniformKey,
+    WorkingSetKey,
+    ZipfKey,
+    decimal_fmtr,
+    format_keys,
+    hash_fmtr,
+    hex_fmtr,
+)
+from spring.generators import DOC_GENERATORS, new_doc_generator
+from spring.keydist import KEY_DISTRIBUTIONS, new_distribution_key
+
+KEY_FORMATTERS = {
+    'decimal': decimal_fmtr,
+    'hash': hash_fmtr,
+    'hex': hex_fmtr,
+}
+
+PREFIX = 'bench'
+
+BATCH_SIZE = 1000  # Keys per next_batch() call
+
+MEMORY_CALLS = 1000  # Calls whose results are kept alive to measure memory
+
+KEY_GENERATORS = (
+    'uniform', 'working_set', 'moving_working_set', 'power', 'zipf',
+) + KEY_DISTRIBUTIONS
+
+N1QL_QUERIES = [
+    {'statement': 'SELECT * FROM `bucket-1` USE KEYS[$1];', 'args': '["{key}"]'},
+    {'statement': 'SELECT name AS _name, street AS _street FROM `bucket-1` '
+                  'WHERE capped_small=$1 ORDER BY _name LIMIT 10;',
+     'args': '["{capped_small}"]'},
+    {'statement': 'SELECT email FROM `bucket-1` WHERE coins BETWEEN $1 AND $2;',
+     'args': '[{coins}, {coins} + 100]', 'scan_consistency': 'request_plus'},
+]
+
+# Benchmark: function that performs one call, number of operations per call
+Benchmark = Tuple[Callable[[], object], int]
+
+
+def keys_per_sec(method: Callable, num_keys: int) -> float:
+    t0 = time.time()
+    method(num_keys)
+    return num_keys / (time.time() - t0)
+
+
+def key_formatters(num_keys: int):
+    """Compare per-key and bulk key formatting.
+
+    A create or update reads the key string at least twice (for the document
+    and for the SDK call). Previously each access re-ran the formatter, now the
+    keys of a batch are formatted in one pass and memoized.
+    """
+    for fmtr, fmtr_func in sorted(KEY_FORMATTERS.items()):
+        def per_key(n: int):
+            for number in range(n):
+                key = Key(number, PREFIX, fmtr)
+                fmtr_func(key.number, key.prefix)
+                fmtr_func(key.number, key.prefix)
+
+        def bulk(n: int):
+            numbers = list(range(n))
+            strings = format_keys(numbers, PREFIX, fmtr)
+            for number, string in zip(numbers, strings):
+                key = Key(number, PREFIX, fmtr, string=string)
+                key.string
+                key.string
+
+        before = keys_per_sec(per_key, num_keys)
+        after = keys_per_sec(bulk, num_keys)
+        logger.info('Key formatter: {}, before: {:.0f} keys/sec, '
+                    'after: {:.0f} keys/sec ({:.1f}x)'
+                    .format(fmtr, before, after, after / before))
+
+
+STARTUP_SCRIPT = """
+import json, resource, sys, time
+from types import SimpleNamespace
+
+t0 = time.time()
+import spring.wgen
+from spring.docgen import Key
+from spring.generators import new_doc_generator
+t1 = time.time()
+import_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+ws = SimpleNamespace(size=1024, items=10 ** 6, range_distance=100,
+                     num_categories=10, num_replies=10, array_size=10,
+                     item_size=64, size_variation_min=1, size_variation_max=1024)
+ts = SimpleNamespace(prefix='bench')
+docs = new_doc_generator(sys.argv[1], ws, ts)
+docs.next(Key(0, 'bench', 'decimal'))
+t2 = time.time()
+
+print(json.dumps({
+    'import_time': t1 - t0,
+    'init_time': t2 - t1,
+    'import_rss': import_rss,
+    'rss': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+}))
+"""
+
+
+def startup(doc_gens: List[str], num_runs: int):
+    """Measure the start-up cost of a worker process.
+
+    Every run imports the workload generator in a fresh interpreter, creates
+    the document generator and generates the first document. The maximum RSS
+    is reported in MB.
+    """
+    for doc_gen in doc_gens:
+        runs = []
+        for _ in range(num_runs):
+            output = subprocess.check_output([sys.executable, '-c', STARTUP_SCRIPT, doc_gen])
+            runs.append(json.loads(output.decode().splitlines()[-1]))
+
+        def median(metric: str) -> float:
+            return statistics.median(run[metric] for run in runs)
+
+        logger.info('Start-up: {}, import: {:.1f} ms ({:.1f} MB), '
+                    'first document: {:.1f} ms ({:.1f} MB)'
+                    .format(doc_gen,
+                            median('import_time') * 1000, median('import_rss') / 1024,
+                            median('init_time') * 1000, median('rss') / 1024))
+
+
+STANDIN_PHASES = [
+    ('kv', {'reads': 50, 'updates': 50}),
+    ('subdoc', {'reads': 50, 'updates': 50, 'subdoc_field': 'name'}),
+    ('async', {'reads': 50, 'updates': 50, 'async': 1}),
+]
+
+
+def free_ports(n: int) -> List[int]:
+    sockets = [socket.socket() for _ in range(n)]
+    for sock in sockets:
+        sock.bind(('127.0.0.1', 0))
+    ports = [sock.getsockname()[1] for sock in sockets]
+    for sock in sockets:
+        sock.close()
+    return ports
+
+
+def client_cpu_time() -> float:
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def run_phase(ws, ts) -> tuple:
+    """Run the workers to completion, return the wall and client CPU time."""
+    from spring.wgen import WorkloadGen
+
+    t0, cpu0 = time.time(), client_cpu_time()
+    WorkloadGen(ws, ts).run()
+    return time.time() - t0, client_cpu_time() - cpu0
+
+
+def standin(num_items: int, num_ops: int, num_workers: int, latency: float, kv_engine: str):
+    """Drive the KV, sub-document and async workers against the stand-in.
+
+    The stand-in serves the memcached protocol from a separate process, so
+    the client side can be profiled without a cluster. The CPU time of the
+    workers is taken from the resource usage of the terminated child
+    processes, the throughput per core is the number of operations divided
+    by that time.
+    """
+    from perfrunner.settings import LoadSettings, PhaseSettings, TargetSettings
+
+    kv_port, rest_port = free_ports(2)
+    server = subprocess.Popen([sys.executable, '-m', 'spring.standin',
+                               '--port', str(kv_port), '--rest-port', str(rest_port),
+                               '--latency', str(latency)])
+    try:
+        time.sleep(1)
+        ts = TargetSettings('127.0.0.1:{}'.format(kv_port), 'bucket-1', 'password', PREFIX)
+        run_phase(LoadSettings({'items': num_items, 'workers': num_workers,
+                                'kv_engine': kv_engine}), ts)
+
+        for name, options in STANDIN_PHASES:
+            options.update(items=num_items, ops=num_ops, workers=num_workers,
+                           kv_engine=kv_engine)
+            wall_time, cpu_time = run_phase(PhaseSettings(options), ts)
+            logger.info('Stand-in: {}, throughput: {:.0f} ops/sec, '
+                        'client CPU: {:.1f} cores, {:.0f} ops/sec per core'
+                        .format(name, num_ops / wall_time, cpu_time / wall_time,
+                                num_ops / cpu_time))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def workload_settings(**kwargs) -> SimpleNamespace:
+    settings = dict(
+        size=1024, items=10 ** 6, key_fmtr='decimal', workers=1, n1ql_workers=1,
+        range_distance=100, num_categories=10, num_replies=10, array_size=10,
+        item_size=64, size_variation_min=1, size_variation_max=1024,
+        working_set=20, working_set_access=90, working_set_moving_docs=10 ** 4,
+        power_alpha=100, zipf_alpha=1.5, zipf_theta=0.99, hotspot_keys=20, hotspot_ops=80,
+        doc_gen='reverse_lookup',
+    )
+    settings.update(kwargs)
+    return SimpleNamespace(**settings)
+
+
+def benchmark_names() -> List[str]:
+    names = ['doc/{}'.format(doc_gen) for doc_gen in sorted(DOC_GENERATORS)]
+    names += ['key/new_ordered', 'key/removal']
+    for key_gen in KEY_GENERATORS:
+        names += ['key/{}'.format(key_gen), 'key/{}_batch'.format(key_gen)]
+    names += ['query/n1ql', 'query/view']
+    return names
+
+
+def new_doc_benchmark(doc_gen: str, ws: SimpleNamespace) -> Benchmark:
+    """Generate the documents of pre-formatted keys, as the KV workers do."""
+    docs = new_doc_generator(doc_gen, ws, SimpleNamespace(prefix=PREFIX))
+    numbers = range(BATCH_SIZE)
+    keys = cycle([Key(number=number, prefix=PREFIX, fmtr=ws.key_fmtr, string=string)
+                  for number, string in zip(numbers,
+                                            format_keys(numbers, PREFIX, ws.key_fmtr))])
+    return lambda: docs.next(next(keys)), 1
+
+
+def new_key_generator(key_gen: str, ws: SimpleNamespace):
+    if key_gen == 'uniform':
+        return UniformKey(PREFIX, ws.key_fmtr)
+    if key_gen == 'working_set':
+        return WorkingSetKey(ws, PREFIX)
+    if key_gen == 'moving_working_set':
+        return MovingWorkingSetKey(ws, PREFIX)
+    if key_gen == 'power':
+        return PowerKey(PREFIX, ws.key_fmtr, ws.power_alpha)
+    if key_gen == 'zipf':
+        return ZipfKey(PREFIX, ws.key_fmtr, ws.zipf_alpha)
+    ws.key_distribution = key_gen
+    return new_distribution_key(ws, PREFIX)
+
+
+def new_key_benchmark(key_gen: str, ws: SimpleNamespace) -> Benchmark:
+    """Sample existing keys from a key space with 10% of the keys deleted."""
+    curr_items, curr_deletes = ws.items, ws.items // 10
+    if key_gen == 'new_ordered':
+        keys = NewOrderedKey(PREFIX, ws.key_fmtr)
+        return lambda: keys.next(curr_items).string, 1
+    if key_gen == 'removal':
+        keys = KeyForRemoval(PREFIX, ws.key_fmtr)
+        return lambda: keys.next(curr_deletes).string, 1
+
+    args = curr_items, curr_deletes, Value('L', 0), Value('I', 0)
+    if key_gen.endswith('_batch'):
+        keys = new_key_generator(key_gen[:-len('_batch')], ws)
+        return lambda: keys.next_batch(BATCH_SIZE, *args), BATCH_SIZE
+    keys = new_key_generator(key_gen, ws)
+    return lambda: keys.next(*args).string, 1
+
+
+def new_query_benchmark(query_gen: str, ws: SimpleNamespace) -> Benchmark:
+    """Generate the queries of the documents, as the query workers do."""
+    from spring.querygen import N1QLQueryGen, ViewQueryGen
+
+    if query_gen == 'n1ql':
+        docs = new_doc_generator(ws.doc_gen, ws, SimpleNamespace(prefix=PREFIX))
+        queries = N1QLQueryGen(N1QL_QUERIES)
+    else:
+        docs = new_doc_generator('basic', ws, SimpleNamespace(prefix=PREFIX))
+        views = {name: {} for name in ViewQueryGen.QUERIES_PER_VIEW}
+        queries = ViewQueryGen({'ddoc': {'views': views}}, params={})
+
+    keys = [Key(number=number, prefix=PREFIX, fmtr=ws.key_fmtr)
+            for number in range(BATCH_SIZE)]
+    pairs = cycle([(key.string, docs.next(key)) for key in keys])
+
+    if query_gen == 'n1ql':
+        return lambda: queries.next(*next(pairs)), 1
+    return lambda: queries.next(next(pairs)[1]), 1
+
+
+def new_benchmark(name: str) -> Benchmark:
+    kind, target = name.split('/')
+    ws = workload_settings()
+    if kind == 'doc':
+        return new_doc_benchmark(target, ws)
+    if kind == 'key':
+        return new_key_benchmark(target, ws)
+    if kind == 'query':
+        return new_query_benchmark(target, ws)
+    raise ValueError('Unknown benchmark: {}'.format(name))
+
+
+def measure(name: str, duration: float) -> dict:
+    """Run a single benchmark in the current process.
+
+    The throughput is measured first. Then the results of MEMORY_CALLS calls
+    are kept alive to count the memory blocks (sys.getallocatedblocks) and
+    bytes (tracemalloc) allocated for them, which excludes the temporary
+    objects freed within a call. The RSS is the peak of the whole process,
+    including the generator set-up.
+    """
+    random.seed(0)
+    np.random.seed(0)
+    op, ops_per_call = new_benchmark(name)
+    op()  # Warm-up
+
+    calls = 0
+    t0 = time.perf_counter()
+    while True:
+        for _ in range(100):
+            op()
+        calls += 100
+        elapsed = time.perf_counter() - t0
+        if elapsed >= duration:
+            break
+
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    results = [op() for _ in range(MEMORY_CALLS)]
+    blocks = sys.getallocatedblocks() - blocks
+    del results
+
+    tracemalloc.start()
+    results = [op() for _ in range(MEMORY_CALLS)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+
+    num_ops = MEMORY_CALLS * ops_per_call
+    return {
+        'name': name,
+        'ops_per_sec': calls * ops_per_call / elapsed,
+        'allocs_per_op': blocks / num_ops,
+        'bytes_per_op': size / num_ops,
+        'rss': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+    }
+
+
+def run_benchmark(name: str, duration: float) -> dict:
+    """Run the benchmark in a fresh interpreter to isolate its RSS."""
+    cmd = [sys.executable, '-m', 'spring.benchmark', '--single', name,
+           '-t', str(duration)]
+    process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if process.returncode:
+        error = process.stderr.decode().strip().splitlines() or ['exit code {}'.format(
+            process.returncode)]
+        return {'name': name, 'error': error[-1]}
+    return json.loads(process.stdout.decode().splitlines()[-1])
+
+
+def compare(results: List[dict], baseline_file: str):
+    with open(baseline_file) as fh:
+        baseline = {result['name']: result for result in json.load(fh)['results']}
+
+    for result in results:
+        before = baseline.get(result['name'], {})
+        if 'ops_per_sec' not in result or 'ops_per_sec' not in before:
+            continue
+        logger.info('{}: {:.0f} -> {:.0f} ops/sec ({:+.1f}%), '
+                    '{:.1f} -> {:.1f} allocs/op'
+                    .format(result['name'], before['ops_per_sec'], result['ops_per_sec'],
+                            100 * (result['ops_per_sec'] / before['ops_per_sec'] - 1),
+                            before['allocs_per_op'], result['allocs_per_op']))
+
+
+def suite(names: List[str], duration: float, output: str, baseline: str = None):
+    """Run the document, key and query generator benchmarks.
+
+    Every benchmark runs in a fresh interpreter. The results are saved to a
+    JSON file, which can serve as the baseline of a later run.
+    """
+    results = []
+    for name in names:
+        result = run_benchmark(name, duration)
+        if 'error' in result:
+            logger.warn('{}: failed, {}'.format(name, result['error']))
+        else:
+            logger.info('{}: {:.0f} ops/sec, {:.1f} allocs/op, {:.0f} bytes/op, '
+                        'RSS: {:.1f} MB'
+                        .format(name, result['ops_per_sec'], result['allocs_per_op'],
+                                result['bytes_per_op'], result['rss'] / 2 ** 20))
+        results.append(result)
+
+    with open(output, 'w') as fh:
+        json.dump({'python': sys.version.split()[0], 'duration': duration,
+                   'results': results}, fh, indent=4, sort_keys=True)
+    logger.info('Results saved to {}'.format(output))
+
+    if baseline:
+        compare(results, baseline)
+
+
+def main():
+    parser = ArgumentParser(prog='spring-bench')
+    parser.add_argument('-n', dest='num_keys', type=int, default=10 ** 6,
+                        help='number of keys per formatter (10^6 by default)')
+    parser.add_argument('--startup', action='store_true', default=False,
+                        help='measure the import time and RSS of a worker instead')
+    parser.add_argument('-g', dest='doc_gens', type=str, default='basic,large,package',
+                        help='comma-separated document generators for --startup')
+    parser.add_argument('-r', dest='num_runs', type=int, default=5,
+                        help='number of --startup runs per generator (5 by default)')
+    parser.add_argument('--standin', action='store_true', default=False,
+                        help='measure the client throughput against the stand-in instead')
+    parser.add_argument('-i', dest='num_items', type=int, default=10 ** 5,
+                        help='number of items for --standin (10^5 by default)')
+    parser.add_argument('-o', dest='num_ops', type=int, default=10 ** 6,
+                        help='number of operations per --standin phase (10^6 by default)')
+    parser.add_argument('-w', dest='num_workers', type=int, default=4,
+                        help='number of workers for --standin (4 by default)')
+    parser.add_argument('--kv-engine', dest='kv_engine', type=str, default='sdk',
+                        choices=('sdk', 'memcached'),
+                        help='client of the KV operations for --standin ("sdk" by default)')
+    parser.add_argument('--latency', type=float, default=0,
+                        help='latency injected by the stand-in in milliseconds')
+    parser.add_argument('--suite', action='store_true', default=False,
+                        help='run the document, key and query generator benchmarks instead')
+    parser.add_argument('-b', dest='benchmarks', type=str, default='',
+                        help='comma-separated benchmarks or prefixes for --suite, '
+                             'e.g. doc/,key/zipf (all by default)')
+    parser.add_argument('-t', dest='duration', type=float, default=1,
+                        help='duration of each --suite benchmark in seconds (1 by default)')
+    parser.add_argument('--output', type=str, default='spring-bench.json',
+                        help='output file of --suite (spring-bench.json by default)')
+    parser.add_argument('-c', dest='baseline', type=str,
+                        help='compare the --suite results with the output of a previous run')
+    parser.add_argument('--list', action='store_true', default=False,
+                        help='list the --suite benchmarks and exit')
+    parser.add_argument('--single', type=str, help=SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        print(json.dumps(measure(args.single, args.duration)))
+    elif args.suite or args.list:
+        names = benchmark_names()
+        if args.benchmarks:
+            prefixes = tuple(args.benchmarks.split(','))
+            names = [name for name in names if name.startswith(prefixes)]
+        if args.list:
+            print('\n'.join(names))
+        else:
+            suite(names, args.duration, args.output, args.baseline)
+    elif args.startup:
+        startup(args.doc_gens.split(','), args.num_runs)
+    elif args.standin:
+        standin(args.num_items, args.num_ops, args.num_workers, args.latency, args.kv_engine)
+    else:
+        key_formatters(args.num_keys)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,10 @@
+import json
 import random
 from collections import defaultdict
-from threading import Timer
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore, Lock, Timer, local
 from time import sleep, time
-from typing import Callable
+from typing import Callable, List, Optional, Tuple, Union
 from urllib import parse
 
 from decorator import decorator
@@ -11,16 +13,18 @@ from txcouchbase.connection import Connection as TxConnection
 from logger import logger
 
 try:
-    from couchbase import experimental, subdocument
+    from couchbase import FMT_JSON, experimental, subdocument
     from couchbase.bucket import Bucket
     from couchbase.exceptions import CouchbaseError, TemporaryFailError
     from couchbase.n1ql import N1QLQuery
+    from couchbase.transcoder import Transcoder
     from couchbase.views.params import ViewQuery
 except ImportError:
-    from couchbase_v2 import experimental, subdocument
+    from couchbase_v2 import FMT_JSON, experimental, subdocument
     from couchbase_v2.bucket import Bucket
     from couchbase_v2.exceptions import CouchbaseError, TemporaryFailError
     from couchbase_v2.n1ql import N1QLQuery
+    from couchbase_v2.transcoder import Transcoder
     from couchbase_v2.views.params import ViewQuery
 
 
@@ -29,6 +33,15 @@ experimental.enable()
 
 class ErrorTracker:
 
+    """Throttle the error warnings and collect the error statistics.
+
+    Besides the warnings, every worker process keeps per-second counters of
+    the successful requests by operation, the errors by operation and
+    exception class, the retries of temporary failures and the time spent in
+    backoff (in seconds). The counters are dumped as a time series at the end
+    of the workload.
+    """
+
     MSG = 'Function: {}, error: {}'
 
     MSG_REPEATED = 'Function: {}, error: {}, repeated {} times'
@@ -37,15 +50,34 @@ class ErrorTracker:
 
     def __init__(self):
         self.errors = defaultdict(int)
+        self.telemetry = None
+        self.lock = Lock()
+        self.stats = defaultdict(lambda: defaultdict(float))
 
     def track(self, method: str, exc: CouchbaseError):
         if type(exc) not in self.errors:
             self.warn(method, exc)  # Always warn upon the first occurrence
             self.check_later(method, exc)
         self.incr(exc)
+        self.count('errors_{}_{}'.format(method, type(exc).__name__))
+
+    def succeed(self, method: str, count: int = 1):
+        """Count the successful requests, e.g., the keys of a multi-key call."""
+        self.count('ops_{}'.format(method), count)
+
+    def retry(self, method: str, delay: float):
+        """Count a retry of a temporary failure after the given delay."""
+        self.count('retries_{}'.format(method))
+        self.count('backoff_{}'.format(method), delay)
+
+    def count(self, metric: str, value: float = 1):
+        with self.lock:
+            self.stats[int(time())][metric] += value
 
     def incr(self, exc: CouchbaseError):
         self.errors[type(exc)] += 1
+        if self.telemetry is not None:
+            self.telemetry.add_error()
 
     def reset(self, exc: CouchbaseError):
         self.errors[type(exc)] = 0
@@ -70,16 +102,35 @@ class ErrorTracker:
         else:  # Not repeated, hence stop tracking it
             self.errors.pop(type(exc))
 
+    def dump(self, filename: str, bucket: str):
+        """Write the per-second error statistics to a JSON file."""
+        with self.lock:
+            samples = [dict(stats, timestamp=timestamp)
+                       for timestamp, stats in sorted(self.stats.items())]
+        with open(filename, 'w') as fh:
+            json.dump({'bucket': bucket, 'samples': samples}, fh)
+
 
 error_tracker = ErrorTracker()
 
 
+def error_log(worker: str, sid: int) -> str:
+    """Return the name of the error statistics file of a worker.
+
+    The name must not match the pattern of the histogram logs (*-worker-*).
+    """
+    return 'spring-errors-{}.{}.json'.format(worker, sid)
+
+
 @decorator
 def quiet(method: Callable, *args, **kwargs):
     try:
-        return method(*args, **kwargs)
+        result = method(*args, **kwargs)
     except CouchbaseError as e:
         error_tracker.track(method.__name__, e)
+    else:
+        error_tracker.succeed(method.__name__)
+        return result
 
 
 @decorator
@@ -89,6 +140,7 @@ def backoff(method: Callable, *args, **kwargs):
         try:
             return method(*args, **kwargs)
         except TemporaryFailError:
+            error_tracker.retry(method.__name__, retry_delay)
             sleep(retry_delay)
             # Increase exponentially with jitter
             retry_delay *= 1 + 0.1 * random.random()
@@ -101,6 +153,69 @@ def timeit(method: Callable, *args, **kwargs) -> float:
     return time() - t0
 
 
+def retry_multi(method: Callable, items: Union[list, dict], **kwargs) -> Optional[float]:
+    """Execute a multi-key operation and return its latency.
+
+    Similar to the backoff decorator, temporary failures are retried with
+    exponential backoff but only for the failed items, and only the last
+    attempt is timed. The successful items and the other errors are counted
+    per item, just like in the quiet decorator. None is returned if no item
+    succeeded.
+    """
+    retry_delay = 0.1
+    succeeded = 0
+    while True:
+        t0 = time()
+        try:
+            method(items, **kwargs)
+            error_tracker.succeed(method.__name__, succeeded + len(items))
+            return time() - t0
+        except CouchbaseError as e:
+            latency = time() - t0
+            if e.all_results is None:  # The entire operation failed
+                error_tracker.track(method.__name__, e)
+                return
+
+            failures = e.split_results()[1]
+            succeeded += len(items) - len(failures)
+            retries = set()
+            for key, result in failures.items():
+                exc_type = CouchbaseError.rc_to_exctype(result.rc)
+                if issubclass(exc_type, TemporaryFailError):
+                    retries.add(key)
+                else:
+                    error_tracker.track(method.__name__,
+                                        exc_type({'rc': result.rc, 'key': key}))
+
+        if isinstance(items, dict):
+            items = {key: items[key] for key in retries}
+        else:
+            items = [key for key in items if key in retries]
+        if not items:
+            if not succeeded:
+                return
+            error_tracker.succeed(method.__name__, succeeded)
+            return latency
+
+        error_tracker.retry(method.__name__, retry_delay)
+        sleep(retry_delay)
+        retry_delay *= 1 + 0.1 * random.random()
+
+
+class RawJSONTranscoder(Transcoder):
+
+    """Store pre-serialized JSON documents as is, with the JSON flags.
+
+    The SDK readers decode such documents the same way as the documents
+    serialized by the default transcoder.
+    """
+
+    def encode_value(self, value, format):
+        if isinstance(value, bytes):
+            return value, FMT_JSON
+        return super().encode_value(value, format)
+
+
 class CBAsyncGen:
 
     TIMEOUT = 60  # seconds
@@ -140,11 +255,33 @@ class CBAsyncGen:
         return self.client.remove(key)
 
 
+class CBAIOGen(CBAsyncGen):
+
+    """Same as CBAsyncGen but with futures of the asyncio event loop."""
+
+    def __init__(self, raw_docs: bool = False, **kwargs):
+        from acouchbase.bucket import Bucket as AIOBucket
+
+        connection_string = 'couchbase://{host}/{bucket}?password={password}'
+        connection_string = connection_string.format(host=kwargs['host'],
+                                                     bucket=kwargs['bucket'],
+                                                     password=kwargs['password'])
+
+        self.client = AIOBucket(connection_string=connection_string)
+        self.client.timeout = self.TIMEOUT
+        if raw_docs:
+            self.client.transcoder = RawJSONTranscoder()
+
+    def connect(self):
+        return self.client.connect()
+
+
 class CBGen(CBAsyncGen):
 
     TIMEOUT = 10  # seconds
 
-    def __init__(self, ssl_mode: str = 'none', n1ql_timeout: int = None, **kwargs):
+    def __init__(self, ssl_mode: str = 'none', n1ql_timeout: int = None,
+                 raw_docs: bool = False, **kwargs):
 
         connection_string = 'couchbase://{host}/{bucket}?password={password}&{params}'
         connstr_params = parse.urlencode(kwargs["connstr_params"])
@@ -163,6 +300,8 @@ class CBGen(CBAsyncGen):
         self.client.timeout = self.TIMEOUT
         if n1ql_timeout:
             self.client.n1ql_timeout = n1ql_timeout
+        if raw_docs:
+            self.client.transcoder = RawJSONTranscoder()
         logger.info("Connection string: {}".format(connection_string))
 
     @quiet
@@ -197,14 +336,48 @@ class CBGen(CBAsyncGen):
     def delete(self, *args, **kwargs):
         super().delete(*args, **kwargs)
 
+    def read_multi(self, args: List[Tuple]) -> Optional[float]:
+        keys = [key for key, *_ in args]
+        return retry_multi(self.client.get_multi, keys)
+
+    def update_multi(self, args: List[Tuple]) -> Optional[float]:
+        _, _, persist_to, replicate_to, ttl = args[0]
+        docs = {key: doc for key, doc, *_ in args}
+        return retry_multi(self.client.upsert_multi, docs,
+                           persist_to=persist_to,
+                           replicate_to=replicate_to,
+                           ttl=ttl)
+
+    def update_durable_multi(self, args: List[Tuple]) -> Optional[float]:
+        _, _, durability, ttl = args[0]
+        docs = {key: doc for key, doc, *_ in args}
+        return retry_multi(self.client.upsert_multi, docs,
+                           durability_level=durability,
+                           ttl=ttl)
+
+    def delete_multi(self, args: List[Tuple]) -> Optional[float]:
+        keys = [key for key, *_ in args]
+        return retry_multi(self.client.remove_multi, keys)
+
     @timeit
     def view_query(self, ddoc: str, view: str, query: ViewQuery):
-        tuple(self.client.query(ddoc, view, query=query))
+        for _ in self.client.query(ddoc, view, query=query):  # Stream the rows
+            pass
 
     @quiet
-    @timeit
-    def n1ql_query(self, query: N1QLQuery):
-        tuple(self.client.n1ql_query(query))
+    def n1ql_query(self, query: N1QLQuery) -> Tuple[float, float]:
+        """Stream the result rows and return the time to the first row and
+        the total query time.
+
+        Non-ad-hoc queries are prepared and cached by the SDK.
+        """
+        t0 = time()
+        time_to_first_row = None
+        for _ in self.client.n1ql_query(query):
+            if time_to_first_row is None:
+                time_to_first_row = time() - t0
+        latency = time() - t0
+        return time_to_first_row or latency, latency
 
 
 class SubDocGen(CBGen):
@@ -234,3 +407,48 @@ class SubDocGen(CBGen):
                                                       value=doc,
                                                       xattr=True,
                                                       create_parents=True))
+
+
+class QueryPool:
+
+    """Run the queries of a worker with a bounded number of them in flight.
+
+    Every thread of the pool opens its own connection. The SDK releases the
+    GIL while waiting for the responses, so the queries are executed
+    concurrently. With a single slot, the queries run inline using the main
+    connection of the worker.
+    """
+
+    def __init__(self, size: int, client: CBGen, new_client: Callable[[], CBGen]):
+        self.client = client
+        self.new_client = new_client
+        self.slots = BoundedSemaphore(size)
+        self.local = local()
+        self.executor = None
+        if size > 1:
+            self.executor = ThreadPoolExecutor(max_workers=size)
+
+    def submit(self, func: Callable, *args):
+        """Call func(client, *args) as soon as there is a free slot."""
+        if self.executor is None:
+            func(self.client, *args)
+            return
+
+        self.slots.acquire()
+        self.executor.submit(self.run, func, *args)
+
+    def run(self, func: Callable, *args):
+        try:
+            client = getattr(self.local, 'client', None)
+            if client is None:
+                client = self.local.client = self.new_client()
+            func(client, *args)
+        except Exception as e:
+            logger.warn('Query failed: {}'.format(e))
+        finally:
+            self.slots.release()
+
+    def shutdown(self):
+        """Wait for the outstanding queries."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
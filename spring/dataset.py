@@ -0,0 +1,197 @@
+import fcntl
+import hashlib
+import json
+import mmap
+import os
+import random
+import shutil
+import struct
+import time
+from multiprocessing import Process
+from typing import List
+
+import numpy as np
+
+from logger import logger
+from spring.docgen import Key, format_keys
+from spring.generators import DOC_GENERATORS, new_doc_generator
+
+
+class Dataset:
+
+    """Pre-generated documents stored in a memory-mapped file.
+
+    The file starts with a header (magic string, number of documents and the
+    length of the config), followed by the JSON config the dataset was
+    compiled from, an array of (items + 1) document offsets and the serialized
+    documents of all keys in key number order. All workers map the same file,
+    so they share the physical pages, and looking up a document costs a copy
+    of its bytes instead of generating it.
+    """
+
+    MAGIC = b'SPRDATA1'
+
+    HEADER = struct.Struct('<8sQI')
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        with open(filename, 'rb') as fh:
+            self.data = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.items, config_size = self.HEADER.unpack_from(self.data)
+        if magic != self.MAGIC:
+            raise ValueError('Not a dataset file: {}'.format(filename))
+        config_offset = self.HEADER.size
+        self.config = json.loads(
+            self.data[config_offset:config_offset + config_size].decode())
+
+        index_offset = self.index_offset(config_size)
+        self.offsets = memoryview(self.data)[
+            index_offset:index_offset + 8 * (self.items + 1)].cast('Q')
+        if self.offsets[-1] != len(self.data):
+            raise ValueError('Truncated dataset file: {}'.format(filename))
+
+    @classmethod
+    def index_offset(cls, config_size: int) -> int:
+        offset = cls.HEADER.size + config_size
+        return offset + -offset % 8  # The offsets are 8-byte aligned
+
+    def __len__(self) -> int:
+        return self.items
+
+    def next(self, key: Key) -> bytes:
+        return self.data[self.offsets[key.number]:self.offsets[key.number + 1]]
+
+
+def serialize(doc) -> bytes:
+    """Encode the document the same way as the JSON transcoder of the SDK."""
+    if isinstance(doc, bytes):  # Already serialized, e.g. by the DocumentCache
+        return doc
+    return json.dumps(doc, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+def dataset_config(ws, ts) -> dict:
+    """Return everything that affects the content of the dataset.
+
+    Besides the common settings, the config includes all constructor
+    arguments of the document generator.
+    """
+    config = {
+        'doc_gen': ws.doc_gen,
+        'items': ws.items,
+        'key_fmtr': ws.key_fmtr,
+        'prefix': ts.prefix,
+        'size': ws.size,
+    }
+    for param in DOC_GENERATORS.get(ws.doc_gen, (None, ()))[1]:
+        if param != 'prefix':
+            config[param] = getattr(ws, param)
+    return config
+
+
+def dataset_file(ws, ts) -> str:
+    config = json.dumps(dataset_config(ws, ts), sort_keys=True)
+    config_hash = hashlib.sha1(config.encode()).hexdigest()[:16]
+    return os.path.join(ws.dataset_dir, '{}-{}.dataset'.format(ws.doc_gen, config_hash))
+
+
+def generate_part(ws, ts, filename: str, first: int, last: int, seed: int):
+    """Write the documents of the [first, last) key range and their sizes."""
+    random.seed(seed)
+    np.random.seed(seed)
+    docs = new_doc_generator(ws.doc_gen, ws, ts)
+    sizes = np.empty(last - first, dtype='<u8')
+    batch_size = 10 ** 4
+
+    with open(filename, 'wb') as fh:
+        for start in range(first, last, batch_size):
+            numbers = range(start, min(start + batch_size, last))
+            strings = format_keys(numbers, ts.prefix, ws.key_fmtr)
+            for number, string in zip(numbers, strings):
+                doc = serialize(docs.next(Key(number=number, prefix=ts.prefix,
+                                              fmtr=ws.key_fmtr, string=string)))
+                fh.write(doc)
+                sizes[number - first] = len(doc)
+    sizes.tofile(filename + '.sizes')
+
+
+def compile_dataset(ws, ts, filename: str, num_parts: int):
+    """Generate all documents in parallel and assemble the dataset file.
+
+    Every process generates a contiguous key range into a separate part file
+    with a fixed seed, so the same config and number of parts always produce
+    the same dataset.
+    """
+    config = dataset_config(ws, ts)
+    config_data = json.dumps(config, sort_keys=True).encode()
+    seed = int(hashlib.sha1(config_data).hexdigest()[:8], 16)
+
+    bounds = np.linspace(0, ws.items, num_parts + 1).astype(int).tolist()
+    parts = ['{}.part{}'.format(filename, i) for i in range(num_parts)]
+    processes = []
+    for i, part in enumerate(parts):
+        process = Process(target=generate_part,
+                          args=(ws, ts, part, bounds[i], bounds[i + 1], seed + i))
+        process.start()
+        processes.append(process)
+    for process in processes:
+        process.join()
+    if any(process.exitcode for process in processes):
+        remove_files(parts)
+        raise RuntimeError('Failed to compile dataset {}'.format(filename))
+
+    sizes = np.concatenate([np.fromfile(part + '.sizes', dtype='<u8') for part in parts])
+    index_offset = Dataset.index_offset(len(config_data))
+    data_offset = index_offset + 8 * (ws.items + 1)
+    offsets = np.zeros(ws.items + 1, dtype='<u8')
+    np.cumsum(sizes, out=offsets[1:])
+    offsets += data_offset
+
+    tmp_file = filename + '.tmp'
+    with open(tmp_file, 'wb') as fh:
+        fh.write(Dataset.HEADER.pack(Dataset.MAGIC, ws.items, len(config_data)))
+        fh.write(config_data)
+        fh.write(b'\0' * (index_offset - fh.tell()))
+        offsets.tofile(fh)
+        for part in parts:
+            with open(part, 'rb') as part_fh:
+                shutil.copyfileobj(part_fh, fh)
+    os.replace(tmp_file, filename)
+    remove_files(parts)
+
+
+def remove_files(parts: List[str]):
+    for part in parts:
+        for filename in part, part + '.sizes':
+            if os.path.exists(filename):
+                os.remove(filename)
+
+
+def is_valid(filename: str, config: dict) -> bool:
+    try:
+        return Dataset(filename).config == config
+    except (OSError, ValueError, struct.error):
+        return False
+
+
+def prepare_dataset(ws, ts) -> str:
+    """Compile the dataset unless a matching one already exists.
+
+    The file name includes the hash of the config, so a dataset is reused by
+    all runs with the same config. A lock file prevents concurrent instances
+    from compiling the same dataset twice.
+    """
+    filename = dataset_file(ws, ts)
+    os.makedirs(ws.dataset_dir, exist_ok=True)
+    with open(filename + '.lock', 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        if is_valid(filename, dataset_config(ws, ts)):
+            logger.info('Reusing dataset {}'.format(filename))
+            return filename
+
+        logger.info('Compiling dataset {}'.format(filename))
+        t0 = time.time()
+        compile_dataset(ws, ts, filename, max(ws.workers, 1))
+        logger.info('Compiled {:,} documents in {:.1f} seconds ({:,} bytes)'
+                    .format(ws.items, time.time() - t0, os.path.getsize(filename)))
+    return filename
@@ -1,3 +1,12 @@
+import functools
+import mmap
+import os
+import struct
+from collections.abc import Sequence
+from typing import Dict, Iterable, List
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+
 STATES = (
     ('AK', 'Alaska'),
     ('AL', 'Alabama'),
@@ -161,9141 +170,6 @@ CATEGORIES = (
     'Women',
 )
 
-COUNTIES = (
-    'Abbeville County',
-    'Acadia Parish',
-    'Accomack County',
-    'Ada County',
-    'Adair County',
-    'Adams County',
-    'Addison County',
-    'Aiken County',
-    'Aitkin County',
-    'Alachua County',
-    'Alamance County',
-    'Alameda County',
-    'Alamosa County',
-    'Albany County',
-    'Albemarle County',
-    'Alcona County',
-    'Alcorn County',
-    'Aleutians East Borough',
-    'Aleutians West Census Area',
-    'Alexander County',
-    'Alexandria city',
-    'Alfalfa County',
-    'Alger County',
-    'Allamakee County',
-    'Allegan County',
-    'Allegany County',
-    'Alleghany County',
-    'Allegheny County',
-    'Allen County',
-    'Allendale County',
-    'Allen Parish',
-    'Alpena County',
-    'Alpine County',
-    'Amador County',
-    'Amelia County',
-    'Amherst County',
-    'Amite County',
-    'Anchorage Borough',
-    'Anderson County',
-    'Andrew County',
-    'Andrews County',
-    'Androscoggin County',
-    'Angelina County',
-    'Anne Arundel County',
-    'Anoka County',
-    'Anson County',
-    'Antelope County',
-    'Antrim County',
-    'Apache County',
-    'Appanoose County',
-    'Appling County',
-    'Appomattox County',
-    'Aransas County',
-    'Arapahoe County',
-    'Archer County',
-    'Archuleta County',
-    'Arenac County',
-    'Arkansas County',
-    'Arlington County',
-    'Armstrong County',
-    'Aroostook County',
-    'Arthur County',
-    'Ascension Parish',
-    'Ashe County',
-    'Ashland County',
-    'Ashley County',
-    'Ashtabula County',
-    'Asotin County',
-    'Assumption Parish',
-    'Atascosa County',
-    'Atchison County',
-    'Athens County',
-    'Atkinson County',
-    'Atlantic County',
-    'Atoka County',
-    'Attala County',
-    'Audrain County',
-    'Audubon County',
-    'Auglaize County',
-    'Augusta County',
-    'Aurora County',
-    'Austin County',
-    'Autauga County',
-    'Avery County',
-    'Avoyelles Parish',
-    'Baca County',
-    'Bacon County',
-    'Bailey County',
-    'Baker County',
-    'Baldwin County',
-    'Ballard County',
-    'Baltimore city',
-    'Baltimore County',
-    'Bamberg County',
-    'Bandera County',
-    'Banks County',
-    'Banner County',
-    'Bannock County',
-    'Baraga County',
-    'Barber County',
-    'Barbour County',
-    'Barnes County',
-    'Barnstable County',
-    'Barnwell County',
-    'Barren County',
-    'Barron County',
-    'Barrow County',
-    'Barry County',
-    'Bartholomew County',
-    'Barton County',
-    'Bartow County',
-    'Bastrop County',
-    'Bates County',
-    'Bath County',
-    'Baxter County',
-    'Bay County',
-    'Bayfield County',
-    'Baylor County',
-    'Beadle County',
-    'Bear Lake County',
-    'Beaufort County',
-    'Beauregard Parish',
-    'Beaver County',
-    'Beaverhead County',
-    'Becker County',
-    'Beckham County',
-    'Bedford city',
-    'Bedford County',
-    'Bee County',
-    'Belknap County',
-    'Bell County',
-    'Belmont County',
-    'Beltrami County',
-    'Benewah County',
-    'Ben Hill County',
-    'Bennett County',
-    'Bennington County',
-    'Benson County',
-    'Bent County',
-    'Benton County',
-    'Benzie County',
-    'Bergen County',
-    'Berkeley County',
-    'Berks County',
-    'Berkshire County',
-    'Bernalillo County',
-    'Berrien County',
-    'Bertie County',
-    'Bethel Census Area',
-    'Bexar County',
-    'Bibb County',
-    'Bienville Parish',
-    'Big Horn County',
-    'Big Stone County',
-    'Billings County',
-    'Bingham County',
-    'Blackford County',
-    'Black Hawk County',
-    'Bladen County',
-    'Blaine County',
-    'Blair County',
-    'Blanco County',
-    'Bland County',
-    'Bleckley County',
-    'Bledsoe County',
-    'Blount County',
-    'Blue Earth County',
-    'Boise County',
-    'Bolivar County',
-    'Bollinger County',
-    'Bond County',
-    'Bon Homme County',
-    'Bonner County',
-    'Bonneville County',
-    'Boone County',
-    'Borden County',
-    'Bosque County',
-    'Bossier Parish',
-    'Botetourt County',
-    'Bottineau County',
-    'Boulder County',
-    'Boundary County',
-    'Bourbon County',
-    'Bowie County',
-    'Bowman County',
-    'Box Butte County',
-    'Box Elder County',
-    'Boyd County',
-    'Boyle County',
-    'Bracken County',
-    'Bradford County',
-    'Bradley County',
-    'Branch County',
-    'Brantley County',
-    'Braxton County',
-    'Brazoria County',
-    'Brazos County',
-    'Breathitt County',
-    'Breckinridge County',
-    'Bremer County',
-    'Brevard County',
-    'Brewster County',
-    'Briscoe County',
-    'Bristol Bay Borough',
-    'Bristol city',
-    'Bristol County',
-    'Broadwater County',
-    'Bronx County',
-    'Brooke County',
-    'Brookings County',
-    'Brooks County',
-    'Broome County',
-    'Broward County',
-    'Brown County',
-    'Brule County',
-    'Brunswick County',
-    'Bryan County',
-    'Buchanan County',
-    'Buckingham County',
-    'Bucks County',
-    'Buena Vista city',
-    'Buena Vista County',
-    'Buffalo County',
-    'Bullitt County',
-    'Bulloch County',
-    'Bullock County',
-    'Buncombe County',
-    'Bureau County',
-    'Burke County',
-    'Burleigh County',
-    'Burleson County',
-    'Burlington County',
-    'Burnet County',
-    'Burnett County',
-    'Burt County',
-    'Butler County',
-    'Butte County',
-    'Butts County',
-    'Cabarrus County',
-    'Cabell County',
-    'Cache County',
-    'Caddo County',
-    'Caddo Parish',
-    'Calaveras County',
-    'Calcasieu Parish',
-    'Caldwell County',
-    'Caldwell Parish',
-    'Caledonia County',
-    'Calhoun County',
-    'Callahan County',
-    'Callaway County',
-    'Calloway County',
-    'Calumet County',
-    'Calvert County',
-    'Camas County',
-    'Cambria County',
-    'Camden County',
-    'Cameron County',
-    'Cameron Parish',
-    'Campbell County',
-    'Camp County',
-    'Canadian County',
-    'Candler County',
-    'Cannon County',
-    'Canyon County',
-    'Cape Girardeau County',
-    'Cape May County',
-    'Carbon County',
-    'Caribou County',
-    'Carlisle County',
-    'Carlton County',
-    'Caroline County',
-    'Carroll County',
-    'Carson City',
-    'Carson County',
-    'Carter County',
-    'Carteret County',
-    'Carver County',
-    'Cascade County',
-    'Casey County',
-    'Cass County',
-    'Cassia County',
-    'Castro County',
-    'Caswell County',
-    'Catahoula Parish',
-    'Catawba County',
-    'Catoosa County',
-    'Catron County',
-    'Cattaraugus County',
-    'Cavalier County',
-    'Cayuga County',
-    'Cecil County',
-    'Cedar County',
-    'Centre County',
-    'Cerro Gordo County',
-    'Chaffee County',
-    'Chambers County',
-    'Champaign County',
-    'Chariton County',
-    'Charle',
-    'Charles City County',
-    'Charles County',
-    'Charles Mix County',
-    'Charleston County',
-    'Charlevoix County',
-    'Charlotte County',
-    'Charlottesville city',
-    'Charlton County',
-    'Chase County',
-    'Chatham County',
-    'Chattahoochee County',
-    'Chattooga County',
-    'Chautauqua County',
-    'Chaves County',
-    'Cheatham County',
-    'Cheboygan County',
-    'Chelan County',
-    'Chemung County',
-    'Chenango County',
-    'Cherokee County',
-    'Cherry County',
-    'Chesapeake city',
-    'Cheshire County',
-    'Chester County',
-    'Chesterfield County',
-    'Cheyenne County',
-    'Chickasaw County',
-    'Chicot County',
-    'Childress County',
-    'Chilton County',
-    'Chippewa County',
-    'Chisago County',
-    'Chittenden County',
-    'Choctaw County',
-    'Chouteau County',
-    'Chowan County',
-    'Christian County',
-    'Churchill County',
-    'Cibola County',
-    'Cimarron County',
-    'Citrus County',
-    'Clackamas County',
-    'Claiborne County',
-    'Claiborne Parish',
-    'Clallam County',
-    'Clare County',
-    'Clarendon County',
-    'Clarion County',
-    'Clark County',
-    'Clarke County',
-    'Clatsop County',
-    'Clay County',
-    'Clayton County',
-    'Clear Creek County',
-    'Clearfield County',
-    'Clearwater County',
-    'Cleburne County',
-    'Clermont County',
-    'Cleveland County',
-    'Clifton Forge city',
-    'Clinch County',
-    'Clinton County',
-    'Cloud County',
-    'Coahoma County',
-    'Coal County',
-    'Cobb County',
-    'Cochise County',
-    'Cochran County',
-    'Cocke County',
-    'Coconino County',
-    'Codington County',
-    'Coffee County',
-    'Coffey County',
-    'Coke County',
-    'Colbert County',
-    'Cole County',
-    'Coleman County',
-    'Coles County',
-    'Colfax County',
-    'Colleton County',
-    'Collier County',
-    'Collin County',
-    'Collingsworth County',
-    'Colonial Heights city',
-    'Colorado County',
-    'Colquitt County',
-    'Columbia County',
-    'Columbiana County',
-    'Columbus County',
-    'Colusa County',
-    'Comal County',
-    'Comanche County',
-    'Concho County',
-    'Concordia Parish',
-    'Conecuh County',
-    'Conejos County',
-    'Contra Costa County',
-    'Converse County',
-    'Conway County',
-    'Cook County',
-    'Cooke County',
-    'Cooper County',
-    'Coosa County',
-    'Coos County',
-    'Copiah County',
-    'Corson County',
-    'Cortland County',
-    'Coryell County',
-    'Coshocton County',
-    'Costilla County',
-    'Cottle County',
-    'Cotton County',
-    'Cottonwood County',
-    'Covington city',
-    'Covington County',
-    'Coweta County',
-    'Cowley County',
-    'Cowlitz County',
-    'Craig County',
-    'Craighead County',
-    'Crane County',
-    'Craven County',
-    'Crawford County',
-    'Creek County',
-    'Crenshaw County',
-    'Crisp County',
-    'Crittenden County',
-    'Crockett County',
-    'Crook County',
-    'Crosby County',
-    'Cross County',
-    'Crowley County',
-    'Crow Wing County',
-    'Culberson County',
-    'Cullman County',
-    'Culpeper County',
-    'Cumberland County',
-    'Cuming County',
-    'Currituck County',
-    'Curry County',
-    'Custer County',
-    'Cuyahoga County',
-    'Dade County',
-    'Daggett County',
-    'Dakota County',
-    'Dale County',
-    'Dallam County',
-    'Dallas County',
-    'Dane County',
-    'Daniels County',
-    'Danville city',
-    'Dare County',
-    'Darke County',
-    'Darlington County',
-    'Dauphin County',
-    'Davidson County',
-    'Davie County',
-    'Daviess County',
-    'Davis County',
-    'Davison County',
-    'Dawes County',
-    'Dawson County',
-    'Day County',
-    'Deaf Smith County',
-    'Dearborn County',
-    'DeBaca County',
-    'Decatur County',
-    'Deer Lodge County',
-    'Defiance County',
-    'De Kalb County',
-    'DeKalb County',
-    'Delaware County',
-    'Del Norte County',
-    'Delta County',
-    'Denali Borough',
-    'Dent County',
-    'Denton County',
-    'Denver County',
-    'Deschutes County',
-    'Desha County',
-    'Des Moines County',
-    'DeSoto County',
-    'De Soto Parish',
-    'Deuel County',
-    'Dewey County',
-    'De Witt County',
-    'DeWitt County',
-    'Dickens County',
-    'Dickenson County',
-    'Dickey County',
-    'Dickinson County',
-    'Dickson County',
-    'Dillingham Census Area',
-    'Dillon County',
-    'Dimmit County',
-    'Dinwiddie County',
-    'District of Columbia',
-    'Divide County',
-    'Dixie County',
-    'Dixon County',
-    'Doddridge County',
-    'Dodge County',
-    'Dolores County',
-    'Dona Ana County',
-    'Doniphan County',
-    'Donley County',
-    'Dooly County',
-    'Door County',
-    'Dorchester County',
-    'Dougherty County',
-    'Douglas County',
-    'Drew County',
-    'Dubois County',
-    'Dubuque County',
-    'Duchesne County',
-    'Dukes County',
-    'Dundy County',
-    'Dunklin County',
-    'Dunn County',
-    'DuPage County',
-    'Duplin County',
-    'Durham County',
-    'Dutchess County',
-    'Duval County',
-    'Dyer County',
-    'Eagle County',
-    'Early County',
-    'East Baton Rouge Parish',
-    'East Carroll Parish',
-    'East Feliciana Parish',
-    'Eastland County',
-    'Eaton County',
-    'Eau Claire County',
-    'Echols County',
-    'Ector County',
-    'Eddy County',
-    'Edgar County',
-    'Edgecombe County',
-    'Edgefield County',
-    'Edmonson County',
-    'Edmunds County',
-    'Edwards County',
-    'Effingham County',
-    'Elbert County',
-    'El Dorado County',
-    'Elk County',
-    'Elkhart County',
-    'Elko County',
-    'Elliott County',
-    'Ellis County',
-    'Ellsworth County',
-    'Elmore County',
-    'El Paso County',
-    'Emanuel County',
-    'Emery County',
-    'Emmet County',
-    'Emmons County',
-    'Emporia city',
-    'Erath County',
-    'Erie County',
-    'Escambia County',
-    'Esmeralda County',
-    'Essex County',
-    'Estill County',
-    'Etowah County',
-    'Eureka County',
-    'Evangeline Parish',
-    'Evans County',
-    'Fairbanks North Star Borough',
-    'Fairfax city',
-    'Fairfax County',
-    'Fairfield County',
-    'Fallon County',
-    'Fall River County',
-    'Falls Church city',
-    'Falls County',
-    'Fannin County',
-    'Faribault County',
-    'Faulk County',
-    'Faulkner County',
-    'Fauquier County',
-    'Fayette County',
-    'Fentress County',
-    'Fergus County',
-    'Ferry County',
-    'Fillmore County',
-    'Finney County',
-    'Fisher County',
-    'Flagler County',
-    'Flathead County',
-    'Fleming County',
-    'Florence County',
-    'Floyd County',
-    'Fluvanna County',
-    'Foard County',
-    'Fond du Lac County',
-    'Ford County',
-    'Forest County',
-    'Forrest County',
-    'Forsyth County',
-    'Fort Bend County',
-    'Foster County',
-    'Fountain County',
-    'Franklin city',
-    'Franklin County',
-    'Franklin Parish',
-    'Frederick County',
-    'Fredericksburg city',
-    'Freeborn County',
-    'Freestone County',
-    'Fremont County',
-    'Fresno County',
-    'Frio County',
-    'Frontier County',
-    'Fulton County',
-    'Furnas County',
-    'Gadsden County',
-    'Gage County',
-    'Gaines County',
-    'Galax city',
-    'Gallatin County',
-    'Gallia County',
-    'Galveston County',
-    'Garden County',
-    'Garfield County',
-    'Garland County',
-    'Garrard County',
-    'Garrett County',
-    'Garvin County',
-    'Garza County',
-    'Gasconade County',
-    'Gaston County',
-    'Gates County',
-    'Geary County',
-    'Geauga County',
-    'Gem County',
-    'Genesee County',
-    'Geneva County',
-    'Gentry County',
-    'George County',
-    'Georgetown County',
-    'Gibson County',
-    'Gila County',
-    'Gilchrist County',
-    'Giles County',
-    'Gillespie County',
-    'Gilliam County',
-    'Gilmer County',
-    'Gilpin County',
-    'Glacier County',
-    'Glades County',
-    'Gladwin County',
-    'Glascock County',
-    'Glasscock County',
-    'Glenn County',
-    'Gloucester County',
-    'Glynn County',
-    'Gogebic County',
-    'Golden Valley County',
-    'Goliad County',
-    'Gonzales County',
-    'Goochland County',
-    'Goodhue County',
-    'Gooding County',
-    'Gordon County',
-    'Goshen County',
-    'Gosper County',
-    'Gove County',
-    'Grady County',
-    'Grafton County',
-    'Graham County',
-    'Grainger County',
-    'Grand County',
-    'Grand Forks County',
-    'Grand Isle County',
-    'Grand Traverse County',
-    'Granite County',
-    'Grant County',
-    'Grant Parish',
-    'Granville County',
-    'Gratiot County',
-    'Graves County',
-    'Gray County',
-    'Grays Harbor County',
-    'Grayson County',
-    'Greeley County',
-    'Greenbrier County',
-    'Green County',
-    'Greene County',
-    'Green Lake County',
-    'Greenlee County',
-    'Greensville County',
-    'Greenup County',
-    'Greenville County',
-    'Greenwood County',
-    'Greer County',
-    'Gregg County',
-    'Gregory County',
-    'Grenada County',
-    'Griggs County',
-    'Grimes County',
-    'Grundy County',
-    'Guadalupe County',
-    'Guernsey County',
-    'Guilford County',
-    'Gulf County',
-    'Gunnison County',
-    'Guthrie County',
-    'Gwinnett County',
-    'Haakon County',
-    'Habersham County',
-    'Haines Borough',
-    'Hale County',
-    'Halifax County',
-    'Hall County',
-    'Hamblen County',
-    'Hamilton County',
-    'Hamlin County',
-    'Hampden County',
-    'Hampshire County',
-    'Hampton city',
-    'Hampton County',
-    'Hancock County',
-    'Hand County',
-    'Hanover County',
-    'Hansford County',
-    'Hanson County',
-    'Haralson County',
-    'Hardee County',
-    'Hardeman County',
-    'Hardin County',
-    'Harding County',
-    'Hardy County',
-    'Harford County',
-    'Harlan County',
-    'Harmon County',
-    'Harnett County',
-    'Harney County',
-    'Harper County',
-    'Harris County',
-    'Harrisonburg city',
-    'Harrison County',
-    'Hart County',
-    'Hartford County',
-    'Hartley County',
-    'Harvey County',
-    'Haskell County',
-    'Hawaii County',
-    'Hawkins County',
-    'Hayes County',
-    'Hays County',
-    'Haywood County',
-    'Heard County',
-    'Hemphill County',
-    'Hempstead County',
-    'Henderson County',
-    'Hendricks County',
-    'Hendry County',
-    'Hennepin County',
-    'Henrico County',
-    'Henry County',
-    'Herkimer County',
-    'Hernando County',
-    'Hertford County',
-    'Hettinger County',
-    'Hickman County',
-    'Hickory County',
-    'Hidalgo County',
-    'Highland County',
-    'Highlands County',
-    'Hill County',
-    'Hillsborough County',
-    'Hillsdale County',
-    'Hinds County',
-    'Hinsdale County',
-    'Hitchcock County',
-    'Hocking County',
-    'Hockley County',
-    'Hodgeman County',
-    'Hoke County',
-    'Holmes County',
-    'Holt County',
-    'Honolulu County',
-    'Hood County',
-    'Hood River County',
-    'Hooker County',
-    'Hopewell city',
-    'Hopkins County',
-    'Horry County',
-    'Hot Spring County',
-    'Hot Springs County',
-    'Houghton County',
-    'Houston County',
-    'Howard County',
-    'Howell County',
-    'Hubbard County',
-    'Hudson County',
-    'Hudspeth County',
-    'Huerfano County',
-    'Hughes County',
-    'Humboldt County',
-    'Humphreys County',
-    'Hunt County',
-    'Hunterdon County',
-    'Huntingdon County',
-    'Huntington County',
-    'Huron County',
-    'Hutchinson County',
-    'Hyde County',
-    'Iberia Parish',
-    'Iberville Parish',
-    'Ida County',
-    'Idaho County',
-    'Imperial County',
-    'Independence County',
-    'Indiana County',
-    'Indian River County',
-    'Ingham County',
-    'Inyo County',
-    'Ionia County',
-    'Iosco County',
-    'Iowa County',
-    'Iredell County',
-    'Irion County',
-    'Iron County',
-    'Iroquois County',
-    'Irwin County',
-    'Isabella County',
-    'Isanti County',
-    'Island County',
-    'Isle of Wight County',
-    'Issaquena County',
-    'Itasca County',
-    'Itawamba County',
-    'Izard County',
-    'Jack County',
-    'Jackson County',
-    'Jackson Parish',
-    'James City County',
-    'Jasper County',
-    'Jay County',
-    'Jeff Davis County',
-    'Jefferson County',
-    'Jefferson Davis County',
-    'Jefferson Davis Parish',
-    'Jefferson Parish',
-    'Jenkins County',
-    'Jennings County',
-    'Jerauld County',
-    'Jerome County',
-    'Jersey County',
-    'Jessamine County',
-    'Jewell County',
-    'Jim Hogg County',
-    'Jim Wells County',
-    'Jo Daviess County',
-    'Johnson County',
-    'Johnston County',
-    'Jones County',
-    'Josephine County',
-    'Juab County',
-    'Judith Basin County',
-    'Juneau Borough',
-    'Juneau County',
-    'Juniata County',
-    'Kalamazoo County',
-    'Kalkaska County',
-    'Kanabec County',
-    'Kanawha County',
-    'Kandiyohi County',
-    'Kane County',
-    'Kankakee County',
-    'Karnes County',
-    'Kauai County',
-    'Kaufman County',
-    'Kay County',
-    'Kearney County',
-    'Kearny County',
-    'Keith County',
-    'Kemper County',
-    'Kenai Peninsula Borough',
-    'Kendall County',
-    'Kenedy County',
-    'Kennebec County',
-    'Kenosha County',
-    'Kent County',
-    'Kenton County',
-    'Keokuk County',
-    'Kern County',
-    'Kerr County',
-    'Kershaw County',
-    'Ketchikan Gateway Borough',
-    'Kewaunee County',
-    'Keweenaw County',
-    'Keya Paha County',
-    'Kidder County',
-    'Kimball County',
-    'Kimble County',
-    'King and Queen County',
-    'King County',
-    'Kingfisher County',
-    'King George County',
-    'Kingman County',
-    'Kingsbury County',
-    'Kings County',
-    'King William County',
-    'Kinney County',
-    'Kiowa County',
-    'Kit Carson County',
-    'Kitsap County',
-    'Kittitas County',
-    'Kittson County',
-    'Klamath County',
-    'Kleberg County',
-    'Klickitat County',
-    'Knott County',
-    'Knox County',
-    'Kodiak Island Borough',
-    'Koochiching County',
-    'Kootenai County',
-    'Kosciusko County',
-    'Kossuth County',
-    'Labette County',
-    'Lackawanna County',
-    'Laclede County',
-    'Lac qui Parle County',
-    'La Crosse County',
-    'Lafayette County',
-    'Lafayette Parish',
-    'Lafourche Parish',
-    'Lagrange County',
-    'Lake and Peninsula Borough',
-    'Lake County',
-    'Lake of the Woods County',
-    'Lamar County',
-    'Lamb County',
-    'Lamoille County',
-    'LaMoure County',
-    'Lampasas County',
-    'Lancaster County',
-    'Lander County',
-    'Lane County',
-    'Langlade County',
-    'Lanier County',
-    'La Paz County',
-    'Lapeer County',
-    'La Plata County',
-    'La Porte County',
-    'Laramie County',
-    'Larimer County',
-    'Larue County',
-    'La Salle County',
-    'La Salle Parish',
-    'Las Animas County',
-    'Lassen County',
-    'Latah County',
-    'Latimer County',
-    'Lauderdale County',
-    'Laurel County',
-    'Laurens County',
-    'Lavaca County',
-    'Lawrence County',
-    'Lea County',
-    'Leake County',
-    'Leavenworth County',
-    'Lebanon County',
-    'Lee County',
-    'Leelanau County',
-    'Leflore County',
-    'Le Flore County',
-    'Lehigh County',
-    'Lemhi County',
-    'Lenawee County',
-    'Lenoir County',
-    'Leon County',
-    'Leslie County',
-    'Le Sueur County',
-    'Letcher County',
-    'Levy County',
-    'Lewis and Clark County',
-    'Lewis County',
-    'Lexington city',
-    'Lexington County',
-    'Liberty County',
-    'Licking County',
-    'Limestone County',
-    'Lincoln County',
-    'Lincoln Parish',
-    'Linn County',
-    'Lipscomb County',
-    'Litchfield County',
-    'Little River County',
-    'Live Oak County',
-    'Livingston County',
-    'Livingston Parish',
-    'Llano County',
-    'Logan County',
-    'Long County',
-    'Lonoke County',
-    'Lorain County',
-    'Los Alamos County',
-    'Los Angeles County',
-    'Loudon County',
-    'Loudoun County',
-    'Louisa County',
-    'Loup County',
-    'Love County',
-    'Loving County',
-    'Lowndes County',
-    'Lubbock County',
-    'Lucas County',
-    'Luce County',
-    'Lumpkin County',
-    'Luna County',
-    'Lunenburg County',
-    'Luzerne County',
-    'Lycoming County',
-    'Lyman County',
-    'Lynchburg city',
-    'Lynn County',
-    'Lyon County',
-    'Mackinac County',
-    'Macomb County',
-    'Macon County',
-    'Macoupin County',
-    'Madera County',
-    'Madison County',
-    'Madison Parish',
-    'Magoffin County',
-    'Mahaska County',
-    'Mahnomen County',
-    'Mahoning County',
-    'Major County',
-    'Malheur County',
-    'Manassas city',
-    'Manassas Park city',
-    'Manatee County',
-    'Manistee County',
-    'Manitowoc County',
-    'Marathon County',
-    'Marengo County',
-    'Maricopa County',
-    'Maries County',
-    'Marin County',
-    'Marinette County',
-    'Marion County',
-    'Mariposa County',
-    'Marlboro County',
-    'Marquette County',
-    'Marshall County',
-    'Martin County',
-    'Martinsville city',
-    'Mason County',
-    'Massac County',
-    'Matagorda County',
-    'Matanuska-Susitna Borough',
-    'Mathews County',
-    'Maui County',
-    'Maury County',
-    'Maverick County',
-    'Mayes County',
-    'McClain County',
-    'McCone County',
-    'McCook County',
-    'McCormick County',
-    'McCracken County',
-    'McCreary County',
-    'McCulloch County',
-    'McCurtain County',
-    'McDonald County',
-    'McDonough County',
-    'McDowell County',
-    'McDuffie County',
-    'McHenry County',
-    'McIntosh County',
-    'McKean County',
-    'McKenzie County',
-    'McKinley County',
-    'McLean County',
-    'McLennan County',
-    'McLeod County',
-    'McMinn County',
-    'McMullen County',
-    'McNairy County',
-    'McPherson County',
-    'Meade County',
-    'Meagher County',
-    'Mecklenburg County',
-    'Mecosta County',
-    'Medina County',
-    'Meeker County',
-    'Meigs County',
-    'Mellette County',
-    'Menard County',
-    'Mendocino County',
-    'Menifee County',
-    'Menominee County',
-    'Merced County',
-    'Mercer County',
-    'Meriwether County',
-    'Merrick County',
-    'Merrimack County',
-    'Mesa County',
-    'Metcalfe County',
-    'Miami County',
-    'Middlesex County',
-    'Midland County',
-    'Mifflin County',
-    'Milam County',
-    'Millard County',
-    'Mille Lacs County',
-    'Miller County',
-    'Mills County',
-    'Milwaukee County',
-    'Mineral County',
-    'Miner County',
-    'Mingo County',
-    'Minidoka County',
-    'Minnehaha County',
-    'Missaukee County',
-    'Mississippi County',
-    'Missoula County',
-    'Mitchell County',
-    'Mobile County',
-    'Modoc County',
-    'Moffat County',
-    'Mohave County',
-    'Moniteau County',
-    'Monmouth County',
-    'Mono County',
-    'Monona County',
-    'Monongalia County',
-    'Monroe County',
-    'Montague County',
-    'Montcalm County',
-    'Monterey County',
-    'Montezuma County',
-    'Montgomery County',
-    'Montmorency County',
-    'Montour County',
-    'Montrose County',
-    'Moody County',
-    'Moore County',
-    'Mora County',
-    'Morehouse Parish',
-    'Morgan County',
-    'Morrill County',
-    'Morris County',
-    'Morrison County',
-    'Morrow County',
-    'Morton County',
-    'Motley County',
-    'Moultrie County',
-    'Mountrail County',
-    'Mower County',
-    'Muhlenberg County',
-    'Multnomah County',
-    'Murray County',
-    'Muscatine County',
-    'Muscogee County',
-    'Muskegon County',
-    'Muskingum County',
-    'Muskogee County',
-    'Musselshell County',
-    'Nacogdoches County',
-    'Nance County',
-    'Nantucket County',
-    'Napa County',
-    'Nash County',
-    'Nassau County',
-    'Natchitoches Parish',
-    'Natrona County',
-    'Navajo County',
-    'Navarro County',
-    'Nelson County',
-    'Nemaha County',
-    'Neosho County',
-    'Neshoba County',
-    'Ness County',
-    'Nevada County',
-    'Newaygo County',
-    'Newberry County',
-    'New Castle County',
-    'New Hanover County',
-    'New Haven County',
-    'New Kent County',
-    'New London County',
-    'New Madrid County',
-    'Newport County',
-    'Newport News city',
-    'Newton County',
-    'New York County',
-    'Nez Perce County',
-    'Niagara County',
-    'Nicholas County',
-    'Nicollet County',
-    'Niobrara County',
-    'Noble County',
-    'Nobles County',
-    'Nodaway County',
-    'Nolan County',
-    'Nome Census Area',
-    'Norfolk city',
-    'Norfolk County',
-    'Norman County',
-    'Northampton County',
-    'North Slope Borough',
-    'Northumberland County',
-    'Northwest Arctic Borough',
-    'Norton city',
-    'Norton County',
-    'Nottoway County',
-    'Nowata County',
-    'Noxubee County',
-    'Nuckolls County',
-    'Nueces County',
-    'Nye County',
-    'Oakland County',
-    'Obion County',
-    'O-Brien County',
-    'Oceana County',
-    'Ocean County',
-    'Ochiltree County',
-    'Oconee County',
-    'Oconto County',
-    'Ogemaw County',
-    'Ogle County',
-    'Oglethorpe County',
-    'Ohio County',
-    'Okaloosa County',
-    'Okanogan County',
-    'Okeechobee County',
-    'Okfuskee County',
-    'Oklahoma County',
-    'Okmulgee County',
-    'Oktibbeha County',
-    'Oldham County',
-    'Oliver County',
-    'Olmsted County',
-    'Oneida County',
-    'Onondaga County',
-    'Onslow County',
-    'Ontario County',
-    'Ontonagon County',
-    'Orangeburg County',
-    'Orange County',
-    'Oregon County',
-    'Orleans County',
-    'Orleans Parish',
-    'Osage County',
-    'Osborne County',
-    'Osceola County',
-    'Oscoda County',
-    'Oswego County',
-    'Otero County',
-    'Otoe County',
-    'Otsego County',
-    'Ottawa County',
-    'Otter Tail County',
-    'Ouachita County',
-    'Ouachita Parish',
-    'Ouray County',
-    'Outagamie County',
-    'Overton County',
-    'Owen County',
-    'Owsley County',
-    'Owyhee County',
-    'Oxford County',
-    'Ozark County',
-    'Ozaukee County',
-    'Pacific County',
-    'Page County',
-    'Palm Beach County',
-    'Palo Alto County',
-    'Palo Pinto County',
-    'Pamlico County',
-    'Panola County',
-    'Park County',
-    'Parke County',
-    'Parker County',
-    'Parmer County',
-    'Pasco County',
-    'Pasquotank County',
-    'Passaic County',
-    'Patrick County',
-    'Paulding County',
-    'Pawnee County',
-    'Payette County',
-    'Payne County',
-    'Peach County',
-    'Pearl River County',
-    'Pecos County',
-    'Pembina County',
-    'Pemiscot County',
-    'Pender County',
-    'Pendleton County',
-    'Pend Oreille County',
-    'Pennington County',
-    'Penobscot County',
-    'Peoria County',
-    'Pepin County',
-    'Perkins County',
-    'Perquimans County',
-    'Perry County',
-    'Pershing County',
-    'Person County',
-    'Petersburg city',
-    'Petroleum County',
-    'Pettis County',
-    'Phelps County',
-    'Philadelphia County',
-    'Phillips County',
-    'Piatt County',
-    'Pickaway County',
-    'Pickens County',
-    'Pickett County',
-    'Pierce County',
-    'Pike County',
-    'Pima County',
-    'Pinal County',
-    'Pine County',
-    'Pinellas County',
-    'Pipestone County',
-    'Piscataquis County',
-    'Pitkin County',
-    'Pitt County',
-    'Pittsburg County',
-    'Pittsylvania County',
-    'Piute County',
-    'Placer County',
-    'Plaquemines Parish',
-    'Platte County',
-    'Pleasants County',
-    'Plumas County',
-    'Plymouth County',
-    'Pocahontas County',
-    'Poinsett County',
-    'Pointe Coupee Parish',
-    'Polk County',
-    'Pondera County',
-    'Pontotoc County',
-    'Pope County',
-    'Poquoson city',
-    'Portage County',
-    'Porter County',
-    'Portsmouth city',
-    'Posey County',
-    'Pottawatomie County',
-    'Pottawattamie County',
-    'Potter County',
-    'Powder River County',
-    'Powell County',
-    'Power County',
-    'Poweshiek County',
-    'Powhatan County',
-    'Prairie County',
-    'Pratt County',
-    'Preble County',
-    'Prentiss County',
-    'Presidio County',
-    'Presque Isle County',
-    'Preston County',
-    'Price County',
-    'Prince Edward County',
-    'Prince George County',
-    'Prince William County',
-    'Providence County',
-    'Prowers County',
-    'Pueblo County',
-    'Pulaski County',
-    'Pushmataha County',
-    'Putnam County',
-    'Quay County',
-    'Queen Anne County',
-    'Queens County',
-    'Quitman County',
-    'Rabun County',
-    'Racine County',
-    'Radford city',
-    'Rains County',
-    'Raleigh County',
-    'Ralls County',
-    'Ramsey County',
-    'Randall County',
-    'Randolph County',
-    'Rankin County',
-    'Ransom County',
-    'Rapides Parish',
-    'Rappahannock County',
-    'Ravalli County',
-    'Rawlins County',
-    'Ray County',
-    'Reagan County',
-    'Real County',
-    'Red Lake County',
-    'Red River County',
-    'Red River Parish',
-    'Red Willow County',
-    'Redwood County',
-    'Reeves County',
-    'Refugio County',
-    'Reno County',
-    'Rensselaer County',
-    'Renville County',
-    'Republic County',
-    'Reynolds County',
-    'Rhea County',
-    'Rice County',
-    'Richardson County',
-    'Rich County',
-    'Richland County',
-    'Richland Parish',
-    'Richmond city',
-    'Richmond County',
-    'Riley County',
-    'Ringgold County',
-    'Rio Arriba County',
-    'Rio Blanco County',
-    'Rio Grande County',
-    'Ripley County',
-    'Ritchie County',
-    'Riverside County',
-    'Roane County',
-    'Roanoke city',
-    'Roanoke County',
-    'Roberts County',
-    'Robertson County',
-    'Robeson County',
-    'Rockbridge County',
-    'Rockcastle County',
-    'Rock County',
-    'Rockdale County',
-    'Rockingham County',
-    'Rock Island County',
-    'Rockland County',
-    'Rockwall County',
-    'Roger Mills County',
-    'Rogers County',
-    'Rolette County',
-    'Rooks County',
-    'Roosevelt County',
-    'Roscommon County',
-    'Roseau County',
-    'Rosebud County',
-    'Ross County',
-    'Routt County',
-    'Rowan County',
-    'Runnels County',
-    'Rush County',
-    'Rusk County',
-    'Russell County',
-    'Rutherford County',
-    'Rutland County',
-    'Sabine County',
-    'Sabine Parish',
-    'Sac County',
-    'Sacramento County',
-    'Sagadahoc County',
-    'Saginaw County',
-    'Saguache County',
-    'Salem city',
-    'Salem County',
-    'Saline County',
-    'Salt Lake County',
-    'Saluda County',
-    'Sampson County',
-    'San Augustine County',
-    'San Benito County',
-    'San Bernardino County',
-    'Sanborn County',
-    'Sanders County',
-    'San Diego County',
-    'Sandoval County',
-    'Sandusky County',
-    'San Francisco County',
-    'Sangamon County',
-    'Sanilac County',
-    'San Jacinto County',
-    'San Joaquin County',
-    'San Juan County',
-    'San Luis Obispo County',
-    'San Mateo County',
-    'San Miguel County',
-    'San Patricio County',
-    'Sanpete County',
-    'San Saba County',
-    'Santa Barbara County',
-    'Santa Clara County',
-    'Santa Cruz County',
-    'Santa Fe County',
-    'Santa Rosa County',
-    'Sarasota County',
-    'Saratoga County',
-    'Sargent County',
-    'Sarpy County',
-    'Sauk County',
-    'Saunders County',
-    'Sawyer County',
-    'Schenectady County',
-    'Schleicher County',
-    'Schley County',
-    'Schoharie County',
-    'Schoolcraft County',
-    'Schuyler County',
-    'Schuylkill County',
-    'Scioto County',
-    'Scotland County',
-    'Scott County',
-    'Scotts Bluff County',
-    'Screven County',
-    'Scurry County',
-    'Searcy County',
-    'Sebastian County',
-    'Sedgwick County',
-    'Seminole County',
-    'Seneca County',
-    'Sequatchie County',
-    'Sequoyah County',
-    'Sevier County',
-    'Seward County',
-    'Shackelford County',
-    'Shannon County',
-    'Sharkey County',
-    'Sharp County',
-    'Shasta County',
-    'Shawano County',
-    'Shawnee County',
-    'Sheboygan County',
-    'Shelby County',
-    'Shenandoah County',
-    'Sherburne County',
-    'Sheridan County',
-    'Sherman County',
-    'Shiawassee County',
-    'Shoshone County',
-    'Sibley County',
-    'Sierra County',
-    'Silver Bow County',
-    'Simpson County',
-    'Sioux County',
-    'Siskiyou County',
-    'Sitka Borough',
-    'Skagit County',
-    'Skamania County',
-    'Slope County',
-    'Smith County',
-    'Smyth County',
-    'Snohomish County',
-    'Snyder County',
-    'Socorro County',
-    'Solano County',
-    'Somerset County',
-    'Somervell County',
-    'Sonoma County',
-    'Southampton County',
-    'Spalding County',
-    'Spartanburg County',
-    'Spencer County',
-    'Spink County',
-    'Spokane County',
-    'Spotsylvania County',
-    'Stafford County',
-    'Stanislaus County',
-    'Stanley County',
-    'Stanly County',
-    'Stanton County',
-    'Stark County',
-    'Starke County',
-    'Starr County',
-    'Staunton city',
-    'Stearns County',
-    'Steele County',
-    'Stephens County',
-    'Stephenson County',
-    'Sterling County',
-    'Steuben County',
-    'Stevens County',
-    'Stewart County',
-    'Stillwater County',
-    'Stoddard County',
-    'Stokes County',
-    'Stone County',
-    'Stonewall County',
-    'Storey County',
-    'Story County',
-    'Strafford County',
-    'Stutsman County',
-    'Sublette County',
-    'Suffolk city',
-    'Suffolk County',
-    'Sullivan County',
-    'Sully County',
-    'Summers County',
-    'Summit County',
-    'Sumner County',
-    'Sumter County',
-    'Sunflower County',
-    'Surry County',
-    'Susquehanna County',
-    'Sussex County',
-    'Sutter County',
-    'Sutton County',
-    'Suwannee County',
-    'Swain County',
-    'Sweet Grass County',
-    'Sweetwater County',
-    'Swift County',
-    'Swisher County',
-    'Switzerland County',
-    'Talbot County',
-    'Taliaferro County',
-    'Talladega County',
-    'Tallahatchie County',
-    'Tallapoosa County',
-    'Tama County',
-    'Taney County',
-    'Tangipahoa Parish',
-    'Taos County',
-    'Tarrant County',
-    'Tate County',
-    'Tattnall County',
-    'Taylor County',
-    'Tazewell County',
-    'Tehama County',
-    'Telfair County',
-    'Teller County',
-    'Tensas Parish',
-    'Terrebonne Parish',
-    'Terrell County',
-    'Terry County',
-    'Teton County',
-    'Texas County',
-    'Thayer County',
-    'Thomas County',
-    'Throckmorton County',
-    'Thurston County',
-    'Tift County',
-    'Tillamook County',
-    'Tillman County',
-    'Tioga County',
-    'Tippah County',
-    'Tippecanoe County',
-    'Tipton County',
-    'Tishomingo County',
-    'Titus County',
-    'Todd County',
-    'Tolland County',
-    'Tom Green County',
-    'Tompkins County',
-    'Tooele County',
-    'Toole County',
-    'Toombs County',
-    'Torrance County',
-    'Towner County',
-    'Towns County',
-    'Traill County',
-    'Transylvania County',
-    'Traverse County',
-    'Travis County',
-    'Treasure County',
-    'Trego County',
-    'Trempealeau County',
-    'Treutlen County',
-    'Trigg County',
-    'Trimble County',
-    'Trinity County',
-    'Tripp County',
-    'Troup County',
-    'Trousdale County',
-    'Trumbull County',
-    'Tucker County',
-    'Tulare County',
-    'Tulsa County',
-    'Tunica County',
-    'Tuolumne County',
-    'Turner County',
-    'Tuscaloosa County',
-    'Tuscarawas County',
-    'Tuscola County',
-    'Twiggs County',
-    'Twin Falls County',
-    'Tyler County',
-    'Tyrrell County',
-    'Uinta County',
-    'Uintah County',
-    'Ulster County',
-    'Umatilla County',
-    'Unicoi County',
-    'Union County',
-    'Union Parish',
-    'Upshur County',
-    'Upson County',
-    'Upton County',
-    'Utah County',
-    'Uvalde County',
-    'Valdez-Cordova Census Area',
-    'Valencia County',
-    'Valley County',
-    'Val Verde County',
-    'Van Buren County',
-    'Vance County',
-    'Vanderburgh County',
-    'Van Wert County',
-    'Van Zandt County',
-    'Venango County',
-    'Ventura County',
-    'Vermilion County',
-    'Vermilion Parish',
-    'Vermillion County',
-    'Vernon County',
-    'Vernon Parish',
-    'Victoria County',
-    'Vigo County',
-    'Vilas County',
-    'Vinton County',
-    'Virginia Beach city',
-    'Volusia County',
-    'Wabasha County',
-    'Wabash County',
-    'Wabaunsee County',
-    'Wade Hampton Census Area',
-    'Wadena County',
-    'Wagoner County',
-    'Wahkiakum County',
-    'Wake County',
-    'Wakulla County',
-    'Waldo County',
-    'Walker County',
-    'Wallace County',
-    'Walla Walla County',
-    'Waller County',
-    'Wallowa County',
-    'Walsh County',
-    'Walthall County',
-    'Walton County',
-    'Walworth County',
-    'Wapello County',
-    'Ward County',
-    'Ware County',
-    'Warren County',
-    'Warrick County',
-    'Wasatch County',
-    'Wasco County',
-    'Waseca County',
-    'Washakie County',
-    'Washburn County',
-    'Washington County',
-    'Washington Parish',
-    'Washita County',
-    'Washoe County',
-    'Washtenaw County',
-    'Watauga County',
-    'Watonwan County',
-    'Waukesha County',
-    'Waupaca County',
-    'Waushara County',
-    'Wayne County',
-    'Waynesboro city',
-    'Weakley County',
-    'Webb County',
-    'Weber County',
-    'Webster County',
-    'Webster Parish',
-    'Weld County',
-    'Wells County',
-    'West Baton Rouge Parish',
-    'West Carroll Parish',
-    'Westchester County',
-    'West Feliciana Parish',
-    'Westmoreland County',
-    'Weston County',
-    'Wetzel County',
-    'Wexford County',
-    'Wharton County',
-    'Whatcom County',
-    'Wheatland County',
-    'Wheeler County',
-    'White County',
-    'White Pine County',
-    'Whiteside County',
-    'Whitfield County',
-    'Whitley County',
-    'Whitman County',
-    'Wibaux County',
-    'Wichita County',
-    'Wicomico County',
-    'Wilbarger County',
-    'Wilcox County',
-    'Wilkes County',
-    'Wilkin County',
-    'Wilkinson County',
-    'Willacy County',
-    'Will County',
-    'Williamsburg city',
-    'Williamsburg County',
-    'Williams County',
-    'Williamson County',
-    'Wilson County',
-    'Winchester city',
-    'Windham County',
-    'Windsor County',
-    'Winkler County',
-    'Winnebago County',
-    'Winneshiek County',
-    'Winn Parish',
-    'Winona County',
-    'Winston County',
-    'Wirt County',
-    'Wise County',
-    'Wolfe County',
-    'Woodbury County',
-    'Wood County',
-    'Woodford County',
-    'Woodruff County',
-    'Woods County',
-    'Woodson County',
-    'Woodward County',
-    'Worcester County',
-    'Worth County',
-    'Wright County',
-    'Wyandot County',
-    'Wyandotte County',
-    'Wyoming County',
-    'Wythe County',
-    'Yadkin County',
-    'Yakima County',
-    'Yakutat Borough',
-    'Yalobusha County',
-    'Yamhill County',
-    'Yancey County',
-    'Yankton County',
-    'Yates County',
-    'Yavapai County',
-    'Yazoo County',
-    'Yell County',
-    'Yellow Medicine County',
-    'Yellowstone County',
-    'Yoakum County',
-    'Yolo County',
-    'York County',
-    'Young County',
-    'Yuba County',
-    'Yukon-Koyukuk Census Area',
-    'Yuma County',
-    'Zapata County',
-    'Zavala County',
-    'Ziebach County',
-)
-
-ZIP_CODES = (
-    "00601",
-    "00608",
-    "00626",
-    "00649",
-    "00659",
-    "00668",
-    "00669",
-    "00716",
-    "00725",
-    "00728",
-    "00741",
-    "00749",
-    "00750",
-    "00762",
-    "00764",
-    "00769",
-    "00791",
-    "00794",
-    "00804",
-    "00816",
-    "00836",
-    "00844",
-    "00862",
-    "00868",
-    "00875",
-    "00896",
-    "00897",
-    "00902",
-    "00909",
-    "00919",
-    "00923",
-    "00925",
-    "00944",
-    "00969",
-    "00999",
-    "01008",
-    "01011",
-    "01018",
-    "01019",
-    "01028",
-    "01051",
-    "01092",
-    "01099",
-    "01114",
-    "01119",
-    "01125",
-    "01134",
-    "01140",
-    "01173",
-    "01184",
-    "01186",
-    "01187",
-    "01189",
-    "01213",
-    "01218",
-    "01231",
-    "01234",
-    "01235",
-    "01262",
-    "01281",
-    "01302",
-    "01325",
-    "01332",
-    "01344",
-    "01366",
-    "01452",
-    "01454",
-    "01494",
-    "01499",
-    "01513",
-    "01519",
-    "01565",
-    "01574",
-    "01675",
-    "01683",
-    "01687",
-    "01704",
-    "01740",
-    "01743",
-    "01747",
-    "01750",
-    "01760",
-    "01801",
-    "01804",
-    "01806",
-    "01809",
-    "01816",
-    "01818",
-    "01819",
-    "01829",
-    "01878",
-    "01889",
-    "01945",
-    "01987",
-    "01998",
-    "02003",
-    "02009",
-    "02021",
-    "02022",
-    "02023",
-    "02053",
-    "02121",
-    "02129",
-    "02145",
-    "02190",
-    "02239",
-    "02249",
-    "02251",
-    "02254",
-    "02269",
-    "02275",
-    "02285",
-    "02292",
-    "02311",
-    "02315",
-    "02332",
-    "02349",
-    "02357",
-    "02364",
-    "02381",
-    "02382",
-    "02392",
-    "02397",
-    "02421",
-    "02424",
-    "02438",
-    "02444",
-    "02452",
-    "02454",
-    "02504",
-    "02533",
-    "02534",
-    "02544",
-    "02552",
-    "02633",
-    "02637",
-    "02644",
-    "02646",
-    "02663",
-    "02682",
-    "02705",
-    "02706",
-    "02723",
-    "02750",
-    "02805",
-    "02810",
-    "02819",
-    "02824",
-    "02844",
-    "02876",
-    "02884",
-    "02891",
-    "02893",
-    "02897",
-    "02924",
-    "02966",
-    "03044",
-    "03055",
-    "03059",
-    "03077",
-    "03103",
-    "03132",
-    "03162",
-    "03165",
-    "03221",
-    "03229",
-    "03286",
-    "03298",
-    "03324",
-    "03329",
-    "03331",
-    "03338",
-    "03408",
-    "03412",
-    "03414",
-    "03419",
-    "03434",
-    "03484",
-    "03498",
-    "03524",
-    "03535",
-    "03603",
-    "03627",
-    "03675",
-    "03709",
-    "03788",
-    "03835",
-    "03887",
-    "03889",
-    "03892",
-    "03898",
-    "03901",
-    "03942",
-    "03960",
-    "03972",
-    "03973",
-    "03994",
-    "04005",
-    "04025",
-    "04045",
-    "04051",
-    "04081",
-    "04111",
-    "04124",
-    "04130",
-    "04192",
-    "04195",
-    "04204",
-    "04228",
-    "04283",
-    "04304",
-    "04388",
-    "04390",
-    "04404",
-    "04424",
-    "04445",
-    "04468",
-    "04541",
-    "04551",
-    "04557",
-    "04558",
-    "04584",
-    "04627",
-    "04645",
-    "04662",
-    "04674",
-    "04690",
-    "04692",
-    "04698",
-    "04704",
-    "04707",
-    "04720",
-    "04736",
-    "04737",
-    "04745",
-    "04753",
-    "04767",
-    "04769",
-    "04774",
-    "04788",
-    "04790",
-    "04812",
-    "04840",
-    "04844",
-    "04853",
-    "04867",
-    "04873",
-    "04889",
-    "04924",
-    "04938",
-    "04955",
-    "04969",
-    "05008",
-    "05022",
-    "05029",
-    "05062",
-    "05064",
-    "05066",
-    "05089",
-    "05125",
-    "05136",
-    "05146",
-    "05154",
-    "05192",
-    "05193",
-    "05202",
-    "05214",
-    "05242",
-    "05286",
-    "05294",
-    "05348",
-    "05349",
-    "05352",
-    "05369",
-    "05443",
-    "05451",
-    "05454",
-    "05519",
-    "05575",
-    "05580",
-    "05581",
-    "05593",
-    "05618",
-    "05638",
-    "05679",
-    "05685",
-    "05714",
-    "05715",
-    "05719",
-    "05724",
-    "05783",
-    "05841",
-    "05858",
-    "05871",
-    "05872",
-    "05881",
-    "05894",
-    "05954",
-    "06002",
-    "06013",
-    "06020",
-    "06023",
-    "06036",
-    "06058",
-    "06064",
-    "06065",
-    "06069",
-    "06091",
-    "06095",
-    "06101",
-    "06108",
-    "06121",
-    "06166",
-    "06176",
-    "06191",
-    "06205",
-    "06221",
-    "06223",
-    "06225",
-    "06269",
-    "06273",
-    "06276",
-    "06281",
-    "06309",
-    "06317",
-    "06352",
-    "06399",
-    "06404",
-    "06417",
-    "06419",
-    "06443",
-    "06458",
-    "06467",
-    "06488",
-    "06494",
-    "06503",
-    "06545",
-    "06557",
-    "06565",
-    "06566",
-    "06575",
-    "06580",
-    "06585",
-    "06587",
-    "06600",
-    "06645",
-    "06660",
-    "06674",
-    "06698",
-    "06715",
-    "06734",
-    "06792",
-    "06796",
-    "06835",
-    "06845",
-    "06877",
-    "06884",
-    "06891",
-    "06894",
-    "06940",
-    "06943",
-    "06964",
-    "06978",
-    "06986",
-    "07031",
-    "07057",
-    "07110",
-    "07117",
-    "07134",
-    "07149",
-    "07157",
-    "07175",
-    "07194",
-    "07207",
-    "07214",
-    "07222",
-    "07253",
-    "07268",
-    "07296",
-    "07297",
-    "07302",
-    "07319",
-    "07347",
-    "07349",
-    "07387",
-    "07388",
-    "07396",
-    "07398",
-    "07420",
-    "07467",
-    "07471",
-    "07493",
-    "07496",
-    "07509",
-    "07538",
-    "07555",
-    "07564",
-    "07571",
-    "07584",
-    "07597",
-    "07621",
-    "07622",
-    "07657",
-    "07666",
-    "07775",
-    "07872",
-    "07892",
-    "07917",
-    "07934",
-    "07954",
-    "07969",
-    "08011",
-    "08041",
-    "08084",
-    "08129",
-    "08134",
-    "08137",
-    "08138",
-    "08209",
-    "08244",
-    "08246",
-    "08283",
-    "08287",
-    "08302",
-    "08313",
-    "08345",
-    "08346",
-    "08348",
-    "08352",
-    "08383",
-    "08438",
-    "08496",
-    "08532",
-    "08536",
-    "08540",
-    "08541",
-    "08551",
-    "08595",
-    "08601",
-    "08603",
-    "08614",
-    "08641",
-    "08648",
-    "08654",
-    "08659",
-    "08675",
-    "08680",
-    "08687",
-    "08695",
-    "08719",
-    "08740",
-    "08764",
-    "08765",
-    "08767",
-    "08809",
-    "08822",
-    "08852",
-    "08880",
-    "08883",
-    "08937",
-    "08939",
-    "08942",
-    "08954",
-    "08970",
-    "08971",
-    "08975",
-    "08989",
-    "09030",
-    "09034",
-    "09082",
-    "09096",
-    "09119",
-    "09125",
-    "09129",
-    "09148",
-    "09156",
-    "09167",
-    "09179",
-    "09189",
-    "09193",
-    "09205",
-    "09217",
-    "09254",
-    "09321",
-    "09322",
-    "09354",
-    "09367",
-    "09373",
-    "09384",
-    "09385",
-    "09411",
-    "09428",
-    "09431",
-    "09452",
-    "09454",
-    "09477",
-    "09483",
-    "09502",
-    "09509",
-    "09515",
-    "09525",
-    "09530",
-    "09532",
-    "09534",
-    "09548",
-    "09550",
-    "09566",
-    "09568",
-    "09571",
-    "09583",
-    "09584",
-    "09594",
-    "09603",
-    "09614",
-    "09634",
-    "09637",
-    "09651",
-    "09672",
-    "09681",
-    "09689",
-    "09701",
-    "09712",
-    "09737",
-    "09745",
-    "09765",
-    "09793",
-    "09818",
-    "09831",
-    "09837",
-    "09840",
-    "09843",
-    "09858",
-    "09875",
-    "09903",
-    "09905",
-    "09906",
-    "09910",
-    "09918",
-    "09920",
-    "09943",
-    "09951",
-    "09958",
-    "09966",
-    "09971",
-    "09981",
-    "09987",
-    "09991",
-    "09998",
-    "10001",
-    "10008",
-    "10026",
-    "10059",
-    "10068",
-    "10069",
-    "10116",
-    "10125",
-    "10141",
-    "10150",
-    "10156",
-    "10162",
-    "10164",
-    "10169",
-    "10191",
-    "10194",
-    "10216",
-    "10236",
-    "10262",
-    "10268",
-    "10275",
-    "10296",
-    "10302",
-    "10307",
-    "10309",
-    "10314",
-    "10317",
-    "10319",
-    "10325",
-    "10336",
-    "10344",
-    "10369",
-    "10382",
-    "10399",
-    "10408",
-    "10411",
-    "10414",
-    "10418",
-    "10419",
-    "10444",
-    "10451",
-    "10492",
-    "10499",
-    "10519",
-    "10525",
-    "10534",
-    "10540",
-    "10573",
-    "10584",
-    "10586",
-    "10587",
-    "10589",
-    "10613",
-    "10618",
-    "10631",
-    "10634",
-    "10635",
-    "10636",
-    "10662",
-    "10663",
-    "10679",
-    "10689",
-    "10725",
-    "10732",
-    "10744",
-    "10757",
-    "10765",
-    "10766",
-    "10844",
-    "10852",
-    "10854",
-    "10870",
-    "10894",
-    "10899",
-    "10913",
-    "10918",
-    "10919",
-    "10965",
-    "11075",
-    "11083",
-    "11087",
-    "11140",
-    "11143",
-    "11147",
-    "11160",
-    "11176",
-    "11178",
-    "11185",
-    "11187",
-    "11201",
-    "11204",
-    "11206",
-    "11209",
-    "11216",
-    "11218",
-    "11229",
-    "11233",
-    "11289",
-    "11294",
-    "11338",
-    "11364",
-    "11387",
-    "11398",
-    "11400",
-    "11403",
-    "11409",
-    "11421",
-    "11422",
-    "11423",
-    "11425",
-    "11479",
-    "11521",
-    "11523",
-    "11525",
-    "11529",
-    "11545",
-    "11564",
-    "11581",
-    "11620",
-    "11621",
-    "11639",
-    "11654",
-    "11669",
-    "11675",
-    "11686",
-    "11692",
-    "11711",
-    "11715",
-    "11721",
-    "11732",
-    "11749",
-    "11757",
-    "11767",
-    "11777",
-    "11781",
-    "11797",
-    "11818",
-    "11821",
-    "11824",
-    "11838",
-    "11844",
-    "11852",
-    "11854",
-    "11877",
-    "11883",
-    "11888",
-    "11900",
-    "11904",
-    "11933",
-    "11934",
-    "11944",
-    "11952",
-    "11985",
-    "12022",
-    "12033",
-    "12037",
-    "12044",
-    "12046",
-    "12063",
-    "12105",
-    "12106",
-    "12123",
-    "12124",
-    "12145",
-    "12150",
-    "12185",
-    "12193",
-    "12205",
-    "12210",
-    "12219",
-    "12224",
-    "12244",
-    "12276",
-    "12284",
-    "12291",
-    "12293",
-    "12297",
-    "12324",
-    "12352",
-    "12366",
-    "12400",
-    "12455",
-    "12459",
-    "12477",
-    "12503",
-    "12522",
-    "12532",
-    "12562",
-    "12565",
-    "12621",
-    "12629",
-    "12645",
-    "12648",
-    "12668",
-    "12686",
-    "12698",
-    "12724",
-    "12738",
-    "12808",
-    "12812",
-    "12814",
-    "12819",
-    "12834",
-    "12891",
-    "12898",
-    "12924",
-    "12935",
-    "12952",
-    "13003",
-    "13027",
-    "13075",
-    "13188",
-    "13191",
-    "13235",
-    "13252",
-    "13298",
-    "13301",
-    "13318",
-    "13342",
-    "13360",
-    "13368",
-    "13372",
-    "13373",
-    "13394",
-    "13396",
-    "13405",
-    "13425",
-    "13445",
-    "13447",
-    "13451",
-    "13481",
-    "13511",
-    "13524",
-    "13592",
-    "13595",
-    "13604",
-    "13622",
-    "13628",
-    "13683",
-    "13764",
-    "13788",
-    "13790",
-    "13804",
-    "13824",
-    "13830",
-    "13868",
-    "13883",
-    "13951",
-    "13957",
-    "13984",
-    "14027",
-    "14062",
-    "14072",
-    "14074",
-    "14092",
-    "14098",
-    "14104",
-    "14107",
-    "14120",
-    "14136",
-    "14145",
-    "14153",
-    "14167",
-    "14169",
-    "14174",
-    "14188",
-    "14190",
-    "14212",
-    "14219",
-    "14240",
-    "14244",
-    "14253",
-    "14273",
-    "14289",
-    "14324",
-    "14338",
-    "14360",
-    "14369",
-    "14408",
-    "14462",
-    "14464",
-    "14466",
-    "14489",
-    "14525",
-    "14536",
-    "14546",
-    "14554",
-    "14561",
-    "14593",
-    "14602",
-    "14614",
-    "14629",
-    "14642",
-    "14686",
-    "14694",
-    "14749",
-    "14752",
-    "14843",
-    "14851",
-    "14854",
-    "14919",
-    "14975",
-    "14980",
-    "14993",
-    "15018",
-    "15038",
-    "15079",
-    "15085",
-    "15114",
-    "15115",
-    "15119",
-    "15124",
-    "15143",
-    "15167",
-    "15241",
-    "15258",
-    "15272",
-    "15281",
-    "15290",
-    "15294",
-    "15319",
-    "15354",
-    "15386",
-    "15402",
-    "15413",
-    "15423",
-    "15464",
-    "15465",
-    "15495",
-    "15501",
-    "15508",
-    "15521",
-    "15532",
-    "15566",
-    "15576",
-    "15590",
-    "15591",
-    "15605",
-    "15615",
-    "15621",
-    "15623",
-    "15625",
-    "15669",
-    "15673",
-    "15676",
-    "15681",
-    "15695",
-    "15709",
-    "15717",
-    "15743",
-    "15752",
-    "15781",
-    "15799",
-    "15802",
-    "15804",
-    "15817",
-    "15819",
-    "15858",
-    "15867",
-    "15903",
-    "15922",
-    "15933",
-    "15945",
-    "15965",
-    "15980",
-    "15985",
-    "15990",
-    "16000",
-    "16045",
-    "16053",
-    "16060",
-    "16074",
-    "16075",
-    "16088",
-    "16098",
-    "16115",
-    "16134",
-    "16149",
-    "16192",
-    "16196",
-    "16240",
-    "16245",
-    "16277",
-    "16284",
-    "16291",
-    "16340",
-    "16343",
-    "16364",
-    "16378",
-    "16386",
-    "16454",
-    "16457",
-    "16475",
-    "16489",
-    "16497",
-    "16510",
-    "16534",
-    "16539",
-    "16549",
-    "16557",
-    "16575",
-    "16594",
-    "16614",
-    "16622",
-    "16653",
-    "16668",
-    "16693",
-    "16696",
-    "16697",
-    "16719",
-    "16747",
-    "16787",
-    "16788",
-    "16798",
-    "16801",
-    "16820",
-    "16867",
-    "16871",
-    "16893",
-    "16894",
-    "16896",
-    "16909",
-    "16913",
-    "16938",
-    "16944",
-    "16955",
-    "16971",
-    "16984",
-    "16997",
-    "17018",
-    "17021",
-    "17023",
-    "17039",
-    "17057",
-    "17066",
-    "17172",
-    "17219",
-    "17237",
-    "17272",
-    "17292",
-    "17317",
-    "17319",
-    "17333",
-    "17334",
-    "17354",
-    "17411",
-    "17441",
-    "17529",
-    "17537",
-    "17538",
-    "17564",
-    "17595",
-    "17609",
-    "17644",
-    "17682",
-    "17683",
-    "17687",
-    "17702",
-    "17743",
-    "17745",
-    "17746",
-    "17752",
-    "17783",
-    "17820",
-    "17838",
-    "17896",
-    "17912",
-    "17932",
-    "17934",
-    "17936",
-    "17940",
-    "17941",
-    "17951",
-    "17991",
-    "17995",
-    "18001",
-    "18003",
-    "18014",
-    "18018",
-    "18041",
-    "18048",
-    "18054",
-    "18057",
-    "18059",
-    "18075",
-    "18087",
-    "18095",
-    "18119",
-    "18124",
-    "18140",
-    "18164",
-    "18165",
-    "18167",
-    "18205",
-    "18209",
-    "18222",
-    "18223",
-    "18239",
-    "18249",
-    "18252",
-    "18274",
-    "18280",
-    "18339",
-    "18354",
-    "18370",
-    "18371",
-    "18375",
-    "18391",
-    "18434",
-    "18482",
-    "18519",
-    "18525",
-    "18529",
-    "18567",
-    "18578",
-    "18579",
-    "18605",
-    "18617",
-    "18721",
-    "18722",
-    "18754",
-    "18767",
-    "18773",
-    "18784",
-    "18785",
-    "18811",
-    "18828",
-    "18862",
-    "18877",
-    "18883",
-    "18899",
-    "18909",
-    "18924",
-    "18930",
-    "18948",
-    "18971",
-    "18988",
-    "18994",
-    "19003",
-    "19037",
-    "19089",
-    "19101",
-    "19120",
-    "19145",
-    "19162",
-    "19165",
-    "19188",
-    "19193",
-    "19230",
-    "19231",
-    "19236",
-    "19237",
-    "19275",
-    "19303",
-    "19305",
-    "19306",
-    "19310",
-    "19317",
-    "19343",
-    "19351",
-    "19387",
-    "19391",
-    "19398",
-    "19431",
-    "19452",
-    "19454",
-    "19471",
-    "19501",
-    "19515",
-    "19532",
-    "19534",
-    "19550",
-    "19568",
-    "19583",
-    "19584",
-    "19614",
-    "19634",
-    "19651",
-    "19672",
-    "19681",
-    "19698",
-    "19785",
-    "19818",
-    "19840",
-    "19843",
-    "19858",
-    "19865",
-    "19920",
-    "19938",
-    "19981",
-    "20001",
-    "20008",
-    "20026",
-    "20029",
-    "20049",
-    "20059",
-    "20068",
-    "20069",
-    "20116",
-    "20125",
-    "20128",
-    "20141",
-    "20149",
-    "20150",
-    "20156",
-    "20162",
-    "20163",
-    "20164",
-    "20169",
-    "20191",
-    "20193",
-    "20194",
-    "20204",
-    "20216",
-    "20224",
-    "20238",
-    "20244",
-    "20245",
-    "20262",
-    "20268",
-    "20275",
-    "20278",
-    "20296",
-    "20297",
-    "20302",
-    "20307",
-    "20309",
-    "20311",
-    "20314",
-    "20319",
-    "20320",
-    "20323",
-    "20325",
-    "20330",
-    "20344",
-    "20369",
-    "20381",
-    "20383",
-    "20399",
-    "20407",
-    "20408",
-    "20411",
-    "20414",
-    "20418",
-    "20419",
-    "20428",
-    "20444",
-    "20445",
-    "20451",
-    "20468",
-    "20481",
-    "20485",
-    "20492",
-    "20499",
-    "20514",
-    "20519",
-    "20522",
-    "20525",
-    "20526",
-    "20534",
-    "20540",
-    "20573",
-    "20584",
-    "20586",
-    "20587",
-    "20589",
-    "20613",
-    "20618",
-    "20631",
-    "20634",
-    "20635",
-    "20647",
-    "20663",
-    "20681",
-    "20689",
-    "20702",
-    "20725",
-    "20728",
-    "20732",
-    "20744",
-    "20765",
-    "20766",
-    "20817",
-    "20844",
-    "20851",
-    "20852",
-    "20854",
-    "20858",
-    "20875",
-    "20894",
-    "20899",
-    "20913",
-    "20918",
-    "20919",
-    "20945",
-    "20965",
-    "20974",
-    "20982",
-    "20986",
-    "21075",
-    "21083",
-    "21087",
-    "21103",
-    "21104",
-    "21140",
-    "21143",
-    "21147",
-    "21150",
-    "21160",
-    "21176",
-    "21184",
-    "21185",
-    "21187",
-    "21201",
-    "21204",
-    "21206",
-    "21209",
-    "21216",
-    "21218",
-    "21219",
-    "21229",
-    "21278",
-    "21286",
-    "21289",
-    "21294",
-    "21309",
-    "21320",
-    "21327",
-    "21338",
-    "21364",
-    "21373",
-    "21379",
-    "21387",
-    "21398",
-    "21400",
-    "21403",
-    "21409",
-    "21422",
-    "21423",
-    "21425",
-    "21439",
-    "21495",
-    "21513",
-    "21521",
-    "21523",
-    "21525",
-    "21529",
-    "21545",
-    "21549",
-    "21564",
-    "21581",
-    "21606",
-    "21620",
-    "21621",
-    "21639",
-    "21649",
-    "21654",
-    "21666",
-    "21669",
-    "21675",
-    "21685",
-    "21686",
-    "21692",
-    "21711",
-    "21715",
-    "21721",
-    "21732",
-    "21733",
-    "21749",
-    "21753",
-    "21757",
-    "21764",
-    "21767",
-    "21777",
-    "21781",
-    "21782",
-    "21792",
-    "21795",
-    "21802",
-    "21811",
-    "21818",
-    "21821",
-    "21824",
-    "21830",
-    "21838",
-    "21844",
-    "21851",
-    "21852",
-    "21854",
-    "21869",
-    "21877",
-    "21883",
-    "21900",
-    "21904",
-    "21933",
-    "21934",
-    "21944",
-    "21952",
-    "22000",
-    "22005",
-    "22024",
-    "22033",
-    "22046",
-    "22063",
-    "22082",
-    "22095",
-    "22105",
-    "22106",
-    "22123",
-    "22139",
-    "22145",
-    "22150",
-    "22193",
-    "22205",
-    "22210",
-    "22219",
-    "22224",
-    "22244",
-    "22255",
-    "22258",
-    "22276",
-    "22281",
-    "22284",
-    "22291",
-    "22293",
-    "22297",
-    "22324",
-    "22352",
-    "22366",
-    "22403",
-    "22444",
-    "22455",
-    "22459",
-    "22477",
-    "22503",
-    "22522",
-    "22532",
-    "22539",
-    "22562",
-    "22565",
-    "22621",
-    "22629",
-    "22633",
-    "22645",
-    "22648",
-    "22668",
-    "22686",
-    "22698",
-    "22704",
-    "22724",
-    "22729",
-    "22738",
-    "22758",
-    "22807",
-    "22808",
-    "22812",
-    "22814",
-    "22819",
-    "22834",
-    "22884",
-    "22891",
-    "22894",
-    "22898",
-    "22917",
-    "22924",
-    "22935",
-    "23003",
-    "23027",
-    "23054",
-    "23075",
-    "23094",
-    "23175",
-    "23191",
-    "23199",
-    "23235",
-    "23252",
-    "23289",
-    "23292",
-    "23298",
-    "23301",
-    "23308",
-    "23342",
-    "23360",
-    "23372",
-    "23373",
-    "23394",
-    "23396",
-    "23405",
-    "23425",
-    "23445",
-    "23451",
-    "23481",
-    "23511",
-    "23521",
-    "23524",
-    "23540",
-    "23592",
-    "23595",
-    "23604",
-    "23607",
-    "23617",
-    "23622",
-    "23628",
-    "23629",
-    "23647",
-    "23664",
-    "23683",
-    "23704",
-    "23725",
-    "23764",
-    "23788",
-    "23790",
-    "23804",
-    "23811",
-    "23824",
-    "23834",
-    "23845",
-    "23852",
-    "23868",
-    "23879",
-    "23883",
-    "23898",
-    "23918",
-    "23941",
-    "23951",
-    "23957",
-    "23958",
-    "23984",
-    "23989",
-    "24004",
-    "24027",
-    "24029",
-    "24039",
-    "24045",
-    "24062",
-    "24074",
-    "24090",
-    "24092",
-    "24098",
-    "24104",
-    "24106",
-    "24107",
-    "24120",
-    "24136",
-    "24137",
-    "24145",
-    "24146",
-    "24153",
-    "24167",
-    "24169",
-    "24174",
-    "24188",
-    "24190",
-    "24212",
-    "24219",
-    "24240",
-    "24244",
-    "24253",
-    "24254",
-    "24255",
-    "24267",
-    "24273",
-    "24289",
-    "24312",
-    "24324",
-    "24338",
-    "24355",
-    "24356",
-    "24360",
-    "24369",
-    "24372",
-    "24387",
-    "24408",
-    "24422",
-    "24429",
-    "24435",
-    "24462",
-    "24464",
-    "24466",
-    "24484",
-    "24489",
-    "24525",
-    "24536",
-    "24546",
-    "24554",
-    "24561",
-    "24569",
-    "24592",
-    "24593",
-    "24597",
-    "24602",
-    "24614",
-    "24615",
-    "24642",
-    "24686",
-    "24689",
-    "24694",
-    "24742",
-    "24744",
-    "24748",
-    "24749",
-    "24752",
-    "24760",
-    "24769",
-    "24820",
-    "24843",
-    "24851",
-    "24854",
-    "24919",
-    "24925",
-    "24966",
-    "24975",
-    "24980",
-    "24981",
-    "24993",
-    "25010",
-    "25018",
-    "25038",
-    "25079",
-    "25085",
-    "25097",
-    "25114",
-    "25115",
-    "25119",
-    "25124",
-    "25143",
-    "25183",
-    "25236",
-    "25241",
-    "25247",
-    "25258",
-    "25271",
-    "25272",
-    "25274",
-    "25281",
-    "25290",
-    "25294",
-    "25319",
-    "25325",
-    "25354",
-    "25386",
-    "25391",
-    "25392",
-    "25402",
-    "25413",
-    "25423",
-    "25436",
-    "25442",
-    "25460",
-    "25464",
-    "25465",
-    "25495",
-    "25497",
-    "25501",
-    "25508",
-    "25521",
-    "25532",
-    "25547",
-    "25553",
-    "25566",
-    "25576",
-    "25580",
-    "25590",
-    "25591",
-    "25597",
-    "25605",
-    "25621",
-    "25623",
-    "25625",
-    "25642",
-    "25669",
-    "25676",
-    "25681",
-    "25695",
-    "25709",
-    "25717",
-    "25743",
-    "25752",
-    "25798",
-    "25799",
-    "25802",
-    "25804",
-    "25817",
-    "25819",
-    "25858",
-    "25867",
-    "25888",
-    "25894",
-    "25903",
-    "25933",
-    "25945",
-    "25957",
-    "25965",
-    "25966",
-    "25975",
-    "25980",
-    "25985",
-    "25987",
-    "25990",
-    "26000",
-    "26033",
-    "26045",
-    "26053",
-    "26060",
-    "26074",
-    "26075",
-    "26097",
-    "26098",
-    "26115",
-    "26134",
-    "26156",
-    "26192",
-    "26196",
-    "26197",
-    "26235",
-    "26237",
-    "26239",
-    "26240",
-    "26245",
-    "26261",
-    "26277",
-    "26282",
-    "26284",
-    "26291",
-    "26294",
-    "26340",
-    "26343",
-    "26364",
-    "26378",
-    "26386",
-    "26389",
-    "26397",
-    "26431",
-    "26454",
-    "26457",
-    "26489",
-    "26510",
-    "26517",
-    "26534",
-    "26539",
-    "26549",
-    "26557",
-    "26575",
-    "26594",
-    "26607",
-    "26614",
-    "26622",
-    "26653",
-    "26668",
-    "26693",
-    "26696",
-    "26697",
-    "26699",
-    "26702",
-    "26704",
-    "26719",
-    "26747",
-    "26749",
-    "26787",
-    "26788",
-    "26796",
-    "26798",
-    "26820",
-    "26830",
-    "26867",
-    "26871",
-    "26888",
-    "26893",
-    "26896",
-    "26909",
-    "26913",
-    "26933",
-    "26938",
-    "26944",
-    "26955",
-    "26964",
-    "26971",
-    "26984",
-    "26992",
-    "26995",
-    "26997",
-    "27021",
-    "27022",
-    "27023",
-    "27039",
-    "27042",
-    "27057",
-    "27066",
-    "27098",
-    "27113",
-    "27119",
-    "27149",
-    "27175",
-    "27207",
-    "27219",
-    "27253",
-    "27272",
-    "27280",
-    "27292",
-    "27317",
-    "27319",
-    "27322",
-    "27334",
-    "27377",
-    "27389",
-    "27395",
-    "27411",
-    "27422",
-    "27441",
-    "27484",
-    "27529",
-    "27534",
-    "27537",
-    "27538",
-    "27563",
-    "27564",
-    "27570",
-    "27595",
-    "27609",
-    "27644",
-    "27658",
-    "27671",
-    "27682",
-    "27683",
-    "27687",
-    "27702",
-    "27713",
-    "27743",
-    "27745",
-    "27746",
-    "27748",
-    "27750",
-    "27752",
-    "27759",
-    "27783",
-    "27820",
-    "27835",
-    "27838",
-    "27841",
-    "27845",
-    "27854",
-    "27880",
-    "27896",
-    "27903",
-    "27932",
-    "27934",
-    "27936",
-    "27940",
-    "27941",
-    "27995",
-    "27999",
-    "28003",
-    "28014",
-    "28018",
-    "28041",
-    "28048",
-    "28054",
-    "28059",
-    "28075",
-    "28080",
-    "28087",
-    "28095",
-    "28109",
-    "28119",
-    "28140",
-    "28164",
-    "28167",
-    "28209",
-    "28221",
-    "28222",
-    "28223",
-    "28249",
-    "28252",
-    "28257",
-    "28274",
-    "28280",
-    "28283",
-    "28336",
-    "28337",
-    "28339",
-    "28342",
-    "28354",
-    "28370",
-    "28371",
-    "28375",
-    "28389",
-    "28434",
-    "28466",
-    "28482",
-    "28519",
-    "28522",
-    "28525",
-    "28529",
-    "28548",
-    "28556",
-    "28567",
-    "28579",
-    "28587",
-    "28593",
-    "28605",
-    "28637",
-    "28654",
-    "28674",
-    "28721",
-    "28722",
-    "28754",
-    "28767",
-    "28773",
-    "28784",
-    "28811",
-    "28828",
-    "28862",
-    "28877",
-    "28883",
-    "28903",
-    "28909",
-    "28924",
-    "28930",
-    "28948",
-    "28971",
-    "28988",
-    "28994",
-    "29003",
-    "29037",
-    "29044",
-    "29089",
-    "29094",
-    "29101",
-    "29105",
-    "29112",
-    "29120",
-    "29145",
-    "29162",
-    "29165",
-    "29188",
-    "29193",
-    "29230",
-    "29231",
-    "29236",
-    "29237",
-    "29252",
-    "29275",
-    "29303",
-    "29305",
-    "29306",
-    "29309",
-    "29310",
-    "29317",
-    "29318",
-    "29343",
-    "29352",
-    "29358",
-    "29387",
-    "29391",
-    "29398",
-    "29431",
-    "29452",
-    "29454",
-    "29501",
-    "29502",
-    "29515",
-    "29525",
-    "29530",
-    "29532",
-    "29534",
-    "29550",
-    "29553",
-    "29566",
-    "29583",
-    "29584",
-    "29614",
-    "29634",
-    "29651",
-    "29672",
-    "29681",
-    "29698",
-    "29726",
-    "29737",
-    "29766",
-    "29778",
-    "29785",
-    "29793",
-    "29818",
-    "29829",
-    "29840",
-    "29843",
-    "29858",
-    "29865",
-    "29920",
-    "29966",
-    "29981",
-    "30001",
-    "30008",
-    "30026",
-    "30029",
-    "30049",
-    "30056",
-    "30059",
-    "30069",
-    "30116",
-    "30125",
-    "30128",
-    "30141",
-    "30150",
-    "30156",
-    "30162",
-    "30164",
-    "30169",
-    "30191",
-    "30194",
-    "30204",
-    "30216",
-    "30224",
-    "30238",
-    "30245",
-    "30254",
-    "30262",
-    "30268",
-    "30275",
-    "30278",
-    "30296",
-    "30302",
-    "30307",
-    "30309",
-    "30311",
-    "30317",
-    "30319",
-    "30323",
-    "30330",
-    "30336",
-    "30344",
-    "30348",
-    "30369",
-    "30382",
-    "30383",
-    "30386",
-    "30399",
-    "30407",
-    "30408",
-    "30411",
-    "30418",
-    "30419",
-    "30428",
-    "30445",
-    "30451",
-    "30468",
-    "30481",
-    "30492",
-    "30499",
-    "30514",
-    "30519",
-    "30522",
-    "30525",
-    "30526",
-    "30534",
-    "30540",
-    "30573",
-    "30580",
-    "30584",
-    "30586",
-    "30587",
-    "30589",
-    "30618",
-    "30631",
-    "30634",
-    "30635",
-    "30636",
-    "30662",
-    "30679",
-    "30702",
-    "30725",
-    "30728",
-    "30732",
-    "30744",
-    "30757",
-    "30765",
-    "30766",
-    "30817",
-    "30844",
-    "30852",
-    "30854",
-    "30870",
-    "30875",
-    "30894",
-    "30899",
-    "30913",
-    "30918",
-    "30919",
-    "30945",
-    "30965",
-    "30967",
-    "30974",
-    "31075",
-    "31083",
-    "31087",
-    "31103",
-    "31104",
-    "31135",
-    "31140",
-    "31143",
-    "31147",
-    "31150",
-    "31160",
-    "31176",
-    "31185",
-    "31187",
-    "31201",
-    "31204",
-    "31206",
-    "31209",
-    "31216",
-    "31218",
-    "31219",
-    "31229",
-    "31233",
-    "31255",
-    "31278",
-    "31286",
-    "31289",
-    "31294",
-    "31309",
-    "31338",
-    "31379",
-    "31383",
-    "31387",
-    "31398",
-    "31400",
-    "31403",
-    "31409",
-    "31421",
-    "31422",
-    "31423",
-    "31439",
-    "31453",
-    "31495",
-    "31513",
-    "31521",
-    "31523",
-    "31525",
-    "31529",
-    "31545",
-    "31549",
-    "31564",
-    "31590",
-    "31606",
-    "31620",
-    "31639",
-    "31649",
-    "31654",
-    "31666",
-    "31669",
-    "31675",
-    "31685",
-    "31686",
-    "31692",
-    "31711",
-    "31715",
-    "31721",
-    "31732",
-    "31733",
-    "31749",
-    "31753",
-    "31757",
-    "31764",
-    "31767",
-    "31771",
-    "31777",
-    "31781",
-    "31792",
-    "31795",
-    "31802",
-    "31818",
-    "31821",
-    "31824",
-    "31830",
-    "31838",
-    "31844",
-    "31851",
-    "31852",
-    "31854",
-    "31869",
-    "31877",
-    "31883",
-    "31900",
-    "31904",
-    "31933",
-    "31934",
-    "31944",
-    "31952",
-    "32000",
-    "32022",
-    "32024",
-    "32033",
-    "32037",
-    "32063",
-    "32082",
-    "32095",
-    "32105",
-    "32106",
-    "32123",
-    "32124",
-    "32139",
-    "32145",
-    "32150",
-    "32160",
-    "32185",
-    "32193",
-    "32205",
-    "32210",
-    "32219",
-    "32224",
-    "32230",
-    "32244",
-    "32255",
-    "32258",
-    "32276",
-    "32281",
-    "32284",
-    "32291",
-    "32293",
-    "32297",
-    "32324",
-    "32352",
-    "32366",
-    "32389",
-    "32400",
-    "32444",
-    "32455",
-    "32459",
-    "32469",
-    "32477",
-    "32503",
-    "32522",
-    "32532",
-    "32539",
-    "32562",
-    "32565",
-    "32621",
-    "32629",
-    "32633",
-    "32645",
-    "32668",
-    "32686",
-    "32704",
-    "32711",
-    "32724",
-    "32729",
-    "32738",
-    "32807",
-    "32808",
-    "32812",
-    "32814",
-    "32819",
-    "32834",
-    "32884",
-    "32894",
-    "32898",
-    "32924",
-    "32935",
-    "32952",
-    "33003",
-    "33027",
-    "33075",
-    "33094",
-    "33109",
-    "33175",
-    "33191",
-    "33199",
-    "33235",
-    "33252",
-    "33287",
-    "33298",
-    "33301",
-    "33308",
-    "33318",
-    "33342",
-    "33360",
-    "33368",
-    "33372",
-    "33373",
-    "33394",
-    "33396",
-    "33405",
-    "33425",
-    "33445",
-    "33447",
-    "33451",
-    "33481",
-    "33511",
-    "33521",
-    "33524",
-    "33530",
-    "33540",
-    "33592",
-    "33595",
-    "33604",
-    "33607",
-    "33617",
-    "33622",
-    "33628",
-    "33647",
-    "33664",
-    "33683",
-    "33704",
-    "33764",
-    "33788",
-    "33790",
-    "33804",
-    "33824",
-    "33834",
-    "33845",
-    "33852",
-    "33868",
-    "33883",
-    "33918",
-    "33941",
-    "33949",
-    "33951",
-    "33957",
-    "33959",
-    "33971",
-    "33984",
-    "33989",
-    "34004",
-    "34027",
-    "34039",
-    "34045",
-    "34062",
-    "34072",
-    "34074",
-    "34088",
-    "34090",
-    "34092",
-    "34098",
-    "34104",
-    "34107",
-    "34120",
-    "34136",
-    "34137",
-    "34145",
-    "34146",
-    "34153",
-    "34167",
-    "34169",
-    "34174",
-    "34188",
-    "34190",
-    "34212",
-    "34219",
-    "34240",
-    "34244",
-    "34253",
-    "34254",
-    "34255",
-    "34267",
-    "34273",
-    "34286",
-    "34289",
-    "34317",
-    "34324",
-    "34338",
-    "34355",
-    "34356",
-    "34360",
-    "34369",
-    "34372",
-    "34408",
-    "34422",
-    "34429",
-    "34435",
-    "34462",
-    "34464",
-    "34466",
-    "34477",
-    "34484",
-    "34489",
-    "34525",
-    "34536",
-    "34546",
-    "34554",
-    "34561",
-    "34569",
-    "34592",
-    "34593",
-    "34597",
-    "34602",
-    "34614",
-    "34615",
-    "34629",
-    "34642",
-    "34683",
-    "34686",
-    "34694",
-    "34748",
-    "34749",
-    "34752",
-    "34760",
-    "34769",
-    "34820",
-    "34843",
-    "34851",
-    "34854",
-    "34919",
-    "34921",
-    "34966",
-    "34975",
-    "34980",
-    "34981",
-    "34993",
-    "35018",
-    "35038",
-    "35079",
-    "35085",
-    "35097",
-    "35114",
-    "35115",
-    "35119",
-    "35124",
-    "35143",
-    "35183",
-    "35236",
-    "35241",
-    "35247",
-    "35258",
-    "35271",
-    "35272",
-    "35274",
-    "35281",
-    "35290",
-    "35294",
-    "35319",
-    "35325",
-    "35350",
-    "35354",
-    "35386",
-    "35391",
-    "35392",
-    "35402",
-    "35413",
-    "35423",
-    "35436",
-    "35442",
-    "35458",
-    "35460",
-    "35464",
-    "35465",
-    "35469",
-    "35495",
-    "35497",
-    "35501",
-    "35508",
-    "35521",
-    "35532",
-    "35547",
-    "35566",
-    "35576",
-    "35580",
-    "35591",
-    "35597",
-    "35605",
-    "35615",
-    "35623",
-    "35669",
-    "35673",
-    "35676",
-    "35681",
-    "35709",
-    "35717",
-    "35720",
-    "35752",
-    "35781",
-    "35798",
-    "35799",
-    "35802",
-    "35804",
-    "35817",
-    "35819",
-    "35843",
-    "35858",
-    "35867",
-    "35894",
-    "35903",
-    "35922",
-    "35945",
-    "35957",
-    "35965",
-    "35966",
-    "35975",
-    "35980",
-    "35985",
-    "35987",
-    "35990",
-    "36000",
-    "36045",
-    "36053",
-    "36060",
-    "36074",
-    "36088",
-    "36098",
-    "36115",
-    "36134",
-    "36144",
-    "36149",
-    "36156",
-    "36192",
-    "36196",
-    "36197",
-    "36237",
-    "36239",
-    "36245",
-    "36261",
-    "36277",
-    "36282",
-    "36284",
-    "36291",
-    "36294",
-    "36340",
-    "36343",
-    "36364",
-    "36378",
-    "36386",
-    "36397",
-    "36431",
-    "36444",
-    "36454",
-    "36457",
-    "36497",
-    "36510",
-    "36517",
-    "36534",
-    "36549",
-    "36550",
-    "36552",
-    "36557",
-    "36575",
-    "36594",
-    "36607",
-    "36614",
-    "36622",
-    "36653",
-    "36668",
-    "36693",
-    "36696",
-    "36697",
-    "36699",
-    "36702",
-    "36704",
-    "36719",
-    "36747",
-    "36749",
-    "36787",
-    "36788",
-    "36796",
-    "36798",
-    "36801",
-    "36820",
-    "36830",
-    "36853",
-    "36867",
-    "36871",
-    "36888",
-    "36893",
-    "36894",
-    "36896",
-    "36909",
-    "36938",
-    "36944",
-    "36955",
-    "36964",
-    "36971",
-    "36984",
-    "36992",
-    "36995",
-    "36997",
-    "37018",
-    "37021",
-    "37022",
-    "37023",
-    "37039",
-    "37042",
-    "37057",
-    "37066",
-    "37098",
-    "37113",
-    "37119",
-    "37137",
-    "37149",
-    "37172",
-    "37175",
-    "37207",
-    "37219",
-    "37253",
-    "37272",
-    "37292",
-    "37317",
-    "37319",
-    "37333",
-    "37334",
-    "37354",
-    "37369",
-    "37377",
-    "37389",
-    "37395",
-    "37397",
-    "37411",
-    "37422",
-    "37441",
-    "37484",
-    "37529",
-    "37534",
-    "37537",
-    "37538",
-    "37563",
-    "37564",
-    "37570",
-    "37609",
-    "37644",
-    "37646",
-    "37658",
-    "37671",
-    "37682",
-    "37683",
-    "37687",
-    "37702",
-    "37713",
-    "37743",
-    "37745",
-    "37746",
-    "37748",
-    "37750",
-    "37751",
-    "37752",
-    "37759",
-    "37783",
-    "37820",
-    "37835",
-    "37838",
-    "37841",
-    "37845",
-    "37854",
-    "37896",
-    "37903",
-    "37912",
-    "37932",
-    "37934",
-    "37936",
-    "37940",
-    "37941",
-    "37991",
-    "37995",
-    "37999",
-    "38003",
-    "38014",
-    "38018",
-    "38041",
-    "38048",
-    "38054",
-    "38057",
-    "38059",
-    "38075",
-    "38087",
-    "38095",
-    "38109",
-    "38119",
-    "38124",
-    "38137",
-    "38140",
-    "38163",
-    "38164",
-    "38165",
-    "38167",
-    "38205",
-    "38209",
-    "38222",
-    "38223",
-    "38239",
-    "38249",
-    "38252",
-    "38274",
-    "38280",
-    "38336",
-    "38337",
-    "38339",
-    "38342",
-    "38354",
-    "38370",
-    "38371",
-    "38375",
-    "38389",
-    "38391",
-    "38423",
-    "38430",
-    "38434",
-    "38466",
-    "38482",
-    "38496",
-    "38525",
-    "38529",
-    "38548",
-    "38556",
-    "38567",
-    "38579",
-    "38582",
-    "38587",
-    "38589",
-    "38595",
-    "38605",
-    "38617",
-    "38637",
-    "38674",
-    "38721",
-    "38722",
-    "38754",
-    "38767",
-    "38773",
-    "38784",
-    "38785",
-    "38811",
-    "38828",
-    "38862",
-    "38877",
-    "38883",
-    "38899",
-    "38903",
-    "38909",
-    "38930",
-    "38948",
-    "38971",
-    "38994",
-    "39003",
-    "39037",
-    "39044",
-    "39089",
-    "39101",
-    "39112",
-    "39120",
-    "39145",
-    "39162",
-    "39165",
-    "39193",
-    "39230",
-    "39231",
-    "39237",
-    "39252",
-    "39275",
-    "39303",
-    "39305",
-    "39306",
-    "39309",
-    "39310",
-    "39317",
-    "39318",
-    "39343",
-    "39351",
-    "39352",
-    "39358",
-    "39376",
-    "39387",
-    "39391",
-    "39398",
-    "39431",
-    "39452",
-    "39454",
-    "39501",
-    "39515",
-    "39525",
-    "39530",
-    "39532",
-    "39534",
-    "39550",
-    "39553",
-    "39566",
-    "39568",
-    "39583",
-    "39584",
-    "39611",
-    "39614",
-    "39634",
-    "39642",
-    "39651",
-    "39672",
-    "39681",
-    "39698",
-    "39737",
-    "39740",
-    "39750",
-    "39766",
-    "39778",
-    "39785",
-    "39787",
-    "39818",
-    "39829",
-    "39840",
-    "39843",
-    "39858",
-    "39920",
-    "39938",
-    "39959",
-    "39966",
-    "39971",
-    "39981",
-    "40001",
-    "40008",
-    "40026",
-    "40029",
-    "40056",
-    "40059",
-    "40068",
-    "40069",
-    "40116",
-    "40125",
-    "40141",
-    "40149",
-    "40150",
-    "40156",
-    "40162",
-    "40163",
-    "40164",
-    "40169",
-    "40191",
-    "40193",
-    "40194",
-    "40204",
-    "40216",
-    "40238",
-    "40244",
-    "40245",
-    "40262",
-    "40268",
-    "40275",
-    "40278",
-    "40296",
-    "40302",
-    "40309",
-    "40311",
-    "40317",
-    "40319",
-    "40320",
-    "40323",
-    "40330",
-    "40336",
-    "40344",
-    "40369",
-    "40381",
-    "40382",
-    "40383",
-    "40386",
-    "40399",
-    "40407",
-    "40408",
-    "40411",
-    "40414",
-    "40418",
-    "40419",
-    "40444",
-    "40451",
-    "40468",
-    "40485",
-    "40492",
-    "40499",
-    "40514",
-    "40519",
-    "40525",
-    "40526",
-    "40534",
-    "40540",
-    "40573",
-    "40580",
-    "40584",
-    "40586",
-    "40587",
-    "40589",
-    "40613",
-    "40618",
-    "40631",
-    "40634",
-    "40635",
-    "40636",
-    "40647",
-    "40663",
-    "40679",
-    "40681",
-    "40689",
-    "40702",
-    "40725",
-    "40732",
-    "40744",
-    "40757",
-    "40765",
-    "40766",
-    "40844",
-    "40851",
-    "40852",
-    "40854",
-    "40858",
-    "40870",
-    "40875",
-    "40894",
-    "40899",
-    "40913",
-    "40918",
-    "40919",
-    "40945",
-    "40965",
-    "40967",
-    "40974",
-    "40982",
-    "40986",
-    "41075",
-    "41083",
-    "41087",
-    "41135",
-    "41140",
-    "41143",
-    "41147",
-    "41150",
-    "41160",
-    "41176",
-    "41178",
-    "41184",
-    "41185",
-    "41187",
-    "41201",
-    "41204",
-    "41206",
-    "41209",
-    "41216",
-    "41218",
-    "41219",
-    "41229",
-    "41233",
-    "41254",
-    "41255",
-    "41286",
-    "41289",
-    "41294",
-    "41309",
-    "41320",
-    "41345",
-    "41364",
-    "41373",
-    "41379",
-    "41383",
-    "41387",
-    "41398",
-    "41400",
-    "41403",
-    "41409",
-    "41422",
-    "41423",
-    "41425",
-    "41439",
-    "41453",
-    "41479",
-    "41495",
-    "41513",
-    "41521",
-    "41525",
-    "41529",
-    "41545",
-    "41549",
-    "41564",
-    "41590",
-    "41606",
-    "41620",
-    "41621",
-    "41632",
-    "41639",
-    "41649",
-    "41651",
-    "41654",
-    "41666",
-    "41669",
-    "41675",
-    "41685",
-    "41686",
-    "41692",
-    "41711",
-    "41715",
-    "41721",
-    "41732",
-    "41733",
-    "41749",
-    "41753",
-    "41757",
-    "41764",
-    "41771",
-    "41792",
-    "41795",
-    "41802",
-    "41811",
-    "41818",
-    "41821",
-    "41824",
-    "41830",
-    "41838",
-    "41844",
-    "41851",
-    "41852",
-    "41854",
-    "41888",
-    "41900",
-    "41904",
-    "41933",
-    "41934",
-    "41944",
-    "41952",
-    "41985",
-    "42000",
-    "42022",
-    "42033",
-    "42037",
-    "42044",
-    "42063",
-    "42082",
-    "42095",
-    "42105",
-    "42106",
-    "42123",
-    "42145",
-    "42150",
-    "42160",
-    "42185",
-    "42193",
-    "42205",
-    "42210",
-    "42219",
-    "42224",
-    "42230",
-    "42244",
-    "42255",
-    "42276",
-    "42284",
-    "42291",
-    "42293",
-    "42297",
-    "42324",
-    "42366",
-    "42389",
-    "42400",
-    "42444",
-    "42455",
-    "42459",
-    "42477",
-    "42503",
-    "42522",
-    "42539",
-    "42562",
-    "42565",
-    "42621",
-    "42629",
-    "42633",
-    "42645",
-    "42648",
-    "42668",
-    "42686",
-    "42704",
-    "42711",
-    "42724",
-    "42731",
-    "42735",
-    "42738",
-    "42807",
-    "42808",
-    "42812",
-    "42814",
-    "42819",
-    "42884",
-    "42891",
-    "42898",
-    "42924",
-    "42935",
-    "42952",
-    "43003",
-    "43027",
-    "43054",
-    "43075",
-    "43094",
-    "43100",
-    "43109",
-    "43188",
-    "43191",
-    "43199",
-    "43235",
-    "43252",
-    "43287",
-    "43292",
-    "43298",
-    "43301",
-    "43308",
-    "43318",
-    "43342",
-    "43360",
-    "43368",
-    "43372",
-    "43373",
-    "43394",
-    "43396",
-    "43405",
-    "43425",
-    "43445",
-    "43447",
-    "43451",
-    "43481",
-    "43511",
-    "43524",
-    "43540",
-    "43592",
-    "43595",
-    "43604",
-    "43607",
-    "43617",
-    "43622",
-    "43628",
-    "43647",
-    "43664",
-    "43683",
-    "43704",
-    "43725",
-    "43764",
-    "43788",
-    "43790",
-    "43804",
-    "43811",
-    "43824",
-    "43830",
-    "43834",
-    "43845",
-    "43852",
-    "43868",
-    "43879",
-    "43883",
-    "43898",
-    "43918",
-    "43951",
-    "43957",
-    "43958",
-    "43959",
-    "43971",
-    "43984",
-    "43989",
-    "44004",
-    "44027",
-    "44029",
-    "44039",
-    "44045",
-    "44062",
-    "44074",
-    "44090",
-    "44092",
-    "44098",
-    "44104",
-    "44107",
-    "44120",
-    "44136",
-    "44137",
-    "44145",
-    "44153",
-    "44167",
-    "44169",
-    "44174",
-    "44188",
-    "44190",
-    "44212",
-    "44240",
-    "44244",
-    "44253",
-    "44273",
-    "44286",
-    "44289",
-    "44312",
-    "44317",
-    "44324",
-    "44338",
-    "44360",
-    "44369",
-    "44408",
-    "44422",
-    "44429",
-    "44435",
-    "44462",
-    "44464",
-    "44466",
-    "44477",
-    "44484",
-    "44489",
-    "44525",
-    "44536",
-    "44546",
-    "44554",
-    "44561",
-    "44569",
-    "44592",
-    "44593",
-    "44602",
-    "44614",
-    "44615",
-    "44629",
-    "44642",
-    "44686",
-    "44689",
-    "44694",
-    "44742",
-    "44744",
-    "44749",
-    "44752",
-    "44760",
-    "44769",
-    "44820",
-    "44843",
-    "44854",
-    "44919",
-    "44925",
-    "44966",
-    "44975",
-    "44980",
-    "44993",
-    "45010",
-    "45018",
-    "45038",
-    "45079",
-    "45085",
-    "45097",
-    "45114",
-    "45115",
-    "45119",
-    "45124",
-    "45167",
-    "45183",
-    "45236",
-    "45247",
-    "45258",
-    "45271",
-    "45272",
-    "45274",
-    "45281",
-    "45290",
-    "45294",
-    "45319",
-    "45325",
-    "45354",
-    "45386",
-    "45391",
-    "45392",
-    "45402",
-    "45413",
-    "45420",
-    "45423",
-    "45436",
-    "45442",
-    "45460",
-    "45464",
-    "45465",
-    "45469",
-    "45491",
-    "45495",
-    "45497",
-    "45501",
-    "45508",
-    "45521",
-    "45532",
-    "45547",
-    "45553",
-    "45566",
-    "45576",
-    "45580",
-    "45590",
-    "45591",
-    "45605",
-    "45615",
-    "45621",
-    "45623",
-    "45642",
-    "45669",
-    "45673",
-    "45676",
-    "45681",
-    "45695",
-    "45709",
-    "45717",
-    "45720",
-    "45743",
-    "45752",
-    "45781",
-    "45798",
-    "45799",
-    "45804",
-    "45817",
-    "45819",
-    "45858",
-    "45867",
-    "45888",
-    "45894",
-    "45903",
-    "45922",
-    "45945",
-    "45957",
-    "45965",
-    "45975",
-    "45980",
-    "45985",
-    "45990",
-    "46000",
-    "46045",
-    "46060",
-    "46074",
-    "46098",
-    "46115",
-    "46134",
-    "46144",
-    "46149",
-    "46192",
-    "46196",
-    "46197",
-    "46235",
-    "46237",
-    "46239",
-    "46240",
-    "46245",
-    "46261",
-    "46277",
-    "46282",
-    "46284",
-    "46291",
-    "46340",
-    "46343",
-    "46364",
-    "46378",
-    "46386",
-    "46389",
-    "46397",
-    "46431",
-    "46444",
-    "46454",
-    "46457",
-    "46475",
-    "46489",
-    "46497",
-    "46510",
-    "46534",
-    "46539",
-    "46549",
-    "46550",
-    "46552",
-    "46557",
-    "46575",
-    "46594",
-    "46607",
-    "46614",
-    "46622",
-    "46653",
-    "46668",
-    "46693",
-    "46696",
-    "46697",
-    "46702",
-    "46704",
-    "46708",
-    "46719",
-    "46747",
-    "46749",
-    "46787",
-    "46788",
-    "46796",
-    "46798",
-    "46801",
-    "46820",
-    "46830",
-    "46867",
-    "46871",
-    "46888",
-    "46893",
-    "46894",
-    "46896",
-    "46909",
-    "46933",
-    "46938",
-    "46944",
-    "46955",
-    "46964",
-    "46971",
-    "46984",
-    "46995",
-    "46997",
-    "47018",
-    "47021",
-    "47022",
-    "47023",
-    "47039",
-    "47042",
-    "47057",
-    "47066",
-    "47098",
-    "47113",
-    "47119",
-    "47137",
-    "47149",
-    "47172",
-    "47175",
-    "47207",
-    "47237",
-    "47253",
-    "47272",
-    "47280",
-    "47292",
-    "47317",
-    "47319",
-    "47322",
-    "47334",
-    "47369",
-    "47377",
-    "47389",
-    "47395",
-    "47411",
-    "47422",
-    "47441",
-    "47484",
-    "47529",
-    "47534",
-    "47537",
-    "47538",
-    "47564",
-    "47570",
-    "47595",
-    "47609",
-    "47644",
-    "47671",
-    "47682",
-    "47683",
-    "47687",
-    "47702",
-    "47721",
-    "47743",
-    "47745",
-    "47746",
-    "47748",
-    "47750",
-    "47751",
-    "47752",
-    "47759",
-    "47783",
-    "47820",
-    "47835",
-    "47838",
-    "47841",
-    "47845",
-    "47854",
-    "47880",
-    "47896",
-    "47903",
-    "47932",
-    "47934",
-    "47936",
-    "47940",
-    "47941",
-    "47951",
-    "47995",
-    "47997",
-    "47999",
-    "48003",
-    "48014",
-    "48018",
-    "48041",
-    "48048",
-    "48054",
-    "48057",
-    "48059",
-    "48075",
-    "48080",
-    "48087",
-    "48095",
-    "48119",
-    "48124",
-    "48137",
-    "48140",
-    "48163",
-    "48164",
-    "48167",
-    "48205",
-    "48209",
-    "48221",
-    "48222",
-    "48223",
-    "48239",
-    "48252",
-    "48257",
-    "48274",
-    "48280",
-    "48283",
-    "48336",
-    "48337",
-    "48339",
-    "48342",
-    "48354",
-    "48370",
-    "48371",
-    "48375",
-    "48389",
-    "48423",
-    "48430",
-    "48434",
-    "48482",
-    "48519",
-    "48522",
-    "48525",
-    "48529",
-    "48548",
-    "48567",
-    "48579",
-    "48582",
-    "48589",
-    "48593",
-    "48595",
-    "48605",
-    "48617",
-    "48637",
-    "48654",
-    "48674",
-    "48721",
-    "48722",
-    "48754",
-    "48767",
-    "48773",
-    "48784",
-    "48785",
-    "48811",
-    "48828",
-    "48862",
-    "48877",
-    "48883",
-    "48899",
-    "48903",
-    "48909",
-    "48924",
-    "48930",
-    "48935",
-    "48948",
-    "48971",
-    "48988",
-    "48994",
-    "49003",
-    "49037",
-    "49089",
-    "49094",
-    "49101",
-    "49105",
-    "49112",
-    "49120",
-    "49145",
-    "49162",
-    "49165",
-    "49188",
-    "49193",
-    "49230",
-    "49231",
-    "49237",
-    "49252",
-    "49275",
-    "49303",
-    "49305",
-    "49306",
-    "49309",
-    "49310",
-    "49343",
-    "49351",
-    "49352",
-    "49358",
-    "49376",
-    "49387",
-    "49391",
-    "49398",
-    "49431",
-    "49452",
-    "49454",
-    "49471",
-    "49501",
-    "49502",
-    "49515",
-    "49525",
-    "49530",
-    "49532",
-    "49534",
-    "49550",
-    "49553",
-    "49566",
-    "49568",
-    "49583",
-    "49584",
-    "49611",
-    "49614",
-    "49634",
-    "49642",
-    "49651",
-    "49672",
-    "49681",
-    "49698",
-    "49737",
-    "49740",
-    "49750",
-    "49766",
-    "49778",
-    "49785",
-    "49793",
-    "49818",
-    "49829",
-    "49840",
-    "49843",
-    "49858",
-    "49865",
-    "49920",
-    "49938",
-    "49959",
-    "49966",
-    "49971",
-    "49981",
-    "50001",
-    "50008",
-    "50026",
-    "50029",
-    "50049",
-    "50056",
-    "50059",
-    "50068",
-    "50069",
-    "50116",
-    "50125",
-    "50141",
-    "50149",
-    "50150",
-    "50156",
-    "50162",
-    "50163",
-    "50164",
-    "50169",
-    "50191",
-    "50194",
-    "50204",
-    "50216",
-    "50236",
-    "50238",
-    "50244",
-    "50245",
-    "50254",
-    "50262",
-    "50268",
-    "50275",
-    "50296",
-    "50297",
-    "50302",
-    "50307",
-    "50309",
-    "50311",
-    "50314",
-    "50317",
-    "50319",
-    "50320",
-    "50325",
-    "50330",
-    "50336",
-    "50344",
-    "50348",
-    "50369",
-    "50382",
-    "50386",
-    "50399",
-    "50408",
-    "50411",
-    "50414",
-    "50418",
-    "50419",
-    "50428",
-    "50445",
-    "50451",
-    "50468",
-    "50485",
-    "50492",
-    "50499",
-    "50514",
-    "50519",
-    "50525",
-    "50526",
-    "50534",
-    "50540",
-    "50573",
-    "50580",
-    "50587",
-    "50589",
-    "50613",
-    "50618",
-    "50631",
-    "50634",
-    "50635",
-    "50636",
-    "50663",
-    "50679",
-    "50702",
-    "50725",
-    "50728",
-    "50732",
-    "50744",
-    "50757",
-    "50765",
-    "50766",
-    "50817",
-    "50844",
-    "50851",
-    "50852",
-    "50854",
-    "50870",
-    "50894",
-    "50899",
-    "50913",
-    "50919",
-    "50945",
-    "50965",
-    "50967",
-    "50974",
-    "50982",
-    "51075",
-    "51083",
-    "51087",
-    "51104",
-    "51135",
-    "51140",
-    "51143",
-    "51147",
-    "51150",
-    "51160",
-    "51176",
-    "51178",
-    "51184",
-    "51185",
-    "51187",
-    "51201",
-    "51204",
-    "51206",
-    "51209",
-    "51216",
-    "51218",
-    "51219",
-    "51229",
-    "51233",
-    "51254",
-    "51255",
-    "51278",
-    "51286",
-    "51289",
-    "51320",
-    "51327",
-    "51338",
-    "51345",
-    "51355",
-    "51364",
-    "51379",
-    "51387",
-    "51398",
-    "51400",
-    "51403",
-    "51409",
-    "51421",
-    "51423",
-    "51425",
-    "51479",
-    "51513",
-    "51521",
-    "51525",
-    "51529",
-    "51545",
-    "51549",
-    "51581",
-    "51590",
-    "51606",
-    "51620",
-    "51621",
-    "51639",
-    "51649",
-    "51651",
-    "51654",
-    "51669",
-    "51675",
-    "51686",
-    "51692",
-    "51711",
-    "51715",
-    "51721",
-    "51732",
-    "51733",
-    "51749",
-    "51757",
-    "51764",
-    "51771",
-    "51777",
-    "51781",
-    "51782",
-    "51795",
-    "51797",
-    "51802",
-    "51818",
-    "51821",
-    "51824",
-    "51830",
-    "51838",
-    "51844",
-    "51851",
-    "51852",
-    "51854",
-    "51869",
-    "51883",
-    "51900",
-    "51904",
-    "51933",
-    "51934",
-    "51944",
-    "51952",
-    "51985",
-    "52005",
-    "52022",
-    "52024",
-    "52033",
-    "52044",
-    "52046",
-    "52082",
-    "52095",
-    "52105",
-    "52106",
-    "52123",
-    "52124",
-    "52139",
-    "52145",
-    "52150",
-    "52160",
-    "52185",
-    "52193",
-    "52205",
-    "52210",
-    "52219",
-    "52224",
-    "52230",
-    "52244",
-    "52255",
-    "52276",
-    "52281",
-    "52284",
-    "52291",
-    "52293",
-    "52297",
-    "52324",
-    "52352",
-    "52366",
-    "52389",
-    "52400",
-    "52403",
-    "52444",
-    "52455",
-    "52459",
-    "52469",
-    "52477",
-    "52503",
-    "52522",
-    "52532",
-    "52539",
-    "52562",
-    "52565",
-    "52621",
-    "52629",
-    "52645",
-    "52648",
-    "52668",
-    "52686",
-    "52698",
-    "52704",
-    "52711",
-    "52724",
-    "52729",
-    "52731",
-    "52735",
-    "52738",
-    "52758",
-    "52808",
-    "52812",
-    "52814",
-    "52819",
-    "52834",
-    "52884",
-    "52898",
-    "52917",
-    "52924",
-    "52935",
-    "53003",
-    "53027",
-    "53054",
-    "53075",
-    "53094",
-    "53100",
-    "53109",
-    "53175",
-    "53188",
-    "53191",
-    "53199",
-    "53235",
-    "53252",
-    "53287",
-    "53289",
-    "53292",
-    "53298",
-    "53301",
-    "53308",
-    "53318",
-    "53342",
-    "53360",
-    "53368",
-    "53372",
-    "53373",
-    "53394",
-    "53405",
-    "53425",
-    "53445",
-    "53447",
-    "53451",
-    "53481",
-    "53511",
-    "53521",
-    "53524",
-    "53530",
-    "53540",
-    "53592",
-    "53595",
-    "53604",
-    "53607",
-    "53617",
-    "53622",
-    "53628",
-    "53629",
-    "53647",
-    "53664",
-    "53683",
-    "53704",
-    "53764",
-    "53788",
-    "53790",
-    "53804",
-    "53811",
-    "53824",
-    "53830",
-    "53834",
-    "53845",
-    "53868",
-    "53879",
-    "53918",
-    "53941",
-    "53949",
-    "53951",
-    "53957",
-    "53958",
-    "53959",
-    "53971",
-    "53984",
-    "53989",
-    "54027",
-    "54029",
-    "54039",
-    "54045",
-    "54062",
-    "54072",
-    "54074",
-    "54088",
-    "54090",
-    "54092",
-    "54098",
-    "54104",
-    "54106",
-    "54107",
-    "54120",
-    "54136",
-    "54145",
-    "54146",
-    "54153",
-    "54167",
-    "54169",
-    "54174",
-    "54188",
-    "54190",
-    "54212",
-    "54219",
-    "54240",
-    "54244",
-    "54253",
-    "54254",
-    "54255",
-    "54267",
-    "54273",
-    "54286",
-    "54289",
-    "54312",
-    "54324",
-    "54338",
-    "54355",
-    "54356",
-    "54360",
-    "54369",
-    "54372",
-    "54387",
-    "54408",
-    "54422",
-    "54429",
-    "54435",
-    "54462",
-    "54464",
-    "54466",
-    "54484",
-    "54489",
-    "54525",
-    "54536",
-    "54546",
-    "54554",
-    "54561",
-    "54569",
-    "54592",
-    "54593",
-    "54597",
-    "54602",
-    "54614",
-    "54629",
-    "54642",
-    "54683",
-    "54686",
-    "54689",
-    "54694",
-    "54742",
-    "54744",
-    "54748",
-    "54749",
-    "54752",
-    "54760",
-    "54769",
-    "54820",
-    "54843",
-    "54851",
-    "54854",
-    "54919",
-    "54925",
-    "54966",
-    "54975",
-    "54980",
-    "54981",
-    "54993",
-    "55018",
-    "55038",
-    "55079",
-    "55085",
-    "55097",
-    "55114",
-    "55115",
-    "55119",
-    "55124",
-    "55143",
-    "55167",
-    "55183",
-    "55236",
-    "55247",
-    "55258",
-    "55272",
-    "55274",
-    "55281",
-    "55290",
-    "55294",
-    "55319",
-    "55325",
-    "55350",
-    "55354",
-    "55386",
-    "55391",
-    "55392",
-    "55402",
-    "55413",
-    "55420",
-    "55423",
-    "55436",
-    "55442",
-    "55458",
-    "55460",
-    "55464",
-    "55465",
-    "55469",
-    "55491",
-    "55495",
-    "55501",
-    "55508",
-    "55521",
-    "55532",
-    "55547",
-    "55553",
-    "55566",
-    "55576",
-    "55580",
-    "55591",
-    "55605",
-    "55615",
-    "55621",
-    "55623",
-    "55625",
-    "55642",
-    "55669",
-    "55676",
-    "55681",
-    "55695",
-    "55709",
-    "55717",
-    "55743",
-    "55752",
-    "55781",
-    "55798",
-    "55799",
-    "55802",
-    "55804",
-    "55817",
-    "55819",
-    "55843",
-    "55858",
-    "55867",
-    "55888",
-    "55894",
-    "55903",
-    "55922",
-    "55933",
-    "55945",
-    "55957",
-    "55965",
-    "55966",
-    "55975",
-    "55980",
-    "55985",
-    "55987",
-    "55990",
-    "56000",
-    "56033",
-    "56045",
-    "56053",
-    "56060",
-    "56074",
-    "56075",
-    "56088",
-    "56097",
-    "56098",
-    "56115",
-    "56134",
-    "56144",
-    "56156",
-    "56192",
-    "56196",
-    "56235",
-    "56237",
-    "56239",
-    "56240",
-    "56245",
-    "56261",
-    "56277",
-    "56282",
-    "56284",
-    "56291",
-    "56294",
-    "56340",
-    "56343",
-    "56364",
-    "56386",
-    "56389",
-    "56397",
-    "56431",
-    "56454",
-    "56457",
-    "56475",
-    "56497",
-    "56510",
-    "56517",
-    "56534",
-    "56539",
-    "56549",
-    "56550",
-    "56552",
-    "56557",
-    "56575",
-    "56594",
-    "56607",
-    "56614",
-    "56622",
-    "56653",
-    "56668",
-    "56693",
-    "56696",
-    "56697",
-    "56699",
-    "56702",
-    "56704",
-    "56708",
-    "56719",
-    "56723",
-    "56747",
-    "56787",
-    "56788",
-    "56796",
-    "56798",
-    "56820",
-    "56830",
-    "56853",
-    "56867",
-    "56871",
-    "56888",
-    "56893",
-    "56896",
-    "56909",
-    "56913",
-    "56933",
-    "56938",
-    "56944",
-    "56955",
-    "56971",
-    "56984",
-    "56992",
-    "56995",
-    "56997",
-    "57018",
-    "57021",
-    "57022",
-    "57023",
-    "57042",
-    "57057",
-    "57066",
-    "57113",
-    "57137",
-    "57149",
-    "57172",
-    "57175",
-    "57207",
-    "57237",
-    "57253",
-    "57272",
-    "57280",
-    "57292",
-    "57317",
-    "57319",
-    "57322",
-    "57333",
-    "57334",
-    "57354",
-    "57377",
-    "57389",
-    "57395",
-    "57397",
-    "57411",
-    "57422",
-    "57441",
-    "57529",
-    "57534",
-    "57537",
-    "57538",
-    "57564",
-    "57570",
-    "57595",
-    "57609",
-    "57644",
-    "57646",
-    "57658",
-    "57671",
-    "57682",
-    "57683",
-    "57687",
-    "57702",
-    "57713",
-    "57721",
-    "57743",
-    "57745",
-    "57746",
-    "57748",
-    "57751",
-    "57752",
-    "57759",
-    "57783",
-    "57820",
-    "57835",
-    "57838",
-    "57841",
-    "57845",
-    "57880",
-    "57896",
-    "57903",
-    "57932",
-    "57934",
-    "57936",
-    "57940",
-    "57941",
-    "57951",
-    "57991",
-    "57995",
-    "57999",
-    "58001",
-    "58003",
-    "58014",
-    "58041",
-    "58048",
-    "58054",
-    "58057",
-    "58059",
-    "58075",
-    "58087",
-    "58095",
-    "58109",
-    "58119",
-    "58124",
-    "58137",
-    "58140",
-    "58163",
-    "58164",
-    "58165",
-    "58167",
-    "58205",
-    "58209",
-    "58222",
-    "58223",
-    "58249",
-    "58252",
-    "58257",
-    "58274",
-    "58280",
-    "58283",
-    "58336",
-    "58337",
-    "58339",
-    "58342",
-    "58354",
-    "58370",
-    "58371",
-    "58375",
-    "58389",
-    "58391",
-    "58423",
-    "58430",
-    "58434",
-    "58466",
-    "58482",
-    "58496",
-    "58522",
-    "58525",
-    "58529",
-    "58548",
-    "58556",
-    "58567",
-    "58578",
-    "58579",
-    "58582",
-    "58587",
-    "58589",
-    "58593",
-    "58595",
-    "58605",
-    "58617",
-    "58637",
-    "58654",
-    "58721",
-    "58722",
-    "58754",
-    "58767",
-    "58773",
-    "58784",
-    "58785",
-    "58811",
-    "58828",
-    "58862",
-    "58877",
-    "58883",
-    "58899",
-    "58903",
-    "58909",
-    "58924",
-    "58930",
-    "58935",
-    "58948",
-    "58971",
-    "58988",
-    "58994",
-    "59003",
-    "59037",
-    "59044",
-    "59089",
-    "59094",
-    "59101",
-    "59105",
-    "59120",
-    "59145",
-    "59162",
-    "59165",
-    "59188",
-    "59193",
-    "59230",
-    "59231",
-    "59236",
-    "59237",
-    "59252",
-    "59275",
-    "59303",
-    "59305",
-    "59306",
-    "59309",
-    "59310",
-    "59318",
-    "59343",
-    "59351",
-    "59352",
-    "59376",
-    "59387",
-    "59391",
-    "59398",
-    "59431",
-    "59452",
-    "59454",
-    "59471",
-    "59515",
-    "59530",
-    "59532",
-    "59534",
-    "59550",
-    "59553",
-    "59566",
-    "59568",
-    "59583",
-    "59584",
-    "59611",
-    "59614",
-    "59634",
-    "59642",
-    "59651",
-    "59672",
-    "59681",
-    "59698",
-    "59726",
-    "59737",
-    "59740",
-    "59750",
-    "59787",
-    "59793",
-    "59818",
-    "59840",
-    "59843",
-    "59858",
-    "59865",
-    "59920",
-    "59938",
-    "59959",
-    "59966",
-    "59971",
-    "59981",
-    "60001",
-    "60008",
-    "60026",
-    "60029",
-    "60049",
-    "60059",
-    "60068",
-    "60069",
-    "60116",
-    "60125",
-    "60141",
-    "60149",
-    "60150",
-    "60156",
-    "60162",
-    "60163",
-    "60164",
-    "60169",
-    "60191",
-    "60194",
-    "60216",
-    "60224",
-    "60236",
-    "60238",
-    "60244",
-    "60245",
-    "60254",
-    "60262",
-    "60268",
-    "60275",
-    "60296",
-    "60297",
-    "60302",
-    "60309",
-    "60311",
-    "60314",
-    "60317",
-    "60319",
-    "60323",
-    "60325",
-    "60330",
-    "60336",
-    "60344",
-    "60348",
-    "60369",
-    "60381",
-    "60382",
-    "60383",
-    "60399",
-    "60407",
-    "60408",
-    "60411",
-    "60418",
-    "60419",
-    "60428",
-    "60445",
-    "60451",
-    "60468",
-    "60481",
-    "60485",
-    "60492",
-    "60499",
-    "60514",
-    "60519",
-    "60522",
-    "60525",
-    "60526",
-    "60534",
-    "60540",
-    "60573",
-    "60580",
-    "60586",
-    "60587",
-    "60589",
-    "60618",
-    "60631",
-    "60634",
-    "60635",
-    "60636",
-    "60647",
-    "60662",
-    "60663",
-    "60679",
-    "60681",
-    "60689",
-    "60702",
-    "60725",
-    "60728",
-    "60732",
-    "60744",
-    "60757",
-    "60765",
-    "60766",
-    "60817",
-    "60851",
-    "60852",
-    "60854",
-    "60858",
-    "60870",
-    "60875",
-    "60894",
-    "60899",
-    "60913",
-    "60918",
-    "60919",
-    "60945",
-    "60965",
-    "60982",
-    "60986",
-    "61075",
-    "61083",
-    "61087",
-    "61103",
-    "61104",
-    "61135",
-    "61140",
-    "61143",
-    "61147",
-    "61150",
-    "61160",
-    "61176",
-    "61178",
-    "61184",
-    "61185",
-    "61187",
-    "61201",
-    "61204",
-    "61206",
-    "61209",
-    "61216",
-    "61218",
-    "61219",
-    "61229",
-    "61233",
-    "61254",
-    "61255",
-    "61278",
-    "61286",
-    "61289",
-    "61320",
-    "61327",
-    "61338",
-    "61345",
-    "61355",
-    "61364",
-    "61373",
-    "61379",
-    "61383",
-    "61387",
-    "61398",
-    "61400",
-    "61403",
-    "61409",
-    "61421",
-    "61423",
-    "61425",
-    "61453",
-    "61479",
-    "61495",
-    "61521",
-    "61523",
-    "61525",
-    "61529",
-    "61545",
-    "61549",
-    "61564",
-    "61581",
-    "61590",
-    "61606",
-    "61620",
-    "61621",
-    "61632",
-    "61639",
-    "61649",
-    "61651",
-    "61654",
-    "61666",
-    "61669",
-    "61675",
-    "61685",
-    "61686",
-    "61692",
-    "61711",
-    "61715",
-    "61732",
-    "61733",
-    "61749",
-    "61757",
-    "61764",
-    "61767",
-    "61771",
-    "61777",
-    "61781",
-    "61782",
-    "61795",
-    "61797",
-    "61818",
-    "61821",
-    "61824",
-    "61830",
-    "61838",
-    "61844",
-    "61852",
-    "61854",
-    "61869",
-    "61877",
-    "61900",
-    "61904",
-    "61933",
-    "61934",
-    "61944",
-    "61952",
-    "62005",
-    "62022",
-    "62024",
-    "62033",
-    "62037",
-    "62044",
-    "62046",
-    "62063",
-    "62082",
-    "62095",
-    "62105",
-    "62106",
-    "62123",
-    "62139",
-    "62145",
-    "62150",
-    "62160",
-    "62185",
-    "62193",
-    "62205",
-    "62210",
-    "62219",
-    "62224",
-    "62230",
-    "62244",
-    "62255",
-    "62258",
-    "62276",
-    "62281",
-    "62284",
-    "62291",
-    "62293",
-    "62297",
-    "62324",
-    "62366",
-    "62389",
-    "62403",
-    "62444",
-    "62455",
-    "62459",
-    "62469",
-    "62477",
-    "62503",
-    "62522",
-    "62532",
-    "62539",
-    "62562",
-    "62565",
-    "62621",
-    "62629",
-    "62633",
-    "62645",
-    "62668",
-    "62686",
-    "62698",
-    "62711",
-    "62724",
-    "62729",
-    "62731",
-    "62735",
-    "62738",
-    "62758",
-    "62807",
-    "62808",
-    "62812",
-    "62814",
-    "62819",
-    "62834",
-    "62884",
-    "62891",
-    "62894",
-    "62898",
-    "62917",
-    "62924",
-    "62935",
-    "62952",
-    "63003",
-    "63027",
-    "63054",
-    "63075",
-    "63100",
-    "63109",
-    "63175",
-    "63188",
-    "63191",
-    "63199",
-    "63235",
-    "63289",
-    "63292",
-    "63298",
-    "63301",
-    "63318",
-    "63342",
-    "63360",
-    "63372",
-    "63373",
-    "63394",
-    "63396",
-    "63405",
-    "63425",
-    "63445",
-    "63447",
-    "63451",
-    "63481",
-    "63511",
-    "63521",
-    "63524",
-    "63540",
-    "63592",
-    "63595",
-    "63604",
-    "63607",
-    "63617",
-    "63622",
-    "63628",
-    "63629",
-    "63647",
-    "63664",
-    "63683",
-    "63764",
-    "63788",
-    "63790",
-    "63804",
-    "63824",
-    "63830",
-    "63845",
-    "63868",
-    "63879",
-    "63883",
-    "63918",
-    "63941",
-    "63949",
-    "63951",
-    "63957",
-    "63958",
-    "63959",
-    "63984",
-    "64004",
-    "64027",
-    "64029",
-    "64039",
-    "64062",
-    "64072",
-    "64074",
-    "64088",
-    "64090",
-    "64092",
-    "64098",
-    "64104",
-    "64107",
-    "64120",
-    "64136",
-    "64137",
-    "64145",
-    "64146",
-    "64153",
-    "64167",
-    "64169",
-    "64174",
-    "64188",
-    "64190",
-    "64212",
-    "64219",
-    "64240",
-    "64244",
-    "64253",
-    "64254",
-    "64255",
-    "64267",
-    "64273",
-    "64286",
-    "64289",
-    "64312",
-    "64324",
-    "64338",
-    "64355",
-    "64356",
-    "64360",
-    "64369",
-    "64372",
-    "64408",
-    "64422",
-    "64429",
-    "64435",
-    "64462",
-    "64464",
-    "64466",
-    "64477",
-    "64484",
-    "64489",
-    "64525",
-    "64536",
-    "64546",
-    "64554",
-    "64561",
-    "64569",
-    "64592",
-    "64593",
-    "64597",
-    "64602",
-    "64614",
-    "64615",
-    "64629",
-    "64642",
-    "64686",
-    "64689",
-    "64694",
-    "64742",
-    "64744",
-    "64748",
-    "64749",
-    "64752",
-    "64760",
-    "64820",
-    "64843",
-    "64851",
-    "64854",
-    "64919",
-    "64925",
-    "64975",
-    "64980",
-    "64993",
-    "65010",
-    "65018",
-    "65038",
-    "65079",
-    "65085",
-    "65097",
-    "65114",
-    "65115",
-    "65119",
-    "65124",
-    "65167",
-    "65236",
-    "65241",
-    "65247",
-    "65258",
-    "65271",
-    "65272",
-    "65274",
-    "65281",
-    "65294",
-    "65319",
-    "65325",
-    "65354",
-    "65386",
-    "65392",
-    "65413",
-    "65420",
-    "65423",
-    "65436",
-    "65442",
-    "65458",
-    "65460",
-    "65464",
-    "65465",
-    "65491",
-    "65495",
-    "65497",
-    "65501",
-    "65508",
-    "65521",
-    "65532",
-    "65553",
-    "65566",
-    "65576",
-    "65580",
-    "65590",
-    "65591",
-    "65597",
-    "65605",
-    "65615",
-    "65621",
-    "65623",
-    "65642",
-    "65669",
-    "65673",
-    "65676",
-    "65681",
-    "65695",
-    "65709",
-    "65717",
-    "65720",
-    "65752",
-    "65781",
-    "65798",
-    "65799",
-    "65802",
-    "65804",
-    "65817",
-    "65819",
-    "65843",
-    "65858",
-    "65867",
-    "65888",
-    "65903",
-    "65933",
-    "65945",
-    "65957",
-    "65965",
-    "65966",
-    "65980",
-    "65985",
-    "65987",
-    "65990",
-    "66000",
-    "66033",
-    "66045",
-    "66053",
-    "66060",
-    "66074",
-    "66075",
-    "66097",
-    "66098",
-    "66115",
-    "66134",
-    "66144",
-    "66149",
-    "66156",
-    "66192",
-    "66196",
-    "66197",
-    "66235",
-    "66237",
-    "66239",
-    "66240",
-    "66245",
-    "66261",
-    "66277",
-    "66282",
-    "66284",
-    "66291",
-    "66294",
-    "66340",
-    "66343",
-    "66364",
-    "66378",
-    "66386",
-    "66397",
-    "66444",
-    "66454",
-    "66457",
-    "66475",
-    "66489",
-    "66510",
-    "66517",
-    "66534",
-    "66539",
-    "66549",
-    "66550",
-    "66557",
-    "66575",
-    "66594",
-    "66607",
-    "66614",
-    "66622",
-    "66653",
-    "66668",
-    "66693",
-    "66696",
-    "66697",
-    "66699",
-    "66702",
-    "66708",
-    "66719",
-    "66723",
-    "66747",
-    "66749",
-    "66787",
-    "66788",
-    "66796",
-    "66798",
-    "66801",
-    "66820",
-    "66830",
-    "66867",
-    "66871",
-    "66888",
-    "66893",
-    "66894",
-    "66896",
-    "66909",
-    "66913",
-    "66933",
-    "66938",
-    "66944",
-    "66955",
-    "66964",
-    "66971",
-    "66984",
-    "66992",
-    "66995",
-    "66997",
-    "67018",
-    "67021",
-    "67022",
-    "67023",
-    "67039",
-    "67042",
-    "67057",
-    "67066",
-    "67098",
-    "67137",
-    "67149",
-    "67172",
-    "67175",
-    "67219",
-    "67237",
-    "67272",
-    "67280",
-    "67292",
-    "67317",
-    "67319",
-    "67322",
-    "67333",
-    "67334",
-    "67354",
-    "67369",
-    "67377",
-    "67389",
-    "67395",
-    "67411",
-    "67422",
-    "67441",
-    "67484",
-    "67529",
-    "67537",
-    "67538",
-    "67563",
-    "67570",
-    "67609",
-    "67644",
-    "67646",
-    "67658",
-    "67671",
-    "67682",
-    "67683",
-    "67687",
-    "67702",
-    "67713",
-    "67721",
-    "67743",
-    "67745",
-    "67746",
-    "67748",
-    "67751",
-    "67752",
-    "67759",
-    "67783",
-    "67820",
-    "67838",
-    "67841",
-    "67845",
-    "67854",
-    "67880",
-    "67896",
-    "67903",
-    "67932",
-    "67936",
-    "67940",
-    "67941",
-    "67951",
-    "67995",
-    "67997",
-    "67999",
-    "68001",
-    "68003",
-    "68014",
-    "68018",
-    "68041",
-    "68048",
-    "68054",
-    "68057",
-    "68059",
-    "68075",
-    "68080",
-    "68087",
-    "68095",
-    "68109",
-    "68119",
-    "68124",
-    "68137",
-    "68140",
-    "68164",
-    "68165",
-    "68167",
-    "68209",
-    "68221",
-    "68222",
-    "68223",
-    "68239",
-    "68249",
-    "68252",
-    "68257",
-    "68274",
-    "68280",
-    "68283",
-    "68336",
-    "68337",
-    "68339",
-    "68342",
-    "68354",
-    "68370",
-    "68371",
-    "68375",
-    "68389",
-    "68430",
-    "68434",
-    "68466",
-    "68482",
-    "68496",
-    "68519",
-    "68522",
-    "68525",
-    "68529",
-    "68556",
-    "68567",
-    "68578",
-    "68579",
-    "68582",
-    "68587",
-    "68589",
-    "68593",
-    "68595",
-    "68605",
-    "68654",
-    "68674",
-    "68721",
-    "68722",
-    "68754",
-    "68767",
-    "68773",
-    "68784",
-    "68785",
-    "68811",
-    "68828",
-    "68862",
-    "68877",
-    "68883",
-    "68899",
-    "68903",
-    "68909",
-    "68924",
-    "68930",
-    "68935",
-    "68948",
-    "68971",
-    "68988",
-    "68994",
-    "69003",
-    "69037",
-    "69044",
-    "69089",
-    "69094",
-    "69101",
-    "69112",
-    "69120",
-    "69145",
-    "69162",
-    "69188",
-    "69193",
-    "69230",
-    "69231",
-    "69236",
-    "69237",
-    "69252",
-    "69275",
-    "69303",
-    "69305",
-    "69306",
-    "69309",
-    "69310",
-    "69318",
-    "69343",
-    "69351",
-    "69352",
-    "69376",
-    "69387",
-    "69391",
-    "69398",
-    "69431",
-    "69452",
-    "69454",
-    "69501",
-    "69502",
-    "69515",
-    "69532",
-    "69534",
-    "69550",
-    "69553",
-    "69566",
-    "69568",
-    "69583",
-    "69584",
-    "69611",
-    "69614",
-    "69634",
-    "69642",
-    "69651",
-    "69672",
-    "69681",
-    "69698",
-    "69726",
-    "69737",
-    "69740",
-    "69750",
-    "69766",
-    "69785",
-    "69793",
-    "69818",
-    "69829",
-    "69840",
-    "69843",
-    "69858",
-    "69865",
-    "69920",
-    "69938",
-    "69959",
-    "69966",
-    "69971",
-    "69981",
-    "70001",
-    "70008",
-    "70026",
-    "70029",
-    "70056",
-    "70059",
-    "70069",
-    "70116",
-    "70125",
-    "70141",
-    "70149",
-    "70150",
-    "70156",
-    "70162",
-    "70163",
-    "70164",
-    "70169",
-    "70191",
-    "70193",
-    "70194",
-    "70204",
-    "70216",
-    "70224",
-    "70236",
-    "70238",
-    "70244",
-    "70245",
-    "70254",
-    "70262",
-    "70268",
-    "70275",
-    "70278",
-    "70296",
-    "70297",
-    "70302",
-    "70307",
-    "70309",
-    "70311",
-    "70317",
-    "70319",
-    "70320",
-    "70323",
-    "70325",
-    "70336",
-    "70344",
-    "70348",
-    "70369",
-    "70383",
-    "70386",
-    "70399",
-    "70407",
-    "70408",
-    "70411",
-    "70414",
-    "70418",
-    "70419",
-    "70428",
-    "70451",
-    "70481",
-    "70485",
-    "70492",
-    "70499",
-    "70514",
-    "70519",
-    "70525",
-    "70534",
-    "70540",
-    "70573",
-    "70580",
-    "70584",
-    "70586",
-    "70587",
-    "70589",
-    "70613",
-    "70618",
-    "70631",
-    "70634",
-    "70635",
-    "70636",
-    "70662",
-    "70663",
-    "70679",
-    "70681",
-    "70689",
-    "70702",
-    "70725",
-    "70732",
-    "70744",
-    "70757",
-    "70765",
-    "70766",
-    "70817",
-    "70844",
-    "70851",
-    "70852",
-    "70854",
-    "70870",
-    "70875",
-    "70894",
-    "70899",
-    "70913",
-    "70918",
-    "70919",
-    "70965",
-    "70967",
-    "70974",
-    "70982",
-    "70986",
-    "71075",
-    "71083",
-    "71087",
-    "71103",
-    "71104",
-    "71140",
-    "71143",
-    "71147",
-    "71160",
-    "71176",
-    "71178",
-    "71184",
-    "71185",
-    "71187",
-    "71201",
-    "71204",
-    "71206",
-    "71209",
-    "71216",
-    "71218",
-    "71229",
-    "71254",
-    "71278",
-    "71286",
-    "71289",
-    "71309",
-    "71327",
-    "71345",
-    "71355",
-    "71364",
-    "71373",
-    "71379",
-    "71383",
-    "71387",
-    "71398",
-    "71400",
-    "71409",
-    "71421",
-    "71423",
-    "71425",
-    "71453",
-    "71479",
-    "71495",
-    "71513",
-    "71521",
-    "71523",
-    "71529",
-    "71545",
-    "71549",
-    "71564",
-    "71581",
-    "71590",
-    "71606",
-    "71620",
-    "71621",
-    "71632",
-    "71639",
-    "71649",
-    "71651",
-    "71654",
-    "71666",
-    "71669",
-    "71675",
-    "71685",
-    "71686",
-    "71692",
-    "71711",
-    "71715",
-    "71721",
-    "71732",
-    "71733",
-    "71749",
-    "71753",
-    "71757",
-    "71764",
-    "71767",
-    "71771",
-    "71777",
-    "71781",
-    "71782",
-    "71795",
-    "71797",
-    "71811",
-    "71821",
-    "71824",
-    "71830",
-    "71838",
-    "71844",
-    "71851",
-    "71852",
-    "71854",
-    "71869",
-    "71877",
-    "71883",
-    "71900",
-    "71904",
-    "71933",
-    "71934",
-    "71944",
-    "71952",
-    "71985",
-    "72005",
-    "72022",
-    "72024",
-    "72033",
-    "72044",
-    "72046",
-    "72063",
-    "72082",
-    "72095",
-    "72105",
-    "72106",
-    "72123",
-    "72124",
-    "72139",
-    "72145",
-    "72150",
-    "72160",
-    "72185",
-    "72193",
-    "72205",
-    "72210",
-    "72219",
-    "72224",
-    "72244",
-    "72258",
-    "72276",
-    "72284",
-    "72291",
-    "72293",
-    "72297",
-    "72324",
-    "72352",
-    "72366",
-    "72389",
-    "72400",
-    "72403",
-    "72444",
-    "72455",
-    "72459",
-    "72469",
-    "72477",
-    "72503",
-    "72522",
-    "72539",
-    "72562",
-    "72565",
-    "72621",
-    "72629",
-    "72645",
-    "72668",
-    "72686",
-    "72704",
-    "72711",
-    "72724",
-    "72738",
-    "72758",
-    "72807",
-    "72808",
-    "72812",
-    "72814",
-    "72819",
-    "72834",
-    "72884",
-    "72891",
-    "72894",
-    "72898",
-    "72924",
-    "72935",
-    "72952",
-    "73003",
-    "73027",
-    "73075",
-    "73094",
-    "73100",
-    "73109",
-    "73175",
-    "73188",
-    "73191",
-    "73199",
-    "73235",
-    "73252",
-    "73289",
-    "73298",
-    "73301",
-    "73308",
-    "73318",
-    "73342",
-    "73360",
-    "73368",
-    "73372",
-    "73373",
-    "73394",
-    "73396",
-    "73405",
-    "73425",
-    "73445",
-    "73451",
-    "73481",
-    "73511",
-    "73521",
-    "73524",
-    "73530",
-    "73540",
-    "73592",
-    "73595",
-    "73604",
-    "73607",
-    "73617",
-    "73622",
-    "73628",
-    "73629",
-    "73647",
-    "73664",
-    "73683",
-    "73704",
-    "73725",
-    "73764",
-    "73788",
-    "73790",
-    "73804",
-    "73811",
-    "73824",
-    "73830",
-    "73834",
-    "73845",
-    "73868",
-    "73879",
-    "73883",
-    "73898",
-    "73941",
-    "73949",
-    "73951",
-    "73957",
-    "73958",
-    "73959",
-    "73984",
-    "74004",
-    "74027",
-    "74029",
-    "74039",
-    "74045",
-    "74062",
-    "74072",
-    "74074",
-    "74090",
-    "74092",
-    "74098",
-    "74104",
-    "74106",
-    "74107",
-    "74120",
-    "74136",
-    "74145",
-    "74146",
-    "74153",
-    "74167",
-    "74169",
-    "74174",
-    "74188",
-    "74190",
-    "74212",
-    "74219",
-    "74240",
-    "74244",
-    "74253",
-    "74254",
-    "74255",
-    "74267",
-    "74273",
-    "74286",
-    "74289",
-    "74312",
-    "74317",
-    "74324",
-    "74338",
-    "74356",
-    "74360",
-    "74369",
-    "74372",
-    "74387",
-    "74408",
-    "74422",
-    "74462",
-    "74464",
-    "74466",
-    "74477",
-    "74484",
-    "74489",
-    "74525",
-    "74536",
-    "74546",
-    "74554",
-    "74561",
-    "74593",
-    "74597",
-    "74602",
-    "74614",
-    "74615",
-    "74629",
-    "74642",
-    "74683",
-    "74686",
-    "74689",
-    "74694",
-    "74742",
-    "74744",
-    "74748",
-    "74749",
-    "74752",
-    "74760",
-    "74769",
-    "74820",
-    "74843",
-    "74851",
-    "74854",
-    "74919",
-    "74921",
-    "74925",
-    "74975",
-    "74980",
-    "74981",
-    "74993",
-    "75010",
-    "75018",
-    "75038",
-    "75079",
-    "75085",
-    "75114",
-    "75115",
-    "75119",
-    "75124",
-    "75143",
-    "75167",
-    "75183",
-    "75236",
-    "75241",
-    "75247",
-    "75258",
-    "75271",
-    "75272",
-    "75274",
-    "75281",
-    "75290",
-    "75294",
-    "75319",
-    "75325",
-    "75354",
-    "75386",
-    "75391",
-    "75392",
-    "75402",
-    "75413",
-    "75420",
-    "75423",
-    "75436",
-    "75442",
-    "75458",
-    "75464",
-    "75465",
-    "75469",
-    "75491",
-    "75495",
-    "75497",
-    "75508",
-    "75521",
-    "75547",
-    "75566",
-    "75576",
-    "75580",
-    "75590",
-    "75591",
-    "75597",
-    "75605",
-    "75615",
-    "75621",
-    "75623",
-    "75625",
-    "75642",
-    "75669",
-    "75673",
-    "75681",
-    "75695",
-    "75709",
-    "75717",
-    "75720",
-    "75743",
-    "75752",
-    "75781",
-    "75798",
-    "75799",
-    "75802",
-    "75804",
-    "75817",
-    "75819",
-    "75843",
-    "75858",
-    "75867",
-    "75888",
-    "75903",
-    "75922",
-    "75933",
-    "75945",
-    "75957",
-    "75965",
-    "75975",
-    "75980",
-    "75985",
-    "75987",
-    "76000",
-    "76033",
-    "76045",
-    "76060",
-    "76074",
-    "76088",
-    "76097",
-    "76098",
-    "76115",
-    "76134",
-    "76149",
-    "76156",
-    "76192",
-    "76196",
-    "76197",
-    "76237",
-    "76239",
-    "76245",
-    "76261",
-    "76277",
-    "76284",
-    "76291",
-    "76294",
-    "76340",
-    "76343",
-    "76364",
-    "76378",
-    "76386",
-    "76389",
-    "76397",
-    "76431",
-    "76444",
-    "76454",
-    "76457",
-    "76475",
-    "76489",
-    "76497",
-    "76510",
-    "76517",
-    "76534",
-    "76539",
-    "76549",
-    "76550",
-    "76552",
-    "76557",
-    "76575",
-    "76594",
-    "76607",
-    "76614",
-    "76622",
-    "76653",
-    "76668",
-    "76693",
-    "76696",
-    "76697",
-    "76699",
-    "76702",
-    "76704",
-    "76719",
-    "76723",
-    "76747",
-    "76749",
-    "76787",
-    "76788",
-    "76796",
-    "76798",
-    "76801",
-    "76820",
-    "76830",
-    "76853",
-    "76867",
-    "76871",
-    "76888",
-    "76893",
-    "76894",
-    "76896",
-    "76909",
-    "76913",
-    "76933",
-    "76938",
-    "76944",
-    "76955",
-    "76964",
-    "76971",
-    "76984",
-    "76992",
-    "76995",
-    "76997",
-    "77018",
-    "77021",
-    "77023",
-    "77039",
-    "77057",
-    "77066",
-    "77098",
-    "77113",
-    "77119",
-    "77137",
-    "77149",
-    "77175",
-    "77207",
-    "77219",
-    "77237",
-    "77253",
-    "77272",
-    "77280",
-    "77292",
-    "77317",
-    "77319",
-    "77322",
-    "77333",
-    "77334",
-    "77354",
-    "77369",
-    "77377",
-    "77389",
-    "77411",
-    "77441",
-    "77484",
-    "77529",
-    "77537",
-    "77538",
-    "77563",
-    "77564",
-    "77570",
-    "77595",
-    "77609",
-    "77644",
-    "77646",
-    "77658",
-    "77683",
-    "77687",
-    "77702",
-    "77713",
-    "77721",
-    "77743",
-    "77745",
-    "77746",
-    "77748",
-    "77750",
-    "77751",
-    "77752",
-    "77759",
-    "77783",
-    "77820",
-    "77838",
-    "77845",
-    "77854",
-    "77880",
-    "77896",
-    "77912",
-    "77932",
-    "77934",
-    "77936",
-    "77940",
-    "77941",
-    "77951",
-    "77991",
-    "77995",
-    "77997",
-    "77999",
-    "78001",
-    "78003",
-    "78014",
-    "78018",
-    "78041",
-    "78048",
-    "78054",
-    "78057",
-    "78059",
-    "78075",
-    "78080",
-    "78087",
-    "78095",
-    "78109",
-    "78119",
-    "78137",
-    "78140",
-    "78163",
-    "78164",
-    "78167",
-    "78209",
-    "78221",
-    "78222",
-    "78223",
-    "78249",
-    "78252",
-    "78257",
-    "78274",
-    "78280",
-    "78283",
-    "78336",
-    "78337",
-    "78339",
-    "78342",
-    "78354",
-    "78370",
-    "78371",
-    "78375",
-    "78389",
-    "78423",
-    "78434",
-    "78482",
-    "78496",
-    "78519",
-    "78522",
-    "78525",
-    "78529",
-    "78556",
-    "78567",
-    "78578",
-    "78579",
-    "78582",
-    "78587",
-    "78589",
-    "78593",
-    "78595",
-    "78605",
-    "78617",
-    "78637",
-    "78674",
-    "78721",
-    "78722",
-    "78754",
-    "78767",
-    "78773",
-    "78784",
-    "78785",
-    "78811",
-    "78828",
-    "78862",
-    "78877",
-    "78883",
-    "78899",
-    "78903",
-    "78909",
-    "78924",
-    "78930",
-    "78935",
-    "78948",
-    "78971",
-    "78988",
-    "78994",
-    "79003",
-    "79037",
-    "79044",
-    "79089",
-    "79094",
-    "79101",
-    "79105",
-    "79112",
-    "79120",
-    "79145",
-    "79165",
-    "79188",
-    "79193",
-    "79230",
-    "79231",
-    "79236",
-    "79237",
-    "79275",
-    "79303",
-    "79305",
-    "79306",
-    "79310",
-    "79318",
-    "79343",
-    "79351",
-    "79352",
-    "79358",
-    "79376",
-    "79387",
-    "79391",
-    "79398",
-    "79431",
-    "79452",
-    "79454",
-    "79471",
-    "79501",
-    "79515",
-    "79525",
-    "79530",
-    "79532",
-    "79534",
-    "79550",
-    "79553",
-    "79566",
-    "79568",
-    "79583",
-    "79584",
-    "79611",
-    "79614",
-    "79634",
-    "79642",
-    "79651",
-    "79672",
-    "79681",
-    "79726",
-    "79737",
-    "79740",
-    "79766",
-    "79785",
-    "79787",
-    "79793",
-    "79818",
-    "79829",
-    "79840",
-    "79843",
-    "79858",
-    "79865",
-    "79920",
-    "79938",
-    "79959",
-    "79966",
-    "79971",
-    "79981",
-    "80001",
-    "80008",
-    "80026",
-    "80029",
-    "80049",
-    "80059",
-    "80068",
-    "80069",
-    "80116",
-    "80125",
-    "80141",
-    "80149",
-    "80150",
-    "80156",
-    "80162",
-    "80164",
-    "80169",
-    "80191",
-    "80194",
-    "80204",
-    "80216",
-    "80236",
-    "80244",
-    "80245",
-    "80262",
-    "80268",
-    "80275",
-    "80278",
-    "80296",
-    "80302",
-    "80307",
-    "80309",
-    "80311",
-    "80314",
-    "80317",
-    "80319",
-    "80320",
-    "80330",
-    "80344",
-    "80348",
-    "80369",
-    "80383",
-    "80386",
-    "80399",
-    "80408",
-    "80411",
-    "80414",
-    "80418",
-    "80419",
-    "80428",
-    "80451",
-    "80468",
-    "80481",
-    "80485",
-    "80492",
-    "80499",
-    "80519",
-    "80525",
-    "80526",
-    "80534",
-    "80540",
-    "80573",
-    "80580",
-    "80587",
-    "80589",
-    "80618",
-    "80631",
-    "80634",
-    "80635",
-    "80647",
-    "80679",
-    "80681",
-    "80702",
-    "80725",
-    "80732",
-    "80744",
-    "80765",
-    "80766",
-    "80817",
-    "80852",
-    "80854",
-    "80858",
-    "80875",
-    "80894",
-    "80899",
-    "80913",
-    "80919",
-    "80945",
-    "80965",
-    "80974",
-    "80986",
-    "81075",
-    "81083",
-    "81087",
-    "81103",
-    "81104",
-    "81140",
-    "81143",
-    "81147",
-    "81150",
-    "81160",
-    "81176",
-    "81178",
-    "81184",
-    "81185",
-    "81201",
-    "81204",
-    "81206",
-    "81209",
-    "81216",
-    "81218",
-    "81219",
-    "81229",
-    "81254",
-    "81255",
-    "81286",
-    "81289",
-    "81309",
-    "81320",
-    "81338",
-    "81345",
-    "81355",
-    "81383",
-    "81387",
-    "81398",
-    "81400",
-    "81409",
-    "81422",
-    "81423",
-    "81425",
-    "81453",
-    "81479",
-    "81513",
-    "81521",
-    "81525",
-    "81529",
-    "81545",
-    "81564",
-    "81620",
-    "81621",
-    "81639",
-    "81649",
-    "81654",
-    "81669",
-    "81675",
-    "81686",
-    "81692",
-    "81711",
-    "81715",
-    "81732",
-    "81733",
-    "81749",
-    "81753",
-    "81757",
-    "81764",
-    "81792",
-    "81795",
-    "81797",
-    "81811",
-    "81818",
-    "81821",
-    "81824",
-    "81830",
-    "81838",
-    "81844",
-    "81851",
-    "81852",
-    "81854",
-    "81883",
-    "81888",
-    "81900",
-    "81904",
-    "81933",
-    "81934",
-    "81944",
-    "81952",
-    "82022",
-    "82024",
-    "82033",
-    "82037",
-    "82063",
-    "82082",
-    "82095",
-    "82105",
-    "82106",
-    "82123",
-    "82124",
-    "82139",
-    "82150",
-    "82193",
-    "82205",
-    "82219",
-    "82224",
-    "82230",
-    "82244",
-    "82276",
-    "82284",
-    "82293",
-    "82297",
-    "82324",
-    "82352",
-    "82366",
-    "82389",
-    "82455",
-    "82459",
-    "82477",
-    "82503",
-    "82522",
-    "82539",
-    "82562",
-    "82565",
-    "82621",
-    "82629",
-    "82648",
-    "82668",
-    "82686",
-    "82698",
-    "82711",
-    "82724",
-    "82729",
-    "82731",
-    "82735",
-    "82738",
-    "82758",
-    "82807",
-    "82808",
-    "82812",
-    "82814",
-    "82819",
-    "82834",
-    "82884",
-    "82894",
-    "82898",
-    "82917",
-    "82924",
-    "82935",
-    "83003",
-    "83027",
-    "83075",
-    "83094",
-    "83100",
-    "83175",
-    "83188",
-    "83199",
-    "83235",
-    "83298",
-    "83301",
-    "83342",
-    "83360",
-    "83368",
-    "83372",
-    "83373",
-    "83394",
-    "83396",
-    "83405",
-    "83425",
-    "83445",
-    "83447",
-    "83451",
-    "83481",
-    "83511",
-    "83521",
-    "83524",
-    "83530",
-    "83592",
-    "83595",
-    "83604",
-    "83628",
-    "83683",
-    "83764",
-    "83788",
-    "83790",
-    "83804",
-    "83824",
-    "83830",
-    "83845",
-    "83852",
-    "83868",
-    "83879",
-    "83883",
-    "83898",
-    "83918",
-    "83949",
-    "83951",
-    "83957",
-    "83958",
-    "83971",
-    "83984",
-    "83989",
-    "84027",
-    "84029",
-    "84039",
-    "84045",
-    "84062",
-    "84072",
-    "84074",
-    "84088",
-    "84090",
-    "84092",
-    "84098",
-    "84104",
-    "84107",
-    "84120",
-    "84136",
-    "84145",
-    "84146",
-    "84153",
-    "84167",
-    "84169",
-    "84174",
-    "84188",
-    "84190",
-    "84212",
-    "84219",
-    "84240",
-    "84244",
-    "84253",
-    "84254",
-    "84273",
-    "84289",
-    "84312",
-    "84317",
-    "84324",
-    "84338",
-    "84355",
-    "84356",
-    "84360",
-    "84369",
-    "84372",
-    "84387",
-    "84408",
-    "84422",
-    "84462",
-    "84464",
-    "84466",
-    "84489",
-    "84525",
-    "84536",
-    "84546",
-    "84554",
-    "84561",
-    "84569",
-    "84592",
-    "84593",
-    "84602",
-    "84614",
-    "84615",
-    "84642",
-    "84683",
-    "84686",
-    "84694",
-    "84742",
-    "84744",
-    "84748",
-    "84749",
-    "84752",
-    "84760",
-    "84769",
-    "84820",
-    "84843",
-    "84851",
-    "84854",
-    "84919",
-    "84921",
-    "84925",
-    "84966",
-    "84975",
-    "84980",
-    "84981",
-    "85018",
-    "85038",
-    "85079",
-    "85097",
-    "85114",
-    "85115",
-    "85119",
-    "85124",
-    "85143",
-    "85247",
-    "85258",
-    "85272",
-    "85274",
-    "85281",
-    "85290",
-    "85294",
-    "85325",
-    "85350",
-    "85354",
-    "85386",
-    "85392",
-    "85402",
-    "85413",
-    "85420",
-    "85423",
-    "85458",
-    "85460",
-    "85464",
-    "85465",
-    "85469",
-    "85491",
-    "85495",
-    "85497",
-    "85501",
-    "85508",
-    "85521",
-    "85547",
-    "85553",
-    "85566",
-    "85576",
-    "85580",
-    "85590",
-    "85591",
-    "85597",
-    "85605",
-    "85621",
-    "85623",
-    "85642",
-    "85669",
-    "85681",
-    "85695",
-    "85709",
-    "85717",
-    "85720",
-    "85743",
-    "85752",
-    "85781",
-    "85798",
-    "85799",
-    "85802",
-    "85804",
-    "85817",
-    "85819",
-    "85858",
-    "85867",
-    "85903",
-    "85945",
-    "85957",
-    "85965",
-    "85980",
-    "85985",
-    "85987",
-    "85990",
-    "86000",
-    "86045",
-    "86060",
-    "86074",
-    "86075",
-    "86088",
-    "86097",
-    "86098",
-    "86115",
-    "86134",
-    "86144",
-    "86156",
-    "86192",
-    "86196",
-    "86197",
-    "86235",
-    "86237",
-    "86239",
-    "86245",
-    "86261",
-    "86277",
-    "86284",
-    "86291",
-    "86340",
-    "86343",
-    "86364",
-    "86386",
-    "86389",
-    "86397",
-    "86431",
-    "86454",
-    "86457",
-    "86475",
-    "86489",
-    "86510",
-    "86517",
-    "86534",
-    "86549",
-    "86552",
-    "86557",
-    "86575",
-    "86594",
-    "86607",
-    "86614",
-    "86622",
-    "86653",
-    "86668",
-    "86693",
-    "86696",
-    "86697",
-    "86699",
-    "86704",
-    "86708",
-    "86719",
-    "86749",
-    "86787",
-    "86788",
-    "86796",
-    "86798",
-    "86801",
-    "86820",
-    "86830",
-    "86853",
-    "86867",
-    "86871",
-    "86888",
-    "86893",
-    "86894",
-    "86896",
-    "86909",
-    "86913",
-    "86933",
-    "86938",
-    "86944",
-    "86955",
-    "86964",
-    "86971",
-    "86992",
-    "86997",
-    "87018",
-    "87021",
-    "87023",
-    "87039",
-    "87042",
-    "87057",
-    "87066",
-    "87098",
-    "87113",
-    "87149",
-    "87172",
-    "87175",
-    "87219",
-    "87237",
-    "87272",
-    "87280",
-    "87292",
-    "87317",
-    "87319",
-    "87334",
-    "87354",
-    "87377",
-    "87395",
-    "87397",
-    "87411",
-    "87441",
-    "87529",
-    "87534",
-    "87537",
-    "87538",
-    "87564",
-    "87570",
-    "87595",
-    "87609",
-    "87644",
-    "87646",
-    "87658",
-    "87671",
-    "87682",
-    "87683",
-    "87687",
-    "87702",
-    "87713",
-    "87721",
-    "87743",
-    "87745",
-    "87746",
-    "87748",
-    "87750",
-    "87752",
-    "87783",
-    "87820",
-    "87838",
-    "87841",
-    "87845",
-    "87854",
-    "87880",
-    "87896",
-    "87912",
-    "87934",
-    "87936",
-    "87940",
-    "87941",
-    "87991",
-    "87995",
-    "87999",
-    "88001",
-    "88003",
-    "88014",
-    "88018",
-    "88041",
-    "88048",
-    "88054",
-    "88059",
-    "88075",
-    "88087",
-    "88095",
-    "88109",
-    "88119",
-    "88124",
-    "88137",
-    "88140",
-    "88163",
-    "88164",
-    "88167",
-    "88209",
-    "88221",
-    "88222",
-    "88223",
-    "88239",
-    "88252",
-    "88274",
-    "88280",
-    "88283",
-    "88336",
-    "88337",
-    "88339",
-    "88342",
-    "88354",
-    "88370",
-    "88371",
-    "88375",
-    "88389",
-    "88430",
-    "88434",
-    "88466",
-    "88482",
-    "88522",
-    "88525",
-    "88529",
-    "88556",
-    "88567",
-    "88578",
-    "88579",
-    "88582",
-    "88589",
-    "88593",
-    "88595",
-    "88605",
-    "88617",
-    "88637",
-    "88674",
-    "88721",
-    "88722",
-    "88754",
-    "88767",
-    "88773",
-    "88784",
-    "88785",
-    "88811",
-    "88828",
-    "88862",
-    "88877",
-    "88883",
-    "88903",
-    "88909",
-    "88924",
-    "88930",
-    "88948",
-    "88971",
-    "88988",
-    "88994",
-    "89003",
-    "89089",
-    "89094",
-    "89101",
-    "89120",
-    "89145",
-    "89188",
-    "89193",
-    "89230",
-    "89231",
-    "89236",
-    "89237",
-    "89252",
-    "89275",
-    "89303",
-    "89305",
-    "89306",
-    "89309",
-    "89310",
-    "89343",
-    "89351",
-    "89352",
-    "89387",
-    "89391",
-    "89398",
-    "89431",
-    "89452",
-    "89454",
-    "89501",
-    "89515",
-    "89532",
-    "89534",
-    "89550",
-    "89583",
-    "89584",
-    "89614",
-    "89634",
-    "89642",
-    "89651",
-    "89672",
-    "89681",
-    "89726",
-    "89737",
-    "89740",
-    "89766",
-    "89785",
-    "89793",
-    "89818",
-    "89829",
-    "89840",
-    "89843",
-    "89858",
-    "89865",
-    "89920",
-    "89938",
-    "89959",
-    "89971",
-    "89981",
-    "90001",
-    "90008",
-    "90026",
-    "90049",
-    "90056",
-    "90059",
-    "90069",
-    "90116",
-    "90125",
-    "90128",
-    "90141",
-    "90150",
-    "90162",
-    "90163",
-    "90164",
-    "90169",
-    "90191",
-    "90193",
-    "90194",
-    "90216",
-    "90236",
-    "90238",
-    "90262",
-    "90268",
-    "90275",
-    "90278",
-    "90296",
-    "90297",
-    "90302",
-    "90307",
-    "90309",
-    "90311",
-    "90314",
-    "90319",
-    "90320",
-    "90323",
-    "90325",
-    "90336",
-    "90344",
-    "90369",
-    "90381",
-    "90383",
-    "90399",
-    "90408",
-    "90411",
-    "90414",
-    "90418",
-    "90419",
-    "90428",
-    "90444",
-    "90451",
-    "90468",
-    "90485",
-    "90492",
-    "90499",
-    "90519",
-    "90522",
-    "90525",
-    "90526",
-    "90534",
-    "90540",
-    "90573",
-    "90584",
-    "90586",
-    "90587",
-    "90589",
-    "90618",
-    "90631",
-    "90634",
-    "90635",
-    "90681",
-    "90725",
-    "90728",
-    "90732",
-    "90744",
-    "90757",
-    "90765",
-    "90766",
-    "90817",
-    "90852",
-    "90854",
-    "90875",
-    "90894",
-    "90899",
-    "90913",
-    "90918",
-    "90919",
-    "90965",
-    "90982",
-    "90986",
-    "91075",
-    "91083",
-    "91087",
-    "91104",
-    "91135",
-    "91143",
-    "91147",
-    "91160",
-    "91176",
-    "91178",
-    "91201",
-    "91204",
-    "91206",
-    "91209",
-    "91216",
-    "91218",
-    "91219",
-    "91229",
-    "91233",
-    "91254",
-    "91278",
-    "91286",
-    "91289",
-    "91294",
-    "91320",
-    "91364",
-    "91379",
-    "91387",
-    "91398",
-    "91403",
-    "91409",
-    "91421",
-    "91423",
-    "91439",
-    "91453",
-    "91495",
-    "91521",
-    "91523",
-    "91525",
-    "91529",
-    "91545",
-    "91564",
-    "91590",
-    "91620",
-    "91632",
-    "91639",
-    "91649",
-    "91654",
-    "91669",
-    "91675",
-    "91685",
-    "91686",
-    "91692",
-    "91711",
-    "91715",
-    "91721",
-    "91732",
-    "91749",
-    "91757",
-    "91764",
-    "91767",
-    "91782",
-    "91818",
-    "91821",
-    "91824",
-    "91830",
-    "91838",
-    "91844",
-    "91851",
-    "91852",
-    "91854",
-    "91869",
-    "91877",
-    "91904",
-    "91933",
-    "91934",
-    "91944",
-    "91952",
-    "92005",
-    "92022",
-    "92024",
-    "92033",
-    "92046",
-    "92105",
-    "92106",
-    "92123",
-    "92124",
-    "92139",
-    "92150",
-    "92160",
-    "92185",
-    "92205",
-    "92219",
-    "92244",
-    "92255",
-    "92258",
-    "92276",
-    "92284",
-    "92291",
-    "92293",
-    "92297",
-    "92324",
-    "92366",
-    "92444",
-    "92455",
-    "92459",
-    "92477",
-    "92503",
-    "92532",
-    "92562",
-    "92565",
-    "92621",
-    "92629",
-    "92648",
-    "92668",
-    "92686",
-    "92704",
-    "92724",
-    "92738",
-    "92807",
-    "92808",
-    "92812",
-    "92814",
-    "92819",
-    "92834",
-    "92884",
-    "92898",
-    "92917",
-    "92924",
-    "92935",
-    "93003",
-    "93027",
-    "93075",
-    "93109",
-    "93175",
-    "93235",
-    "93289",
-    "93292",
-    "93298",
-    "93301",
-    "93318",
-    "93342",
-    "93360",
-    "93368",
-    "93372",
-    "93394",
-    "93405",
-    "93425",
-    "93445",
-    "93447",
-    "93451",
-    "93481",
-    "93511",
-    "93521",
-    "93524",
-    "93592",
-    "93595",
-    "93604",
-    "93617",
-    "93622",
-    "93628",
-    "93629",
-    "93683",
-    "93788",
-    "93790",
-    "93804",
-    "93824",
-    "93830",
-    "93868",
-    "93879",
-    "93883",
-    "93951",
-    "93957",
-    "93959",
-    "93971",
-    "94004",
-    "94027",
-    "94029",
-    "94039",
-    "94062",
-    "94074",
-    "94088",
-    "94090",
-    "94092",
-    "94098",
-    "94104",
-    "94106",
-    "94107",
-    "94120",
-    "94136",
-    "94145",
-    "94153",
-    "94167",
-    "94174",
-    "94188",
-    "94190",
-    "94212",
-    "94240",
-    "94244",
-    "94253",
-    "94254",
-    "94267",
-    "94273",
-    "94286",
-    "94289",
-    "94312",
-    "94324",
-    "94338",
-    "94355",
-    "94369",
-    "94372",
-    "94408",
-    "94422",
-    "94435",
-    "94462",
-    "94464",
-    "94466",
-    "94489",
-    "94525",
-    "94536",
-    "94546",
-    "94554",
-    "94569",
-    "94593",
-    "94597",
-    "94602",
-    "94614",
-    "94615",
-    "94642",
-    "94683",
-    "94686",
-    "94689",
-    "94694",
-    "94744",
-    "94748",
-    "94749",
-    "94752",
-    "94760",
-    "94769",
-    "94843",
-    "94854",
-    "94919",
-    "94921",
-    "94975",
-    "94980",
-    "94993",
-    "95010",
-    "95018",
-    "95038",
-    "95079",
-    "95114",
-    "95115",
-    "95119",
-    "95124",
-    "95167",
-    "95236",
-    "95241",
-    "95258",
-    "95271",
-    "95272",
-    "95281",
-    "95290",
-    "95294",
-    "95325",
-    "95354",
-    "95386",
-    "95391",
-    "95392",
-    "95402",
-    "95413",
-    "95420",
-    "95423",
-    "95460",
-    "95464",
-    "95465",
-    "95491",
-    "95495",
-    "95497",
-    "95501",
-    "95508",
-    "95521",
-    "95566",
-    "95576",
-    "95591",
-    "95597",
-    "95605",
-    "95621",
-    "95623",
-    "95625",
-    "95669",
-    "95681",
-    "95709",
-    "95717",
-    "95743",
-    "95752",
-    "95781",
-    "95799",
-    "95802",
-    "95804",
-    "95817",
-    "95819",
-    "95858",
-    "95867",
-    "95888",
-    "95903",
-    "95933",
-    "95945",
-    "95965",
-    "95975",
-    "95980",
-    "95985",
-    "95990",
-    "96000",
-    "96045",
-    "96060",
-    "96074",
-    "96075",
-    "96088",
-    "96098",
-    "96115",
-    "96134",
-    "96144",
-    "96192",
-    "96196",
-    "96197",
-    "96237",
-    "96239",
-    "96240",
-    "96245",
-    "96277",
-    "96284",
-    "96291",
-    "96294",
-    "96340",
-    "96343",
-    "96364",
-    "96386",
-    "96389",
-    "96431",
-    "96444",
-    "96457",
-    "96489",
-    "96497",
-    "96517",
-    "96534",
-    "96539",
-    "96549",
-    "96557",
-    "96575",
-    "96594",
-    "96607",
-    "96614",
-    "96622",
-    "96653",
-    "96668",
-    "96693",
-    "96696",
-    "96697",
-    "96699",
-    "96719",
-    "96723",
-    "96749",
-    "96787",
-    "96788",
-    "96798",
-    "96801",
-    "96820",
-    "96830",
-    "96853",
-    "96867",
-    "96871",
-    "96893",
-    "96894",
-    "96896",
-    "96909",
-    "96933",
-    "96938",
-    "96955",
-    "96964",
-    "96971",
-    "96984",
-    "96992",
-    "96997",
-    "97021",
-    "97023",
-    "97039",
-    "97042",
-    "97057",
-    "97066",
-    "97098",
-    "97113",
-    "97137",
-    "97172",
-    "97207",
-    "97219",
-    "97253",
-    "97272",
-    "97292",
-    "97317",
-    "97319",
-    "97322",
-    "97333",
-    "97334",
-    "97354",
-    "97395",
-    "97411",
-    "97441",
-)
-
 PACKAGE_STATUSES = (
     'Manifest',
     'In-Transit',
@@ -9306,9 +180,121 @@ PACKAGE_STATUSES = (
     'Void',
 )
 
-with open('spring/dictionary.txt') as fh:
-    LOREM = fh.read()
+
+class Table(Sequence):
+
+    """A read-only sequence of strings stored in the binary tables file.
+
+    The file is memory-mapped upon the first access, so the processes that
+    never use the table do not pay for it and the processes that do share
+    the same physical pages. Every table is an array of (count + 1) string
+    offsets followed by the UTF-8 encoded strings.
+
+    The file is built from the text sources (one string per line) by running
+    "python -m spring.dictionary" whenever a source changes.
+    """
+
+    FILENAME = os.path.join(DATA_DIR, 'dictionary.dat')
+
+    MAGIC = b'SPRDICT1'
+
+    HEADER = struct.Struct('<8sI')
+
+    ENTRY = struct.Struct('<16sIQ')  # Name, number of strings, offset
+
+    def __init__(self, name: str, filename: str = FILENAME):
+        self.name = name
+        self.filename = filename
+        self._offsets = None
+        self._data = None
+
+    def _load(self):
+        with open(self.filename, 'rb') as fh:
+            data = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, num_tables = self.HEADER.unpack_from(data)
+        if magic != self.MAGIC:
+            raise ValueError('Not a dictionary file: {}'.format(self.filename))
+
+        for i in range(num_tables):
+            name, count, offset = self.ENTRY.unpack_from(
+                data, self.HEADER.size + i * self.ENTRY.size)
+            if name.rstrip(b'\0').decode() == self.name:
+                self._offsets = memoryview(data)[offset:offset + 4 * (count + 1)].cast('I')
+                self._data = data
+                return
+        raise KeyError('Unknown table: {}'.format(self.name))
+
+    def __len__(self) -> int:
+        if self._offsets is None:
+            self._load()
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        if self._offsets is None:
+            self._load()
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Table index out of range')
+        return self._data[self._offsets[index]:self._offsets[index + 1]].decode()
+
+
+def dump_tables(filename: str, tables: Dict[str, Iterable[str]]):
+    """Write the tables to a new binary file."""
+    entries, blobs = [], []
+    offset = Table.HEADER.size + len(tables) * Table.ENTRY.size
+    for name, strings in sorted(tables.items()):
+        encoded = [string.encode() for string in strings]
+        positions = [0]
+        for string in encoded:
+            positions.append(positions[-1] + len(string))
+        data_offset = offset + 4 * len(positions)
+        blob = struct.pack('<{}I'.format(len(positions)),
+                           *(position + data_offset for position in positions))
+        blob += b''.join(encoded)
+        entries.append(Table.ENTRY.pack(name.encode(), len(encoded), offset))
+        blobs.append(blob)
+        offset += len(blob)
+
+    with open(filename, 'wb') as fh:
+        fh.write(Table.HEADER.pack(Table.MAGIC, len(tables)))
+        fh.write(b''.join(entries))
+        fh.write(b''.join(blobs))
+
+
+TABLES = 'counties', 'zip_codes'
+
+
+def read_source(name: str) -> List[str]:
+    """Read the strings of a table from its text source."""
+    with open(os.path.join(DATA_DIR, '{}.txt'.format(name))) as fh:
+        return fh.read().splitlines()
+
+
+def build_dictionary(filename: str = Table.FILENAME):
+    """Rebuild the binary tables file from the text sources."""
+    dump_tables(filename, {name: read_source(name) for name in TABLES})
+
+
+COUNTIES = Table('counties')
+
+ZIP_CODES = Table('zip_codes')
+
+
+@functools.lru_cache()
+def lorem() -> str:
+    with open(os.path.join(DATA_DIR, 'dictionary.txt')) as fh:
+        return fh.read()
+
+
+@functools.lru_cache()
+def garbage() -> str:
+    with open(os.path.join(DATA_DIR, 'garbage.txt')) as fh:
+        return fh.read()
 
 
-with open('spring/garbage.txt') as fh:
-    GARBAGE = fh.read()
+if __name__ == '__main__':
+    build_dictionary()
@@ -1,21 +1,26 @@
+import copy
+import functools
+import json
 import math
 import random
 import time
 from datetime import datetime
-from typing import Iterator, List, Tuple
+from typing import Any, Callable, Iterator, List, Tuple, Union
 
 import numpy as np
 import spooky
 
 from fastdocgen import build_achievements
-from perfrunner.workloads.bigfun import query_gen
+
+try:
+    from fastdocgen import build_basic, build_large, build_nested
+except ImportError:  # The extension was built before the native builders
+    build_basic = build_large = build_nested = None
 from spring.dictionary import (
     CATEGORIES,
     COUNTIES,
     EDUCATION_STATUSES,
-    GARBAGE,
     GENDERS,
-    LOREM,
     MARITAL_STATUSES,
     NUM_STATES,
     NUM_STREET_SUFFIXES,
@@ -24,6 +29,8 @@ from spring.dictionary import (
     STREET_SUFFIX,
     YEARS,
     ZIP_CODES,
+    garbage,
+    lorem,
 )
 from spring.settings import WorkloadSettings
 
@@ -35,6 +42,8 @@ OFFSET = 25000000000
 
 HASH_LENGTH = 16
 
+Bound = Union[int, np.ndarray]  # Key space boundary, scalar or per key
+
 
 def hex_digest(key: str) -> str:
     return '%032x' % spooky.hash128(key)
@@ -61,21 +70,61 @@ def hex_fmtr(key: int, prefix: str) -> str:
     return key
 
 
+def decimal_fmtr_bulk(keys: List[int], prefix: str) -> List[str]:
+    template = prefix and prefix + '-%012d' or '%012d'
+    return list(map(template.__mod__, keys))
+
+
+def hash_fmtr_bulk(keys: List[int], prefix: str) -> List[str]:
+    hash128 = spooky.hash128
+    # The first 16 hex digits of a 128-bit digest are the upper 64 bits
+    return ['%016x' % (hash128(key) >> 64)
+            for key in decimal_fmtr_bulk(keys, prefix)]
+
+
+def hex_fmtr_bulk(keys: List[int], prefix: str) -> List[str]:
+    template = prefix and prefix + '-%036x' or '%036x'
+    return [template % (OFFSET + (key * PRIME) % MAX_PRIME) ** 4
+            for key in keys]
+
+
+def format_keys(numbers: Union[List[int], np.ndarray], prefix: str,
+                fmtr: str) -> List[str]:
+    """Format a batch of key numbers in a single pass.
+
+    The result is identical to calling the scalar formatter for every key.
+    """
+    if isinstance(numbers, np.ndarray):
+        numbers = numbers.tolist()  # Python integers prevent overflow
+    if fmtr == 'hash':
+        return hash_fmtr_bulk(numbers, prefix)
+    if fmtr == 'hex':
+        return hex_fmtr_bulk(numbers, prefix)
+    return decimal_fmtr_bulk(numbers, prefix)
+
+
 class Key:
 
-    def __init__(self, number: int, prefix: str, fmtr: str, hit: bool = False):
+    __slots__ = 'number', 'prefix', 'hit', 'fmtr', '_string'
+
+    def __init__(self, number: int, prefix: str, fmtr: str, hit: bool = False,
+                 string: str = None):
         self.number = number
         self.prefix = prefix
         self.hit = hit
         self.fmtr = fmtr
+        self._string = string
 
     @property
     def string(self) -> str:
-        if self.fmtr == 'hash':
-            return hash_fmtr(self.number, self.prefix)
-        if self.fmtr == 'hex':
-            return hex_fmtr(self.number, self.prefix)
-        return decimal_fmtr(self.number, self.prefix)
+        if self._string is None:
+            if self.fmtr == 'hash':
+                self._string = hash_fmtr(self.number, self.prefix)
+            elif self.fmtr == 'hex':
+                self._string = hex_fmtr(self.number, self.prefix)
+            else:
+                self._string = decimal_fmtr(self.number, self.prefix)
+        return self._string
 
 
 class NewOrderedKey:
@@ -138,6 +187,10 @@ class UniformKey:
         number = random.randrange(curr_deletes, curr_items)
         return Key(number=number, prefix=self.prefix, fmtr=self.fmtr)
 
+    def next_batch(self, n: int, curr_items: Bound, curr_deletes: Bound,
+                   *args) -> np.ndarray:
+        return np.random.randint(curr_deletes, curr_items, size=n)
+
 
 class WorkingSetKey:
 
@@ -185,6 +238,18 @@ class WorkingSetKey:
         number = random.randrange(left_boundary, right_boundary)
         return Key(number=number, prefix=self.prefix, fmtr=self.fmtr, hit=hit)
 
+    def next_batch(self, n: int, curr_items: Bound, curr_deletes: Bound,
+                   *args) -> np.ndarray:
+        num_cold_items = curr_items - self.num_hot_items
+
+        # Same as random.randint(0, 100), the upper bound is inclusive
+        hits = np.random.randint(0, 101, size=n) <= self.working_set_access
+
+        left_boundary = np.where(hits, num_cold_items, curr_deletes)
+        right_boundary = np.where(hits, curr_items, num_cold_items)
+
+        return np.random.randint(left_boundary, right_boundary, size=n)
+
 
 class MovingWorkingSetKey:
 
@@ -195,11 +260,8 @@ class MovingWorkingSetKey:
         self.prefix = prefix
         self.fmtr = ws.key_fmtr
 
-    def next(self, curr_items: int, curr_deletes: int,
-             current_hot_load_start: int, timer_elapse: int) -> Key:
-        num_existing_items = curr_items - curr_deletes
-        num_hot_items = int(num_existing_items * self.working_set / 100)
-
+    def move_working_set(self, num_existing_items: int, num_hot_items: int,
+                         current_hot_load_start: int, timer_elapse: int):
         if timer_elapse.value:
             timer_elapse.value = 0
             # Create next hot_load_start, add working_set_move_docs and then
@@ -208,11 +270,34 @@ class MovingWorkingSetKey:
             offset = current_hot_load_start.value + self.working_set_moving_docs
             current_hot_load_start.value = int(offset % num_items)
 
+    def next(self, curr_items: int, curr_deletes: int,
+             current_hot_load_start: int, timer_elapse: int) -> Key:
+        num_existing_items = curr_items - curr_deletes
+        num_hot_items = int(num_existing_items * self.working_set / 100)
+
+        self.move_working_set(num_existing_items, num_hot_items,
+                              current_hot_load_start, timer_elapse)
+
         left_boundary = curr_deletes + current_hot_load_start.value
         right_boundary = left_boundary + num_hot_items
         number = random.randrange(left_boundary, right_boundary)
         return Key(number=number, prefix=self.prefix, fmtr=self.fmtr)
 
+    def next_batch(self, n: int, curr_items: Bound, curr_deletes: Bound,
+                   current_hot_load_start: int,
+                   timer_elapse: int) -> np.ndarray:
+        num_existing_items = np.asarray(curr_items - curr_deletes)
+        num_hot_items = (num_existing_items * self.working_set / 100)\
+            .astype(np.int64)
+
+        self.move_working_set(int(num_existing_items.flat[0]),
+                              int(num_hot_items.flat[0]),
+                              current_hot_load_start, timer_elapse)
+
+        left_boundary = curr_deletes + current_hot_load_start.value
+        right_boundary = left_boundary + num_hot_items
+        return np.random.randint(left_boundary, right_boundary, size=n)
+
 
 class ContinuousKey:
 
@@ -230,6 +315,11 @@ class ZipfKey(ContinuousKey):
             number = curr_items - 1
         return Key(number=number, prefix=self.prefix, fmtr=self.fmtr)
 
+    def next_batch(self, n: int, curr_items: Bound, curr_deletes: Bound,
+                   *args) -> np.ndarray:
+        numbers = curr_items - np.random.zipf(a=self.alpha, size=n)
+        return np.where(numbers <= curr_deletes, curr_items - 1, numbers)
+
 
 class PowerKey(ContinuousKey):
 
@@ -238,6 +328,12 @@ class PowerKey(ContinuousKey):
         number = curr_deletes + int(r * (curr_items - curr_deletes - 1))
         return Key(number=number, prefix=self.prefix, fmtr=self.fmtr)
 
+    def next_batch(self, n: int, curr_items: Bound, curr_deletes: Bound,
+                   *args) -> np.ndarray:
+        r = np.random.power(a=self.alpha, size=n)
+        return curr_deletes + \
+            (r * (curr_items - curr_deletes - 1)).astype(np.int64)
+
 
 class SequentialKey:
 
@@ -329,7 +425,7 @@ class IncompressibleString(String):
 
     @staticmethod
     def build_alphabet(*args) -> str:
-        return GARBAGE
+        return garbage()
 
     @staticmethod
     def build_string(alphabet: str, length: float):
@@ -344,6 +440,12 @@ class Document(String):
 
     OVERHEAD = 210  # Minimum size due to static fields, body size is variable
 
+    def __init__(self, avg_size: int):
+        super().__init__(avg_size)
+        # Only the exact classes are built natively, subclasses may override
+        # the builders
+        self.native = NATIVE_BUILDERS.get(type(self)) is not None
+
     @classmethod
     def _get_variation_coeff(cls) -> float:
         return np.random.uniform(1 - cls.SIZE_VARIATION, 1 + cls.SIZE_VARIATION)
@@ -419,6 +521,10 @@ class Document(String):
         return self._get_variation_coeff() * (self.avg_size - self.OVERHEAD)
 
     def next(self, key: Key) -> dict:
+        if self.native:
+            return build_basic(key.string, self._size(),
+                               random.randint(1, 9), random.randint(12, 18))
+
         alphabet = self.build_alphabet(key.string)
         size = self._size()
 
@@ -453,6 +559,10 @@ class NestedDocument(Document):
             return 2048 / np.random.beta(a=2.2, b=1.0)
 
     def next(self, key: Key):
+        if self.native:
+            return build_nested(key.string, self._size(),
+                                random.randint(1, 9), random.randint(12, 18), STATES)
+
         alphabet = self.build_alphabet(key.string)
         size = self._size()
 
@@ -476,6 +586,135 @@ class NestedDocument(Document):
         }
 
 
+class DocumentCache:
+
+    """Produce pre-serialized JSON documents from cached templates.
+
+    Basic and nested documents share the same layout and only differ in the
+    values derived from the key alphabet and in the body size. So instead of
+    building a dict and serializing it upon every operation, a template is
+    rendered once per size class. Every field is left-justified to the
+    maximum width of its values, so all fields have fixed offsets within the
+    template and only need to be filled in. The padding is whitespace, which
+    keeps the document valid JSON.
+
+    Alternative emails are derived from the alphabet rather than from the
+    global random state.
+
+    Size classes are drawn from the size distribution of the generator using
+    a fixed seed, and the size class of a document is derived from its key.
+    Therefore, the same key always produces the same bytes.
+    """
+
+    NUM_SIZE_CLASSES = 32
+
+    SAMPLES = 10 ** 4
+
+    SEED = 4889
+
+    SUPPORTED = Document, NestedDocument
+
+    FIELDS = (  # Builder and the maximum width of the JSON value
+        ('build_name', 15),
+        ('build_email', 19),
+        ('build_alt_email', 19),
+        ('build_street', 10),
+        ('build_city', 8),
+        ('build_county', 8),
+        ('build_state', 4),
+        ('build_full_state', 22),
+        ('build_country', 8),
+        ('build_realm', 8),
+        ('build_coins', 6),
+        ('build_category', 3),
+        ('build_achievements', 80),
+        ('build_gmtime', 36),
+        ('build_year', 4),
+    )
+
+    BODY_MARKER = 'Z'
+
+    def __init__(self, docs: Document):
+        self.docs = docs
+        self.templates = [
+            self.render(size) for size in self.size_classes()
+        ]
+
+    @classmethod
+    def supports(cls, docs) -> bool:
+        return type(docs) in cls.SUPPORTED
+
+    @staticmethod
+    def build_alt_email(alphabet: str) -> str:
+        name = 1 + int(alphabet[0], 16) % 9
+        domain = 12 + int(alphabet[1], 16) % 7
+        return '%s@%s.com' % (alphabet[name:name + 6], alphabet[domain:domain + 6])
+
+    def size_classes(self) -> List[int]:
+        py_state, np_state = random.getstate(), np.random.get_state()
+        random.seed(self.SEED)
+        np.random.seed(self.SEED)
+        try:
+            sizes = [self.docs._size() for _ in range(self.SAMPLES)]
+        finally:
+            random.setstate(py_state)
+            np.random.set_state(np_state)
+
+        percentiles = (np.arange(self.NUM_SIZE_CLASSES) + 0.5) * \
+            100 / self.NUM_SIZE_CLASSES
+        return [max(0, int(size)) for size in np.percentile(sizes, percentiles)]
+
+    def render(self, size: int) -> Tuple[str, list]:
+        template = copy.copy(self.docs)
+        template.native = False  # The builders are replaced below
+        markers = []
+        for i, (builder, width) in enumerate(self.FIELDS):
+            marker = chr(ord('A') + i) * (width - 2)  # Excluding the quotes
+            setattr(template, builder, lambda alphabet, marker=marker: marker)
+            markers.append(('"{}"'.format(marker), width, builder))
+        markers.append(('"{}"'.format(self.BODY_MARKER * size), 0, None))
+        template.build_alphabet = lambda key: ''
+        template.build_string = lambda alphabet, length: \
+            self.BODY_MARKER * int(length)
+        template._size = lambda: size
+
+        doc = template.next(Key(number=0, prefix='', fmtr='decimal'))
+        data = json.dumps(doc, sort_keys=True).replace('%', '%%')
+
+        fields = sorted((data.find(marker), marker, width, builder)
+                        for marker, width, builder in markers
+                        if marker in data)
+        builders = []
+        for _, marker, width, builder in fields:
+            if builder is None:  # Body
+                data = data.replace(marker, '"%s"', 1)
+                builders.append((str, functools.partial(
+                    self.docs.build_string, length=size)))
+            else:
+                data = data.replace(marker, '%-{}s'.format(width), 1)
+                builder = getattr(self, builder, None) or \
+                    getattr(self.docs, builder)
+                builders.append((self.encoder(builder('0' * 64)), builder))
+        return data, builders
+
+    @staticmethod
+    def encoder(value) -> Callable[[Any], str]:
+        """Pick a serializer that is cheaper than json.dumps for small values."""
+        if isinstance(value, str):
+            return '"%s"'.__mod__  # Alphabet-based strings need no escaping
+        if isinstance(value, (list, tuple)):
+            return lambda v: '[%s]' % ', '.join(map(str, v))
+        return repr
+
+    def next(self, key: Key) -> bytes:
+        alphabet = self.docs.build_alphabet(key.string)
+        size_class = int(alphabet[32:36], 16) % self.NUM_SIZE_CLASSES
+        template, builders = self.templates[size_class]
+
+        values = tuple(encode(build(alphabet)) for encode, build in builders)
+        return (template % values).encode()
+
+
 class LargeDocument(Document):
 
     OVERHEAD = 680
@@ -492,9 +731,14 @@ class LargeDocument(Document):
         return body[:length_int]
 
     def next(self, key: Key) -> dict:
-        alphabet = self.build_alphabet(key.string)
         size = self._size() / 3
-        offset = (PRIME * key.number) % (len(LOREM) - self.TEXT_LENGTH)
+        text = lorem()
+        offset = (PRIME * key.number) % (len(text) - self.TEXT_LENGTH)
+        if self.native:
+            return build_large(key.string, size, text[offset:offset + self.TEXT_LENGTH],
+                               STATES)
+
+        alphabet = self.build_alphabet(key.string)
 
         return {
             'id': alphabet,
@@ -516,10 +760,17 @@ class LargeDocument(Document):
             'padding': self.build_string(alphabet, size),
             'notes': self.build_string(alphabet[::-1], size),
             'text': self.build_string(alphabet[:16], size),
-            'lorem': LOREM[offset:offset + self.TEXT_LENGTH],
+            'lorem': text[offset:offset + self.TEXT_LENGTH],
         }
 
 
+NATIVE_BUILDERS = {  # The documents built by the C extension, if available
+    Document: build_basic,
+    NestedDocument: build_nested,
+    LargeDocument: build_large,
+}
+
+
 class ReverseLookupDocument(NestedDocument):
 
     OVERHEAD = 420
@@ -1432,14 +1683,19 @@ class PackageDocument(Document):
 
 class BigFunDocument:
 
+    def __init__(self):
+        # Imported on demand, perfrunner.workloads imports spring.wgen
+        from perfrunner.workloads.bigfun import query_gen
+        self.query_gen = query_gen
+
     def next(self, *args) -> dict:
         return {
-            'user_since_small': query_gen.bf03params(num_matches=1e2),
-            'user_since_medium': query_gen.bf03params(num_matches=1e4),
-            'user_since_large': query_gen.bf03params(num_matches=1e6),
-            'send_time_small': query_gen.bf08params(num_matches=1e2),
-            'send_time_medium': query_gen.bf08params(num_matches=1e4),
-            'send_time_large': query_gen.bf08params(num_matches=1e6),
+            'user_since_small': self.query_gen.bf03params(num_matches=1e2),
+            'user_since_medium': self.query_gen.bf03params(num_matches=1e4),
+            'user_since_large': self.query_gen.bf03params(num_matches=1e6),
+            'send_time_small': self.query_gen.bf08params(num_matches=1e2),
+            'send_time_medium': self.query_gen.bf08params(num_matches=1e4),
+            'send_time_large': self.query_gen.bf08params(num_matches=1e6),
         }
 
 
@@ -1487,7 +1743,8 @@ class AdvFilterDocument(Document):
     def next(self, key: Key) -> dict:
         alphabet = self.build_alphabet(key.string)
         size = self._size() / 3
-        offset = (PRIME * key.number) % (len(LOREM) - self.TEXT_LENGTH)
+        text = lorem()
+        offset = (PRIME * key.number) % (len(text) - self.TEXT_LENGTH)
         identifier = key.string.split("-")[1]
 
         return {
@@ -1510,7 +1767,7 @@ class AdvFilterDocument(Document):
             'padding': self.build_string(alphabet, size),
             'notes': self.build_string(alphabet[::-1], size),
             'text': self.build_string(alphabet[:16], size),
-            'lorem': LOREM[offset:offset + self.TEXT_LENGTH],
+            'lorem': text[offset:offset + self.TEXT_LENGTH],
             'identifier1': identifier,
             'identifier2': {'n': {'a': {'m': {'e': {'s': self.build_name(
                        alphabet) * random.randint(0, 3)}}}}},
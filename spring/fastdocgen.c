@@ -1,18 +1,46 @@
 #include <Python.h>
+#include <string.h>
+#include <time.h>
+
+#define DIGEST_LEN 32
+#define ALPHABET_LEN (2 * DIGEST_LEN)
+#define NUM_GMTIMES 12
+
+enum field {
+    F, NAME, EMAIL, ALT_EMAIL, STREET, CITY, COUNTY, STATE, FULL_STATE, COUNTRY,
+    REALM, COINS, CATEGORY, ACHIEVEMENTS, GMTIME, YEAR, BODY, ID, REVERED_ID,
+    CODE, PADDING, NOTES, TEXT, LOREM, NUM_FIELDS
+};
+
+static const char *field_names[NUM_FIELDS] = {
+    "f", "name", "email", "alt_email", "street", "city", "county", "state",
+    "full_state", "country", "realm", "coins", "category", "achievements",
+    "gmtime", "year", "body", "id", "revered_id", "code", "padding", "notes",
+    "text", "lorem"
+};
 
 struct module_state {
     PyObject *error;
+    PyObject *hash128;
+    PyObject *gmtimes[NUM_GMTIMES];
+    PyObject *fields[NUM_FIELDS];  /* Interned field names */
 };
 
 #define GETSTATE(m) ((struct module_state*)PyModule_GetState(m))
 
-static PyObject *
-build_achievements(PyObject *self, PyObject *args)
+static int
+hex_value(char c)
 {
-    char *alphabet;
-    if (!PyArg_ParseTuple(args, "s", &alphabet))
-        return NULL;
+    if (c >= '0' && c <= '9')
+        return c - '0';
+    if (c >= 'a' && c <= 'f')
+        return c - 'a' + 10;
+    return 0;
+}
 
+static PyObject *
+achievements_list(const char *alphabet)
+{
     const int offset = 42;
     const int max_len = 16;
 
@@ -22,7 +50,7 @@ build_achievements(PyObject *self, PyObject *args)
     int num_valid = 0;
 
     for (i = 0; i < max_len; i++) {
-        int hex = strtol((char[]){alphabet[i+offset], 0}, NULL, 16);
+        int hex = hex_value(alphabet[i+offset]);
         achievement = (achievement + hex * i) % 512;
         if (achievement < 256) {
             num_valid++;
@@ -33,6 +61,8 @@ build_achievements(PyObject *self, PyObject *args)
     }
 
     PyObject *py_array = PyList_New(num_valid);
+    if (py_array == NULL)
+        return NULL;
     int iter = 0;
     for (i = 0; i < max_len; i++) {
         if (achievements[i] >= 0) {
@@ -44,20 +74,396 @@ build_achievements(PyObject *self, PyObject *args)
     return py_array;
 }
 
+static PyObject *
+build_achievements(PyObject *self, PyObject *args)
+{
+    char *alphabet;
+    if (!PyArg_ParseTuple(args, "s", &alphabet))
+        return NULL;
+
+    return achievements_list(alphabet);
+}
+
+/* Document builders
+ *
+ * The builders below produce the same documents as Document.next(),
+ * NestedDocument.next() and LargeDocument.next() in spring/docgen.py. The
+ * random numbers (the body size and the alternative email offsets) are drawn
+ * by the caller, so that the random state advances exactly as in Python.
+ */
+
+/* '%032x' % spooky.hash128(key) */
+static int
+hex_digest(PyObject *m, PyObject *key, char *digest)
+{
+    PyObject *hash = PyObject_CallFunctionObjArgs(GETSTATE(m)->hash128, key, NULL);
+    if (hash == NULL)
+        return -1;
+
+    unsigned long long low = PyLong_AsUnsignedLongLongMask(hash);
+    PyObject *shift = PyLong_FromLong(64);
+    PyObject *upper = shift ? PyNumber_Rshift(hash, shift) : NULL;
+    Py_DECREF(hash);
+    Py_XDECREF(shift);
+    if (upper == NULL)
+        return -1;
+    unsigned long long high = PyLong_AsUnsignedLongLong(upper);
+    Py_DECREF(upper);
+    if (PyErr_Occurred())
+        return -1;
+
+    snprintf(digest, DIGEST_LEN + 1, "%016llx%016llx", high, low);
+    return 0;
+}
+
+static int
+hex_digest_of(PyObject *m, const char *str, Py_ssize_t len, char *digest)
+{
+    PyObject *key = PyUnicode_FromStringAndSize(str, len);
+    if (key == NULL)
+        return -1;
+    int res = hex_digest(m, key, digest);
+    Py_DECREF(key);
+    return res;
+}
+
+static void
+reverse(const char *str, Py_ssize_t len, char *reversed)
+{
+    Py_ssize_t i;
+    for (i = 0; i < len; i++)
+        reversed[i] = str[len - 1 - i];
+    reversed[len] = 0;
+}
+
+/* hex_digest(key) + hex_digest(key[::-1]) */
+static int
+build_alphabet(PyObject *m, PyObject *key, char *alphabet)
+{
+    if (hex_digest(m, key, alphabet) < 0)
+        return -1;
+
+    PyObject *step = PyLong_FromLong(-1);
+    PyObject *slice = step ? PySlice_New(NULL, NULL, step) : NULL;
+    Py_XDECREF(step);
+    if (slice == NULL)
+        return -1;
+    PyObject *reversed = PyObject_GetItem(key, slice);
+    Py_DECREF(slice);
+    if (reversed == NULL)
+        return -1;
+    int res = hex_digest(m, reversed, alphabet + DIGEST_LEN);
+    Py_DECREF(reversed);
+    return res;
+}
+
+/* The pattern repeated up to int(length) characters */
+static PyObject *
+build_string(const char *pattern, Py_ssize_t pattern_len, double length)
+{
+    Py_ssize_t len = length > 0 ? (Py_ssize_t)length : 0;
+    PyObject *str = PyUnicode_New(len, 127);
+    if (str == NULL)
+        return NULL;
+
+    Py_UCS1 *data = PyUnicode_1BYTE_DATA(str);
+    Py_ssize_t i;
+    for (i = 0; i < len; i += pattern_len)
+        memcpy(data + i, pattern, len - i < pattern_len ? len - i : pattern_len);
+    return str;
+}
+
+static PyObject *
+substring(const char *alphabet, int start, int end)
+{
+    return PyUnicode_FromStringAndSize(alphabet + start, end - start);
+}
+
+/* '%s %s' % (alphabet[:6], alphabet[6:12]) */
+static PyObject *
+build_name(const char *alphabet)
+{
+    char name[13];
+    memcpy(name, alphabet, 6);
+    name[6] = ' ';
+    memcpy(name + 7, alphabet + 6, 6);
+    return PyUnicode_FromStringAndSize(name, sizeof(name));
+}
+
+/* '%s@%s.com' % (alphabet[name:name + 6], alphabet[domain:domain + 6]) */
+static PyObject *
+build_email(const char *alphabet, int name, int domain)
+{
+    char email[17];
+    memcpy(email, alphabet + name, 6);
+    email[6] = '@';
+    memcpy(email + 7, alphabet + domain, 6);
+    memcpy(email + 13, ".com", 4);
+    return PyUnicode_FromStringAndSize(email, sizeof(email));
+}
+
+static PyObject *
+build_coins(const char *alphabet)
+{
+    int coins = 0;
+    int i;
+    for (i = 36; i < 40; i++)
+        coins = coins * 16 + hex_value(alphabet[i]);
+    double value = coins / 100.0;
+    return PyFloat_FromDouble(value < 0.1 ? 0.1 : value);
+}
+
+static PyObject *
+build_category(const char *alphabet)
+{
+    return PyLong_FromLong(hex_value(alphabet[41]) % 3);
+}
+
+static PyObject *
+build_year(const char *alphabet)
+{
+    return PyLong_FromLong(1985 + hex_value(alphabet[62]));
+}
+
+static PyObject *
+build_achievements_or_zero(const char *alphabet)
+{
+    PyObject *achievements = achievements_list(alphabet);
+    if (achievements != NULL && PyList_GET_SIZE(achievements) == 0) {
+        Py_DECREF(achievements);
+        return Py_BuildValue("[i]", 0);
+    }
+    return achievements;
+}
+
+/* tuple(time.gmtime(seconds)), there are only NUM_GMTIMES distinct values */
+static PyObject *
+build_gmtime(PyObject *m, const char *alphabet)
+{
+    int idx = hex_value(alphabet[63]) % NUM_GMTIMES;
+    PyObject **cached = &GETSTATE(m)->gmtimes[idx];
+
+    if (*cached == NULL) {
+        time_t seconds = (time_t)396 * 24 * 3600 * idx;
+        struct tm tm;
+        if (gmtime_r(&seconds, &tm) == NULL) {
+            PyErr_SetFromErrno(PyExc_OSError);
+            return NULL;
+        }
+        *cached = Py_BuildValue("(iiiiiiiii)",
+                                tm.tm_year + 1900, tm.tm_mon + 1, tm.tm_mday,
+                                tm.tm_hour, tm.tm_min, tm.tm_sec,
+                                (tm.tm_wday + 6) % 7, tm.tm_yday + 1, tm.tm_isdst);
+        if (*cached == NULL)
+            return NULL;
+    }
+    Py_INCREF(*cached);
+    return *cached;
+}
+
+/* STATES[alphabet.find(digit) % NUM_STATES][field] */
+static PyObject *
+build_state(PyObject *states, const char *alphabet, char digit, int field)
+{
+    Py_ssize_t num_states = PySequence_Size(states);
+    if (num_states <= 0) {
+        if (!PyErr_Occurred())
+            PyErr_SetString(PyExc_ValueError, "no states");
+        return NULL;
+    }
+
+    const char *found = memchr(alphabet, digit, ALPHABET_LEN);
+    Py_ssize_t idx = found ? found - alphabet : -1;
+    idx = ((idx % num_states) + num_states) % num_states;
+
+    PyObject *state = PySequence_GetItem(states, idx);
+    if (state == NULL)
+        return NULL;
+    PyObject *value = PySequence_GetItem(state, field);
+    Py_DECREF(state);
+    return value;
+}
+
+/* {'f': value}, nested the given number of times */
+static PyObject *
+nest(struct module_state *st, PyObject *value, int depth)
+{
+    while (value != NULL && depth--) {
+        PyObject *outer = PyDict_New();
+        if (outer != NULL && PyDict_SetItem(outer, st->fields[F], value) < 0)
+            Py_CLEAR(outer);
+        Py_DECREF(value);
+        value = outer;
+    }
+    return value;
+}
+
+/* Steals the reference to the value, which may be NULL on error */
+static int
+set_field(struct module_state *st, PyObject *doc, enum field field, PyObject *value)
+{
+    if (value == NULL)
+        return -1;
+    int res = PyDict_SetItem(doc, st->fields[field], value);
+    Py_DECREF(value);
+    return res;
+}
+
+static PyObject *
+build_basic(PyObject *self, PyObject *args)
+{
+    PyObject *key;
+    double size;
+    int name, domain;
+    if (!PyArg_ParseTuple(args, "Udii", &key, &size, &name, &domain))
+        return NULL;
+
+    char alphabet[ALPHABET_LEN + 1];
+    if (build_alphabet(self, key, alphabet) < 0)
+        return NULL;
+
+    struct module_state *st = GETSTATE(self);
+    PyObject *doc = PyDict_New();
+    if (doc == NULL)
+        return NULL;
+
+    if (set_field(st, doc, NAME, build_name(alphabet)) < 0 ||
+            set_field(st, doc, EMAIL, build_email(alphabet, 12, 18)) < 0 ||
+            set_field(st, doc, ALT_EMAIL, build_email(alphabet, name, domain)) < 0 ||
+            set_field(st, doc, CITY, substring(alphabet, 24, 30)) < 0 ||
+            set_field(st, doc, REALM, substring(alphabet, 30, 36)) < 0 ||
+            set_field(st, doc, COINS, build_coins(alphabet)) < 0 ||
+            set_field(st, doc, CATEGORY, build_category(alphabet)) < 0 ||
+            set_field(st, doc, ACHIEVEMENTS, build_achievements_or_zero(alphabet)) < 0 ||
+            set_field(st, doc, BODY, build_string(alphabet, ALPHABET_LEN, size)) < 0) {
+        Py_DECREF(doc);
+        return NULL;
+    }
+    return doc;
+}
+
+static PyObject *
+build_nested(PyObject *self, PyObject *args)
+{
+    PyObject *key, *states;
+    double size;
+    int name, domain;
+    if (!PyArg_ParseTuple(args, "UdiiO", &key, &size, &name, &domain, &states))
+        return NULL;
+
+    char alphabet[ALPHABET_LEN + 1];
+    if (build_alphabet(self, key, alphabet) < 0)
+        return NULL;
+
+    struct module_state *st = GETSTATE(self);
+    PyObject *doc = PyDict_New();
+    if (doc == NULL)
+        return NULL;
+
+    if (set_field(st, doc, NAME, nest(st, build_name(alphabet), 3)) < 0 ||
+            set_field(st, doc, EMAIL, nest(st, build_email(alphabet, 12, 18), 2)) < 0 ||
+            set_field(st, doc, ALT_EMAIL, nest(st, build_email(alphabet, name, domain), 2)) < 0 ||
+            set_field(st, doc, STREET, nest(st, substring(alphabet, 54, 62), 2)) < 0 ||
+            set_field(st, doc, CITY, nest(st, substring(alphabet, 24, 30), 2)) < 0 ||
+            set_field(st, doc, COUNTY, nest(st, substring(alphabet, 48, 54), 2)) < 0 ||
+            set_field(st, doc, STATE, nest(st, build_state(states, alphabet, '7', 0), 1)) < 0 ||
+            set_field(st, doc, FULL_STATE, nest(st, build_state(states, alphabet, '8', 1), 1)) < 0 ||
+            set_field(st, doc, COUNTRY, nest(st, substring(alphabet, 42, 48), 1)) < 0 ||
+            set_field(st, doc, REALM, nest(st, substring(alphabet, 30, 36), 1)) < 0 ||
+            set_field(st, doc, COINS, nest(st, build_coins(alphabet), 1)) < 0 ||
+            set_field(st, doc, CATEGORY, build_category(alphabet)) < 0 ||
+            set_field(st, doc, ACHIEVEMENTS, build_achievements_or_zero(alphabet)) < 0 ||
+            set_field(st, doc, GMTIME, build_gmtime(self, alphabet)) < 0 ||
+            set_field(st, doc, YEAR, build_year(alphabet)) < 0 ||
+            set_field(st, doc, BODY, build_string(alphabet, ALPHABET_LEN, size)) < 0) {
+        Py_DECREF(doc);
+        return NULL;
+    }
+    return doc;
+}
+
+static PyObject *
+build_large(PyObject *self, PyObject *args)
+{
+    PyObject *key, *lorem, *states;
+    double size;
+    if (!PyArg_ParseTuple(args, "UdUO", &key, &size, &lorem, &states))
+        return NULL;
+
+    char alphabet[ALPHABET_LEN + 1];
+    char reversed[ALPHABET_LEN + 1];
+    char code[DIGEST_LEN + 1], notes[DIGEST_LEN + 1], text[DIGEST_LEN + 1];
+    if (build_alphabet(self, key, alphabet) < 0)
+        return NULL;
+    reverse(alphabet, ALPHABET_LEN, reversed);
+    if (hex_digest_of(self, alphabet, ALPHABET_LEN, code) < 0 ||
+            hex_digest_of(self, reversed, ALPHABET_LEN, notes) < 0 ||
+            hex_digest_of(self, alphabet, 16, text) < 0)
+        return NULL;
+
+    struct module_state *st = GETSTATE(self);
+    PyObject *doc = PyDict_New();
+    if (doc == NULL)
+        return NULL;
+
+    if (set_field(st, doc, ID, substring(alphabet, 0, ALPHABET_LEN)) < 0 ||
+            set_field(st, doc, REVERED_ID, substring(reversed, 0, ALPHABET_LEN)) < 0 ||
+            set_field(st, doc, CODE, substring(code, 0, DIGEST_LEN)) < 0 ||
+            set_field(st, doc, NAME, build_name(alphabet)) < 0 ||
+            set_field(st, doc, EMAIL, build_email(alphabet, 12, 18)) < 0 ||
+            set_field(st, doc, CITY, substring(alphabet, 24, 30)) < 0 ||
+            set_field(st, doc, COUNTY, substring(alphabet, 48, 54)) < 0 ||
+            set_field(st, doc, STATE, build_state(states, alphabet, '7', 0)) < 0 ||
+            set_field(st, doc, FULL_STATE, build_state(states, alphabet, '8', 1)) < 0 ||
+            set_field(st, doc, COUNTRY, substring(alphabet, 42, 48)) < 0 ||
+            set_field(st, doc, REALM, substring(alphabet, 30, 36)) < 0 ||
+            set_field(st, doc, COINS, build_coins(alphabet)) < 0 ||
+            set_field(st, doc, CATEGORY, build_category(alphabet)) < 0 ||
+            set_field(st, doc, ACHIEVEMENTS, build_achievements_or_zero(alphabet)) < 0 ||
+            set_field(st, doc, GMTIME, build_gmtime(self, alphabet)) < 0 ||
+            set_field(st, doc, YEAR, build_year(alphabet)) < 0 ||
+            set_field(st, doc, PADDING, build_string(code, DIGEST_LEN, size)) < 0 ||
+            set_field(st, doc, NOTES, build_string(notes, DIGEST_LEN, size)) < 0 ||
+            set_field(st, doc, TEXT, build_string(text, DIGEST_LEN, size)) < 0 ||
+            set_field(st, doc, LOREM, (Py_INCREF(lorem), lorem)) < 0) {
+        Py_DECREF(doc);
+        return NULL;
+    }
+    return doc;
+}
+
 
 static PyMethodDef
 fastdocgen_methods[] = {
     {"build_achievements",  build_achievements, METH_VARARGS, NULL},
+    {"build_basic",  build_basic, METH_VARARGS,
+     "build_basic(key, size, alt_name, alt_domain) -> dict"},
+    {"build_nested",  build_nested, METH_VARARGS,
+     "build_nested(key, size, alt_name, alt_domain, states) -> dict"},
+    {"build_large",  build_large, METH_VARARGS,
+     "build_large(key, size, lorem, states) -> dict"},
     {NULL, NULL, 0, NULL}
 };
 
 static int fastdocgen_traverse(PyObject *m, visitproc visit, void *arg) {
+    int i;
     Py_VISIT(GETSTATE(m)->error);
+    Py_VISIT(GETSTATE(m)->hash128);
+    for (i = 0; i < NUM_GMTIMES; i++)
+        Py_VISIT(GETSTATE(m)->gmtimes[i]);
+    for (i = 0; i < NUM_FIELDS; i++)
+        Py_VISIT(GETSTATE(m)->fields[i]);
     return 0;
 }
 
 static int fastdocgen_clear(PyObject *m) {
+    int i;
     Py_CLEAR(GETSTATE(m)->error);
+    Py_CLEAR(GETSTATE(m)->hash128);
+    for (i = 0; i < NUM_GMTIMES; i++)
+        Py_CLEAR(GETSTATE(m)->gmtimes[i]);
+    for (i = 0; i < NUM_FIELDS; i++)
+        Py_CLEAR(GETSTATE(m)->fields[i]);
     return 0;
 }
 
@@ -82,5 +488,26 @@ PyInit_fastdocgen(void)
     if (m == NULL)
         return NULL;
 
+    PyObject *spooky = PyImport_ImportModule("spooky");
+    if (spooky == NULL) {
+        Py_DECREF(m);
+        return NULL;
+    }
+    GETSTATE(m)->hash128 = PyObject_GetAttrString(spooky, "hash128");
+    Py_DECREF(spooky);
+    if (GETSTATE(m)->hash128 == NULL) {
+        Py_DECREF(m);
+        return NULL;
+    }
+
+    int i;
+    for (i = 0; i < NUM_FIELDS; i++) {
+        GETSTATE(m)->fields[i] = PyUnicode_InternFromString(field_names[i]);
+        if (GETSTATE(m)->fields[i] == NULL) {
+            Py_DECREF(m);
+            return NULL;
+        }
+    }
+
     return m;
 }
@@ -0,0 +1,65 @@
+import importlib
+
+DOC_GENERATORS = {
+    # Name: (class path, constructor arguments)
+    'basic': ('spring.docgen.Document', ('size',)),
+    'string': ('spring.docgen.String', ('size',)),
+    'nested': ('spring.docgen.NestedDocument', ('size',)),
+    'reverse_lookup': ('spring.docgen.ReverseLookupDocument', ('size', 'prefix')),
+    'reverse_range_lookup': ('spring.docgen.ReverseRangeLookupDocument',
+                             ('size', 'prefix', 'range_distance')),
+    'ext_reverse_lookup': ('spring.docgen.ExtReverseLookupDocument',
+                           ('size', 'prefix', 'items')),
+    'hash_join': ('spring.docgen.HashJoinDocument', ('size', 'prefix', 'range_distance')),
+    'join': ('spring.docgen.JoinedDocument',
+             ('size', 'prefix', 'items', 'num_categories', 'num_replies')),
+    'ref': ('spring.docgen.RefDocument', ('size', 'prefix')),
+    'array_indexing': ('spring.docgen.ArrayIndexingDocument',
+                       ('size', 'prefix', 'array_size', 'items')),
+    'array_indexing_unique': ('spring.docgen.ArrayIndexingUniqueDocument',
+                              ('size', 'prefix', 'array_size', 'items')),
+    'array_indexing_range_scan': ('spring.docgen.ArrayIndexingRangeScanDocument',
+                                  ('size', 'prefix', 'array_size', 'items')),
+    'profile': ('spring.docgen.ProfileDocument', ('size', 'prefix')),
+    'import_export_simple': ('spring.docgen.ImportExportDocument', ('size', 'prefix')),
+    'import_export_array': ('spring.docgen.ImportExportDocumentArray', ('size', 'prefix')),
+    'import_export_nested': ('spring.docgen.ImportExportDocumentNested', ('size', 'prefix')),
+    'large': ('spring.docgen.LargeDocument', ('size',)),
+    'gsi_multiindex': ('spring.docgen.GSIMultiIndexDocument', ('size',)),
+    'small_plasma': ('spring.docgen.SmallPlasmaDocument', ('size',)),
+    'sequential_plasma': ('spring.docgen.SequentialPlasmaDocument', ('size',)),
+    'large_item_plasma': ('spring.docgen.LargeItemPlasmaDocument', ('size', 'item_size')),
+    'varying_item_plasma': ('spring.docgen.VaryingItemSizePlasmaDocument',
+                            ('size', 'size_variation_min', 'size_variation_max')),
+    'eventing_small': ('spring.docgen.EventingSmallDocument', ('size',)),
+    'tpc_ds': ('spring.docgen.TpcDsDocument', ()),
+    'package': ('spring.docgen.PackageDocument', ('size',)),
+    'incompressible': ('spring.docgen.IncompressibleString', ('size',)),
+    'big_fun': ('spring.docgen.BigFunDocument', ()),
+    'multibucket': ('spring.docgen.MultiBucketDocument', ('size',)),
+    'advancedfilter': ('spring.docgen.AdvFilterDocument', ('size',)),
+    'advancedfilterxattr': ('spring.docgen.AdvFilterXattrBody', ('size',)),
+}
+
+
+def doc_generator_class(name: str) -> type:
+    """Import the module of the document generator on demand."""
+    if name not in DOC_GENERATORS:
+        raise ValueError('Unknown document generator: {}'.format(name))
+    module_name, class_name = DOC_GENERATORS[name][0].rsplit('.', 1)
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def new_doc_generator(name: str, workload_settings, target_settings):
+    """Create a document generator by name.
+
+    The constructor arguments are taken from the workload settings, except
+    for the key prefix, which is a target setting.
+    """
+    args = []
+    for param in DOC_GENERATORS.get(name, (None, ()))[1]:
+        if param == 'prefix':
+            args.append(target_settings.prefix)
+        else:
+            args.append(getattr(workload_settings, param))
+    return doc_generator_class(name)(*args)
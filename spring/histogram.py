@@ -0,0 +1,287 @@
+import glob
+import math
+import struct
+import time
+from array import array
+from typing import Dict, Iterator, Tuple
+
+import numpy as np
+
+from logger import logger
+
+
+class Histogram:
+
+    """Implement a log-linear (HDR) histogram of non-negative integers.
+
+    Every power-of-two range of values is split into a fixed number of linear
+    sub-buckets, so the relative error of the reported values never exceeds
+    1 / SUB_BUCKET_HALF_COUNT regardless of the magnitude. The memory footprint
+    is fixed and histograms from different processes are merged by adding up
+    the counts.
+
+    See also http://hdrhistogram.org/
+    """
+
+    SUB_BUCKET_BITS = 10  # 1024 sub-buckets, i.e. < 0.2% error
+
+    MAX_VALUE_BITS = 36  # ~19 hours in microseconds
+
+    SUB_BUCKET_HALF_COUNT_MAGNITUDE = SUB_BUCKET_BITS - 1
+
+    SUB_BUCKET_HALF_COUNT = 1 << SUB_BUCKET_HALF_COUNT_MAGNITUDE
+
+    SUB_BUCKET_MASK = (1 << SUB_BUCKET_BITS) - 1
+
+    BUCKET_COUNT = MAX_VALUE_BITS - SUB_BUCKET_BITS + 1
+
+    COUNTS_LEN = (BUCKET_COUNT + 1) * SUB_BUCKET_HALF_COUNT
+
+    MAX_VALUE = (1 << MAX_VALUE_BITS) - 1
+
+    def __init__(self):
+        self.counts = np.zeros(self.COUNTS_LEN, dtype=np.int64)
+
+    @classmethod
+    def index_of(cls, value: int) -> int:
+        bucket_idx = (value | cls.SUB_BUCKET_MASK).bit_length() - \
+            cls.SUB_BUCKET_BITS
+        sub_bucket_idx = value >> bucket_idx
+        return ((bucket_idx + 1) << cls.SUB_BUCKET_HALF_COUNT_MAGNITUDE) + \
+            sub_bucket_idx - cls.SUB_BUCKET_HALF_COUNT
+
+    @classmethod
+    def highest_equivalent(cls, indexes: np.ndarray) -> np.ndarray:
+        """Return the largest value that maps to each of the given indexes."""
+        indexes = np.asarray(indexes, dtype=np.int64)
+        bucket_idx = (indexes >> cls.SUB_BUCKET_HALF_COUNT_MAGNITUDE) - 1
+        sub_bucket_idx = (indexes & (cls.SUB_BUCKET_HALF_COUNT - 1)) + \
+            cls.SUB_BUCKET_HALF_COUNT
+        first_bucket = bucket_idx < 0
+        sub_bucket_idx[first_bucket] -= cls.SUB_BUCKET_HALF_COUNT
+        bucket_idx[first_bucket] = 0
+        return ((sub_bucket_idx + 1) << bucket_idx) - 1
+
+    @classmethod
+    def percentile_of(cls, indexes: np.ndarray, counts: np.ndarray,
+                      percentile: float) -> int:
+        """Return the percentile of sparse counts sorted by index."""
+        total = int(counts.sum())
+        if not total:
+            return 0
+        rank = max(1, int(math.ceil(percentile / 100 * total)))
+        pos = np.searchsorted(np.cumsum(counts), rank)
+        return int(cls.highest_equivalent(indexes[pos:pos + 1])[0])
+
+    @classmethod
+    def percentiles_of(cls, indexes: np.ndarray, counts: np.ndarray,
+                       offsets: np.ndarray, percentile: float) -> np.ndarray:
+        """Return the percentile of every slice of sparse counts at once.
+
+        The i-th histogram consists of the indexes and counts in the range
+        [offsets[i], offsets[i + 1]). The ranks are located in the cumulative
+        sum of all counts, which is strictly increasing since every count is
+        positive.
+        """
+        cumsum = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=cumsum[1:])
+        base = cumsum[offsets[:-1]]
+        totals = cumsum[offsets[1:]] - base
+        ranks = np.maximum(1, np.ceil(percentile / 100 * totals)).astype(np.int64)
+        if not len(indexes):
+            return np.zeros(len(totals), dtype=np.int64)
+        positions = np.minimum(np.searchsorted(cumsum[1:], base + ranks), len(indexes) - 1)
+        return np.where(totals > 0, cls.highest_equivalent(indexes[positions]), 0)
+
+    def record(self, value: int, count: int = 1):
+        value = min(max(value, 0), self.MAX_VALUE)
+        self.counts[self.index_of(value)] += count
+
+    def add(self, indexes: np.ndarray, counts: np.ndarray):
+        self.counts[indexes] += counts
+
+    def merge(self, other: 'Histogram'):
+        self.counts += other.counts
+
+    def reset(self, indexes: np.ndarray):
+        self.counts[indexes] = 0
+
+    def nonzero(self) -> Tuple[np.ndarray, np.ndarray]:
+        indexes = np.flatnonzero(self.counts)
+        return indexes, self.counts[indexes]
+
+    @property
+    def total_count(self) -> int:
+        return int(self.counts.sum())
+
+    def percentile(self, percentile: float) -> int:
+        indexes, counts = self.nonzero()
+        return self.percentile_of(indexes, counts, percentile)
+
+
+class HistogramRecorder:
+
+    """Record every measurement into per-operation interval histograms.
+
+    Latencies are stored in microseconds. Upon every interval the non-empty
+    buckets are appended to the interval log and the histogram is cleared, so
+    the memory usage does not depend on the number of operations.
+
+    Every log record consists of the operation code, the interval start time
+    (in nanoseconds) and the number of non-empty buckets, followed by the
+    bucket indexes and counts. The records are kept in typed arrays, one per
+    column, and written as is. See IntervalLog for the file layout.
+
+    The optional telemetry ring receives every interval before it is cleared.
+    """
+
+    INTERVAL = 1  # 1 second
+
+    def __init__(self, interval: float = INTERVAL, telemetry=None):
+        self.interval = interval
+        self.telemetry = telemetry
+        self.histograms = {}  # type: Dict[str, Histogram]
+        self.operations = {}  # type: Dict[str, int]
+        self.codes = array('B')
+        self.timestamps = array('q')
+        self.sizes = array('I')
+        self.indexes = array('I')
+        self.counts = array('q')
+        self.interval_start = time.time()
+
+    def update(self, operation: str, value: float, count: int = 1):
+        """Add a new measurement (in seconds) to the interval histogram."""
+        if not value:  # Ignore bad results
+            return
+
+        now = time.time()
+        if now - self.interval_start >= self.interval:
+            self.flush()
+            self.interval_start = now
+
+        histogram = self.histograms.get(operation)
+        if histogram is None:
+            histogram = self.histograms[operation] = Histogram()
+        histogram.record(int(value * 10 ** 6), count)
+
+    def flush(self):
+        if self.telemetry is not None:
+            self.telemetry.publish(self.interval_start, self.histograms)
+
+        timestamp = int(self.interval_start * 10 ** 9)  # Nanosecond granularity
+        for operation, histogram in self.histograms.items():
+            indexes, counts = histogram.nonzero()
+            if len(indexes):
+                code = self.operations.setdefault(operation, len(self.operations))
+                self.codes.append(code)
+                self.timestamps.append(timestamp)
+                self.sizes.append(len(indexes))
+                self.indexes.frombytes(indexes.astype(np.uint32).tobytes())
+                self.counts.frombytes(counts.tobytes())
+                histogram.reset(indexes)
+
+    def dump(self, filename: str):
+        """Write the interval log to a local binary file."""
+        self.flush()
+        logger.info('Writing histograms to {}'.format(filename))
+        operations = sorted(self.operations, key=self.operations.get)
+        with open(filename, 'wb') as fh:
+            fh.write(IntervalLog.HEADER.pack(IntervalLog.MAGIC, len(operations),
+                                             len(self.codes), len(self.indexes)))
+            for operation in operations:
+                fh.write(IntervalLog.NAME.pack(operation.encode()))
+            for column in (self.timestamps, self.counts, self.sizes, self.indexes,
+                           self.codes):
+                column.tofile(fh)
+
+
+class IntervalLog:
+
+    """Load the columns of an interval log file.
+
+    The file starts with a header (magic string, number of operations,
+    records and non-empty buckets) and the operation names. The columns
+    follow, ordered by the item size to keep them aligned: the record
+    timestamps (int64), the bucket counts (int64), the record sizes (uint32),
+    the bucket indexes (uint32) and the record operation codes (uint8).
+    The columns are mapped to arrays without parsing individual records.
+    """
+
+    MAGIC = b'SPRHIST1'
+
+    HEADER = struct.Struct('<8sIIQ')
+
+    NAME = struct.Struct('8s')
+
+    def __init__(self, filename: str):
+        data = np.fromfile(filename, dtype=np.uint8)
+        if len(data) < self.HEADER.size:
+            raise ValueError('Not an interval log: {}'.format(filename))
+        magic, num_operations, num_records, num_buckets = self.HEADER.unpack_from(data)
+        if magic != self.MAGIC:
+            raise ValueError('Not an interval log: {}'.format(filename))
+
+        offset = self.HEADER.size
+        self.operations = []
+        for _ in range(num_operations):
+            name, = self.NAME.unpack_from(data, offset)
+            self.operations.append(name.rstrip(b'\0').decode())
+            offset += self.NAME.size
+
+        columns = []
+        for dtype, size in (('<i8', num_records), ('<i8', num_buckets),
+                            ('<u4', num_records), ('<u4', num_buckets),
+                            ('u1', num_records)):
+            length = np.dtype(dtype).itemsize * size
+            columns.append(data[offset:offset + length].view(dtype))
+            offset += length
+        if offset != len(data):
+            raise ValueError('Truncated interval log: {}'.format(filename))
+        self.timestamps, self.counts, sizes, self.indexes, self.codes = columns
+
+        self.offsets = np.zeros(num_records + 1, dtype=np.int64)
+        np.cumsum(sizes, out=self.offsets[1:])
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def records(self) -> Iterator[Tuple[str, int, np.ndarray, np.ndarray]]:
+        """Yield (operation, timestamp, indexes, counts) interval records."""
+        offsets = self.offsets.tolist()
+        for i, (code, timestamp) in enumerate(zip(self.codes.tolist(),
+                                                  self.timestamps.tolist())):
+            yield (self.operations[code], timestamp,
+                   self.indexes[offsets[i]:offsets[i + 1]],
+                   self.counts[offsets[i]:offsets[i + 1]])
+
+    def percentiles(self, percentile: float) -> np.ndarray:
+        """Return the percentile of every record."""
+        return Histogram.percentiles_of(self.indexes, self.counts, self.offsets,
+                                        percentile)
+
+    def merge(self, histograms: Dict[str, Histogram]):
+        """Add the counts of all records to the histograms by operation."""
+        codes = np.repeat(self.codes, np.diff(self.offsets))
+        for code, operation in enumerate(self.operations):
+            histogram = histograms.get(operation)
+            if histogram is None:
+                histogram = histograms[operation] = Histogram()
+            matches = codes == code
+            np.add.at(histogram.counts, self.indexes[matches], self.counts[matches])
+
+
+def read_logs(pattern: str) -> Iterator[IntervalLog]:
+    """Load the interval logs of all matching files, skip other files."""
+    for filename in sorted(glob.glob(pattern)):
+        try:
+            yield IntervalLog(filename)
+        except ValueError as e:
+            logger.warn('Skipping {}: {}'.format(filename, e))
+
+
+def merge_logs(pattern: str) -> Dict[str, Histogram]:
+    """Merge the interval logs of all matching files by operation."""
+    histograms = {}  # type: Dict[str, Histogram]
+    for log in read_logs(pattern):
+        log.merge(histograms)
+    return histograms
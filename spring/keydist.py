@@ -0,0 +1,239 @@
+import functools
+from multiprocessing import RawArray
+from typing import Tuple, Union
+
+import numpy as np
+
+from spring.docgen import Key
+
+Bound = Union[int, np.ndarray]
+
+
+def shared_array(array: np.ndarray) -> np.ndarray:
+    """Copy the array to shared memory, which is inherited by the workers."""
+    shared = np.frombuffer(RawArray('b', array.nbytes), dtype=array.dtype)
+    shared[:] = array
+    return shared
+
+
+class AliasTable:
+
+    """Sample the indexes of a discrete distribution in O(1) (Vose's method).
+
+    Every entry of the table keeps the probability of its own index and the
+    alias index, which takes the rest of the entry. The arrays live in shared
+    memory and are never modified after construction.
+    """
+
+    def __init__(self, weights: np.ndarray):
+        n = len(weights)
+        scaled = np.asarray(weights, dtype=np.float64) * n / np.sum(weights)
+        prob = np.ones(n, dtype=np.float64)
+        alias = np.arange(n, dtype=np.int64)
+
+        small = np.flatnonzero(scaled < 1).tolist()
+        large = np.flatnonzero(scaled >= 1).tolist()
+        while small and large:
+            less, more = small.pop(), large.pop()
+            prob[less] = scaled[less]
+            alias[less] = more
+            scaled[more] -= 1 - scaled[less]
+            if scaled[more] < 1:
+                small.append(more)
+            else:
+                large.append(more)
+
+        self.prob = shared_array(prob)
+        self.alias = shared_array(alias)
+
+    def __len__(self) -> int:
+        return len(self.prob)
+
+    def sample(self, size: int) -> np.ndarray:
+        u = np.random.random(size) * len(self)
+        indexes = u.astype(np.int64)
+        return np.where(u - indexes < self.prob[indexes], indexes, self.alias[indexes])
+
+
+class ZipfianTable:
+
+    """Describe the bounded zipfian distribution of ranks in [0, num_items).
+
+    The probability of rank r is proportional to 1 / (r + 1) ^ theta. The
+    first EXACT ranks have their own entries with the exact weights. The rest
+    of the ranks are grouped into geometric buckets (each RATIO times wider
+    than the previous one) with the weights approximated by the integral of
+    the density. Ranks within a bucket follow the continuous power law. Hence
+    the table has a few tens of thousands of entries even for billions of keys.
+    """
+
+    EXACT = 2 ** 16
+
+    RATIO = 1.01
+
+    def __init__(self, num_items: int, theta: float):
+        self.num_items = num_items
+        self.theta = theta
+
+        lo = np.arange(min(num_items, self.EXACT), dtype=np.int64)
+        hi = lo + 1
+        if num_items > self.EXACT:
+            bounds = [self.EXACT]
+            while bounds[-1] < num_items:
+                bounds.append(min(num_items, max(bounds[-1] + 1,
+                                                 int(bounds[-1] * self.RATIO))))
+            lo = np.append(lo, bounds[:-1])
+            hi = np.append(hi, bounds[1:])
+
+        # The rank r corresponds to x = r + 1 in [lo + 0.5, hi + 0.5)
+        self.lo = shared_array(lo)
+        self.hi = shared_array(hi)
+        self.a = shared_array(lo + 0.5)
+        self.b = shared_array(hi + 0.5)
+        weights = self.integral(self.a, self.b)
+        exact = hi - lo == 1
+        weights[exact] = (lo[exact] + 1.0) ** -theta
+        self.table = AliasTable(weights)
+
+    def integral(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        if self.theta == 1:
+            return np.log(b / a)
+        return (b ** (1 - self.theta) - a ** (1 - self.theta)) / (1 - self.theta)
+
+    def inverse(self, a: np.ndarray, b: np.ndarray, u: np.ndarray) -> np.ndarray:
+        if self.theta == 1:
+            return a * (b / a) ** u
+        p = 1 - self.theta
+        return (a ** p + u * (b ** p - a ** p)) ** (1 / p)
+
+    def sample(self, size: int) -> np.ndarray:
+        entries = self.table.sample(size)
+        x = self.inverse(self.a[entries], self.b[entries], np.random.random(size))
+        ranks = np.floor(x + 0.5).astype(np.int64) - 1
+        return np.clip(ranks, self.lo[entries], self.hi[entries] - 1)
+
+
+@functools.lru_cache()
+def zipfian_table(num_items: int, theta: float) -> ZipfianTable:
+    """Return the table of the given shape, built once per process tree.
+
+    WorkloadGen builds the table before starting the workers, so the forked
+    workers inherit it instead of building their own copies.
+    """
+    return ZipfianTable(num_items, theta)
+
+
+def scramble(ranks: np.ndarray) -> np.ndarray:
+    """Spread the ranks over the key space (splitmix64 finalizer)."""
+    with np.errstate(over='ignore'):
+        z = ranks.astype(np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return z ^ (z >> np.uint64(31))
+
+
+class DistributionKey:
+
+    """Sample the existing keys according to a precomputed distribution.
+
+    The distributions are defined over ranks and do not depend on the actual
+    boundaries of the key space, which move as the keys are created and
+    deleted. A rank beyond the current number of keys wraps around.
+    """
+
+    def __init__(self, prefix: str, fmtr: str):
+        self.prefix = prefix
+        self.fmtr = fmtr
+
+    def numbers(self, n: int, curr_items: Bound, curr_deletes: Bound) -> np.ndarray:
+        raise NotImplementedError
+
+    def next(self, curr_items: int, curr_deletes: int, *args) -> Key:
+        number = int(self.numbers(1, curr_items, curr_deletes)[0])
+        return Key(number=number, prefix=self.prefix, fmtr=self.fmtr)
+
+    def next_batch(self, n: int, curr_items: Bound, curr_deletes: Bound,
+                   *args) -> np.ndarray:
+        return self.numbers(n, curr_items, curr_deletes)
+
+
+class ZipfianKey(DistributionKey):
+
+    """Make the oldest existing keys the most popular ones."""
+
+    def __init__(self, prefix: str, fmtr: str, num_items: int, theta: float):
+        super().__init__(prefix, fmtr)
+        self.table = zipfian_table(num_items, theta)
+
+    def numbers(self, n: int, curr_items: Bound, curr_deletes: Bound) -> np.ndarray:
+        ranks = self.table.sample(n) % (curr_items - curr_deletes)
+        return curr_deletes + ranks
+
+
+class ScrambledZipfianKey(ZipfianKey):
+
+    """Scatter the popular keys uniformly across the key space."""
+
+    def numbers(self, n: int, curr_items: Bound, curr_deletes: Bound) -> np.ndarray:
+        num_keys = np.asarray(curr_items - curr_deletes, dtype=np.uint64)
+        ranks = (scramble(self.table.sample(n)) % num_keys).astype(np.int64)
+        return curr_deletes + ranks
+
+
+class LatestKey(ZipfianKey):
+
+    """Make the most recently created keys the most popular ones."""
+
+    def numbers(self, n: int, curr_items: Bound, curr_deletes: Bound) -> np.ndarray:
+        ranks = self.table.sample(n) % (curr_items - curr_deletes)
+        return curr_items - 1 - ranks
+
+
+class HotspotKey(DistributionKey):
+
+    """Direct hot_ops % of the operations to the newest hot_keys % of keys."""
+
+    def __init__(self, prefix: str, fmtr: str, hot_keys: float, hot_ops: float):
+        super().__init__(prefix, fmtr)
+        self.hot_keys = hot_keys / 100
+        self.table = AliasTable(np.array([100 - hot_ops, hot_ops]))
+
+    def split(self, curr_items: Bound, curr_deletes: Bound) -> Tuple[Bound, Bound]:
+        num_keys = curr_items - curr_deletes
+        num_hot_keys = np.maximum(1, (num_keys * self.hot_keys).astype(np.int64))
+        return num_keys - num_hot_keys, num_hot_keys
+
+    def numbers(self, n: int, curr_items: Bound, curr_deletes: Bound) -> np.ndarray:
+        num_cold_keys, num_hot_keys = self.split(np.asarray(curr_items),
+                                                 np.asarray(curr_deletes))
+        hot = self.table.sample(n).astype(bool) | (num_cold_keys == 0)
+        u = np.random.random(n)
+        return np.where(hot,
+                        curr_deletes + num_cold_keys + (u * num_hot_keys).astype(np.int64),
+                        curr_deletes + (u * num_cold_keys).astype(np.int64))
+
+
+ZIPFIAN_KEYS = {
+    'zipfian': ZipfianKey,
+    'scrambled_zipfian': ScrambledZipfianKey,
+    'latest': LatestKey,
+}
+
+KEY_DISTRIBUTIONS = 'zipfian', 'scrambled_zipfian', 'latest', 'hotspot'
+
+
+def new_distribution_key(ws, prefix: str) -> DistributionKey:
+    """Create the key generator of the key_distribution setting."""
+    if ws.key_distribution == 'hotspot':
+        return HotspotKey(prefix, ws.key_fmtr, ws.hotspot_keys, ws.hotspot_ops)
+
+    cls = ZIPFIAN_KEYS.get(ws.key_distribution)
+    if cls is None:
+        raise ValueError('Unknown key distribution: {}'.format(ws.key_distribution))
+    return cls(prefix, ws.key_fmtr, max(ws.items, 1), ws.zipf_theta)
+
+
+def build_tables(ws):
+    """Build the shared tables in the parent process before forking workers."""
+    if getattr(ws, 'key_distribution', 'uniform') in ZIPFIAN_KEYS:
+        zipfian_table(max(ws.items, 1), ws.zipf_theta)
@@ -0,0 +1,90 @@
+import math
+from ctypes import c_uint64
+from multiprocessing import Lock, RawArray, RawValue
+
+
+class SequenceCounter:
+
+    """Hand out contiguous ranges of sequence numbers to the workers.
+
+    The workers lease large ranges of numbers (e.g., new keys or operations)
+    under the lock and then consume them without any synchronization until
+    the lease is used up.
+
+    Every lease has a slot in shared memory with the first number that might
+    still be in use by its worker. The minimum across all slots and the
+    counter itself is the watermark: all numbers below it have been consumed.
+    Readers compute the watermark without locking.
+    """
+
+    MAX_LEASES = 1024
+
+    IDLE = 2 ** 64 - 1  # The slot does not hold any unconsumed numbers
+
+    def __init__(self, initial: int = 0, limit: float = float('inf')):
+        self.limit = limit
+        self.lock = Lock()
+        self.counter = RawValue(c_uint64, initial)
+        self.num_leases = RawValue(c_uint64, 0)
+        self.positions = RawArray(c_uint64, [self.IDLE] * self.MAX_LEASES)
+
+    @property
+    def value(self) -> int:
+        """Return the first number that has not been leased yet."""
+        return self.counter.value
+
+    @property
+    def watermark(self) -> int:
+        """Return the number below which all numbers have been consumed."""
+        value = self.counter.value  # Must be read before the slots
+        num_leases = self.num_leases.value
+        if num_leases:
+            return min(value, min(self.positions[:num_leases]))
+        return value
+
+
+class Lease:
+
+    """Consume the numbers of a SequenceCounter in a single worker."""
+
+    def __init__(self, counter: SequenceCounter):
+        self.counter = counter
+        with counter.lock:
+            self.slot = counter.num_leases.value
+            if self.slot >= counter.MAX_LEASES:
+                raise RuntimeError('Cannot lease more than {} ranges of the same counter'
+                                   .format(counter.MAX_LEASES))
+            counter.num_leases.value += 1
+        self.next_number = self.end = 0
+
+    @property
+    def remaining(self) -> int:
+        return self.end - self.next_number
+
+    def renew(self, size: int, unit: int = 1) -> int:
+        """Lease up to size new numbers in multiples of unit.
+
+        The previous lease is abandoned. Return the number of leased numbers,
+        which is less than requested when the counter approaches its limit.
+        """
+        counter = self.counter
+        with counter.lock:
+            start = counter.counter.value
+            available = counter.limit - start
+            if available < size:
+                size = max(0, int(math.ceil(available / unit)) * unit)
+            counter.positions[self.slot] = start
+            counter.counter.value = start + size
+        self.next_number, self.end = start, start + size
+        return size
+
+    def take(self, n: int) -> int:
+        """Return the first of the next n numbers of the current lease."""
+        start = self.next_number
+        self.next_number += n
+        self.counter.positions[self.slot] = start
+        return start
+
+    def release(self):
+        self.counter.positions[self.slot] = SequenceCounter.IDLE
+        self.next_number = self.end = 0
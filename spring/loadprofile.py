@@ -0,0 +1,169 @@
+import math
+import time
+from threading import Event, Thread
+from typing import List, Tuple
+
+from logger import logger
+from spring.ratelimiter import TokenBucket
+
+
+class Phase:
+
+    SHAPE = None
+
+    def __init__(self, duration: float):
+        self.duration = duration
+
+    def target(self, elapsed: float) -> float:
+        raise NotImplementedError
+
+    def __str__(self):
+        params = ', '.join('{}={:g}'.format(name, value)
+                           for name, value in sorted(vars(self).items()))
+        return '{}({})'.format(self.SHAPE, params)
+
+
+class Ramp(Phase):
+
+    """Change the rate linearly from start to end."""
+
+    SHAPE = 'ramp'
+
+    def __init__(self, duration: float, start: float, end: float):
+        super().__init__(duration)
+        self.start = start
+        self.end = end
+
+    def target(self, elapsed: float) -> float:
+        return self.start + (self.end - self.start) * elapsed / self.duration
+
+
+class Step(Phase):
+
+    """Keep a constant rate."""
+
+    SHAPE = 'step'
+
+    def __init__(self, duration: float, rate: float):
+        super().__init__(duration)
+        self.rate = rate
+
+    def target(self, elapsed: float) -> float:
+        return self.rate
+
+
+class Sine(Phase):
+
+    """Oscillate around the mean rate, e.g., to emulate diurnal traffic."""
+
+    SHAPE = 'sine'
+
+    def __init__(self, duration: float, mean: float, amplitude: float,
+                 period: float):
+        super().__init__(duration)
+        self.mean = mean
+        self.amplitude = amplitude
+        self.period = period
+
+    def target(self, elapsed: float) -> float:
+        return self.mean + \
+            self.amplitude * math.sin(2 * math.pi * elapsed / self.period)
+
+
+class Burst(Phase):
+
+    """Run at the base rate with periodic bursts at the peak rate.
+
+    Every "every" seconds the rate jumps to the peak for "length" seconds.
+    """
+
+    SHAPE = 'burst'
+
+    def __init__(self, duration: float, rate: float, peak: float,
+                 length: float, every: float):
+        super().__init__(duration)
+        self.rate = rate
+        self.peak = peak
+        self.length = length
+        self.every = every
+
+    def target(self, elapsed: float) -> float:
+        if elapsed % self.every < self.length:
+            return self.peak
+        return self.rate
+
+
+class LoadProfile:
+
+    """Define a piecewise schedule of the target throughput.
+
+    The phases are given as dictionaries with the shape name and the shape
+    parameters (see the Phase subclasses). The last rate is kept after the
+    schedule ends.
+    """
+
+    SHAPES = {shape.SHAPE: shape for shape in (Ramp, Step, Sine, Burst)}
+
+    def __init__(self, phases: List[dict]):
+        self.phases = []
+        for phase in phases:
+            params = dict(phase)
+            shape = self.SHAPES[params.pop('shape')]
+            self.phases.append(shape(**params))
+
+    @property
+    def duration(self) -> float:
+        return sum(phase.duration for phase in self.phases)
+
+    def rate_at(self, elapsed: float) -> Tuple[int, float]:
+        """Return the phase index and the target rate after elapsed seconds."""
+        elapsed = max(elapsed, 0)
+        for i, phase in enumerate(self.phases):
+            if elapsed < phase.duration:
+                return i, phase.target(elapsed)
+            elapsed -= phase.duration
+        last = len(self.phases) - 1
+        return last, self.phases[last].target(self.phases[last].duration)
+
+
+class RateController(Thread):
+
+    """Make all workers follow the load profile via the shared token bucket."""
+
+    INTERVAL = 0.1  # 100 ms
+
+    MIN_RATE = 1  # The bucket cannot be stopped completely
+
+    def __init__(self, profile: LoadProfile, bucket: TokenBucket,
+                 interval: float = INTERVAL):
+        super().__init__(daemon=True)
+        self.profile = profile
+        self.bucket = bucket
+        self.interval = interval
+        self.stopped = Event()
+        self.start_time = None
+
+    def update(self, now: float) -> int:
+        phase, rate = self.profile.rate_at(now - self.start_time)
+        self.bucket.set_rate(max(rate, self.MIN_RATE))
+        return phase
+
+    def start(self):
+        self.start_time = time.time()
+        self.update(self.start_time)  # Before the workers start
+        super().start()
+
+    def run(self):
+        current_phase = None
+        while True:
+            phase = self.update(time.time())
+            if phase != current_phase:
+                logger.info('Load profile phase {}: {}'
+                            .format(phase, self.profile.phases[phase]))
+                current_phase = phase
+            if self.stopped.wait(self.interval):
+                break
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
@@ -0,0 +1,426 @@
+import asyncio
+import json
+import random
+import struct
+import zlib
+from time import sleep, time
+from typing import Callable, List, Optional, Tuple
+
+from logger import logger
+from spring.cbgen import backoff, error_tracker, quiet, timeit
+from spring.dataset import serialize
+from spring.standin import (
+    ALT_REQ_MAGIC,
+    DELETE,
+    FEATURE_ALT_REQUEST,
+    FEATURE_JSON,
+    FEATURE_SELECT_BUCKET,
+    FEATURE_SYNC_REPLICATION,
+    FEATURE_TCPNODELAY,
+    FEATURE_XERROR,
+    GET,
+    GET_CLUSTER_CONFIG,
+    HEADER,
+    HELLO,
+    NOT_MY_VBUCKET,
+    REQ_MAGIC,
+    SASL_AUTH,
+    SELECT_BUCKET,
+    SET,
+)
+
+try:
+    from couchbase.exceptions import (
+        AuthError,
+        CouchbaseError,
+        KeyExistsError,
+        NetworkError,
+        NotFoundError,
+        TemporaryFailError,
+        TimeoutError,
+    )
+except ImportError:
+    from couchbase_v2.exceptions import (
+        AuthError,
+        CouchbaseError,
+        KeyExistsError,
+        NetworkError,
+        NotFoundError,
+        TemporaryFailError,
+        TimeoutError,
+    )
+
+ERRORS = {
+    0x01: NotFoundError,  # KEY_ENOENT
+    0x02: KeyExistsError,  # KEY_EEXISTS
+    0x20: AuthError,  # AUTH_ERROR
+    0x82: TemporaryFailError,  # ENOMEM
+    0x85: TemporaryFailError,  # EBUSY
+    0x86: TemporaryFailError,  # ETMPFAIL
+    0xa2: TemporaryFailError,  # SYNC_WRITE_IN_PROGRESS
+    0xa4: TemporaryFailError,  # SYNC_WRITE_RE_COMMIT_IN_PROGRESS
+}
+
+FEATURES = (
+    FEATURE_TCPNODELAY, FEATURE_XERROR, FEATURE_SELECT_BUCKET, FEATURE_JSON,
+    FEATURE_ALT_REQUEST, FEATURE_SYNC_REPLICATION,
+)
+
+JSON_FLAGS = 0x02000006  # Common flags of JSON documents, as set by the SDK
+
+DATATYPE_JSON = 0x01
+
+FRAME_DURABILITY = 0x11  # Frame ID 1, 1 byte long
+
+Response = Tuple[int, int, bytes, bytes]  # Status, CAS, extras, value
+
+
+def new_error(status: int, key: bytes, message: str = '') -> CouchbaseError:
+    exc_type = ERRORS.get(status, CouchbaseError)
+    return exc_type({'key': key.decode(),
+                     'message': message or 'Status: {:#04x}'.format(status)})
+
+
+def vbucket_id(key: bytes, num_vbuckets: int) -> int:
+    """Map a key to its vbucket, the same way as the SDK does (CRC32)."""
+    return ((zlib.crc32(key) >> 16) & 0x7fff) % num_vbuckets
+
+
+class MemcachedConnection(asyncio.Protocol):
+
+    """Pipeline memcached binary protocol requests over a single socket.
+
+    Every request gets a unique opaque value and the future of its response.
+    The requests are written as soon as they are issued, without waiting for
+    the responses of the previous ones. The responses are matched by opaque,
+    so they may arrive in any order.
+    """
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self.loop = asyncio.get_event_loop()
+        self.transport = None
+        self.buffer = bytearray()
+        self.opaque = 0
+        self.pending = {}  # type: dict
+        self.features = set()
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def connection_lost(self, exc):
+        self.transport = None
+        for opaque in list(self.pending):
+            self.fail(opaque, NetworkError({'message': 'Connection lost: {}'.format(exc)}))
+
+    def data_received(self, data: bytes):
+        self.buffer += data
+        offset = 0
+        while len(self.buffer) - offset >= HEADER.size:
+            magic, _, key_len, ext_len, _, status, body_len, opaque, cas = \
+                HEADER.unpack_from(self.buffer, offset)
+            end = offset + HEADER.size + body_len
+            if len(self.buffer) < end:
+                break
+
+            start = offset + HEADER.size
+            if magic != 0x81:  # Alternative response with framing extras
+                start += key_len >> 8
+                key_len &= 0xff
+            extras = bytes(self.buffer[start:start + ext_len])
+            value = bytes(self.buffer[start + ext_len + key_len:end])
+            offset = end
+
+            future, handle = self.pending.pop(opaque, (None, None))
+            if future is not None:
+                handle.cancel()
+                if not future.done():
+                    future.set_result((status, cas, extras, value))
+        del self.buffer[:offset]
+
+    def expire(self, opaque: int, key: bytes):
+        self.fail(opaque, TimeoutError({'key': key.decode(), 'message': 'Request timed out'}))
+
+    def fail(self, opaque: int, exc: Exception):
+        future, handle = self.pending.pop(opaque, (None, None))
+        if future is not None:
+            handle.cancel()
+            if not future.done():
+                future.set_exception(exc)
+
+    def request(self, opcode: int, key: bytes = b'', extras: bytes = b'', value: bytes = b'',
+                vbucket: int = 0, datatype: int = 0, frame: bytes = b'') -> asyncio.Future:
+        if self.transport is None:
+            raise NetworkError({'key': key.decode(), 'message': 'Not connected'})
+
+        self.opaque = (self.opaque + 1) & 0xffffffff
+        body_len = len(frame) + len(extras) + len(key) + len(value)
+        if frame:
+            header = HEADER.pack(ALT_REQ_MAGIC, opcode, len(frame) << 8 | len(key), len(extras),
+                                 datatype, vbucket, body_len, self.opaque, 0)
+        else:
+            header = HEADER.pack(REQ_MAGIC, opcode, len(key), len(extras), datatype, vbucket,
+                                 body_len, self.opaque, 0)
+        self.transport.write(b''.join((header, frame, extras, key, value)))
+
+        future = self.loop.create_future()
+        handle = self.loop.call_later(self.timeout, self.expire, self.opaque, key)
+        self.pending[self.opaque] = future, handle
+        return future
+
+    async def execute(self, opcode: int, key: bytes = b'', extras: bytes = b'',
+                      value: bytes = b'') -> bytes:
+        """Execute a request, which is expected to succeed."""
+        status, _, _, value = await self.request(opcode, key, extras, value)
+        if status:
+            raise new_error(status, key, '{:#04x} failed with status {:#04x}: {}'.format(
+                opcode, status, value.decode(errors='replace')))
+        return value
+
+    async def bootstrap(self, bucket: str, password: str):
+        """Negotiate the features, authenticate and select the bucket."""
+        features = struct.pack('>{}H'.format(len(FEATURES)), *FEATURES)
+        value = await self.execute(HELLO, b'spring', value=features)
+        self.features = set(struct.unpack('>{}H'.format(len(value) // 2), value))
+
+        credentials = '\0{}\0{}'.format(bucket, password).encode()
+        await self.execute(SASL_AUTH, b'PLAIN', value=credentials)
+        await self.execute(SELECT_BUCKET, bucket.encode())
+
+    def close(self):
+        if self.transport is not None:
+            self.transport.close()
+
+
+class MCAIOGen:
+
+    """Execute the KV operations over the memcached binary protocol.
+
+    This is a minimal alternative to the SDK: a single pipelined connection
+    per KV node and no client-side features beyond what the operations
+    require. The vbucket map is fetched from the bootstrap node (CCCP) and
+    updated from the config attached to NOT_MY_VBUCKET responses, after which
+    the request is sent to the new owner of the vbucket.
+
+    The coroutines raise the same exceptions as the SDK, so the asyncio
+    workers handle the errors and temporary failures the same way.
+    """
+
+    TIMEOUT = 10  # seconds
+
+    PORT = 11210
+
+    MAX_REDIRECTS = 10
+
+    REDIRECT_DELAY = 0.01  # seconds, if the config did not change since the request
+
+    def __init__(self, host: str, bucket: str, password: str, **kwargs):
+        self.host, _, port = host.partition(':')
+        self.bootstrap_node = '{}:{}'.format(self.host, port or self.PORT)
+        self.bucket = bucket
+        self.password = password
+
+        self.rev = -1
+        self.config_data = b''
+        self.servers = []  # type: List[str]
+        self.vbucket_map = []  # type: List[int]
+        self.connections = {}  # type: dict
+
+    async def open(self, node: str) -> MemcachedConnection:
+        host, port = node.rsplit(':', 1)
+        loop = asyncio.get_event_loop()
+        _, connection = await loop.create_connection(
+            lambda: MemcachedConnection(self.TIMEOUT), host, int(port))
+        await connection.bootstrap(self.bucket, self.password)
+        return connection
+
+    def connection(self, node: str) -> asyncio.Future:
+        """Return the future of the connection to the node, open it if needed."""
+        connection = self.connections.get(node)
+        if connection is None or connection.done() and (
+                connection.exception() or connection.result().transport is None):
+            connection = asyncio.ensure_future(self.open(node))
+            self.connections[node] = connection
+        return connection
+
+    async def connect(self):
+        connection = await self.connection(self.bootstrap_node)
+        self.update_config(await connection.execute(GET_CLUSTER_CONFIG))
+        for node in self.servers:
+            await self.connection(node)
+        logger.info('Connected to {} KV nodes, config revision {}'
+                    .format(len(self.servers), self.rev))
+
+    def update_config(self, data: bytes):
+        """Apply the cluster config unless it is not newer than the current one.
+
+        All requests in flight get the same config with NOT_MY_VBUCKET, so
+        the last one is compared as is before parsing.
+        """
+        if data == self.config_data:
+            return
+        self.config_data = data
+
+        config = json.loads(data.decode().replace('$HOST', self.host))
+        if config.get('rev', 0) <= self.rev:
+            return
+
+        server_map = config['vBucketServerMap']
+        self.rev = config.get('rev', 0)
+        self.servers = server_map['serverList']
+        self.vbucket_map = [chain[0] for chain in server_map['vBucketMap']]
+
+    async def execute(self, opcode: int, key: str, extras: bytes = b'', value: bytes = b'',
+                      datatype: int = 0, frame: bytes = b'') -> Response:
+        key = key.encode()
+        vbucket = vbucket_id(key, len(self.vbucket_map))
+        for _ in range(self.MAX_REDIRECTS):
+            rev = self.rev
+            node = self.servers[self.vbucket_map[vbucket]]
+            connection = await self.connection(node)
+            if FEATURE_JSON not in connection.features:
+                datatype = 0
+            response = await connection.request(opcode, key, extras, value, vbucket,
+                                                datatype, frame)
+            status = response[0]
+            if status != NOT_MY_VBUCKET:
+                if status:
+                    raise new_error(status, key)
+                return response
+
+            self.update_config(response[3] or await connection.execute(GET_CLUSTER_CONFIG))
+            if self.rev == rev:  # Not rebalanced yet, wait for the new config
+                await asyncio.sleep(self.REDIRECT_DELAY)
+        raise new_error(NOT_MY_VBUCKET, key, 'Too many NOT_MY_VBUCKET redirects')
+
+    async def create(self, key: str, doc, persist_to: int = 0, replicate_to: int = 0,
+                     ttl: int = 0):
+        await self.update(key, doc, persist_to, replicate_to, ttl)
+
+    async def create_durable(self, key: str, doc, durability: int = None, ttl: int = 0):
+        await self.update_durable(key, doc, durability, ttl)
+
+    async def read(self, key: str) -> bytes:
+        return (await self.execute(GET, key))[3]
+
+    async def update(self, key: str, doc, persist_to: int = 0, replicate_to: int = 0,
+                     ttl: int = 0):
+        # Observe-based durability (persist_to, replicate_to) is rejected by the
+        # workload settings
+        await self.execute(SET, key, struct.pack('>II', JSON_FLAGS, ttl), serialize(doc),
+                           DATATYPE_JSON)
+
+    async def update_durable(self, key: str, doc, durability: int = None, ttl: int = 0):
+        frame = bytes((FRAME_DURABILITY, durability)) if durability else b''
+        await self.execute(SET, key, struct.pack('>II', JSON_FLAGS, ttl), serialize(doc),
+                           DATATYPE_JSON, frame)
+
+    async def delete(self, key: str):
+        await self.execute(DELETE, key)
+
+    def close(self):
+        for connection in self.connections.values():
+            if connection.done() and not connection.exception():
+                connection.result().close()
+
+
+class MCGen:
+
+    """Drop-in replacement of CBGen for the KV workers.
+
+    Every call runs the event loop of the worker process until the
+    operation completes, with the same error tracking and backoff as CBGen.
+    The multi-key operations issue all requests at once, so they are
+    pipelined over the connections to the KV nodes.
+    """
+
+    def __init__(self, **kwargs):
+        self.loop = asyncio.get_event_loop()
+        self.client = MCAIOGen(**kwargs)
+        self.run(self.client.connect())
+
+    def run(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    @quiet
+    @backoff
+    def create(self, *args, **kwargs):
+        self.run(self.client.create(*args, **kwargs))
+
+    @quiet
+    @backoff
+    def create_durable(self, *args, **kwargs):
+        self.run(self.client.create_durable(*args, **kwargs))
+
+    @quiet
+    @backoff
+    @timeit
+    def read(self, *args, **kwargs):
+        self.run(self.client.read(*args, **kwargs))
+
+    @quiet
+    @backoff
+    @timeit
+    def update(self, *args, **kwargs):
+        self.run(self.client.update(*args, **kwargs))
+
+    @quiet
+    @backoff
+    @timeit
+    def update_durable(self, *args, **kwargs):
+        self.run(self.client.update_durable(*args, **kwargs))
+
+    @quiet
+    def delete(self, *args, **kwargs):
+        self.run(self.client.delete(*args, **kwargs))
+
+    def multi(self, method: Callable, args: List[Tuple]) -> Optional[float]:
+        """Pipeline the operations and return the latency of the batch.
+
+        Similar to cbgen.retry_multi, temporary failures are retried with
+        exponential backoff but only for the failed items, and only the last
+        attempt is timed. The successful items and the other errors are
+        counted per item. None is returned if no item succeeded.
+        """
+        retry_delay = 0.1
+        succeeded = 0
+        name = '{}_multi'.format(method.__name__)
+        while True:
+            t0 = time()
+            results = self.run(asyncio.gather(*(method(*item) for item in args),
+                                              return_exceptions=True))
+            latency = time() - t0
+
+            retries = []
+            for item, result in zip(args, results):
+                if isinstance(result, TemporaryFailError):
+                    retries.append(item)
+                elif isinstance(result, CouchbaseError):
+                    error_tracker.track(name, result)
+                elif isinstance(result, Exception):
+                    raise result
+                else:
+                    succeeded += 1
+
+            args = retries
+            if not args:
+                if not succeeded:
+                    return
+                error_tracker.succeed(name, succeeded)
+                return latency
+
+            error_tracker.retry(name, retry_delay)
+            sleep(retry_delay)
+            retry_delay *= 1 + 0.1 * random.random()
+
+    def read_multi(self, args: List[Tuple]) -> Optional[float]:
+        return self.multi(self.client.read, [(key,) for key, *_ in args])
+
+    def update_multi(self, args: List[Tuple]) -> Optional[float]:
+        return self.multi(self.client.update, args)
+
+    def update_durable_multi(self, args: List[Tuple]) -> Optional[float]:
+        return self.multi(self.client.update_durable, args)
+
+    def delete_multi(self, args: List[Tuple]) -> Optional[float]:
+        return self.multi(self.client.delete, [(key,) for key, *_ in args])
@@ -0,0 +1,176 @@
+import os
+from collections import OrderedDict, namedtuple
+from typing import Dict, List, Set
+
+from logger import logger
+
+CPU = namedtuple('CPU', ('id', 'core', 'node'))
+
+
+def parse_cpu_list(cpu_list: str) -> List[int]:
+    """Parse the kernel CPU list format, e.g. "0-3,8-11"."""
+    cpus = []
+    for chunk in cpu_list.strip().split(','):
+        if not chunk:
+            continue
+        first, _, last = chunk.partition('-')
+        cpus += range(int(first), int(last or first) + 1)
+    return cpus
+
+
+def glob_dirs(path: str, prefix: str) -> List[str]:
+    if not os.path.isdir(path):
+        return []
+    return [os.path.join(path, name) for name in sorted(os.listdir(path))
+            if name.startswith(prefix) and name[len(prefix):].isdigit()]
+
+
+def read_file(path: str, default: str = '') -> str:
+    try:
+        with open(path) as fh:
+            return fh.read().strip()
+    except OSError:
+        return default
+
+
+class CPUTopology:
+
+    """Describe the CPUs available to the current process.
+
+    The physical cores and NUMA nodes are read from sysfs. Hyperthread
+    siblings share the core, which is identified by the package and core IDs.
+    If sysfs is not available, every CPU is treated as a separate core on a
+    single node.
+    """
+
+    SYSFS = '/sys/devices/system'
+
+    def __init__(self, cpus: List[CPU]):
+        self.cpus = cpus
+
+    @classmethod
+    def read(cls, sysfs: str = SYSFS) -> 'CPUTopology':
+        nodes = {}
+        for node_dir in glob_dirs(os.path.join(sysfs, 'node'), 'node'):
+            node = int(os.path.basename(node_dir)[4:])
+            for cpu in parse_cpu_list(read_file(os.path.join(node_dir, 'cpulist'))):
+                nodes[cpu] = node
+
+        cpus = []
+        for cpu in sorted(os.sched_getaffinity(0)):
+            topology = os.path.join(sysfs, 'cpu', 'cpu{}'.format(cpu), 'topology')
+            package = read_file(os.path.join(topology, 'physical_package_id'), '0')
+            core_id = read_file(os.path.join(topology, 'core_id'), str(cpu))
+            cpus.append(CPU(id=cpu,
+                            core=(int(package), int(core_id)),
+                            node=nodes.get(cpu, 0)))
+        return cls(cpus)
+
+    @property
+    def cores(self) -> Dict[tuple, List[CPU]]:
+        """Return the CPUs of every physical core, grouped by node."""
+        cores = OrderedDict()
+        for cpu in sorted(self.cpus, key=lambda cpu: (cpu.node, cpu.core, cpu.id)):
+            cores.setdefault(cpu.core, []).append(cpu)
+        return cores
+
+    @property
+    def nodes(self) -> List[int]:
+        return sorted({cpu.node for cpu in self.cpus})
+
+    def reserved(self, num_cores: int) -> Set[int]:
+        """Return the CPUs of the last physical cores, e.g. for cbagent."""
+        cores = list(self.cores.values())
+        if num_cores >= len(cores):
+            logger.warn('Cannot reserve {} out of {} cores'.format(num_cores, len(cores)))
+            return set()
+        return {cpu.id for core in cores[len(cores) - num_cores:] for cpu in core}
+
+    def exclude(self, cpus: Set[int]) -> 'CPUTopology':
+        return CPUTopology([cpu for cpu in self.cpus if cpu.id not in cpus])
+
+
+class Placement:
+
+    """Assign the worker processes to CPUs according to the policy.
+
+    "spread" - one CPU per worker, the first hyperthreads of all physical cores
+    are used before their siblings and the consecutive workers alternate
+    between the NUMA nodes.
+
+    "pack" - one CPU per worker, the cores of a NUMA node (including the
+    siblings) are filled before moving to the next node.
+
+    "none" - the workers are not pinned.
+
+    The workers wrap around when there are more workers than CPUs. The
+    assignment continues across the worker groups (KV, views, N1QL) of the
+    same workload.
+    """
+
+    POLICIES = 'spread', 'pack', 'none'
+
+    def __init__(self, policy: str, reserved_cores: int = 0,
+                 topology: CPUTopology = None):
+        if policy not in self.POLICIES:
+            raise ValueError('Unknown CPU placement policy: {}'.format(policy))
+        self.policy = policy
+        self.topology = topology or CPUTopology.read()
+        if reserved_cores:
+            reserved = self.topology.reserved(reserved_cores)
+            logger.info('Reserved CPUs: {}'.format(sorted(reserved)))
+            self.topology = self.topology.exclude(reserved)
+        self.slots = getattr(self, policy)()
+        self.next_slot = 0
+
+    def spread(self) -> List[CPU]:
+        by_node = OrderedDict()
+        for cpus in self.topology.cores.values():
+            by_node.setdefault(cpus[0].node, []).append(cpus)
+
+        slots = []
+        for sibling in range(max(len(cpus) for cpus in self.topology.cores.values())):
+            columns = [[cpus[sibling] for cpus in cores if sibling < len(cpus)]
+                       for cores in by_node.values()]
+            for i in range(max(len(column) for column in columns)):
+                slots += [column[i] for column in columns if i < len(column)]
+        return slots
+
+    def pack(self) -> List[CPU]:
+        slots = []
+        for node in self.topology.nodes:
+            cores = [cpus for cpus in self.topology.cores.values()
+                     if cpus[0].node == node]
+            for sibling in range(max(len(cpus) for cpus in cores)):
+                slots += [cpus[sibling] for cpus in cores if sibling < len(cpus)]
+        return slots
+
+    def none(self) -> List[CPU]:
+        return []
+
+    def assign(self, name: str, num_workers: int) -> List[Set[int]]:
+        """Return the CPU set of every worker in the group, None if not pinned."""
+        if not self.slots:
+            return [None] * num_workers
+
+        placement = []
+        for sid in range(num_workers):
+            cpu = self.slots[self.next_slot % len(self.slots)]
+            self.next_slot += 1
+            placement.append({cpu.id})
+
+        logger.info('CPU placement ({}): {}'.format(self.policy, ', '.join(
+            '{}-{} -> cpu{}'.format(name, sid, ','.join(map(str, sorted(cpus))))
+            for sid, cpus in enumerate(placement))))
+        return placement
+
+
+def pin(cpus: Set[int], pid: int = 0):
+    """Pin the process (the current one by default).
+
+    The threads that the process starts later inherit the affinity, which
+    includes the I/O threads of the SDK if the process is pinned before the
+    client is created.
+    """
+    if cpus:
+        os.sched_setaffinity(pid, cpus)
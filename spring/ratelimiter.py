@@ -0,0 +1,110 @@
+import time
+from multiprocessing import Lock, RawValue
+from threading import Event, Thread
+from typing import Optional
+
+from logger import logger
+
+
+class TokenBucket:
+
+    """Share the target throughput between the worker processes.
+
+    The bucket tracks the theoretical arrival time (TAT) of the next token in
+    shared memory. Every process reserves tokens by advancing the TAT and
+    waits until the reserved time comes, so the aggregate rate does not depend
+    on how the tokens are distributed across the workers.
+
+    Unused tokens are accumulated for up to "burst" seconds, which absorbs the
+    scheduling jitter without letting the workers catch up after long stalls.
+
+    The rate is stored in shared memory as well, so it can be changed while
+    the workers are running. Without a limit, the tokens are neither locked
+    nor counted.
+    """
+
+    BURST = 0.01  # 10 ms
+
+    def __init__(self, rate: float, burst: float = BURST):
+        self.burst = burst
+
+        self.lock = Lock()
+        self.interval = RawValue('d', 0)
+        self.tat = RawValue('d', 0)
+        self.tokens = RawValue('L', 0)
+
+        self.set_rate(rate)
+
+    def set_rate(self, rate: float):
+        """Change the target rate, 0 and infinity disable the limit."""
+        if 0 < rate < float('inf'):
+            self.interval.value = 1 / rate
+        else:
+            self.interval.value = 0
+
+    def reserve(self, tokens: int = 1) -> float:
+        """Reserve tokens and return the time when they become available."""
+        now = time.time()
+        if not self.interval.value:
+            return now
+        with self.lock:
+            self.tokens.value += tokens
+            interval = self.interval.value
+            if not self.tat.value:  # The first reservation
+                self.tat.value = now
+            start = max(self.tat.value, now - self.burst)
+            self.tat.value = start + tokens * interval
+        return start
+
+    def acquire(self, tokens: int = 1):
+        """Block until the tokens become available."""
+        delay = self.reserve(tokens) - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class RateMonitor(Thread):
+
+    """Sample the number of granted tokens and report the achieved rate.
+
+    The rate is sampled over every wall-clock second and published by the
+    telemetry as "achieved_<name>", next to the target throughput. The average
+    rate is logged once the monitor is stopped.
+    """
+
+    INTERVAL = 1  # 1 second
+
+    def __init__(self, name: str, bucket: TokenBucket, target: float,
+                 interval: float = INTERVAL):
+        super().__init__(daemon=True)
+        self.name = name
+        self.bucket = bucket
+        self.target = target
+        self.interval = interval
+        self.stopped = Event()
+        self.rates = {}  # Achieved rates by second
+        self.start_time = self.start_tokens = None
+
+    def run(self):
+        timestamp, tokens = time.time(), self.bucket.tokens.value
+        self.start_time, self.start_tokens = timestamp, tokens
+        while not self.stopped.wait(self.interval - time.time() % self.interval):
+            now, curr_tokens = time.time(), self.bucket.tokens.value
+            self.rates[int(timestamp)] = (curr_tokens - tokens) / (now - timestamp)
+            timestamp, tokens = now, curr_tokens
+
+    def achieved(self, timestamp: int) -> Optional[float]:
+        """Pop the rate achieved in the given second, the older ones are dropped."""
+        for older in [t for t in list(self.rates) if t < timestamp]:
+            self.rates.pop(older, None)
+        return self.rates.pop(timestamp, None)
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+        if self.start_time is not None:
+            rate = (self.bucket.tokens.value - self.start_tokens) / \
+                (time.time() - self.start_time)
+            logger.info('Achieved {}: {:.1f} ops/sec (target: {})'
+                        .format(self.name, rate, self.target))
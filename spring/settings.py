@@ -13,8 +13,13 @@ class WorkloadSettings:
 
         self.ops = options.ops
         self.throughput = options.throughput
+        self.load_profile = []
+        self.slo_search = None
 
         self.doc_gen = options.generator
+        self.doc_cache = options.doc_cache
+        self.dataset_dir = options.dataset_dir
+        self.kv_engine = options.kv_engine
         self.size = options.size
         self.items = options.items
         self.working_set = options.working_set
@@ -22,22 +27,43 @@ class WorkloadSettings:
         self.working_set_moving_docs = 0
 
         self.async = options.async
+        self.open_loop = options.open_loop
+        self.in_flight = options.in_flight
+
+        self.trace_record = options.trace_record
+        self.trace_replay = options.trace_replay
+        self.trace_offline = options.offline
+        self.trace_speed = options.trace_speed
+
+        self.cpu_placement = options.cpu_placement
+        self.reserved_cores = options.reserved_cores
+
+        self.key_distribution = options.key_distribution
+        self.zipf_theta = options.zipf_theta
+        self.hotspot_keys = options.hotspot_keys
+        self.hotspot_ops = options.hotspot_ops
 
         self.workers = options.workers
+        self.multi_batch_size = options.multi_batch_size
 
         # Stubs for library compatibility
         self.reads_and_updates = 0
+        self.spring_batch_size = 100
 
         self.persist_to = 0
         self.replicate_to = 0
+        self.durability = None
+        self.ttl = 0
 
         self.query_workers = 0
         self.query_throughput = 0
+        self.query_concurrency = 1
         self.index_type = None
         self.ddocs = {}
         self.query_params = {}
 
         self.ssl_mode = 'none'
+        self.connstr_params = {}
 
         self.n1ql_workers = 0
         self.n1ql_timeout = 0
@@ -0,0 +1,195 @@
+import json
+import math
+import time
+from threading import Event, Lock, Thread
+from typing import Dict, Optional
+
+import numpy as np
+
+from logger import logger
+from spring.ratelimiter import TokenBucket
+from spring.telemetry import TelemetryMonitor, TelemetryRing
+
+
+class SLOSearch(Thread):
+
+    """Search for the maximum throughput that meets the latency SLO.
+
+    Every step changes the rate of the shared token bucket, lets the system
+    settle for settle_time seconds and then measures the latency of the given
+    operation for measure_time seconds. The per-second latency histograms are
+    supplied by the telemetry monitor. A step meets the SLO if the latency
+    percentile does not exceed the target and the workers achieve at least
+    MIN_RATIO of the target throughput.
+
+    In the "step" mode the rate grows from min_throughput by a fixed step
+    until the SLO is violated. In the "binary" mode the search bisects the
+    [min_throughput, max_throughput] range until it is narrower than the
+    resolution.
+
+    All steps are written to a JSON file, which is the throughput-latency
+    curve. The result is the achieved throughput of the fastest step that met
+    the SLO. Once the search is complete, the workers are stopped via the
+    shutdown event (if any).
+    """
+
+    PATTERN = 'slo-search-*.json'
+
+    PERCENTILES = 99, 99.9
+
+    MIN_RATIO = 0.9
+
+    SAMPLE_DELAY = TelemetryMonitor.DELAY + TelemetryMonitor.INTERVAL
+
+    def __init__(self, settings, bucket: TokenBucket, name: str,
+                 shutdown_event: Event = None):
+        super().__init__(daemon=True)
+        self.settings = settings
+        self.bucket = bucket
+        self.filename = self.PATTERN.replace('*', name)
+        self.shutdown_event = shutdown_event
+        self.percentiles = sorted(set(self.PERCENTILES + (settings.percentile,)))
+
+        self.lock = Lock()
+        self.samples = {}  # type: Dict[int, np.ndarray]
+        self.stopped = Event()
+
+        self.steps = []
+        self.best_rate = 0
+        self.max_throughput = 0
+        self.complete = False
+
+    def observe(self, timestamp: int, histograms: Dict[str, np.ndarray]):
+        """Store the latency histogram of a per-second telemetry sample."""
+        counts = histograms.get(self.settings.operation)
+        if counts is not None:
+            with self.lock:
+                self.samples[timestamp] = counts
+
+    def wait_until(self, deadline: float) -> bool:
+        """Sleep until the deadline, return False if the search was stopped."""
+        return not self.stopped.wait(max(deadline - time.time(), 0))
+
+    def measure(self, rate: int) -> Optional[dict]:
+        self.bucket.set_rate(rate)
+
+        window_start = time.time() + self.settings.settle_time
+        window_end = window_start + self.settings.measure_time
+        if not self.wait_until(window_start):
+            return
+        tokens = self.bucket.tokens.value
+        if not self.wait_until(window_end):
+            return
+        throughput = (self.bucket.tokens.value - tokens) / self.settings.measure_time
+        if not self.wait_until(window_end + self.SAMPLE_DELAY):
+            return
+
+        counts = None
+        with self.lock:
+            for timestamp in range(math.ceil(window_start), int(window_end)):
+                if timestamp in self.samples:
+                    if counts is None:
+                        counts = self.samples[timestamp].copy()
+                    else:
+                        counts += self.samples[timestamp]
+            self.samples.clear()
+
+        step = {
+            'target_throughput': rate,
+            'throughput': round(throughput, 1),
+        }
+        for percentile in self.percentiles:
+            latency = None
+            if counts is not None:
+                latency = TelemetryRing.percentile_of(counts, percentile) / 1000
+            step['latency_{:g}th'.format(percentile)] = latency
+        return step
+
+    def evaluate(self, rate: int) -> Optional[bool]:
+        """Run a single step, return None if the search was stopped."""
+        step = self.measure(rate)
+        if step is None:
+            return
+
+        latency = step['latency_{:g}th'.format(self.settings.percentile)]
+        step['passed'] = latency is not None and \
+            latency <= self.settings.latency and \
+            step['throughput'] >= self.MIN_RATIO * rate
+        self.steps.append(step)
+
+        logger.info('SLO search: target {:,} ops/sec, achieved {:,.1f} ops/sec, '
+                    '{:g}th percentile {} latency {} ms, SLO {}'
+                    .format(rate, step['throughput'], self.settings.percentile,
+                            self.settings.operation, latency,
+                            step['passed'] and 'met' or 'violated'))
+
+        if step['passed'] and rate > self.best_rate:
+            self.best_rate = rate
+            self.max_throughput = step['throughput']
+        return step['passed']
+
+    def step_search(self) -> bool:
+        rate = self.settings.min_throughput
+        while rate <= self.settings.max_throughput:
+            passed = self.evaluate(rate)
+            if passed is None:
+                return False
+            if not passed:
+                break
+            rate += self.settings.step
+        return True
+
+    def binary_search(self) -> bool:
+        low, high = self.settings.min_throughput, self.settings.max_throughput
+        passed = self.evaluate(low)
+        if not passed:  # The SLO cannot be met at all
+            return passed is not None
+        passed = self.evaluate(high)
+        if passed is not False:  # The SLO is met in the entire range
+            return passed is not None
+
+        while high - low > self.settings.resolution:
+            rate = (low + high) // 2
+            passed = self.evaluate(rate)
+            if passed is None:
+                return False
+            if passed:
+                low = rate
+            else:
+                high = rate
+        return True
+
+    def run(self):
+        logger.info('Searching for the maximum throughput: {}'.format(self.settings))
+        if self.settings.mode == 'binary':
+            self.complete = self.binary_search()
+        else:
+            self.complete = self.step_search()
+
+        if not self.complete:
+            logger.warn('SLO search was interrupted')
+        logger.info('Maximum throughput under SLO: {:,.1f} ops/sec (target {:,} ops/sec)'
+                    .format(self.max_throughput, self.best_rate))
+        self.dump()
+
+        self.bucket.set_rate(self.best_rate or self.settings.min_throughput)
+        if self.complete and self.shutdown_event is not None:
+            self.shutdown_event.set()
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+    def dump(self):
+        """Write the throughput-latency curve and the result to a JSON file."""
+        logger.info('Writing SLO search curve to {}'.format(self.filename))
+        with open(self.filename, 'w') as fh:
+            json.dump({
+                'mode': self.settings.mode,
+                'operation': self.settings.operation,
+                'percentile': self.settings.percentile,
+                'latency': self.settings.latency,
+                'complete': self.complete,
+                'max_throughput': self.max_throughput,
+                'steps': self.steps,
+            }, fh, indent=4)
@@ -0,0 +1,585 @@
+import asyncio
+import hashlib
+import json
+import random
+import struct
+import time
+from argparse import ArgumentParser
+from collections import Counter
+from typing import List, Optional, Tuple
+
+from logger import logger
+
+HEADER = struct.Struct('>BBHBBHIIQ')  # Magic, opcode, key length, extras
+#                                       length, datatype, vbucket or status,
+#                                       body length, opaque, CAS
+
+REQ_MAGIC = 0x80
+ALT_REQ_MAGIC = 0x08  # With framing extras, e.g. the durability requirements
+RES_MAGIC = 0x81
+
+# Opcodes
+GET = 0x00
+SET = 0x01
+ADD = 0x02
+REPLACE = 0x03
+DELETE = 0x04
+NOOP = 0x0a
+VERSION = 0x0b
+HELLO = 0x1f
+SASL_LIST_MECHS = 0x20
+SASL_AUTH = 0x21
+SELECT_BUCKET = 0x89
+GET_CLUSTER_CONFIG = 0xb5
+SUBDOC_GET = 0xc5
+SUBDOC_EXISTS = 0xc6
+SUBDOC_DICT_ADD = 0xc7
+SUBDOC_DICT_UPSERT = 0xc8
+SUBDOC_DELETE = 0xc9
+SUBDOC_REPLACE = 0xca
+SUBDOC_MULTI_LOOKUP = 0xd0
+SUBDOC_MULTI_MUTATION = 0xd1
+
+# Status codes
+SUCCESS = 0x00
+KEY_ENOENT = 0x01
+KEY_EEXISTS = 0x02
+EINVAL = 0x04
+NOT_MY_VBUCKET = 0x07
+AUTH_ERROR = 0x20
+UNKNOWN_COMMAND = 0x81
+TMPFAIL = 0x86
+SUBDOC_PATH_ENOENT = 0xc0
+SUBDOC_PATH_MISMATCH = 0xc1
+SUBDOC_DOC_NOT_JSON = 0xc3
+SUBDOC_PATH_EEXISTS = 0xc9
+SUBDOC_MULTI_PATH_FAILURE = 0xcc
+
+# HELLO features
+FEATURE_TCPNODELAY = 0x03
+FEATURE_XATTR = 0x06
+FEATURE_XERROR = 0x07
+FEATURE_SELECT_BUCKET = 0x08
+FEATURE_JSON = 0x0b
+FEATURE_ALT_REQUEST = 0x10
+FEATURE_SYNC_REPLICATION = 0x11
+
+SUPPORTED_FEATURES = (
+    FEATURE_TCPNODELAY, FEATURE_XATTR, FEATURE_XERROR, FEATURE_SELECT_BUCKET, FEATURE_JSON,
+    FEATURE_ALT_REQUEST, FEATURE_SYNC_REPLICATION,
+)
+
+# Sub-document flags
+SUBDOC_FLAG_MKDIR_P = 0x01
+SUBDOC_FLAG_XATTR_PATH = 0x04
+SUBDOC_DOC_FLAG_MKDOC = 0x01
+SUBDOC_DOC_FLAG_ADD = 0x02
+
+DATA_OPS = {
+    GET, SET, ADD, REPLACE, DELETE, SUBDOC_GET, SUBDOC_EXISTS, SUBDOC_DICT_ADD,
+    SUBDOC_DICT_UPSERT, SUBDOC_DELETE, SUBDOC_REPLACE, SUBDOC_MULTI_LOOKUP,
+    SUBDOC_MULTI_MUTATION,
+}
+
+LOOKUPS = SUBDOC_GET, SUBDOC_EXISTS
+
+
+class SubDocError(Exception):
+
+    def __init__(self, status: int):
+        self.status = status
+
+
+class Item:
+
+    __slots__ = 'value', 'flags', 'datatype', 'cas', 'xattrs'
+
+    def __init__(self, value: bytes, flags: int, datatype: int, cas: int,
+                 xattrs: dict = None):
+        self.value = value
+        self.flags = flags
+        self.datatype = datatype
+        self.cas = cas
+        self.xattrs = xattrs or {}
+
+
+def split_path(path: str) -> List[str]:
+    return path.split('.') if path else []
+
+
+def lookup(doc, path: str):
+    for name in split_path(path):
+        if not isinstance(doc, dict):
+            raise SubDocError(SUBDOC_PATH_MISMATCH)
+        if name not in doc:
+            raise SubDocError(SUBDOC_PATH_ENOENT)
+        doc = doc[name]
+    return doc
+
+
+def mutate(doc: dict, opcode: int, path: str, value, flags: int):
+    names = split_path(path)
+    if not names:
+        raise SubDocError(EINVAL)
+    for name in names[:-1]:
+        if not isinstance(doc, dict):
+            raise SubDocError(SUBDOC_PATH_MISMATCH)
+        if name not in doc:
+            if not flags & SUBDOC_FLAG_MKDIR_P:
+                raise SubDocError(SUBDOC_PATH_ENOENT)
+            doc[name] = {}
+        doc = doc[name]
+    if not isinstance(doc, dict):
+        raise SubDocError(SUBDOC_PATH_MISMATCH)
+
+    name = names[-1]
+    if opcode == SUBDOC_DICT_ADD and name in doc:
+        raise SubDocError(SUBDOC_PATH_EEXISTS)
+    if opcode in (SUBDOC_REPLACE, SUBDOC_DELETE) and name not in doc:
+        raise SubDocError(SUBDOC_PATH_ENOENT)
+    if opcode == SUBDOC_DELETE:
+        del doc[name]
+    else:
+        doc[name] = value
+
+
+class Bucket:
+
+    """In-memory documents and the cluster map of a single bucket."""
+
+    NUM_VBUCKETS = 1024
+
+    def __init__(self, name: str, server: 'StandIn'):
+        self.name = name
+        self.server = server
+        self.items = {}  # type: dict
+
+    def config(self) -> dict:
+        """Return the bucket config, which the clients bootstrap from."""
+        server = self.server
+        kv_nodes = ['{}:{}'.format(server.host, port) for port in server.ports]
+        rest_node = '{}:{}'.format(server.host, server.rest_port)
+        return {
+            'rev': server.rev,
+            'name': self.name,
+            'uuid': hashlib.md5(self.name.encode()).hexdigest(),
+            'bucketType': 'membase',
+            'nodeLocator': 'vbucket',
+            'uri': '/pools/default/buckets/{}'.format(self.name),
+            'streamingUri': '/pools/default/bucketsStreaming/{}'.format(self.name),
+            'bucketCapabilitiesVer': '',
+            'bucketCapabilities': ['xattr', 'cbhello', 'touch', 'cccp', 'nodesExt'],
+            'nodes': [
+                {'hostname': rest_node, 'ports': {'direct': port},
+                 'couchApiBase': 'http://{}/{}'.format(rest_node, self.name),
+                 'status': 'healthy', 'clusterMembership': 'active'}
+                for port in server.ports
+            ],
+            'nodesExt': [
+                {'hostname': server.host,
+                 'services': {'mgmt': server.rest_port, 'kv': port}}
+                for port in server.ports
+            ],
+            'vBucketServerMap': {
+                'hashAlgorithm': 'CRC',
+                'numReplicas': 0,
+                'serverList': kv_nodes,
+                'vBucketMap': [[server.owner(vbucket)] for vbucket in range(self.NUM_VBUCKETS)],
+            },
+        }
+
+    def next_cas(self) -> int:
+        self.server.cas += 1
+        return self.server.cas
+
+    def get(self, key: bytes) -> Tuple[int, Optional[Item]]:
+        item = self.items.get(key)
+        return (SUCCESS, item) if item else (KEY_ENOENT, None)
+
+    def store(self, opcode: int, key: bytes, value: bytes, flags: int, datatype: int,
+              cas: int) -> Tuple[int, int]:
+        item = self.items.get(key)
+        if opcode == ADD and item:
+            return KEY_EEXISTS, 0
+        if opcode == REPLACE and not item:
+            return KEY_ENOENT, 0
+        if cas and (not item or item.cas != cas):
+            return (KEY_EEXISTS, 0) if item else (KEY_ENOENT, 0)
+        item = Item(value, flags, datatype, self.next_cas())
+        self.items[key] = item
+        return SUCCESS, item.cas
+
+    def delete(self, key: bytes) -> Tuple[int, int]:
+        if self.items.pop(key, None) is None:
+            return KEY_ENOENT, 0
+        return SUCCESS, self.next_cas()
+
+    def document(self, key: bytes, doc_flags: int = 0) -> Tuple[Item, dict]:
+        item = self.items.get(key)
+        if item is None:
+            if not doc_flags & (SUBDOC_DOC_FLAG_MKDOC | SUBDOC_DOC_FLAG_ADD):
+                raise SubDocError(KEY_ENOENT)
+            return None, {}
+        if doc_flags & SUBDOC_DOC_FLAG_ADD:
+            raise SubDocError(KEY_EEXISTS)
+        try:
+            return item, json.loads(item.value.decode())
+        except ValueError:
+            raise SubDocError(SUBDOC_DOC_NOT_JSON)
+
+    def lookup_in(self, key: bytes, specs: List[tuple]) -> Tuple[int, List[tuple]]:
+        """Run the (opcode, flags, path) lookups, return per-spec results."""
+        item, doc = self.document(key)
+        results = []
+        for opcode, flags, path in specs:
+            target = item.xattrs if flags & SUBDOC_FLAG_XATTR_PATH else doc
+            try:
+                value = lookup(target, path)
+                if opcode == SUBDOC_EXISTS:
+                    results.append((SUCCESS, b''))
+                else:
+                    results.append((SUCCESS, json.dumps(value).encode()))
+            except SubDocError as e:
+                results.append((e.status, b''))
+        return item.cas, results
+
+    def mutate_in(self, key: bytes, specs: List[tuple], doc_flags: int) -> int:
+        """Apply the (opcode, flags, path, value) mutations atomically."""
+        item, doc = self.document(key, doc_flags)
+        xattrs = json.loads(json.dumps(item.xattrs)) if item else {}
+        for i, (opcode, flags, path, value) in enumerate(specs):
+            target = xattrs if flags & SUBDOC_FLAG_XATTR_PATH else doc
+            try:
+                if opcode == SET:  # Full document
+                    doc = json.loads(value.decode())
+                    continue
+                fragment = None
+                if opcode != SUBDOC_DELETE:
+                    try:
+                        fragment = json.loads(value.decode())
+                    except ValueError:
+                        raise SubDocError(EINVAL)
+                mutate(target, opcode, path, fragment, flags)
+            except SubDocError as e:
+                e.index = i
+                raise
+        new_item = Item(json.dumps(doc).encode(), item.flags if item else 0,
+                        0x01, self.next_cas(), xattrs)
+        self.items[key] = new_item
+        return new_item.cas
+
+
+class MemcachedProtocol(asyncio.Protocol):
+
+    """Serve the memcached binary protocol on behalf of a single node.
+
+    The requests are handled in order as soon as they arrive. The responses
+    of the data operations are delayed by the configured latency, so many
+    requests can be in flight on the same connection, and a fraction of them
+    fails with a temporary failure.
+    """
+
+    def __init__(self, server: 'StandIn', node: int):
+        self.server = server
+        self.node = node
+        self.buffer = bytearray()
+        self.bucket = None  # type: Optional[Bucket]
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def data_received(self, data: bytes):
+        self.buffer += data
+        while len(self.buffer) >= HEADER.size:
+            magic, opcode, key_len, ext_len, datatype, vbucket, body_len, opaque, cas = \
+                HEADER.unpack_from(self.buffer)
+            frame_len = 0
+            if magic == ALT_REQ_MAGIC:  # The framing extras are ignored
+                frame_len, key_len = key_len >> 8, key_len & 0xff
+            elif magic != REQ_MAGIC:
+                logger.warn('Invalid magic {:#x}, closing the connection'.format(magic))
+                self.transport.close()
+                return
+            if len(self.buffer) < HEADER.size + body_len:
+                return
+
+            body = bytes(self.buffer[HEADER.size + frame_len:HEADER.size + body_len])
+            del self.buffer[:HEADER.size + body_len]
+            extras = body[:ext_len]
+            key = body[ext_len:ext_len + key_len]
+            value = body[ext_len + key_len:]
+            self.handle(opcode, key, extras, value, datatype, vbucket, opaque, cas)
+
+    def respond(self, opcode: int, opaque: int, status: int = SUCCESS, cas: int = 0,
+                extras: bytes = b'', key: bytes = b'', value: bytes = b'',
+                datatype: int = 0, delay: float = 0):
+        header = HEADER.pack(RES_MAGIC, opcode, len(key), len(extras), datatype, status,
+                             len(extras) + len(key) + len(value), opaque, cas)
+        response = header + extras + key + value
+        if delay:
+            asyncio.get_event_loop().call_later(delay, self.write, response)
+        else:
+            self.write(response)
+
+    def write(self, response: bytes):
+        if not self.transport.is_closing():
+            self.transport.write(response)
+
+    def handle(self, opcode: int, key: bytes, extras: bytes, value: bytes, datatype: int,
+               vbucket: int, opaque: int, cas: int):
+        self.server.ops[opcode] += 1
+        if opcode in DATA_OPS:
+            if self.bucket is None:
+                return self.respond(opcode, opaque, AUTH_ERROR)
+            if self.server.owner(vbucket) != self.node:
+                config = json.dumps(self.bucket.config()).encode()
+                return self.respond(opcode, opaque, NOT_MY_VBUCKET, value=config)
+            delay = self.server.latency
+            if self.server.error_rate and random.random() < self.server.error_rate:
+                return self.respond(opcode, opaque, TMPFAIL, delay=delay)
+            status, res_cas, res_extras, res_value, res_datatype = \
+                self.handle_data(opcode, key, extras, value, datatype, cas)
+            return self.respond(opcode, opaque, status, res_cas, res_extras,
+                                value=res_value, datatype=res_datatype, delay=delay)
+
+        if opcode == HELLO:
+            features = struct.unpack('>{}H'.format(len(value) // 2), value)
+            supported = [f for f in features if f in SUPPORTED_FEATURES]
+            self.respond(opcode, opaque, value=struct.pack('>{}H'.format(len(supported)),
+                                                           *supported))
+        elif opcode == SASL_LIST_MECHS:
+            self.respond(opcode, opaque, value=b'PLAIN')
+        elif opcode == SASL_AUTH:
+            if key != b'PLAIN':
+                return self.respond(opcode, opaque, AUTH_ERROR)
+            username = value.split(b'\0')[1] if value.count(b'\0') == 2 else b''
+            self.bucket = self.server.bucket(username.decode())
+            self.respond(opcode, opaque, value=b'Authenticated')
+        elif opcode == SELECT_BUCKET:
+            self.bucket = self.server.bucket(key.decode())
+            self.respond(opcode, opaque)
+        elif opcode == GET_CLUSTER_CONFIG:
+            if self.bucket is None:
+                return self.respond(opcode, opaque, AUTH_ERROR)
+            self.respond(opcode, opaque, value=json.dumps(self.bucket.config()).encode(),
+                         datatype=0x01)
+        elif opcode == NOOP:
+            self.respond(opcode, opaque)
+        elif opcode == VERSION:
+            self.respond(opcode, opaque, value=b'6.0.0-stand-in')
+        else:
+            self.respond(opcode, opaque, UNKNOWN_COMMAND)
+
+    def handle_data(self, opcode: int, key: bytes, extras: bytes, value: bytes,
+                    datatype: int, cas: int) -> tuple:
+        """Return the status, CAS, extras, value and datatype of the response."""
+        bucket = self.bucket
+        if opcode == GET:
+            status, item = bucket.get(key)
+            if item is None:
+                return status, 0, b'', b'', 0
+            return status, item.cas, struct.pack('>I', item.flags), item.value, item.datatype
+
+        if opcode in (SET, ADD, REPLACE):
+            flags = struct.unpack_from('>I', extras)[0] if len(extras) >= 4 else 0
+            status, cas = bucket.store(opcode, key, value, flags, datatype, cas)
+            return status, cas, b'', b'', 0
+
+        if opcode == DELETE:
+            status, cas = bucket.delete(key)
+            return status, cas, b'', b'', 0
+
+        try:
+            if opcode in (SUBDOC_MULTI_LOOKUP, SUBDOC_MULTI_MUTATION):
+                return self.handle_multi(opcode, key, extras, value)
+            return self.handle_subdoc(opcode, key, extras, value)
+        except SubDocError as e:
+            return e.status, 0, b'', b'', 0
+
+    def handle_subdoc(self, opcode: int, key: bytes, extras: bytes, value: bytes) -> tuple:
+        path_len, flags = struct.unpack_from('>HB', extras)
+        doc_flags = extras[-1] if len(extras) in (4, 8) else 0
+        path, fragment = value[:path_len].decode(), value[path_len:]
+
+        if opcode in LOOKUPS:
+            cas, [(status, result)] = self.bucket.lookup_in(key, [(opcode, flags, path)])
+            return status, cas, b'', result, 0x01 if result else 0
+
+        cas = self.bucket.mutate_in(key, [(opcode, flags, path, fragment)], doc_flags)
+        return SUCCESS, cas, b'', b'', 0
+
+    def handle_multi(self, opcode: int, key: bytes, extras: bytes, value: bytes) -> tuple:
+        doc_flags = extras[-1] if len(extras) in (1, 5) else 0
+        specs, offset = [], 0
+        while offset < len(value):
+            if opcode == SUBDOC_MULTI_LOOKUP:
+                spec_opcode, flags, path_len = struct.unpack_from('>BBH', value, offset)
+                offset += 4
+                specs.append((spec_opcode, flags, value[offset:offset + path_len].decode()))
+                offset += path_len
+            else:
+                spec_opcode, flags, path_len, value_len = \
+                    struct.unpack_from('>BBHI', value, offset)
+                offset += 8
+                path = value[offset:offset + path_len].decode()
+                offset += path_len
+                specs.append((spec_opcode, flags, path, value[offset:offset + value_len]))
+                offset += value_len
+
+        if opcode == SUBDOC_MULTI_LOOKUP:
+            cas, results = self.bucket.lookup_in(key, specs)
+            body = b''.join(struct.pack('>HI', status, len(result)) + result
+                            for status, result in results)
+            failed = any(status != SUCCESS for status, _ in results)
+            return SUBDOC_MULTI_PATH_FAILURE if failed else SUCCESS, cas, b'', body, 0
+
+        try:
+            cas = self.bucket.mutate_in(key, specs, doc_flags)
+        except SubDocError as e:
+            if not hasattr(e, 'index'):
+                raise
+            return SUBDOC_MULTI_PATH_FAILURE, 0, b'', struct.pack('>BH', e.index, e.status), 0
+        return SUCCESS, cas, b'', b'', 0
+
+
+class StandIn:
+
+    """Stand-in for a Couchbase cluster, which serves the KV requests of spring.
+
+    Every node listens on its own port (consecutive ports starting with the
+    given one, or ephemeral ports if the port is 0) and owns every Nth
+    vbucket. The documents of all nodes are kept in the same process. The
+    bucket config is served over the memcached protocol (CCCP) and the REST
+    bootstrap endpoints of the SDK. The bucket is created upon the first
+    authentication or bucket selection, the passwords are not checked.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 11210, rest_port: int = 8091,
+                 num_nodes: int = 1, latency: float = 0, error_rate: float = 0):
+        self.host = host
+        self.port = port
+        self.rest_port = rest_port
+        self.num_nodes = num_nodes
+        self.latency = latency
+        self.error_rate = error_rate
+
+        self.ports = []  # type: List[int]
+        self.buckets = {}  # type: dict
+        self.servers = []
+        self.rev = 1
+        self.cas = int(time.time() * 10 ** 9)
+        self.shift = 0
+        self.ops = Counter()
+
+    def owner(self, vbucket: int) -> int:
+        return (vbucket + self.shift) % self.num_nodes
+
+    def rebalance(self):
+        """Move every vbucket to the next node and publish a new config."""
+        self.shift += 1
+        self.rev += 1
+
+    def bucket(self, name: str) -> Bucket:
+        if name not in self.buckets:
+            self.buckets[name] = Bucket(name, self)
+        return self.buckets[name]
+
+    async def start(self):
+        loop = asyncio.get_event_loop()
+        for node in range(self.num_nodes):
+            port = self.port and self.port + node
+            server = await loop.create_server(
+                lambda node=node: MemcachedProtocol(self, node), self.host, port)
+            self.servers.append(server)
+            self.ports.append(server.sockets[0].getsockname()[1])
+
+        server = await asyncio.start_server(self.handle_rest, self.host, self.rest_port)
+        self.servers.append(server)
+        self.rest_port = server.sockets[0].getsockname()[1]
+        logger.info('Stand-in is listening on {}, KV ports: {}, REST port: {}'
+                    .format(self.host, self.ports, self.rest_port))
+
+    async def stop(self):
+        for server in self.servers:
+            server.close()
+            await server.wait_closed()
+        logger.info('Served operations: {}'.format(
+            ', '.join('{:#04x}: {:,}'.format(*op) for op in sorted(self.ops.items()))))
+
+    async def handle_rest(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve the bootstrap REST endpoints, the credentials are ignored."""
+        try:
+            request = (await reader.readline()).decode().split()
+            while (await reader.readline()).strip():  # Headers
+                pass
+            if len(request) < 2:
+                return
+
+            path = request[1].split('?')[0].rstrip('/').split('/')[1:]
+            if path[-2:-1] in (['bs'], ['bucketsStreaming']):
+                config = json.dumps(self.bucket(path[-1]).config()) + '\n\n\n\n'
+                writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n'
+                             b'Transfer-Encoding: chunked\r\n\r\n')
+                writer.write('{:x}\r\n{}\r\n'.format(len(config), config).encode())
+                await reader.read()  # Streaming until the client disconnects
+                return
+
+            response = self.rest_response(path)
+            if response is None:
+                writer.write(b'HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\n\r\n')
+            else:
+                body = json.dumps(response).encode()
+                writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n'
+                             b'Content-Length: ' + str(len(body)).encode() + b'\r\n\r\n' + body)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def rest_response(self, path: List[str]):
+        if path == ['pools']:
+            return {'pools': [{'name': 'default', 'uri': '/pools/default'}],
+                    'implementationVersion': '6.0.0-stand-in', 'isAdminCreds': True}
+        if path == ['pools', 'default']:
+            return {'name': 'default',
+                    'buckets': {'uri': '/pools/default/buckets'},
+                    'nodes': self.bucket('default').config()['nodes']}
+        if path == ['pools', 'default', 'buckets']:
+            return [bucket.config() for bucket in self.buckets.values()]
+        if len(path) == 4 and path[:3] in (['pools', 'default', 'buckets'],
+                                           ['pools', 'default', 'b']):
+            return self.bucket(path[3]).config()
+
+
+def main():
+    parser = ArgumentParser(prog='spring.standin')
+    parser.add_argument('--host', type=str, default='127.0.0.1',
+                        help='listening address (127.0.0.1 by default)')
+    parser.add_argument('--port', type=int, default=11210,
+                        help='KV port of the first node (11210 by default)')
+    parser.add_argument('--rest-port', dest='rest_port', type=int, default=8091,
+                        help='REST port (8091 by default)')
+    parser.add_argument('--nodes', dest='num_nodes', type=int, default=1,
+                        help='number of nodes (1 by default)')
+    parser.add_argument('--latency', type=float, default=0,
+                        help='injected latency of KV operations in milliseconds')
+    parser.add_argument('--error-rate', dest='error_rate', type=float, default=0,
+                        help='fraction of KV operations that fail with TMPFAIL')
+    args = parser.parse_args()
+
+    standin = StandIn(args.host, args.port, args.rest_port, args.num_nodes,
+                      args.latency / 1000, args.error_rate)
+    loop = asyncio.get_event_loop()
+    loop.run_until_complete(standin.start())
+    try:
+        loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        loop.run_until_complete(standin.stop())
+
+
+if __name__ == '__main__':
+    main()
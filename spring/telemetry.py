@@ -0,0 +1,236 @@
+import json
+import time
+from collections import defaultdict
+from ctypes import c_int64, c_uint64
+from multiprocessing import RawArray, RawValue
+from threading import Event, Thread
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from logger import logger
+from spring.histogram import Histogram
+
+
+class TelemetryRing:
+
+    """Publish the per-second statistics of a worker through shared memory.
+
+    Every record holds the interval start (in seconds) followed by a coarse
+    latency histogram for each known operation. The coarse buckets are the HDR
+    histogram buckets shifted by SHIFT bits, i.e. every power-of-two range is
+    split into 16 sub-buckets (< 6.25% error). Operation counts are the sums of
+    the histograms.
+
+    The worker is the only writer: it fills the next slot of the ring and then
+    advances the head. A reader that falls behind by SLOTS records or more
+    loses the oldest ones. The error counter is updated upon every error, so
+    it keeps moving even when all requests fail.
+    """
+
+    OPERATIONS = 'get', 'set', 'delete', 'mget', 'mset', 'mdelete', 'query', 'ttfr'
+
+    SHIFT = 5
+
+    BUCKETS = Histogram.COUNTS_LEN >> SHIFT
+
+    RECORD_LEN = 1 + len(OPERATIONS) * BUCKETS
+
+    SLOTS = 16
+
+    def __init__(self):
+        self.buffer = RawArray(c_int64, self.SLOTS * self.RECORD_LEN)
+        self.head = RawValue(c_uint64, 0)  # Total number of published records
+        self.errors = RawValue(c_uint64, 0)
+        self.closed = RawValue('b', 0)
+
+    @property
+    def records(self) -> np.ndarray:
+        return np.frombuffer(self.buffer, dtype=np.int64).reshape(self.SLOTS,
+                                                                  self.RECORD_LEN)
+
+    def publish(self, timestamp: float, histograms: Dict[str, Histogram]):
+        record = np.zeros(self.RECORD_LEN, dtype=np.int64)
+        record[0] = int(timestamp)
+        for i, operation in enumerate(self.OPERATIONS):
+            histogram = histograms.get(operation)
+            if histogram is None:
+                continue
+            indexes, counts = histogram.nonzero()
+            offset = 1 + i * self.BUCKETS
+            np.add.at(record, offset + (indexes >> self.SHIFT), counts)
+
+        head = self.head.value
+        self.records[head % self.SLOTS] = record
+        self.head.value = head + 1
+
+    def add_error(self):
+        self.errors.value += 1
+
+    def close(self):
+        self.closed.value = 1
+
+    def read(self, start: int) -> Tuple[int, List[np.ndarray]]:
+        """Return the position of the next unread record and the new records.
+
+        The records that were overwritten while being copied are discarded.
+        """
+        head = self.head.value
+        start = max(start, head - self.SLOTS + 1)  # The next slot to write
+        records = []
+        for position in range(start, head):
+            record = self.records[position % self.SLOTS].copy()
+            if self.head.value - position < self.SLOTS:
+                records.append(record)
+        return head, records
+
+    @classmethod
+    def histograms(cls, record: np.ndarray) -> Iterator[Tuple[str, np.ndarray]]:
+        """Yield the non-empty (operation, coarse counts) pairs of a record."""
+        for i, operation in enumerate(cls.OPERATIONS):
+            offset = 1 + i * cls.BUCKETS
+            counts = record[offset:offset + cls.BUCKETS]
+            if counts.any():
+                yield operation, counts
+
+    @classmethod
+    def percentile_of(cls, counts: np.ndarray, percentile: float) -> int:
+        """Return the percentile of coarse counts (in microseconds)."""
+        indexes = np.flatnonzero(counts)
+        return Histogram.percentile_of((indexes << cls.SHIFT) + (1 << cls.SHIFT) - 1,
+                                       counts[indexes], percentile)
+
+
+class TelemetryMonitor(Thread):
+
+    """Aggregate the telemetry of all workers in real time.
+
+    Every second the monitor collects the new records, merges the intervals
+    that are at least DELAY seconds old and appends the totals as a JSON line
+    to the telemetry file, which is tailed by the cbagent collector. Records
+    that arrive after their interval has been written are dropped.
+
+    A worker that has not published anything for STALL_TIMEOUT seconds is
+    reported as stalled.
+
+    When the workers follow a load profile, every sample also includes the
+    target throughput and the index of the profile phase. When the throughput
+    is limited, the rate achieved by the workers is included as well.
+    """
+
+    INTERVAL = 1
+
+    DELAY = 2
+
+    STALL_TIMEOUT = 10
+
+    PERCENTILES = 50, 99
+
+    def __init__(self, filename: str, bucket: str):
+        super().__init__(daemon=True)
+        self.filename = filename
+        self.bucket = bucket
+        self.rings = []  # type: List[Tuple[str, TelemetryRing]]
+        self.rate_controller = None
+        self.rate_monitors = []  # Sources of the achieved throughput
+        self.observers = []  # Consumers of the merged samples, e.g. SLOSearch
+        self.stopped = Event()
+
+    def add_ring(self, name: str, ring: TelemetryRing):
+        self.rings.append((name, ring))
+
+    def run(self):
+        positions = defaultdict(int)
+        errors = defaultdict(int)
+        last_seen = defaultdict(time.time)
+        stalled = set()
+        pending = defaultdict(dict)  # type: Dict[int, Dict[str, np.ndarray]]
+        last_written = num_errors = 0
+
+        with open(self.filename, 'w') as fh:
+            while True:
+                stopping = self.stopped.wait(self.INTERVAL)
+                now = time.time()
+
+                for name, ring in self.rings:
+                    head, records = ring.read(positions[name])
+                    if head != positions[name]:
+                        last_seen[name] = now
+                        stalled.discard(name)
+                    elif not ring.closed.value and name not in stalled and \
+                            now - last_seen[name] > self.STALL_TIMEOUT:
+                        logger.warn('Worker {} has not completed any operations '
+                                    'for {} seconds'.format(name, self.STALL_TIMEOUT))
+                        stalled.add(name)
+                    positions[name] = head
+
+                    for record in records:
+                        timestamp = int(record[0])
+                        if timestamp <= last_written:
+                            continue
+                        for operation, counts in ring.histograms(record):
+                            if operation not in pending[timestamp]:
+                                pending[timestamp][operation] = counts
+                            else:
+                                pending[timestamp][operation] += counts
+
+                    num_errors += ring.errors.value - errors[name]
+                    errors[name] = ring.errors.value
+
+                timestamps = [timestamp for timestamp in sorted(pending)
+                              if stopping or timestamp <= now - self.DELAY]
+                if not timestamps and (num_errors or stalled) and \
+                        int(now) - self.DELAY > last_written:
+                    timestamps = [int(now) - self.DELAY]  # No completed ops
+                for timestamp in timestamps:
+                    histograms = pending.pop(timestamp, {})
+                    self.write(fh, timestamp, histograms,
+                               errors=num_errors, stalled=len(stalled))
+                    for observer in self.observers:
+                        observer.observe(timestamp, histograms)
+                    num_errors = 0
+                    last_written = max(last_written, timestamp)
+                fh.flush()
+
+                if stopping:
+                    break
+
+    def write(self, fh, timestamp: int, histograms: Dict[str, np.ndarray],
+              errors: int, stalled: int):
+        sample = {
+            'timestamp': timestamp,
+            'bucket': self.bucket,
+            'errors': errors,
+            'stalled_workers': stalled,
+        }
+        if self.rate_controller is not None:
+            phase, rate = self.rate_controller.profile.rate_at(
+                timestamp - self.rate_controller.start_time)
+            sample['load_phase'] = phase
+            sample['target_throughput'] = rate
+        for rate_monitor in self.rate_monitors:
+            rate = rate_monitor.achieved(timestamp)
+            if rate is not None:
+                sample['achieved_{}'.format(rate_monitor.name)] = round(rate, 1)
+        for operation, counts in histograms.items():
+            sample['{}_ops'.format(operation)] = int(counts.sum())
+            for percentile in self.PERCENTILES:
+                latency = TelemetryRing.percentile_of(counts, percentile)
+                sample['latency_{}_{}th'.format(operation, percentile)] = \
+                    latency / 1000  # Latency in ms
+        fh.write(json.dumps(sample) + '\n')
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+def read_samples(fh) -> Iterator[dict]:
+    """Yield the complete samples appended to the telemetry file."""
+    while True:
+        offset = fh.tell()
+        line = fh.readline()
+        if not line.endswith('\n'):  # Partially written or no more samples
+            fh.seek(offset)
+            break
+        yield json.loads(line)
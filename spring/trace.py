@@ -0,0 +1,118 @@
+import os
+import struct
+from typing import Iterator, Tuple
+
+import numpy as np
+
+from logger import logger
+
+
+class TraceWriter:
+
+    """Append the operations of a worker to a binary trace file.
+
+    The file starts with a header (magic string and the recording start time)
+    followed by fixed-size packed records: the operation ("c", "r", "u", "d" or
+    "m"), the key number (uint64), the document body size (uint32) and the
+    intended time of the operation relative to the start (float64).
+    """
+
+    MAGIC = b'SPRTRACE'
+
+    HEADER = struct.Struct('<8sd')
+
+    RECORD = np.dtype([('op', 'S1'), ('key', '<u8'), ('size', '<u4'), ('time', '<f8')])
+
+    BUFFER_SIZE = 10 ** 4
+
+    def __init__(self, filename: str, start_time: float):
+        self.filename = filename
+        self.start_time = start_time
+        self.buffer = np.empty(self.BUFFER_SIZE, dtype=self.RECORD)
+        self.num_records = 0
+        self.total = 0
+
+        self.fh = open(filename, 'wb')
+        self.fh.write(self.HEADER.pack(self.MAGIC, start_time))
+
+    def append(self, op: str, key: int, size: float, intended_time: float):
+        self.buffer[self.num_records] = (op, key, size, intended_time - self.start_time)
+        self.num_records += 1
+        if self.num_records == self.BUFFER_SIZE:
+            self.flush()
+
+    def flush(self):
+        self.buffer[:self.num_records].tofile(self.fh)
+        self.total += self.num_records
+        self.num_records = 0
+
+    def close(self):
+        self.flush()
+        self.fh.close()
+        logger.info('Recorded {:,} operations to {}'.format(self.total, self.filename))
+
+
+class TraceReader:
+
+    """Stream the records of a trace file in fixed-size chunks.
+
+    Only one chunk is kept in memory, so the trace size is not limited by the
+    available RAM.
+    """
+
+    CHUNK_SIZE = 10 ** 5
+
+    def __init__(self, filename: str):
+        self.filename = filename
+
+    def __iter__(self) -> Iterator[Tuple[str, int, int, float]]:
+        """Yield (op, key number, document size, intended time) records."""
+        with open(self.filename, 'rb') as fh:
+            magic, self.start_time = TraceWriter.HEADER.unpack(
+                fh.read(TraceWriter.HEADER.size))
+            if magic != TraceWriter.MAGIC:
+                raise ValueError('Not a trace file: {}'.format(self.filename))
+
+            while True:
+                chunk = np.fromfile(fh, dtype=TraceWriter.RECORD, count=self.CHUNK_SIZE)
+                if not len(chunk):
+                    break
+                for op, key, size, intended_time in chunk.tolist():
+                    yield op.decode(), key, size, intended_time
+
+
+class DocumentSizes:
+
+    """Capture or enforce the body size of generated documents.
+
+    The document generators draw the body size from their _size() method,
+    which is replaced on the given generator instance. The size is reported as
+    0 for the generators that derive all the content from the key (e.g., the
+    document cache), they are deterministic anyway.
+    """
+
+    def __init__(self, docs):
+        self.draw = getattr(docs, '_size', None)
+        if self.draw is not None:
+            docs._size = self
+        self.forced = None
+        self.last = 0
+
+    def __call__(self) -> float:
+        if self.forced is not None:
+            self.last = self.forced
+        else:
+            self.last = self.draw()
+        return self.last
+
+
+def trace_file(prefix: str, sid: int) -> str:
+    return '{}-{}.trace'.format(prefix, sid)
+
+
+def count_traces(prefix: str) -> int:
+    """Return the number of workers with a trace file."""
+    sid = 0
+    while os.path.exists(trace_file(prefix, sid)):
+        sid += 1
+    return sid
@@ -1,63 +1,65 @@
+import asyncio
+import json
 import os
 import signal
 import time
-from multiprocessing import Event, Lock, Process, Value
-from threading import Timer
-from typing import Callable, List, Tuple, Union
+from collections import defaultdict, deque
+from multiprocessing import Event, Process, Value
+from threading import Lock, Timer
+from typing import Callable, Iterator, List, Tuple, Union
 
 import twisted
-from decorator import decorator
 from numpy import random
-from psutil import cpu_count
 from twisted.internet import reactor
 
 from logger import logger
 from perfrunner.helpers.sync import SyncHotWorkload
-from spring.cbgen import CBAsyncGen, CBGen, SubDocGen
+from spring.cbgen import (
+    CBAIOGen,
+    CBAsyncGen,
+    CBGen,
+    CouchbaseError,
+    N1QLQuery,
+    QueryPool,
+    SubDocGen,
+    TemporaryFailError,
+    error_log,
+    error_tracker,
+)
+from spring.dataset import Dataset, dataset_file, prepare_dataset
 from spring.docgen import (
-    AdvFilterDocument,
-    AdvFilterXattrBody,
-    ArrayIndexingDocument,
-    ArrayIndexingRangeScanDocument,
-    ArrayIndexingUniqueDocument,
-    BigFunDocument,
-    Document,
-    EventingSmallDocument,
-    ExtReverseLookupDocument,
-    GSIMultiIndexDocument,
-    HashJoinDocument,
+    DocumentCache,
     HotKey,
-    ImportExportDocument,
-    ImportExportDocumentArray,
-    ImportExportDocumentNested,
-    IncompressibleString,
-    JoinedDocument,
+    Key,
     KeyForCASUpdate,
     KeyForRemoval,
-    LargeDocument,
-    LargeItemPlasmaDocument,
     MovingWorkingSetKey,
-    MultiBucketDocument,
-    NestedDocument,
     NewOrderedKey,
-    PackageDocument,
     PowerKey,
-    ProfileDocument,
-    RefDocument,
-    ReverseLookupDocument,
-    ReverseRangeLookupDocument,
     SequentialKey,
-    SequentialPlasmaDocument,
-    SmallPlasmaDocument,
-    String,
-    TpcDsDocument,
     UniformKey,
-    VaryingItemSizePlasmaDocument,
     WorkingSetKey,
     ZipfKey,
+    format_keys,
 )
+from spring.generators import new_doc_generator
+from spring.histogram import HistogramRecorder
+from spring.keydist import build_tables, new_distribution_key
+from spring.leases import Lease, SequenceCounter
+from spring.loadprofile import LoadProfile, RateController
+from spring.mcgen import MCAIOGen, MCGen
+from spring.placement import Placement, pin
 from spring.querygen import N1QLQueryGen, ViewQueryGen, ViewQueryGenByType
-from spring.reservoir import Reservoir
+from spring.ratelimiter import RateMonitor, TokenBucket
+from spring.slosearch import SLOSearch
+from spring.telemetry import TelemetryMonitor, TelemetryRing
+from spring.trace import (
+    DocumentSizes,
+    TraceReader,
+    TraceWriter,
+    count_traces,
+    trace_file,
+)
 
 
 def err(*args, **kwargs):
@@ -67,34 +69,45 @@ def err(*args, **kwargs):
 twisted.python.log.err = err
 
 
-@decorator
-def with_sleep(method, *args):
-    self = args[0]
-    if self.target_time is None:
-        return method(self)
-    else:
-        t0 = time.time()
-        method(self)
-        actual_time = time.time() - t0
-        delta = self.target_time - actual_time
-        if delta > 0:
-            time.sleep(self.CORRECTION_FACTOR * delta)
-
+def multi_chunks(args: List[Tuple], size: int) -> Iterator[List[Tuple]]:
+    """Split the operation arguments into chunks of distinct keys.
 
-def set_cpu_afinity(sid):
-    os.system('taskset -p -c {} {}'.format(sid % cpu_count(), os.getpid()))
+    The multi-key operations take the documents as a dict, so a key that
+    appears twice in the same call would be executed only once.
+    """
+    chunk, keys = [], set()
+    for item in args:
+        if len(chunk) == size or item[0] in keys:
+            yield chunk
+            chunk, keys = [], set()
+        chunk.append(item)
+        keys.add(item[0])
+    if chunk:
+        yield chunk
 
 
 class Worker:
 
-    CORRECTION_FACTOR = 0.975  # empiric!
-
     NAME = 'worker'
 
-    def __init__(self, workload_settings, target_settings, shutdown_event=None):
+    RAW_DOCS = True  # Whether the client accepts pre-serialized documents
+
+    DATASET = False  # Whether the documents can be loaded from a dataset file
+
+    MEMCACHED = False  # Whether the client can be replaced with the memcached engine
+
+    THROUGHPUT = 'throughput'  # Name of the target throughput setting
+
+    BURST = TokenBucket.BURST
+
+    def __init__(self, workload_settings, target_settings, shutdown_event=None,
+                 rate_limiter=None, telemetry=None):
         self.ws = workload_settings
         self.ts = target_settings
         self.shutdown_event = shutdown_event
+        self.rate_limiter = rate_limiter or TokenBucket(rate=float('inf'))
+        self.telemetry = telemetry
+        error_tracker.telemetry = telemetry
         self.sid = 0
 
         self.next_report = 0.05  # report after every 5% of completion
@@ -113,6 +126,8 @@ class Worker:
         elif self.ws.working_set < 100:
             self.existing_keys = WorkingSetKey(self.ws,
                                                self.ts.prefix)
+        elif getattr(self.ws, 'key_distribution', 'uniform') != 'uniform':
+            self.existing_keys = new_distribution_key(self.ws, self.ts.prefix)
         elif self.ws.power_alpha:
             self.existing_keys = PowerKey(self.ts.prefix,
                                           self.ws.key_fmtr,
@@ -133,96 +148,31 @@ class Worker:
                                                    self.ws.key_fmtr)
 
     def init_docs(self):
-        if not hasattr(self.ws, 'doc_gen') or self.ws.doc_gen == 'basic':
-            self.docs = Document(self.ws.size)
-        elif self.ws.doc_gen == 'string':
-            self.docs = String(self.ws.size)
-        elif self.ws.doc_gen == 'nested':
-            self.docs = NestedDocument(self.ws.size)
-        elif self.ws.doc_gen == 'reverse_lookup':
-            self.docs = ReverseLookupDocument(self.ws.size,
-                                              self.ts.prefix)
-        elif self.ws.doc_gen == 'reverse_range_lookup':
-            self.docs = ReverseRangeLookupDocument(self.ws.size,
-                                                   self.ts.prefix,
-                                                   self.ws.range_distance)
-        elif self.ws.doc_gen == 'ext_reverse_lookup':
-            self.docs = ExtReverseLookupDocument(self.ws.size,
-                                                 self.ts.prefix,
-                                                 self.ws.items)
-        elif self.ws.doc_gen == 'hash_join':
-            self.docs = HashJoinDocument(self.ws.size,
-                                         self.ts.prefix,
-                                         self.ws.range_distance)
-        elif self.ws.doc_gen == 'join':
-            self.docs = JoinedDocument(self.ws.size,
-                                       self.ts.prefix,
-                                       self.ws.items,
-                                       self.ws.num_categories,
-                                       self.ws.num_replies)
-        elif self.ws.doc_gen == 'ref':
-            self.docs = RefDocument(self.ws.size,
-                                    self.ts.prefix)
-        elif self.ws.doc_gen == 'array_indexing':
-            self.docs = ArrayIndexingDocument(self.ws.size,
-                                              self.ts.prefix,
-                                              self.ws.array_size,
-                                              self.ws.items)
-        elif self.ws.doc_gen == 'array_indexing_unique':
-            self.docs = ArrayIndexingUniqueDocument(self.ws.size,
-                                                    self.ts.prefix,
-                                                    self.ws.array_size,
-                                                    self.ws.items)
-        elif self.ws.doc_gen == 'array_indexing_range_scan':
-            self.docs = ArrayIndexingRangeScanDocument(self.ws.size,
-                                                       self.ts.prefix,
-                                                       self.ws.array_size,
-                                                       self.ws.items)
-        elif self.ws.doc_gen == 'profile':
-            self.docs = ProfileDocument(self.ws.size,
-                                        self.ts.prefix)
-        elif self.ws.doc_gen == 'import_export_simple':
-            self.docs = ImportExportDocument(self.ws.size,
-                                             self.ts.prefix)
-        elif self.ws.doc_gen == 'import_export_array':
-            self.docs = ImportExportDocumentArray(self.ws.size,
-                                                  self.ts.prefix)
-        elif self.ws.doc_gen == 'import_export_nested':
-            self.docs = ImportExportDocumentNested(self.ws.size,
-                                                   self.ts.prefix)
-        elif self.ws.doc_gen == 'large':
-            self.docs = LargeDocument(self.ws.size)
-        elif self.ws.doc_gen == 'gsi_multiindex':
-            self.docs = GSIMultiIndexDocument(self.ws.size)
-        elif self.ws.doc_gen == 'small_plasma':
-            self.docs = SmallPlasmaDocument(self.ws.size)
-        elif self.ws.doc_gen == 'sequential_plasma':
-            self.docs = SequentialPlasmaDocument(self.ws.size)
-        elif self.ws.doc_gen == 'large_item_plasma':
-            self.docs = LargeItemPlasmaDocument(self.ws.size,
-                                                self.ws.item_size)
-        elif self.ws.doc_gen == 'varying_item_plasma':
-            self.docs = VaryingItemSizePlasmaDocument(self.ws.size,
-                                                      self.ws.size_variation_min,
-                                                      self.ws.size_variation_max)
-        elif self.ws.doc_gen == 'eventing_small':
-            self.docs = EventingSmallDocument(self.ws.size)
-        elif self.ws.doc_gen == 'tpc_ds':
-            self.docs = TpcDsDocument()
-        elif self.ws.doc_gen == 'package':
-            self.docs = PackageDocument(self.ws.size)
-        elif self.ws.doc_gen == 'incompressible':
-            self.docs = IncompressibleString(self.ws.size)
-        elif self.ws.doc_gen == 'big_fun':
-            self.docs = BigFunDocument()
-        elif self.ws.doc_gen == 'multibucket':
-            self.docs = MultiBucketDocument(self.ws.size)
-        elif self.ws.doc_gen == 'advancedfilter':
-            self.docs = AdvFilterDocument(self.ws.size)
-        elif self.ws.doc_gen == 'advancedfilterxattr':
-            self.docs = AdvFilterXattrBody(self.ws.size)
+        if self.DATASET and getattr(self.ws, 'dataset_dir', None):
+            self.docs = Dataset(dataset_file(self.ws, self.ts))
+            return
+
+        self.docs = new_doc_generator(getattr(self.ws, 'doc_gen', 'basic'),
+                                      self.ws, self.ts)
+
+        if self.RAW_DOCS and getattr(self.ws, 'doc_cache', False) and \
+                DocumentCache.supports(self.docs):
+            self.docs = DocumentCache(self.docs)
 
     def init_db(self):
+        try:
+            self.cb = self.new_client()
+        except Exception as e:
+            raise SystemExit(e)
+
+    @property
+    def memcached(self) -> bool:
+        return self.MEMCACHED and getattr(self.ws, 'kv_engine', 'sdk') == 'memcached'
+
+    def new_client(self) -> CBGen:
+        if self.memcached:
+            return MCGen(bucket=self.ts.bucket, host=self.ts.node, password=self.ts.password)
+
         params = {
             'bucket': self.ts.bucket,
             'host': self.ts.node,
@@ -231,22 +181,35 @@ class Worker:
             'password': self.ts.password,
             'ssl_mode': self.ws.ssl_mode,
             'n1ql_timeout': self.ws.n1ql_timeout,
-            'connstr_params': self.ws.connstr_params
+            'connstr_params': self.ws.connstr_params,
+            'raw_docs': isinstance(self.docs, (DocumentCache, Dataset)),
         }
+        return CBGen(**params)
 
-        try:
-            self.cb = CBGen(**params)
-        except Exception as e:
-            raise SystemExit(e)
+    def new_aio_client(self) -> Union[CBAIOGen, MCAIOGen]:
+        if self.memcached:
+            return MCAIOGen(**self.params)
+        return CBAIOGen(**self.params)
 
     def init_creds(self):
-        for bucket in getattr(self.ws, 'buckets', []):
-            self.cb.client.add_bucket_creds(bucket, self.ts.password)
+        """Grant the SDK client access to the other buckets for N1QL queries.
+
+        The async workers and the memcached engine only access their own
+        bucket.
+        """
+        if isinstance(getattr(self, 'cb', None), CBGen):
+            self.add_creds(self.cb)
 
-    def report_progress(self, curr_ops):  # only first worker
-        if not self.sid and self.ws.ops < float('inf') and \
-                curr_ops > self.next_report * self.ws.ops:
-            progress = 100.0 * curr_ops / self.ws.ops
+    def add_creds(self, cb: CBGen):
+        for bucket in getattr(self.ws, 'buckets', []):
+            cb.client.add_bucket_creds(bucket, self.ts.password)
+
+    def report_progress(self, curr_ops: SequenceCounter):  # only first worker
+        if self.sid or self.ws.ops == float('inf'):
+            return
+        completed_ops = curr_ops.watermark
+        if completed_ops > self.next_report * self.ws.ops:
+            progress = 100.0 * completed_ops / self.ws.ops
             self.next_report += 0.05
             logger.info('Current progress: {:.2f} %'.format(progress))
 
@@ -258,10 +221,12 @@ class Worker:
         random.seed(seed=self.sid * 9901)
 
     def dump_stats(self):
-        self.reservoir.dump(filename='{}-{}'.format(self.NAME, self.sid))
+        self.histograms.dump(filename='{}-{}'.format(self.NAME, self.sid))
+        error_tracker.dump(filename=error_log(self.NAME, self.sid),
+                           bucket=self.ts.bucket)
 
 
-Client = Union[CBAsyncGen, CBGen, SubDocGen]
+Client = Union[CBAIOGen, CBAsyncGen, CBGen, MCAIOGen, MCGen, SubDocGen]
 
 Sequence = List[Tuple[str, Callable, Tuple]]
 
@@ -270,9 +235,15 @@ class KVWorker(Worker):
 
     NAME = 'kv-worker'
 
+    MEMCACHED = True
+
+    LEASE_BATCHES = 100  # Number of batches leased at once
+
+    MULTI_OPS = True  # Whether the client supports multi-key operations
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.reservoir = Reservoir(num_workers=self.ws.workers)
+        self.histograms = HistogramRecorder(telemetry=self.telemetry)
 
     @property
     def random_ops(self) -> List[str]:
@@ -285,9 +256,7 @@ class KVWorker(Worker):
         random.shuffle(ops)
         return ops
 
-    def create_args(self, cb: Client,
-                    curr_items: int) -> Sequence:
-        key = self.new_keys.next(curr_items)
+    def create_args(self, cb: Client, key: Key) -> Sequence:
         doc = self.docs.next(key)
         if self.ws.durability:
             args = key.string, doc, self.ws.durability, self.ws.ttl
@@ -296,19 +265,12 @@ class KVWorker(Worker):
             args = key.string, doc, self.ws.persist_to, self.ws.replicate_to, self.ws.ttl
             return [('set', cb.update, args)]
 
-    def read_args(self, cb: Client,
-                  curr_items: int, deleted_items: int) -> Sequence:
-        key = self.existing_keys.next(curr_items, deleted_items)
+    def read_args(self, cb: Client, key: Key) -> Sequence:
         args = key.string,
 
         return [('get', cb.read, args)]
 
-    def update_args(self, cb: Client,
-                    curr_items: int, deleted_items: int) -> Sequence:
-        key = self.existing_keys.next(curr_items,
-                                      deleted_items,
-                                      self.current_hot_load_start,
-                                      self.timer_elapse)
+    def update_args(self, cb: Client, key: Key) -> Sequence:
         doc = self.docs.next(key)
         if self.ws.durability:
             args = key.string, doc, self.ws.durability, self.ws.ttl
@@ -317,76 +279,164 @@ class KVWorker(Worker):
             args = key.string, doc, self.ws.persist_to, self.ws.replicate_to, self.ws.ttl
             return [('set', cb.update, args)]
 
-    def delete_args(self, cb: Client,
-                    deleted_items: int) -> Sequence:
-        key = self.keys_for_removal.next(deleted_items)
+    def delete_args(self, cb: Client, key: Key) -> Sequence:
         args = key.string,
 
         return [('delete', cb.delete, args)]
 
-    def modify_args(self, cb: Client,
-                    curr_items: int, deleted_items: int) -> Sequence:
-        key = self.existing_keys.next(curr_items, deleted_items)
+    def modify_args(self, cb: Client, key: Key) -> Sequence:
         doc = self.docs.next(key)
         read_args = key.string,
         update_args = key.string, doc, self.ws.persist_to, self.ws.replicate_to, self.ws.ttl
 
         return [('get', cb.read, read_args), ('set', cb.update, update_args)]
 
-    def gen_cmd_sequence(self, cb: Client = None) -> Sequence:
-        if not cb:
-            cb = self.cb
-
-        curr_items = self.ws.items
+    def gen_ops(self) -> List[Tuple[str, Key]]:
+        """Draw the operations of the next batch and their keys."""
+        curr_items = existing_items = self.ws.items
         if self.ws.creates:
-            with self.lock:
-                curr_items = self.curr_items.value
-                self.curr_items.value += self.ws.creates
+            curr_items = self.items_lease.take(self.ws.creates)
+            existing_items = self.curr_items.watermark
 
-        deleted_items = 0
+        deleted_items = existing_deletes = 0
         if self.ws.deletes:
-            with self.lock:
-                deleted_items = self.deleted_items.value + \
-                    self.ws.deletes * self.ws.workers
-                self.deleted_items.value += self.ws.deletes
-
-        cmds = []
-        for op in self.random_ops:
+            margin = self.ws.deletes * self.ws.workers
+            deleted_items = self.deletes_lease.take(self.ws.deletes) + margin
+            # Other workers might have deleted any key of their leases
+            existing_deletes = self.deleted_items.value + margin
+
+        ops = self.random_ops
+        existing_keys = iter(self.existing_key_batch(ops,
+                                                     existing_items,
+                                                     existing_deletes))
+
+        keys = []
+        for op in ops:
             if op == 'c':
-                cmds += self.create_args(cb, curr_items)
+                keys.append(self.new_keys.next(curr_items))
                 curr_items += 1
-            elif op == 'r':
-                cmds += self.read_args(cb, curr_items, deleted_items)
-            elif op == 'u':
-                cmds += self.update_args(cb, curr_items, deleted_items)
             elif op == 'd':
-                cmds += self.delete_args(cb, deleted_items)
+                keys.append(self.keys_for_removal.next(deleted_items))
                 deleted_items += 1
-            elif op == 'm':
-                cmds += self.modify_args(cb, curr_items, deleted_items)
+            else:
+                keys.append(next(existing_keys))
+        return list(zip(ops, keys))
+
+    def op_args(self, cb: Client, op: str, key: Key) -> Sequence:
+        if op == 'c':
+            return self.create_args(cb, key)
+        elif op == 'r':
+            return self.read_args(cb, key)
+        elif op == 'u':
+            return self.update_args(cb, key)
+        elif op == 'd':
+            return self.delete_args(cb, key)
+        elif op == 'm':
+            return self.modify_args(cb, key)
+
+    def gen_cmd_sequence(self, cb: Client = None) -> Sequence:
+        if not cb:
+            cb = self.cb
+
+        cmds = []
+        for op, key in self.gen_ops():
+            cmds += self.op_args(cb, op, key)
         return cmds
 
-    @with_sleep
+    def existing_key_batch(self, ops: List[str], curr_items: int,
+                           deleted_items: int) -> List[Key]:
+        """Draw the keys for all read/update operations in a single call.
+
+        The lower key space boundary is the end of the delete ranges leased by
+        all workers. The upper boundary is the watermark of created keys.
+        """
+        num_keys = sum(op in 'rum' for op in ops)
+        if not num_keys:
+            return []
+
+        numbers = self.existing_keys.next_batch(num_keys,
+                                                curr_items,
+                                                deleted_items,
+                                                self.current_hot_load_start,
+                                                self.timer_elapse)
+        numbers = numbers.tolist()
+        strings = format_keys(numbers, self.ts.prefix, self.ws.key_fmtr)
+        return [Key(number=number, prefix=self.ts.prefix, fmtr=self.ws.key_fmtr,
+                    string=string)
+                for number, string in zip(numbers, strings)]
+
     def do_batch(self, *args, **kwargs):
-        for cmd, func, args in self.gen_cmd_sequence():
+        if self.ws.multi_batch_size and self.MULTI_OPS:
+            self.do_multi_batch()
+            return
+
+        cmds = self.gen_cmd_sequence()
+        self.rate_limiter.acquire(len(cmds))
+        for cmd, func, args in cmds:
             latency = func(*args)
             if latency is not None:
-                self.reservoir.update(operation=cmd, value=latency)
-
-    def run_condition(self, curr_ops):
-        return curr_ops.value < self.ws.ops and not self.time_to_stop()
+                self.histograms.update(operation=cmd, value=latency)
+
+    def do_multi_batch(self):
+        """Group the commands by type and run them as multi-key operations.
+
+        The latency of every multi-key call is recorded as "m<cmd>". The
+        latency amortized over the keys of the call is recorded once per key
+        under the regular operation name.
+        """
+        cmds = self.gen_cmd_sequence()
+        self.rate_limiter.acquire(len(cmds))
+
+        groups = defaultdict(list)
+        for cmd, func, args in cmds:
+            groups[cmd, func.__name__].append(args)
+
+        for (cmd, method), args in groups.items():
+            func = getattr(self.cb, '{}_multi'.format(method))
+            for chunk in multi_chunks(args, self.ws.multi_batch_size):
+                latency = func(chunk)
+                if latency is not None:
+                    self.histograms.update(operation='m' + cmd, value=latency)
+                    self.histograms.update(operation=cmd, value=latency / len(chunk),
+                                           count=len(chunk))
+
+    def init_leases(self, curr_ops: SequenceCounter,
+                    curr_items: SequenceCounter, deleted_items: SequenceCounter):
+        self.curr_ops = curr_ops
+        self.curr_items = curr_items
+        self.deleted_items = deleted_items
 
-    def run(self, sid, lock, curr_ops, curr_items, deleted_items,
+        self.ops_lease = Lease(curr_ops)
+        self.items_lease = Lease(curr_items)
+        self.deletes_lease = Lease(deleted_items)
+
+    def next_batch(self) -> bool:
+        """Claim the next batch of operations.
+
+        The operations, new keys and deleted keys of many batches are leased
+        together, so that the key ranges are fully used when the operation
+        budget runs out.
+        """
+        if not self.ops_lease.remaining:
+            ops = self.ops_lease.renew(self.LEASE_BATCHES * self.ws.spring_batch_size,
+                                       unit=self.ws.spring_batch_size)
+            if not ops:
+                return False
+            batches = ops // self.ws.spring_batch_size
+            self.items_lease.renew(batches * self.ws.creates)
+            self.deletes_lease.renew(batches * self.ws.deletes)
+
+        self.ops_lease.take(self.ws.spring_batch_size)
+        return True
+
+    def release_leases(self):
+        for lease in self.ops_lease, self.items_lease, self.deletes_lease:
+            lease.release()
+
+    def run(self, sid, curr_ops, curr_items, deleted_items,
             current_hot_load_start=None, timer_elapse=None):
-        if self.ws.throughput < float('inf'):
-            self.target_time = float(self.ws.spring_batch_size) * self.ws.workers / \
-                self.ws.throughput
-        else:
-            self.target_time = None
         self.sid = sid
-        self.lock = lock
-        self.curr_items = curr_items
-        self.deleted_items = deleted_items
+        self.init_leases(curr_ops, curr_items, deleted_items)
         self.current_hot_load_start = current_hot_load_start
         self.timer_elapse = timer_elapse
 
@@ -394,16 +444,15 @@ class KVWorker(Worker):
 
         logger.info('Started: {}-{}'.format(self.NAME, self.sid))
         try:
-            while self.run_condition(curr_ops):
-                with lock:
-                    curr_ops.value += self.ws.spring_batch_size
+            while not self.time_to_stop() and self.next_batch():
                 self.do_batch()
-                self.report_progress(curr_ops.value)
+                self.report_progress(curr_ops)
         except KeyboardInterrupt:
             logger.info('Interrupted: {}-{}'.format(self.NAME, self.sid))
         else:
             logger.info('Finished: {}-{}'.format(self.NAME, self.sid))
 
+        self.release_leases()
         self.dump_stats()
 
 
@@ -411,6 +460,10 @@ class SubDocWorker(KVWorker):
 
     NAME = 'sub-doc-worker'
 
+    RAW_DOCS = False
+
+    MULTI_OPS = False
+
     def init_db(self):
         params = {'bucket': self.ts.bucket,
                   'host': self.ts.node,
@@ -421,19 +474,12 @@ class SubDocWorker(KVWorker):
 
         self.cb = SubDocGen(**params)
 
-    def read_args(self, cb: Client,
-                  curr_items: int, deleted_items: int) -> Sequence:
-        key = self.existing_keys.next(curr_items, deleted_items)
+    def read_args(self, cb: Client, key: Key) -> Sequence:
         read_args = key.string, self.ws.subdoc_field
 
         return [('get', cb.read, read_args)]
 
-    def update_args(self, cb: Client,
-                    curr_items: int, deleted_items: int) -> Sequence:
-        key = self.existing_keys.next(curr_items,
-                                      deleted_items,
-                                      self.current_hot_load_start,
-                                      self.timer_elapse)
+    def update_args(self, cb: Client, key: Key) -> Sequence:
         doc = self.docs.next(key)
         update_args = key.string, self.ws.subdoc_field, doc
 
@@ -444,18 +490,10 @@ class XATTRWorker(SubDocWorker):
 
     NAME = 'xattr-worker'
 
-    def read_args(self, cb: Client,
-                  curr_items: int, deleted_items: int) -> Sequence:
-        key = self.existing_keys.next(curr_items, deleted_items)
-
+    def read_args(self, cb: Client, key: Key) -> Sequence:
         return [('get', cb.read_xattr, (key.string, self.ws.xattr_field))]
 
-    def update_args(self, cb: Client,
-                    curr_items: int, deleted_items: int) -> Sequence:
-        key = self.existing_keys.next(curr_items,
-                                      deleted_items,
-                                      self.current_hot_load_start,
-                                      self.timer_elapse)
+    def update_args(self, cb: Client, key: Key) -> Sequence:
         doc = self.docs.next(key)
         update_args = key.string, self.ws.xattr_field, doc
 
@@ -466,6 +504,8 @@ class AsyncKVWorker(KVWorker):
 
     NAME = 'async-kv-worker'
 
+    RAW_DOCS = False
+
     NUM_CONNECTIONS = 8
 
     def init_db(self):
@@ -478,30 +518,24 @@ class AsyncKVWorker(KVWorker):
     def restart(self, _, cb, i):
         self.counter[i] += 1
         if self.counter[i] == self.ws.spring_batch_size:
-            actual_time = time.time() - self.time_started
-            if self.target_time is not None:
-                delta = self.target_time - actual_time
-                if delta > 0:
-                    time.sleep(self.CORRECTION_FACTOR * delta)
-
-            self.report_progress(self.curr_ops.value)
-            if not self.done and (
-                    self.curr_ops.value >= self.ws.ops or self.time_to_stop()):
-                with self.lock:
-                    self.done = True
-                logger.info('Finished: {}-{}'.format(self.NAME, self.sid))
-                reactor.stop()
-            else:
-                self.do_batch(_, cb, i)
+            self.report_progress(self.curr_ops)
+            self.do_batch(_, cb, i)
 
     def do_batch(self, _, cb, i):
-        self.counter[i] = 0
-        self.time_started = time.time()
+        if self.done:
+            return
+        if self.time_to_stop() or not self.next_batch():
+            self.done = True
+            self.release_leases()
+            logger.info('Finished: {}-{}'.format(self.NAME, self.sid))
+            reactor.stop()
+            return
 
-        with self.lock:
-            self.curr_ops.value += self.ws.spring_batch_size
+        self.counter[i] = 0
 
-        for _, func, args in self.gen_cmd_sequence(cb):
+        cmds = self.gen_cmd_sequence(cb)
+        self.rate_limiter.acquire(len(cmds))
+        for _, func, args in cmds:
             d = func(*args)
             d.addCallback(self.restart, cb, i)
             d.addErrback(self.log_and_restart, cb, i)
@@ -523,21 +557,10 @@ class AsyncKVWorker(KVWorker):
         d.addCallback(self.do_batch, cb, i)
         d.addErrback(self.error, cb, i)
 
-    def run(self, sid, lock, curr_ops, curr_items, deleted_items,
+    def run(self, sid, curr_ops, curr_items, deleted_items,
             current_hot_load_start=None, timer_elapse=None):
-        set_cpu_afinity(sid)
-
-        if self.ws.throughput < float('inf'):
-            self.target_time = (self.ws.spring_batch_size * self.ws.workers /
-                                float(self.ws.throughput))
-        else:
-            self.target_time = None
-
         self.sid = sid
-        self.lock = lock
-        self.curr_items = curr_items
-        self.deleted_items = deleted_items
-        self.curr_ops = curr_ops
+        self.init_leases(curr_ops, curr_items, deleted_items)
         self.current_hot_load_start = current_hot_load_start
         self.timer_elapse = timer_elapse
 
@@ -552,17 +575,215 @@ class AsyncKVWorker(KVWorker):
         reactor.run()
 
 
+class OpenLoopKVWorker(KVWorker):
+
+    """Issue operations at a fixed arrival rate using an asyncio event loop.
+
+    Unlike the closed-loop workers, the next operation does not wait for the
+    previous ones to complete. Every operation is scheduled at its intended
+    send time and its latency is measured from that time rather than from the
+    actual send time. If the server cannot keep up, the queueing delay is
+    reported as latency instead of silently lowering the request rate (i.e.,
+    latencies are corrected for coordinated omission).
+
+    The number of outstanding operations is capped by the "in_flight"
+    setting. When the cap is reached, new operations wait for a free slot,
+    which also counts towards their latency.
+    """
+
+    NAME = 'open-loop-kv-worker'
+
+    RAW_DOCS = False
+
+    BURST = float('inf')  # Missed operations are never skipped
+
+    def init_db(self):
+        self.params = {'bucket': self.ts.bucket, 'host': self.ts.node,
+                       'password': self.ts.password,
+                       'raw_docs': isinstance(self.docs, Dataset)}
+
+    async def do_op(self, cmd: str, func: Callable, args: Tuple,
+                    intended_time: float, in_flight: asyncio.Semaphore):
+        try:
+            await func(*args)
+        except CouchbaseError as e:
+            error_tracker.track(func.__name__, e)
+        else:
+            error_tracker.succeed(func.__name__)
+            self.histograms.update(operation=cmd,
+                                   value=time.time() - intended_time)
+        finally:
+            in_flight.release()
+
+    async def do_batches(self):
+        cb = self.new_aio_client()
+        await cb.connect()
+
+        in_flight = asyncio.Semaphore(self.ws.in_flight)
+        pending = set()
+
+        while not self.time_to_stop() and self.next_batch():
+            cmds = self.gen_cmd_sequence(cb)
+            start = self.rate_limiter.reserve(len(cmds))
+            interval = self.rate_limiter.interval.value
+            for i, (cmd, func, args) in enumerate(cmds):
+                intended_time = start + i * interval
+                delay = intended_time - time.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                await in_flight.acquire()
+                op = asyncio.ensure_future(
+                    self.do_op(cmd, func, args, intended_time, in_flight)
+                )
+                pending.add(op)
+                op.add_done_callback(pending.discard)
+
+            self.report_progress(self.curr_ops)
+
+        if pending:
+            await asyncio.wait(pending)
+
+    def run(self, sid, curr_ops, curr_items, deleted_items,
+            current_hot_load_start=None, timer_elapse=None):
+        self.sid = sid
+        self.init_leases(curr_ops, curr_items, deleted_items)
+        self.current_hot_load_start = current_hot_load_start
+        self.timer_elapse = timer_elapse
+
+        self.seed()
+
+        logger.info('Started: {}-{}'.format(self.NAME, self.sid))
+        loop = asyncio.get_event_loop()
+        try:
+            loop.run_until_complete(self.do_batches())
+        except KeyboardInterrupt:
+            logger.info('Interrupted: {}-{}'.format(self.NAME, self.sid))
+        else:
+            logger.info('Finished: {}-{}'.format(self.NAME, self.sid))
+
+        self.release_leases()
+        self.dump_stats()
+
+
+class TraceRecordWorker(KVWorker):
+
+    """Run the regular KV workload and record every operation to a trace.
+
+    In offline mode the operations are generated but not executed, so traces
+    can be prepared without a cluster. The intended times then follow the
+    target throughput.
+    """
+
+    NAME = 'trace-record-worker'
+
+    MULTI_OPS = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sizes = DocumentSizes(self.docs)
+
+    def init_db(self):
+        if not self.ws.trace_offline:
+            super().init_db()
+
+    def do_batch(self, *args, **kwargs):
+        for op, key in self.gen_ops():
+            self.sizes.last = 0
+            if self.ws.trace_offline:
+                if op in 'cum':
+                    self.docs.next(key)  # Draws the same random numbers
+                cmds = []
+            else:
+                cmds = self.op_args(self.cb, op, key)
+
+            intended_time = self.rate_limiter.reserve(2 if op == 'm' else 1)
+            self.trace.append(op, key.number, self.sizes.last, intended_time)
+
+            delay = intended_time - time.time()
+            if cmds and delay > 0:
+                time.sleep(delay)
+
+            for cmd, func, args in cmds:
+                latency = func(*args)
+                if latency is not None:
+                    self.histograms.update(operation=cmd, value=latency)
+
+    def run(self, sid, *args, **kwargs):
+        self.trace = TraceWriter(trace_file(self.ws.trace_record, sid),
+                                 start_time=time.time())
+        try:
+            super().run(sid, *args, **kwargs)
+        finally:
+            self.trace.close()
+
+
+class TraceReplayWorker(KVWorker):
+
+    """Replay a recorded trace through the regular client code paths.
+
+    The trace is streamed from disk. The intended times are divided by the
+    replay speed, e.g., 2 replays the trace twice as fast and 0 issues the
+    operations back to back.
+    """
+
+    NAME = 'trace-replay-worker'
+
+    MULTI_OPS = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sizes = DocumentSizes(self.docs)
+
+    def replay(self):
+        speed = self.ws.trace_speed
+        t0 = time.time()
+        trace = TraceReader(trace_file(self.ws.trace_replay, self.sid))
+        for op, number, size, intended_time in trace:
+            if self.time_to_stop():
+                break
+
+            if speed:
+                delay = t0 + intended_time / speed - time.time()
+                if delay > 0:
+                    time.sleep(delay)
+
+            key = Key(number=number, prefix=self.ts.prefix, fmtr=self.ws.key_fmtr)
+            self.sizes.forced = size
+            for cmd, func, args in self.op_args(self.cb, op, key):
+                latency = func(*args)
+                if latency is not None:
+                    self.histograms.update(operation=cmd, value=latency)
+
+    def run(self, sid, *args, **kwargs):
+        self.sid = sid
+
+        logger.info('Started: {}-{}'.format(self.NAME, self.sid))
+        try:
+            self.replay()
+        except KeyboardInterrupt:
+            logger.info('Interrupted: {}-{}'.format(self.NAME, self.sid))
+        else:
+            logger.info('Finished: {}-{}'.format(self.NAME, self.sid))
+
+        self.dump_stats()
+
+
 class HotReadsWorker(Worker):
 
-    def run(self, sid, *args):
-        set_cpu_afinity(sid)
+    MEMCACHED = True
 
+    def run(self, sid, *args):
         for key in HotKey(sid, self.ws, self.ts.prefix):
             self.cb.read(key.string)
 
 
 class SeqUpsertsWorker(Worker):
 
+    DATASET = True
+
+    MEMCACHED = True
+
     def run(self, sid, *args):
         for key in SequentialKey(sid, self.ws, self.ts.prefix):
             doc = self.docs.next(key)
@@ -577,14 +798,219 @@ class SeqXATTRUpdatesWorker(XATTRWorker):
             self.cb.update_xattr(key.string, self.ws.xattr_field, doc)
 
 
+class BulkLoadWorker(Worker):
+
+    """Load documents with pipelined asynchronous upserts.
+
+    Every worker loads the same keys as SeqUpsertsWorker, but keeps up to
+    "in_flight" upserts outstanding. Upon every CHECKPOINT_INTERVAL completed
+    items the worker persists its progress, so that a rerun of the same load
+    skips the completed part of the key space.
+
+    Upserts that fail with a permanent error are listed in the checkpoint
+    rather than counted as loaded, and a rerun retries them first. The
+    checkpoint is removed once the worker has loaded every item.
+    """
+
+    NAME = 'bulk-load-worker'
+
+    RAW_DOCS = False
+
+    DATASET = True
+
+    MEMCACHED = True
+
+    CHECKPOINT_INTERVAL = 10 ** 4  # items
+
+    REPORT_INTERVAL = 10  # seconds
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.histograms = HistogramRecorder(telemetry=self.telemetry)
+
+    def init_db(self):
+        self.params = {'bucket': self.ts.bucket, 'host': self.ts.node,
+                       'password': self.ts.password,
+                       'raw_docs': isinstance(self.docs, Dataset)}
+        self.failed = []  # type: List[int]
+
+    @property
+    def checkpoint_file(self) -> str:
+        """The name must not match the pattern of the histogram logs (*-worker-*)."""
+        return '{}.{}.{}.checkpoint'.format(self.NAME, self.ts.bucket, self.sid)
+
+    @property
+    def load_config(self) -> dict:
+        return {
+            'node': self.ts.node,
+            'prefix': self.ts.prefix,
+            'items': self.ws.items,
+            'workers': self.ws.workers,
+            'key_fmtr': self.ws.key_fmtr,
+            'doc_gen': self.ws.doc_gen,
+            'size': self.ws.size,
+        }
+
+    def read_checkpoint(self) -> int:
+        """Return the number of items processed by a previous run, if any.
+
+        The items that failed in the previous run are restored as well.
+        """
+        try:
+            with open(self.checkpoint_file) as fh:
+                checkpoint = json.load(fh)
+        except (OSError, ValueError):
+            return 0
+        if checkpoint['config'] != self.load_config:
+            return 0
+        self.failed = checkpoint['failed']
+        return checkpoint['items']
+
+    def write_checkpoint(self, items: int):
+        tmp_file = self.checkpoint_file + '.tmp'
+        with open(tmp_file, 'w') as fh:
+            json.dump({'config': self.load_config, 'items': items, 'failed': self.failed}, fh)
+        os.replace(tmp_file, self.checkpoint_file)
+
+    def complete(self, items: int, ops: List[Tuple[int, asyncio.Future]]):
+        """Checkpoint a chunk of completed upserts."""
+        self.failed += [number for number, op in ops if not op.result()]
+        self.write_checkpoint(items)
+
+    async def upsert(self, cb: CBAIOGen, key: Key, doc, in_flight: asyncio.Semaphore) -> bool:
+        retry_delay = 0.1
+        try:
+            while True:
+                t0 = time.time()
+                try:
+                    await cb.update(key.string, doc)
+                    error_tracker.succeed('update')
+                    self.histograms.update(operation='set', value=time.time() - t0)
+                    return True
+                except TemporaryFailError:
+                    error_tracker.retry('update', retry_delay)
+                    await asyncio.sleep(retry_delay)
+                    retry_delay *= 1 + 0.1 * random.random()
+                except CouchbaseError as e:
+                    error_tracker.track('update', e)
+                    return False
+        finally:
+            in_flight.release()
+
+    async def start_upsert(self, cb: CBAIOGen, number: int,
+                           in_flight: asyncio.Semaphore) -> asyncio.Future:
+        """Issue the upsert once the throughput and in-flight limits allow it."""
+        key = Key(number=number, prefix=self.ts.prefix, fmtr=self.ws.key_fmtr)
+        doc = self.docs.next(key)
+
+        delay = self.rate_limiter.reserve() - time.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await in_flight.acquire()
+        return asyncio.ensure_future(self.upsert(cb, key, doc, in_flight))
+
+    def report_rate(self, timestamp: float, items: int, curr_items: int) -> Tuple[float, int]:
+        """Periodically log the load rate of the first worker."""
+        now = time.time()
+        if self.sid or now - timestamp < self.REPORT_INTERVAL:
+            return timestamp, items
+        logger.info('Loading rate: {:.0f} items/sec per worker'
+                    .format((curr_items - items) / (now - timestamp)))
+        return now, curr_items
+
+    async def retry_failed(self, cb: CBAIOGen, in_flight: asyncio.Semaphore):
+        """Retry the items that failed in the previous run."""
+        logger.info('Retrying {} failed items'.format(len(self.failed)))
+        ops = []
+        for number in self.failed:
+            ops.append((number, await self.start_upsert(cb, number, in_flight)))
+        await asyncio.wait([op for _, op in ops])
+        self.failed = [number for number, op in ops if not op.result()]
+
+    async def load(self, skip: int):
+        cb = self.new_aio_client()
+        await cb.connect()
+
+        in_flight = asyncio.Semaphore(self.ws.in_flight)
+        if self.failed:
+            await self.retry_failed(cb, in_flight)
+
+        chunks = deque()  # (items processed upon completion, [(number, upsert)])
+        chunk = []
+        last_report = time.time(), skip
+
+        first_number = self.sid + skip * self.ws.workers
+        numbers = range(first_number, self.ws.items, self.ws.workers)
+        for i, number in enumerate(numbers, start=skip + 1):
+            if self.time_to_stop():
+                break
+
+            chunk.append((number, await self.start_upsert(cb, number, in_flight)))
+
+            if len(chunk) == self.CHECKPOINT_INTERVAL:
+                chunks.append((i, chunk))
+                chunk = []
+                while chunks and all(op.done() for _, op in chunks[0][1]):
+                    self.complete(*chunks.popleft())
+
+            last_report = self.report_rate(*last_report, curr_items=i)
+        else:
+            if chunk:
+                chunks.append((skip + len(numbers), chunk))
+                chunk = []
+
+        for items, ops in chunks:
+            await asyncio.wait([op for _, op in ops])
+            self.complete(items, ops)
+
+        if chunk:  # The last chunk was interrupted, no checkpoint
+            await asyncio.wait([op for _, op in chunk])
+        elif self.failed:
+            logger.warn('Failed to load {} items, rerun the load to retry them'
+                        .format(len(self.failed)))
+        elif os.path.exists(self.checkpoint_file):
+            os.remove(self.checkpoint_file)
+
+    def run(self, sid, *args):
+        self.sid = sid
+
+        skip = self.read_checkpoint()
+        if skip:
+            logger.info('Resuming {}-{} after {} items'.format(self.NAME, sid, skip))
+
+        logger.info('Started: {}-{}'.format(self.NAME, self.sid))
+        loop = asyncio.get_event_loop()
+        try:
+            loop.run_until_complete(self.load(skip))
+        except KeyboardInterrupt:
+            logger.info('Interrupted: {}-{}'.format(self.NAME, self.sid))
+        else:
+            logger.info('Finished: {}-{}'.format(self.NAME, self.sid))
+
+        self.dump_stats()
+
+
 class WorkerFactory:
 
     def __new__(cls, settings):
-        if getattr(settings, 'async', None):
+        if getattr(settings, 'trace_replay', None):
+            num_traces = count_traces(settings.trace_replay)
+            if num_traces != settings.workers:
+                logger.interrupt('Found {} trace files for {} replay workers'
+                                 .format(num_traces, settings.workers))
+            worker = TraceReplayWorker
+        elif getattr(settings, 'trace_record', None):
+            worker = TraceRecordWorker
+        elif getattr(settings, 'open_loop', None):
+            worker = OpenLoopKVWorker
+        elif getattr(settings, 'async', None):
             worker = AsyncKVWorker
         elif getattr(settings, 'seq_upserts') and \
                 getattr(settings, 'xattr_field', None):
             worker = SeqXATTRUpdatesWorker
+        elif getattr(settings, 'seq_upserts') and \
+                getattr(settings, 'bulk_load', None):
+            worker = BulkLoadWorker
         elif getattr(settings, 'seq_upserts', None):
             worker = SeqUpsertsWorker
         elif getattr(settings, 'hot_reads', None):
@@ -608,10 +1034,20 @@ class ViewWorker(Worker):
 
     NAME = 'query-worker'
 
-    def __init__(self, workload_settings, target_settings, shutdown_event):
-        super().__init__(workload_settings, target_settings, shutdown_event)
+    RAW_DOCS = False  # Documents are used to build queries
+
+    THROUGHPUT = 'query_throughput'
 
-        self.reservoir = Reservoir(num_workers=self.ws.query_workers)
+    def __init__(self, workload_settings, target_settings, shutdown_event,
+                 rate_limiter=None, telemetry=None):
+        super().__init__(workload_settings, target_settings, shutdown_event,
+                         rate_limiter, telemetry)
+
+        self.histograms = HistogramRecorder(telemetry=self.telemetry)
+        self.lock = Lock()
+
+        self.query_pool = QueryPool(size=workload_settings.query_concurrency,
+                                    client=self.cb, new_client=self.new_client)
 
         if workload_settings.index_type is None:
             self.new_queries = ViewQueryGen(workload_settings.ddocs,
@@ -620,28 +1056,25 @@ class ViewWorker(Worker):
             self.new_queries = ViewQueryGenByType(workload_settings.index_type,
                                                   workload_settings.query_params)
 
-    @with_sleep
     def do_batch(self):
-        curr_items_spot = \
-            self.curr_items.value - self.ws.creates * self.ws.workers
+        curr_items_spot = self.curr_items.watermark
         deleted_spot = \
             self.deleted_items.value + self.ws.deletes * self.ws.workers
 
+        self.rate_limiter.acquire(self.ws.spring_batch_size)
         for _ in range(self.ws.spring_batch_size):
             key = self.existing_keys.next(curr_items_spot, deleted_spot)
             doc = self.docs.next(key)
             ddoc_name, view_name, query = self.new_queries.next(doc)
 
-            latency = self.cb.view_query(ddoc_name, view_name, query=query)
+            self.query_pool.submit(self.execute, ddoc_name, view_name, query)
 
-            self.reservoir.update(operation='query', value=latency)
+    def execute(self, cb: CBGen, ddoc_name: str, view_name: str, query):
+        latency = cb.view_query(ddoc_name, view_name, query=query)
+        with self.lock:  # The queries may run in the pool threads
+            self.histograms.update(operation='query', value=latency)
 
-    def run(self, sid, lock, curr_ops, curr_items, deleted_items, *args):
-        if self.ws.query_throughput < float('inf'):
-            self.target_time = float(self.ws.spring_batch_size) * self.ws.query_workers / \
-                self.ws.query_throughput
-        else:
-            self.target_time = None
+    def run(self, sid, curr_ops, curr_items, deleted_items, *args):
         self.sid = sid
         self.curr_items = curr_items
         self.deleted_items = deleted_items
@@ -655,6 +1088,7 @@ class ViewWorker(Worker):
         else:
             logger.info('Finished: {}-{}'.format(self.NAME, self.sid))
 
+        self.query_pool.shutdown()
         self.dump_stats()
 
 
@@ -668,15 +1102,33 @@ class N1QLWorker(Worker):
 
     NAME = 'query-worker'
 
-    def __init__(self, workload_settings, target_settings, shutdown_event=None):
-        super().__init__(workload_settings, target_settings, shutdown_event)
+    RAW_DOCS = False  # Documents are used to build queries
+
+    THROUGHPUT = 'n1ql_throughput'
+
+    LEASE_BATCHES = 10  # Number of create batches leased at once
+
+    def __init__(self, workload_settings, target_settings, shutdown_event=None,
+                 rate_limiter=None, telemetry=None):
+        super().__init__(workload_settings, target_settings, shutdown_event,
+                         rate_limiter, telemetry)
 
         self.new_queries = N1QLQueryGen(workload_settings.n1ql_queries)
 
-        self.reservoir = Reservoir(num_workers=self.ws.n1ql_workers)
+        self.histograms = HistogramRecorder(telemetry=self.telemetry)
+        self.lock = Lock()
+
+        self.query_pool = QueryPool(size=workload_settings.n1ql_concurrency,
+                                    client=self.cb, new_client=self.new_query_client)
 
-    def read(self):
-        curr_items = self.curr_items.value
+    def new_query_client(self) -> CBGen:
+        """Open the connection of a pool thread with the same credentials."""
+        cb = self.new_client()
+        self.add_creds(cb)
+        return cb
+
+    def read(self) -> Iterator[N1QLQuery]:
+        curr_items = self.curr_items.watermark
         if self.ws.doc_gen == 'ext_reverse_lookup':
             curr_items //= 4
 
@@ -684,56 +1136,54 @@ class N1QLWorker(Worker):
             key = self.existing_keys.next(curr_items=curr_items,
                                           curr_deletes=0)
             doc = self.docs.next(key)
-            query = self.new_queries.next(key.string, doc)
-
-            latency = self.cb.n1ql_query(query)
-            self.reservoir.update(operation='query', value=latency)
+            yield self.new_queries.next(key.string, doc)
 
-    def create(self):
-        with self.lock:
-            curr_items = self.curr_items.value
-            self.curr_items.value += self.ws.n1ql_batch_size
+    def create(self) -> Iterator[N1QLQuery]:
+        if self.items_lease.remaining < self.ws.n1ql_batch_size:
+            self.items_lease.renew(self.LEASE_BATCHES * self.ws.n1ql_batch_size)
+        curr_items = self.items_lease.take(self.ws.n1ql_batch_size)
 
         for _ in range(self.ws.n1ql_batch_size):
             curr_items += 1
             key = self.new_keys.next(curr_items=curr_items)
             doc = self.docs.next(key)
-            query = self.new_queries.next(key.string, doc)
-
-            latency = self.cb.n1ql_query(query)
-            self.reservoir.update(operation='query', value=latency)
+            yield self.new_queries.next(key.string, doc)
 
-    def update(self):
-        with self.lock:
-            curr_items = self.curr_items.value
+    def update(self) -> Iterator[N1QLQuery]:
+        curr_items = self.curr_items.watermark
 
         for _ in range(self.ws.n1ql_batch_size):
             key = self.keys_for_cas_update.next(sid=self.sid,
                                                 curr_items=curr_items)
             doc = self.docs.next(key)
-            query = self.new_queries.next(key.string, doc)
+            yield self.new_queries.next(key.string, doc)
 
-            latency = self.cb.n1ql_query(query)
-            self.reservoir.update(operation='query', value=latency)
+    def execute(self, cb: CBGen, query: N1QLQuery):
+        latencies = cb.n1ql_query(query)
+        if latencies is not None:
+            time_to_first_row, latency = latencies
+            with self.lock:  # The queries may run in the pool threads
+                self.histograms.update(operation='ttfr', value=time_to_first_row)
+                self.histograms.update(operation='query', value=latency)
 
-    @with_sleep
     def do_batch(self):
         if self.ws.n1ql_op == 'read':
-            self.read()
+            queries = self.read()
         elif self.ws.n1ql_op == 'create':
-            self.create()
+            queries = self.create()
         elif self.ws.n1ql_op == 'update':
-            self.update()
-
-    def run(self, sid, lock, curr_ops, curr_items, *args):
-        if self.ws.n1ql_throughput < float('inf'):
-            self.target_time = self.ws.n1ql_batch_size * self.ws.n1ql_workers / \
-                float(self.ws.n1ql_throughput)
+            queries = self.update()
         else:
-            self.target_time = None
-        self.lock = lock
+            return
+
+        self.rate_limiter.acquire(self.ws.n1ql_batch_size)
+        for query in queries:
+            self.query_pool.submit(self.execute, query)
+
+    def run(self, sid, curr_ops, curr_items, *args):
         self.sid = sid
         self.curr_items = curr_items
+        self.items_lease = Lease(curr_items)
 
         try:
             logger.info('Started: {}-{}'.format(self.NAME, self.sid))
@@ -744,6 +1194,8 @@ class N1QLWorker(Worker):
         else:
             logger.info('Finished: {}-{}'.format(self.NAME, self.sid))
 
+        self.query_pool.shutdown()
+        self.items_lease.release()
         self.dump_stats()
 
 
@@ -755,6 +1207,17 @@ class WorkloadGen:
         self.timer = timer and Timer(timer, self.abort) or None
         self.shutdown_event = timer and Event() or None
         self.worker_processes = []
+        self.shared_state = []
+        self.rate_monitors = []
+        self.rate_controller = None
+        self.slo_search = None
+        self.placement = Placement(getattr(self.ws, 'cpu_placement', 'none'),
+                                   getattr(self.ws, 'reserved_cores', 0))
+        build_tables(self.ws)
+        self.telemetry = TelemetryMonitor(
+            filename='spring-telemetry-{}.json'.format(self.ts.bucket),
+            bucket=self.ts.bucket,
+        )
 
     def start_workers(self,
                       worker_factory,
@@ -762,21 +1225,60 @@ class WorkloadGen:
                       deleted_items=None,
                       current_hot_load_start=None,
                       timer_elapse=None):
-        curr_ops = Value('L', 0)
-        lock = Lock()
+        curr_ops = SequenceCounter(limit=self.ws.ops)
         worker_type, total_workers = worker_factory(self.ws)
+        if not total_workers:
+            return
+
+        if worker_type.DATASET and getattr(self.ws, 'dataset_dir', None):
+            prepare_dataset(self.ws, self.ts)
+
+        throughput = getattr(self.ws, worker_type.THROUGHPUT, float('inf'))
+        rate_limiter = TokenBucket(rate=throughput, burst=worker_type.BURST)
+        if worker_type.THROUGHPUT == 'throughput':
+            if getattr(self.ws, 'slo_search', None):
+                self.start_slo_search(rate_limiter)
+                throughput = 'SLO search'
+            elif getattr(self.ws, 'load_profile', None):
+                self.start_rate_controller(rate_limiter)
+                throughput = 'load profile'
+        if throughput != float('inf'):  # Unlimited tokens are not counted
+            rate_monitor = RateMonitor(worker_type.THROUGHPUT, rate_limiter,
+                                       target=throughput)
+            rate_monitor.start()
+            self.rate_monitors.append(rate_monitor)
+            self.telemetry.rate_monitors.append(rate_monitor)
+
+        placement = self.placement.assign(worker_type.NAME, total_workers)
+
+        # The processes drop their arguments once started, so the shared
+        # memory must stay referenced until the workers finish
+        self.shared_state.append((curr_ops, curr_items, deleted_items,
+                                  current_hot_load_start, timer_elapse,
+                                  rate_limiter))
 
         for sid in range(total_workers):
-            args = (sid, lock, curr_ops, curr_items, deleted_items,
+            telemetry = TelemetryRing()
+            self.telemetry.add_ring('{}-{}'.format(worker_type.NAME, sid),
+                                    telemetry)
+
+            args = (sid, curr_ops, curr_items, deleted_items,
                     current_hot_load_start, timer_elapse, worker_type,
-                    self.ws, self.ts, self.shutdown_event)
+                    self.ws, self.ts, self.shutdown_event, rate_limiter,
+                    telemetry, placement[sid])
 
-            def run_worker(sid, lock, curr_ops, curr_items, deleted_items,
+            def run_worker(sid, curr_ops, curr_items, deleted_items,
                            current_hot_load_start, timer_elapse, worker_type,
-                           ws, ts, shutdown_event):
-                worker = worker_type(ws, ts, shutdown_event)
-                worker.run(sid, lock, curr_ops, curr_items, deleted_items,
-                           current_hot_load_start, timer_elapse)
+                           ws, ts, shutdown_event, rate_limiter, telemetry,
+                           cpus):
+                pin(cpus)  # Before the client threads are started
+                worker = worker_type(ws, ts, shutdown_event, rate_limiter,
+                                     telemetry)
+                try:
+                    worker.run(sid, curr_ops, curr_items, deleted_items,
+                               current_hot_load_start, timer_elapse)
+                finally:
+                    telemetry.close()
 
             worker_process = Process(target=run_worker, args=args)
             worker_process.daemon = True
@@ -786,6 +1288,31 @@ class WorkloadGen:
             if getattr(self.ws, 'async', False):
                 time.sleep(2)
 
+    def start_rate_controller(self, rate_limiter: TokenBucket):
+        """Follow the load profile instead of the constant throughput."""
+        profile = LoadProfile(self.ws.load_profile)
+        logger.info('Using load profile: {}'.format(
+            ', '.join(str(phase) for phase in profile.phases)))
+        self.rate_controller = RateController(profile, rate_limiter)
+        self.rate_controller.start()
+        self.telemetry.rate_controller = self.rate_controller
+
+    def stop_rate_controller(self):
+        if self.rate_controller is not None:
+            self.rate_controller.stop()
+
+    def start_slo_search(self, rate_limiter: TokenBucket):
+        """Search for the maximum throughput that meets the latency SLO."""
+        self.slo_search = SLOSearch(self.ws.slo_search, rate_limiter,
+                                    name=self.ts.bucket,
+                                    shutdown_event=self.shutdown_event)
+        self.slo_search.start()
+        self.telemetry.observers.append(self.slo_search)
+
+    def stop_slo_search(self):
+        if self.slo_search is not None:
+            self.slo_search.stop()
+
     def set_signal_handler(self):
         """Abort the execution upon receiving a signal from perfrunner."""
         signal.signal(signal.SIGTERM, self.abort)
@@ -822,12 +1349,26 @@ class WorkloadGen:
         for process in self.worker_processes:
             process.join()
 
+    def start_telemetry(self):
+        """Start aggregating the live statistics of the workers."""
+        if self.telemetry.rings:
+            self.telemetry.start()
+
+    def stop_telemetry(self):
+        if self.telemetry.is_alive():
+            self.telemetry.stop()
+
+    def report_throughput(self):
+        """Stop sampling and log the achieved throughput."""
+        for rate_monitor in self.rate_monitors:
+            rate_monitor.stop()
+
     def start_all_workers(self):
         """Start all the workers groups."""
         logger.info('Starting all workers')
 
-        curr_items = Value('L', self.ws.items)
-        deleted_items = Value('L', 0)
+        curr_items = SequenceCounter(self.ws.items)
+        deleted_items = SequenceCounter()
         current_hot_load_start = Value('L', 0)
         timer_elapse = Value('I', 0)
 
@@ -846,6 +1387,8 @@ class WorkloadGen:
     def run(self):
         self.start_all_workers()
 
+        self.start_telemetry()
+
         self.start_timers()
 
         self.store_pid()
@@ -854,4 +1397,12 @@ class WorkloadGen:
 
         self.wait_for_completion()
 
+        self.stop_rate_controller()
+
+        self.stop_slo_search()
+
+        self.stop_telemetry()
+
+        self.report_throughput()
+
         self.stop_timers()
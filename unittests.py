@@ -1,17 +1,97 @@
+import asyncio
 import glob
 import json
+import os
+import random
+import socket
+import struct
+import tempfile
+import threading
+import time
+import urllib.request
 from collections import defaultdict, namedtuple
-from multiprocessing import Value
+from multiprocessing import Process, Queue, Value
+from types import SimpleNamespace
+from typing import Tuple
 from unittest import TestCase
 
+import numpy as np
 import snappy
 
+import spring.settings
 from perfrunner.tests.analytics import BigFunQueryTest
-from perfrunner.settings import ClusterSpec, TestConfig
+from cbagent.collectors.spring_errors import read_error_logs
+from perfrunner.settings import (
+    ClusterSpec,
+    LoadProfileSettings,
+    LoadSettings,
+    PhaseSettings,
+    SLOSearchSettings,
+    TargetSettings,
+    TestConfig,
+)
 from perfrunner.workloads.bigfun.query_gen import new_queries
 from perfrunner.workloads.tcmalloc import KeyValueIterator, LargeIterator
 from spring import docgen
+from spring.__main__ import CLIParser
+from spring.benchmark import benchmark_names, measure
+from spring.cbgen import (
+    FMT_JSON,
+    CouchbaseError,
+    ErrorTracker,
+    QueryPool,
+    RawJSONTranscoder,
+    TemporaryFailError,
+    error_log,
+    error_tracker,
+    retry_multi,
+)
+from spring.dataset import Dataset, dataset_file, prepare_dataset
+from spring.dictionary import (
+    COUNTIES,
+    ZIP_CODES,
+    Table,
+    build_dictionary,
+    dump_tables,
+    read_source,
+)
+from spring.generators import (
+    DOC_GENERATORS,
+    doc_generator_class,
+    new_doc_generator,
+)
+from spring.histogram import (
+    Histogram,
+    HistogramRecorder,
+    IntervalLog,
+    merge_logs,
+)
+from spring.keydist import (
+    HotspotKey,
+    LatestKey,
+    ScrambledZipfianKey,
+    ZipfianKey,
+    ZipfianTable,
+)
+from spring.leases import Lease, SequenceCounter
+from spring.loadprofile import LoadProfile
+from spring.mcgen import MCGen
+from spring.placement import CPU, CPUTopology, Placement, parse_cpu_list
 from spring.querygen import N1QLQueryGen
+from spring.ratelimiter import RateMonitor, TokenBucket
+from spring.slosearch import SLOSearch
+from spring.standin import HEADER, StandIn
+from spring.telemetry import TelemetryMonitor, TelemetryRing
+from spring.trace import TraceReader, TraceWriter
+from spring.wgen import (
+    BulkLoadWorker,
+    KVWorker,
+    OpenLoopKVWorker,
+    TraceRecordWorker,
+    WorkerFactory,
+    WorkloadGen,
+    multi_chunks,
+)
 
 
 class SettingsTest(TestCase):
@@ -231,6 +311,28 @@ class SpringTest(TestCase):
             key = key_gen.next(curr_deletes=100, curr_items=ws.items)
             self.assertIn(key.string, keys)
 
+    def test_key_distributions(self):
+        num_items, theta = 10 ** 6, 0.99
+        weights = 1 / np.arange(1, num_items + 1) ** theta
+        cdf = np.cumsum(weights) / np.sum(weights)
+
+        ranks = ZipfianTable(num_items, theta).sample(10 ** 6)
+        self.assertTrue(0 <= ranks.min() and ranks.max() < num_items)
+        for rank in 0, 10, 10 ** 5, 5 * 10 ** 5:
+            self.assertAlmostEqual(np.mean(ranks <= rank), cdf[rank], delta=0.005)
+
+        curr_items, curr_deletes = 2000, np.full(10 ** 5, 1000)
+        for key_gen in (ZipfianKey('test', 'decimal', 1000, theta),
+                        ScrambledZipfianKey('test', 'decimal', 1000, theta),
+                        LatestKey('test', 'decimal', 1000, theta),
+                        HotspotKey('test', 'decimal', hot_keys=20, hot_ops=80)):
+            keys = key_gen.next_batch(10 ** 5, curr_items, curr_deletes)
+            self.assertTrue(1000 <= keys.min() and keys.max() < curr_items)
+            key = key_gen.next(curr_items=curr_items, curr_deletes=1000)
+            self.assertTrue(1000 <= key.number < curr_items)
+
+        self.assertAlmostEqual(np.mean(keys >= 1800), 0.8, delta=0.01)
+
     def test_power_generator_cache_miss(self):
         num_ops = 10 ** 5
         ws = WorkloadSettings(items=10 ** 5, workers=40, working_set=1.6,
@@ -409,6 +511,33 @@ class SpringTest(TestCase):
             key = key_gen.next(curr_items=ws.items, curr_deletes=0)
             self.assertIn(key.string, keys)
 
+    def test_key_batches(self):
+        ws = WorkloadSettings(items=10 ** 3, workers=10, working_set=20,
+                              working_set_access=90, working_set_moving_docs=0,
+                              key_fmtr='decimal')
+
+        for key_gen in (docgen.UniformKey(prefix='test', fmtr='decimal'),
+                        docgen.WorkingSetKey(ws=ws, prefix='test'),
+                        docgen.ZipfKey(prefix='test', fmtr='decimal', alpha=1.5),
+                        docgen.PowerKey(prefix='test', fmtr='decimal', alpha=100)):
+            for curr_items in ws.items, np.arange(ws.items, ws.items + 100):
+                numbers = key_gen.next_batch(100, curr_items=curr_items,
+                                             curr_deletes=100)
+                self.assertEqual(len(numbers), 100)
+                self.assertTrue((numbers >= 100).all())
+                self.assertTrue((numbers < curr_items).all())
+
+    def test_working_set_batch_hits(self):
+        ws = WorkloadSettings(items=10 ** 4, workers=10, working_set=20,
+                              working_set_access=90, working_set_moving_docs=0,
+                              key_fmtr='decimal')
+
+        key_gen = docgen.WorkingSetKey(ws=ws, prefix='test')
+        numbers = key_gen.next_batch(10 ** 5, curr_items=ws.items,
+                                     curr_deletes=0)
+        hits = (numbers >= ws.items - key_gen.num_hot_items).mean()
+        self.assertAlmostEqual(hits, 91 / 101, delta=0.01)
+
     def test_moving_working_set_keys(self):
         ws = WorkloadSettings(items=10 ** 3, workers=10, working_set=90,
                               working_set_access=50, working_set_moving_docs=0,
@@ -493,6 +622,615 @@ class SpringTest(TestCase):
                 self.assertEqual(len(key.string), 16)
                 keys.add(key.string)
 
+    def test_bulk_key_fmtrs(self):
+        numbers = np.arange(0, 10 ** 6, 997)
+        for fmtr in 'decimal', 'hash', 'hex':
+            for prefix in '', 'test':
+                keys = [docgen.Key(number=number, prefix=prefix, fmtr=fmtr).string
+                        for number in numbers.tolist()]
+                self.assertEqual(docgen.format_keys(numbers, prefix, fmtr), keys)
+
+    def test_sequence_leases(self):
+        counter = SequenceCounter(initial=100, limit=10 ** 4 + 100)
+        numbers = Queue()
+
+        def consume():
+            lease = Lease(counter)
+            taken = []
+            while lease.remaining or lease.renew(size=700, unit=10):
+                start = lease.take(10)
+                self.assertLessEqual(counter.watermark, start)
+                taken += range(start, start + 10)
+            lease.release()
+            numbers.put(taken)
+
+        processes = [Process(target=consume) for _ in range(8)]
+        for process in processes:
+            process.start()
+        taken = sum((numbers.get() for _ in processes), [])
+        for process in processes:
+            process.join()
+
+        self.assertEqual(sorted(taken), list(range(100, 10 ** 4 + 100)))
+        self.assertEqual(counter.watermark, 10 ** 4 + 100)
+
+        counter = SequenceCounter()
+        for _ in range(SequenceCounter.MAX_LEASES):
+            Lease(counter)
+        self.assertRaises(RuntimeError, Lease, counter)
+
+    def test_deleted_keys(self):
+        args = CLIParser().parse_args(['-r', '50', '-d', '50', '-i', '100000', '-n', '2',
+                                       '--offline', '--trace-record', 'test'])
+        ws = spring.settings.WorkloadSettings(args)
+        ts = spring.settings.TargetSettings(args.uri, args.prefix)
+        counters = SequenceCounter(), SequenceCounter(ws.items), SequenceCounter()
+        behind, ahead = TraceRecordWorker(ws, ts), TraceRecordWorker(ws, ts)
+        for worker in behind, ahead:
+            worker.init_leases(*counters)
+            worker.current_hot_load_start = worker.timer_elapse = None
+            worker.next_batch()
+
+        deleted = []
+        for _ in range(10):
+            deleted += [key.number for op, key in ahead.gen_ops() if op == 'd']
+            ahead.next_batch()
+        reads = [key.number for op, key in behind.gen_ops() if op == 'r']
+        self.assertEqual(len(reads), 50)
+        self.assertGreater(min(reads), max(deleted))
+
+    def test_token_bucket(self):
+        rate, workers, tokens = 2000, 4, 500
+        bucket = TokenBucket(rate=rate)
+
+        def acquire():
+            for _ in range(tokens):
+                bucket.acquire()
+
+        t0 = time.time()
+        processes = [Process(target=acquire) for _ in range(workers)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        elapsed = time.time() - t0
+
+        self.assertEqual(bucket.tokens.value, workers * tokens)
+        self.assertAlmostEqual(workers * tokens / elapsed, rate, delta=0.05 * rate)
+
+        bucket.set_rate(float('inf'))
+        self.assertLessEqual(bucket.reserve(tokens), time.time())
+        self.assertEqual(bucket.tokens.value, workers * tokens)  # Not counted
+
+    def test_rate_monitor(self):
+        rate = 1000
+        bucket = TokenBucket(rate=rate)
+        monitor = RateMonitor('throughput', bucket, target=rate)
+        monitor.start()
+        t0 = time.time()
+        for _ in range(2 * rate):
+            bucket.acquire()
+        monitor.stop()
+
+        # The second after the start is sampled as a whole
+        self.assertAlmostEqual(monitor.rates[int(t0) + 1], rate, delta=0.05 * rate)
+
+        # The telemetry publishes the achieved rate once per second
+        telemetry = TelemetryMonitor(filename='', bucket='bucket')
+        telemetry.rate_monitors.append(monitor)
+        with tempfile.TemporaryFile(mode='w+') as fh:
+            for timestamp in int(t0) + 1, int(t0) + 1:
+                telemetry.write(fh, timestamp, histograms={}, errors=0, stalled=0)
+            fh.seek(0)
+            samples = [json.loads(line) for line in fh]
+        self.assertAlmostEqual(samples[0]['achieved_throughput'], rate, delta=0.05 * rate)
+        self.assertNotIn('achieved_throughput', samples[1])
+        self.assertNotIn(int(t0), monitor.rates)  # Older samples are dropped
+
+    def test_trace_roundtrip(self):
+        records = [(op, 10 ** 12 + i, i % 3 * 1000, i / 8)
+                   for i, op in enumerate('crudm' * 101)]
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, 'test.trace')
+            writer = TraceWriter(filename, start_time=1000)
+            writer.BUFFER_SIZE = 64
+            for op, key, size, intended_time in records:
+                writer.append(op, key, size, 1000 + intended_time)
+            writer.close()
+
+            reader = TraceReader(filename)
+            reader.CHUNK_SIZE = 100
+            self.assertEqual(list(reader), records)
+            self.assertEqual(reader.start_time, 1000)
+
+    def test_offline_trace_record(self):
+        parser = CLIParser()
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                args = parser.parse_args(['-c', '50', '-u', '50', '-i', '100',
+                                          '-o', '400', '-n', '2', '-m', '10',
+                                          '--offline', '--trace-record', 'test'])
+                ws = spring.settings.WorkloadSettings(args)
+                ts = spring.settings.TargetSettings(args.uri, args.prefix)
+                WorkloadGen(ws, ts).run()
+
+                records = []
+                for sid in range(2):
+                    records += list(TraceReader('test-{}.trace'.format(sid)))
+                self.assertEqual(len(records), 400)
+                self.assertEqual({op for op, *_ in records}, {'c', 'u'})
+
+                args = parser.parse_args(['-n', '3', '--trace-replay', 'test'])
+                with self.assertRaises(SystemExit):
+                    WorkerFactory(spring.settings.WorkloadSettings(args))
+            finally:
+                os.chdir(cwd)
+
+    def test_error_stats(self):
+        tracker = ErrorTracker()
+        for _ in range(3):
+            tracker.track('read', TemporaryFailError('temporary failure'))
+        tracker.succeed('read', count=97)
+        tracker.retry('update', delay=0.1)
+        tracker.retry('update', delay=0.2)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, error_log('kv-worker', 0))
+            tracker.dump(filename, bucket='bucket-1')
+
+            stats = defaultdict(float)
+            for bucket, timestamp, sample in read_error_logs(filename):
+                self.assertEqual(bucket, 'bucket-1')
+                for metric, value in sample.items():
+                    stats[metric] += value
+
+        self.assertEqual(stats['errors_read_TemporaryFailError'], 3)
+        self.assertEqual(stats['ops_read'], 97)
+        self.assertEqual(stats['retries_update'], 2)
+        self.assertAlmostEqual(stats['backoff_update'], 0.3)
+
+    def test_multi_retries(self):
+        TMPFAIL, KEY_ENOENT = 0x0b, 0x0d  # libcouchbase error codes
+
+        class MultiError(CouchbaseError):
+
+            all_results = {}
+
+            def __init__(self, failures: dict):
+                self.failures = failures
+
+            def split_results(self):
+                return {}, {key: SimpleNamespace(rc=rc) for key, rc in self.failures.items()}
+
+        def get_multi(keys: list):
+            calls.append(keys)
+            if failures:
+                raise failures.pop(0)
+
+        def count(metric: str) -> float:
+            return sum(stats[metric] for stats in error_tracker.stats.values())
+
+        errors, retries = count('errors_get_multi_NotFoundError'), count('retries_get_multi')
+        ops = count('ops_get_multi')
+
+        # Only the temporary failures are retried, only the last attempt is timed
+        calls = []
+        failures = [MultiError({'a': TMPFAIL, 'b': KEY_ENOENT}), MultiError({'a': TMPFAIL})]
+        latency = retry_multi(get_multi, ['a', 'b', 'c'])
+        self.assertEqual(calls, [['a', 'b', 'c'], ['a'], ['a']])
+        self.assertLess(latency, 0.1)
+        self.assertEqual(count('errors_get_multi_NotFoundError'), errors + 1)
+        self.assertEqual(count('retries_get_multi'), retries + 2)
+        self.assertEqual(count('ops_get_multi'), ops + 2)
+
+        # No latency if no item succeeded
+        calls = []
+        failures = [MultiError({'a': KEY_ENOENT, 'b': KEY_ENOENT})]
+        self.assertIsNone(retry_multi(get_multi, ['a', 'b']))
+        self.assertEqual(calls, [['a', 'b']])
+        self.assertEqual(count('ops_get_multi'), ops + 2)
+
+        # Every key appears once per call
+        args = [('a', 1), ('b', 2), ('a', 3), ('c', 4), ('d', 5), ('e', 6)]
+        self.assertEqual(list(multi_chunks(args, size=3)),
+                         [[('a', 1), ('b', 2)], [('a', 3), ('c', 4), ('d', 5)], [('e', 6)]])
+
+    def test_query_pool(self):
+        size, num_queries = 4, 20
+        clients = []
+        in_flight = Value('i', 0)
+        max_in_flight = Value('i', 0)
+
+        def new_client():
+            clients.append(object())
+            return clients[-1]
+
+        def query(client, i):
+            with in_flight.get_lock():
+                in_flight.value += 1
+                max_in_flight.value = max(max_in_flight.value, in_flight.value)
+            time.sleep(0.01)
+            with in_flight.get_lock():
+                in_flight.value -= 1
+
+        pool = QueryPool(size=size, client=None, new_client=new_client)
+        for i in range(num_queries):
+            pool.submit(query, i)
+        pool.shutdown()
+
+        self.assertEqual(max_in_flight.value, size)
+        self.assertEqual(len(clients), size)  # One connection per thread
+
+    def test_load_profile(self):
+        settings = LoadProfileSettings({'phases': '''
+            ramp duration=10 start=0 end=1000
+            step duration=5 rate=2000
+            sine duration=20 mean=1000 amplitude=500 period=20
+            burst duration=10 rate=100 peak=5000 length=1 every=5
+        '''})
+        profile = LoadProfile(settings.phases)
+        self.assertEqual(profile.duration, 45)
+
+        for elapsed, phase, rate in (-1, 0, 0), \
+                                    (5, 0, 500), \
+                                    (12, 1, 2000), \
+                                    (20, 2, 1500), \
+                                    (35.5, 3, 5000), \
+                                    (37, 3, 100), \
+                                    (40.5, 3, 5000), \
+                                    (100, 3, 5000):
+            self.assertEqual(profile.rate_at(elapsed)[0], phase)
+            self.assertAlmostEqual(profile.rate_at(elapsed)[1], rate)
+
+    def test_slo_search(self):
+        for mode, num_steps, precision in ('step', 8, 5000), ('binary', 9, 1000):
+            settings = SLOSearchSettings({
+                'mode': mode,
+                'percentile': 99.9,
+                'latency': 1,
+                'min_throughput': 5000,
+                'max_throughput': 100000,
+                'step': 5000,
+                'resolution': 1000,
+            })
+            search = SLOSearch(settings, TokenBucket(rate=1000), name='test')
+            search.measure = lambda rate: {'target_throughput': rate,
+                                           'throughput': rate,
+                                           'latency_99.9th': rate / 37000}
+            self.assertTrue(search.binary_search() if mode == 'binary'
+                            else search.step_search())
+            self.assertEqual(len(search.steps), num_steps)
+            self.assertLessEqual(search.max_throughput, 37000)
+            self.assertGreater(search.max_throughput, 37000 - precision)
+
+    def test_cpu_placement(self):
+        self.assertEqual(parse_cpu_list('0-3,8,10-11\n'), [0, 1, 2, 3, 8, 10, 11])
+
+        # 2 nodes x 2 cores x 2 hyperthreads, siblings are numbered last
+        topology = CPUTopology([
+            CPU(id=cpu, core=(cpu % 4 // 2, cpu % 2), node=cpu % 4 // 2)
+            for cpu in range(8)
+        ])
+        for policy, cpus in (('spread', [0, 2, 1, 3, 4, 6, 5, 7, 0]),
+                             ('pack', [0, 1, 4, 5, 2, 3, 6, 7, 0])):
+            placement = Placement(policy, topology=topology)
+            self.assertEqual(placement.assign('kv-worker', 6) +
+                             placement.assign('n1ql-worker', 3),
+                             [{cpu} for cpu in cpus])
+
+        placement = Placement('spread', reserved_cores=1, topology=topology)
+        self.assertEqual(placement.assign('kv-worker', 4), [{0}, {2}, {1}, {4}])
+
+        placement = Placement('none', topology=topology)
+        self.assertEqual(placement.assign('kv-worker', 2), [None, None])
+
+    def test_dictionary_tables(self):
+        tables = {'letters': ['a', 'bb', '', 'ccc'], 'words': ['Zoë', 'Ærø']}
+        with tempfile.NamedTemporaryFile() as fh:
+            dump_tables(fh.name, tables)
+            for name, strings in tables.items():
+                table = Table(name, fh.name)
+                self.assertEqual(len(table), len(strings))
+                self.assertEqual(list(table), strings)
+                self.assertEqual(table[-1], strings[-1])
+            self.assertRaises(KeyError, len, Table('numbers', fh.name))
+
+    def test_dictionary_sources(self):
+        # The tables file is up to date with the text sources
+        with tempfile.NamedTemporaryFile() as fh:
+            build_dictionary(fh.name)
+            with open(Table.FILENAME, 'rb') as dat:
+                self.assertEqual(fh.read(), dat.read())
+
+        self.assertEqual((len(COUNTIES), COUNTIES[0], COUNTIES[-1]),
+                         (1847, 'Abbeville County', 'Ziebach County'))
+        self.assertEqual((len(ZIP_CODES), ZIP_CODES[0], ZIP_CODES[-1]),
+                         (7282, '00601', '97441'))
+        self.assertEqual(list(COUNTIES), read_source('counties'))
+        self.assertEqual(list(ZIP_CODES), read_source('zip_codes'))
+
+    def test_doc_generators(self):
+        ws = namedtuple('ws', ('size', 'items'))(size=1024, items=100)
+        ts = namedtuple('ts', ('prefix', ))(prefix='prefix')
+        for name in DOC_GENERATORS:
+            self.assertTrue(doc_generator_class(name))
+
+        docs = new_doc_generator('ext_reverse_lookup', ws, ts)
+        self.assertIsInstance(docs, docgen.ExtReverseLookupDocument)
+        self.assertEqual((docs.prefix, docs.num_docs), ('prefix', 100))
+        self.assertRaises(ValueError, new_doc_generator, 'unknown', ws, ts)
+
+    def test_doc_cache(self):
+        for doc_gen in docgen.Document, docgen.NestedDocument:
+            for size in 0, 1024, 10 ** 4:
+                docs = doc_gen(avg_size=size)
+                cache = docgen.DocumentCache(docs)
+                another_cache = docgen.DocumentCache(doc_gen(avg_size=size))
+                for number in range(0, 10 ** 5, 997):
+                    key = docgen.Key(number=number, prefix='test', fmtr='hash')
+                    data = cache.next(key)
+                    self.assertEqual(data, another_cache.next(key))
+
+                    doc = json.loads(data.decode())
+                    expected = docs.next(key)
+                    for field in expected.keys() - {'alt_email', 'body'}:
+                        self.assertEqual(doc[field], json.loads(json.dumps(expected[field])))
+
+    def test_raw_json_transcoder(self):
+        transcoder = RawJSONTranscoder()
+        data = docgen.DocumentCache(docgen.Document(avg_size=1024)).next(
+            docgen.Key(number=0, prefix='test', fmtr='decimal'))
+        self.assertEqual(transcoder.encode_value(data, FMT_JSON), (data, FMT_JSON))
+
+        value, flags = transcoder.encode_value({'key': 'value'}, FMT_JSON)
+        self.assertEqual((json.loads(value.decode()), flags), ({'key': 'value'}, FMT_JSON))
+
+    def test_dataset(self):
+        ts = namedtuple('ts', ('prefix', ))(prefix='test')
+        with tempfile.TemporaryDirectory() as dataset_dir:
+            ws = namedtuple('ws', ('doc_gen', 'size', 'items', 'key_fmtr', 'workers',
+                                   'dataset_dir'))('basic', 1024, 1000, 'hash', 3, dataset_dir)
+            filename = prepare_dataset(ws, ts)
+            mtime = os.path.getmtime(filename)
+            self.assertEqual(prepare_dataset(ws, ts), filename)
+            self.assertEqual(os.path.getmtime(filename), mtime)
+            self.assertNotEqual(dataset_file(ws._replace(size=2048), ts), filename)
+
+            dataset = Dataset(filename)
+            docs = docgen.Document(avg_size=ws.size)
+            self.assertEqual(len(dataset), ws.items)
+            for number in range(ws.items):
+                key = docgen.Key(number=number, prefix='test', fmtr='hash')
+                doc = json.loads(dataset.next(key).decode())
+                expected = docs.next(key)
+                for field in expected.keys() - {'alt_email', 'body'}:
+                    self.assertEqual(doc[field], expected[field])
+
+    def test_standin(self):
+        standin = StandIn(port=0, rest_port=0, num_nodes=2, latency=0.001)
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(standin.start())
+        threading.Thread(target=loop.run_forever, daemon=True).start()
+
+        def request(sock, opcode, key=b'', extras=b'', value=b'', vbucket=0):
+            body = extras + key + value
+            sock.sendall(HEADER.pack(0x80, opcode, len(key), len(extras), 0, vbucket,
+                                     len(body), 0, 0) + body)
+            response = b''
+            while len(response) < HEADER.size or \
+                    len(response) < HEADER.size + HEADER.unpack_from(response)[6]:
+                response += sock.recv(4096)
+            _, _, key_len, ext_len, _, status, _, _, _ = HEADER.unpack_from(response)
+            return status, response[HEADER.size + ext_len + key_len:]
+
+        try:
+            with socket.create_connection(('127.0.0.1', standin.ports[0])) as sock:
+                self.assertEqual(request(sock, 0x00, b'key')[0], 0x20)  # Not authenticated
+                request(sock, 0x21, b'PLAIN', value=b'\0bucket\0password')
+
+                doc = b'{"name":"a","city":{"name":"b"}}'
+                self.assertEqual(request(sock, 0x01, b'key', b'\0' * 8, doc), (0, b''))
+                self.assertEqual(request(sock, 0x00, b'key'), (0, doc))
+                self.assertEqual(request(sock, 0x00, b'key', vbucket=1)[0], 0x07)
+
+                path = struct.pack('>HB', 9, 0)
+                request(sock, 0xc8, b'key', path, b'city.name"c"')
+                self.assertEqual(request(sock, 0xc5, b'key', path, b'city.name'), (0, b'"c"'))
+                self.assertEqual(request(sock, 0xc5, b'key', path, b'city.code')[0], 0xc0)
+
+                self.assertEqual(request(sock, 0x04, b'key')[0], 0)
+                self.assertEqual(request(sock, 0x00, b'key')[0], 0x01)
+
+                standin.error_rate = 1
+                self.assertEqual(request(sock, 0x00, b'key')[0], 0x86)
+
+            url = 'http://127.0.0.1:{}/pools/default/buckets/bucket'.format(standin.rest_port)
+            config = json.loads(urllib.request.urlopen(url).read().decode())
+            self.assertEqual(config['vBucketServerMap']['vBucketMap'][:3], [[0], [1], [0]])
+            self.assertEqual([node['services']['kv'] for node in config['nodesExt']],
+                             standin.ports)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+
+    def test_memcached_engine(self):
+        standin = StandIn(port=0, rest_port=0, num_nodes=3)
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(standin.start())
+        threading.Thread(target=loop.run_forever, daemon=True).start()
+        asyncio.set_event_loop(asyncio.new_event_loop())
+        try:
+            cb = MCGen(host='127.0.0.1:{}'.format(standin.ports[0]), bucket='bucket',
+                       password='password')
+            self.assertEqual(len(cb.client.vbucket_map), 1024)
+
+            args = [('key-{}'.format(i), {'number': i}, 0, 0, 0) for i in range(1000)]
+            cb.update_multi(args)
+            self.assertEqual(cb.run(cb.client.read('key-7')), b'{"number":7}')
+
+            standin.rebalance()  # Every request gets NOT_MY_VBUCKET once
+            cb.read_multi(args)
+            self.assertEqual(cb.client.rev, standin.rev)
+
+            standin.error_rate = 0.5  # Temporary failures are retried
+            cb.update_multi([('key-7', {'number': 8}, 0, 0, 0)])
+            standin.error_rate = 0
+            self.assertEqual(cb.run(cb.client.read('key-7')), b'{"number":8}')
+
+            cb.delete_multi(args)
+            self.assertEqual(len(standin.buckets['bucket'].items), 0)
+
+            ws = PhaseSettings({'updates': 100, 'items': 1000, 'multi_batch_size': 10,
+                                'kv_engine': 'memcached'})
+            ts = TargetSettings('127.0.0.1:{}'.format(standin.ports[0]), 'bucket',
+                                'password', 'test')
+            worker = KVWorker(ws, ts)
+            worker.histograms = HistogramRecorder(interval=3600)
+            worker.init_leases(SequenceCounter(), SequenceCounter(ws.items),
+                               SequenceCounter())
+            worker.current_hot_load_start = worker.timer_elapse = None
+            worker.next_batch()
+            worker.do_batch()
+            histograms = worker.histograms.histograms
+            self.assertGreaterEqual(histograms['mset'].total_count, 10)
+            self.assertEqual(histograms['set'].total_count, 100)  # Amortized per key
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+
+        with self.assertRaises(SystemExit):  # Observe is not supported
+            PhaseSettings({'kv_engine': 'memcached', 'persist_to': 1})
+
+    def test_open_loop_arrivals(self):
+        standin = StandIn(port=0, rest_port=0, latency=0.005)
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(standin.start())
+        threading.Thread(target=loop.run_forever, daemon=True).start()
+        asyncio.set_event_loop(asyncio.new_event_loop())
+
+        def run(in_flight: int) -> Tuple[float, Histogram]:
+            ws = PhaseSettings({'updates': 100, 'items': 100, 'ops': 100, 'throughput': 1000,
+                                'open_loop': 1, 'in_flight': in_flight,
+                                'kv_engine': 'memcached'})
+            ts = TargetSettings('127.0.0.1:{}'.format(standin.ports[0]), 'bucket',
+                                'password', 'test')
+            worker = OpenLoopKVWorker(ws, ts, rate_limiter=TokenBucket(
+                rate=ws.throughput, burst=OpenLoopKVWorker.BURST))
+            worker.histograms = HistogramRecorder(interval=3600)
+            worker.init_leases(SequenceCounter(limit=ws.ops), SequenceCounter(ws.items),
+                               SequenceCounter())
+            worker.current_hot_load_start = worker.timer_elapse = None
+
+            t0 = time.time()
+            asyncio.get_event_loop().run_until_complete(worker.do_batches())
+            return time.time() - t0, worker.histograms.histograms['set']
+
+        try:
+            # The arrivals do not wait for the responses
+            elapsed, histogram = run(in_flight=100)
+            self.assertEqual(histogram.total_count, 100)
+            self.assertLess(elapsed, 0.3)
+            self.assertLess(histogram.percentile(99), 50000)
+
+            # The queueing delay is a part of the latency
+            elapsed, histogram = run(in_flight=1)
+            self.assertEqual(histogram.total_count, 100)
+            self.assertGreater(elapsed, 0.5)
+            self.assertGreater(histogram.percentile(99), 300000)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+
+    def test_bulk_load_checkpoints(self):
+        standin = StandIn(port=0, rest_port=0)
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(standin.start())
+        threading.Thread(target=loop.run_forever, daemon=True).start()
+
+        class StopAfter:
+
+            def __init__(self, items: int):
+                self.items = items
+
+            def is_set(self) -> bool:
+                self.items -= 1
+                return self.items < 0
+
+        def new_worker(shutdown_event=None, **options) -> BulkLoadWorker:
+            asyncio.set_event_loop(asyncio.new_event_loop())
+            ws = LoadSettings(dict({'items': 100, 'workers': 1, 'kv_engine': 'memcached'},
+                                   **options))
+            ts = TargetSettings('127.0.0.1:{}'.format(standin.ports[0]), 'bucket',
+                                'password', 'test')
+            worker = BulkLoadWorker(ws, ts, shutdown_event)
+            worker.CHECKPOINT_INTERVAL = 10
+            return worker
+
+        def checkpoint() -> dict:
+            with open(worker.checkpoint_file) as fh:
+                return json.load(fh)
+
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.chdir(tmpdir)
+            try:
+                # Only the completed chunks are checkpointed
+                worker = new_worker(shutdown_event=StopAfter(items=35))
+                worker.run(0)
+                self.assertEqual((checkpoint()['items'], checkpoint()['failed']), (30, []))
+                self.assertEqual(standin.ops[0x01], 35)
+
+                # The stats are written even if the load was interrupted
+                self.assertEqual(merge_logs('*-worker-*')['set'].total_count, 35)
+                self.assertTrue(os.path.exists(error_log(BulkLoadWorker.NAME, 0)))
+
+                # A different load does not resume
+                self.assertEqual(new_worker(items=200).read_checkpoint(), 0)
+
+                # The rerun skips the checkpointed items
+                worker = new_worker()
+                worker.run(0)
+                self.assertEqual(standin.ops[0x01], 35 + 70)
+                self.assertEqual(len(standin.buckets['bucket'].items), 100)
+                self.assertFalse(os.path.exists(worker.checkpoint_file))
+
+                # The failed items are retried first
+                worker = new_worker()
+                worker.failed = [3, 5]
+                worker.write_checkpoint(items=100)
+                worker.run(0)
+                self.assertEqual(standin.ops[0x01], 35 + 70 + 2)
+                self.assertFalse(os.path.exists(worker.checkpoint_file))
+            finally:
+                os.chdir(cwd)
+                loop.call_soon_threadsafe(loop.stop)
+
+    def test_microbench(self):
+        names = benchmark_names()
+        self.assertIn('doc/basic', names)
+        self.assertIn('key/zipfian_batch', names)
+        for name in 'doc/basic', 'key/zipfian_batch':
+            result = measure(name, duration=0.01)
+            self.assertGreater(result['ops_per_sec'], 0)
+            self.assertGreater(result['bytes_per_op'], 0)
+            self.assertGreater(result['rss'], 0)
+        self.assertGreaterEqual(measure('key/uniform', duration=0.01)['allocs_per_op'], 1)
+
+    def test_native_documents(self):
+        for doc_gen in docgen.Document, docgen.NestedDocument, docgen.LargeDocument:
+            docs = doc_gen(avg_size=2048)
+            if not docs.native:
+                self.skipTest('fastdocgen was built without the document builders')
+
+            for fmtr in 'decimal', 'hash', 'hex':
+                keys = [docgen.Key(number=number, prefix='test', fmtr=fmtr)
+                        for number in range(0, 10 ** 5, 997)]
+                documents = []
+                for docs.native in True, False:
+                    random.seed(fmtr)
+                    np.random.seed(len(fmtr))
+                    documents.append([json.dumps(docs.next(key)) for key in keys])
+                self.assertEqual(documents[0], documents[1])
+
     def test_new_working_set_hits(self):
         ws = WorkloadSettings(items=10 ** 3, workers=40, working_set=20,
                               working_set_access=100, working_set_moving_docs=0,
@@ -596,6 +1334,95 @@ class SpringTest(TestCase):
         self.assertEqual(len(doc), size)
 
 
+class HistogramTest(TestCase):
+
+    def test_percentile_error(self):
+        values = np.random.lognormal(mean=6, sigma=1.5, size=10 ** 5)
+        values = np.sort(values.astype(int) + 1)
+
+        histogram = Histogram()
+        for value in values:
+            histogram.record(int(value))
+        self.assertEqual(histogram.total_count, len(values))
+
+        for percentile in 50, 90, 99, 99.9, 99.99:
+            rank = int(np.ceil(percentile / 100 * len(values)))
+            expected = values[rank - 1]
+            actual = histogram.percentile(percentile)
+            self.assertAlmostEqual(actual, expected, delta=expected * 0.002)
+
+    def test_merge_logs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            single = Histogram()
+            for sid in range(4):
+                recorder = HistogramRecorder(interval=0)
+                for i in range(1, 1000):
+                    latency = (sid + 1) * i / 10 ** 6
+                    recorder.update(operation='get', value=latency)
+                    single.record(int(latency * 10 ** 6))
+                recorder.dump(os.path.join(tmp, 'kv-worker-{}'.format(sid)))
+
+            histograms = merge_logs(os.path.join(tmp, '*-worker-*'))
+            self.assertEqual(set(histograms), {'get'})
+            np.testing.assert_array_equal(histograms['get'].counts,
+                                          single.counts)
+
+    def test_interval_log(self):
+        recorder = HistogramRecorder(interval=3600)
+        expected = []
+        for i in range(300):
+            operation = ('get', 'set', 'mget')[i % 3]
+            histogram = Histogram()
+            for value in np.random.lognormal(mean=6, sigma=1, size=i % 7 + 1):
+                recorder.update(operation=operation, value=value / 10 ** 6)
+                histogram.record(int(value))
+            expected.append((operation, histogram))
+            recorder.flush()
+
+        with tempfile.NamedTemporaryFile() as fh:
+            recorder.dump(fh.name)
+            log = IntervalLog(fh.name)
+
+        self.assertEqual(len(log), len(expected))
+        records = list(log.records())
+        for percentile in 50, 99, 100:
+            latencies = log.percentiles(percentile)
+            for (operation, histogram), latency, record in zip(expected, latencies, records):
+                self.assertEqual(record[0], operation)
+                self.assertEqual(latency, histogram.percentile(percentile))
+                self.assertEqual(latency, Histogram.percentile_of(record[2], record[3],
+                                                                  percentile))
+
+        with tempfile.NamedTemporaryFile() as fh:
+            fh.write(b'{"config": {}}')
+            fh.flush()
+            with self.assertRaises(ValueError):
+                IntervalLog(fh.name)
+
+    def test_telemetry_ring(self):
+        ring = TelemetryRing()
+        recorder = HistogramRecorder(interval=3600, telemetry=ring)
+        for i in range(TelemetryRing.SLOTS + 10):
+            recorder.update(operation='get', value=(i + 1) / 10 ** 3)
+            recorder.update(operation='query', value=1)
+            recorder.flush()
+
+        head, records = ring.read(start=0)
+        self.assertEqual(head, TelemetryRing.SLOTS + 10)
+        self.assertEqual(len(records), TelemetryRing.SLOTS - 1)  # Lost the oldest
+
+        for i, record in enumerate(records, start=11):
+            histograms = dict(ring.histograms(record))
+            self.assertEqual(set(histograms), {'get', 'query'})
+            self.assertEqual(histograms['get'].sum(), 1)
+
+            expected = (i + 1) * 1000
+            actual = ring.percentile_of(histograms['get'], 99)
+            self.assertAlmostEqual(actual, expected, delta=expected / 16)
+
+        self.assertEqual(ring.read(start=head), (head, []))
+
+
 class QueryTest(TestCase):
 
     def test_n1ql_query_gen_q1(self):